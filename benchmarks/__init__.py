@@ -0,0 +1,11 @@
+import os
+import sys
+
+from pathlib import Path
+
+"""
+Adding src folder path for correct import of AsyncWeatherChecker and its configs, as it is made for tests.
+"""
+__PROJECT_PATH: Path = Path(os.getcwd())
+__SOURCE_PATH: Path = __PROJECT_PATH.joinpath("src")
+sys.path.append(__SOURCE_PATH.__str__())
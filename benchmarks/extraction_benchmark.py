@@ -0,0 +1,102 @@
+"""
+Micro-benchmark of temperature extraction from weather resources (API) responses: decoding of raw response body
+and walking of result keys. Compares standard JSON decoding with the fastest available backend and the former
+per response keys walking with compiled extractor.
+
+Usage (from project's root directory):
+    python -m benchmarks.extraction_benchmark --responses 10000
+"""
+import json
+import time
+import argparse
+
+from typing import List, Dict, AnyStr, Any, Callable
+
+from result_extractor import ResultExtractor, decode_json, orjson
+
+
+RESULT_KEYS: List[AnyStr] = ['current', 'temperature_2m']
+
+
+def walk_result_keys(response_json: Dict, result_keys: List[AnyStr]) -> Any:
+    """
+    Former implementation of getting temperature from response, which walks result keys on every response.
+    """
+
+    temperature_value: Any = None
+    if not response_json:
+        return temperature_value
+
+    for key in result_keys:
+        weather_info: Any = temperature_value if temperature_value else response_json
+        temperature_value = weather_info.get(key, None)
+
+    return temperature_value
+
+
+def measure(function: Callable[[Any], Any], inputs: List[Any], repeats: int) -> float:
+    """
+    :return: Best time of processing one input in microseconds.
+    """
+
+    best_time: float = float('inf')
+    for _ in range(repeats):
+        start_time: float = time.perf_counter()
+        for function_input in inputs:
+            function(function_input)
+
+        best_time = min(best_time, time.perf_counter() - start_time)
+
+    return best_time / len(inputs) * 1_000_000
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description='Micro-benchmark of temperature extraction')
+    parser.add_argument('--responses', type=int, default=10000, help='Number of responses.')
+    parser.add_argument('--payload-bytes', type=int, default=1024, help='Size of padding in response JSON.')
+    parser.add_argument('--repeats', type=int, default=5, help='Number of repeats, the best one is reported.')
+    arguments: argparse.Namespace = parser.parse_args()
+
+    responses_bodies: List[bytes] = [
+        json.dumps({
+            'current': {'temperature_2m': index / 10},
+            'padding': 'x' * arguments.payload_bytes
+        }).encode() for index in range(arguments.responses)
+    ]
+    responses_jsons: List[Dict] = [json.loads(response_body) for response_body in responses_bodies]
+    result_extractor: ResultExtractor = ResultExtractor(result_keys=RESULT_KEYS)
+    backend_name: AnyStr = 'orjson' if orjson is not None else 'json'
+
+    results: Dict[AnyStr, float] = {
+        'keys walking (decoded JSON)': measure(
+            function=lambda response_json: walk_result_keys(response_json, RESULT_KEYS),
+            inputs=responses_jsons,
+            repeats=arguments.repeats
+        ),
+        'compiled extractor (decoded JSON)': measure(
+            function=result_extractor.extract,
+            inputs=responses_jsons,
+            repeats=arguments.repeats
+        ),
+        'json + keys walking': measure(
+            function=lambda body: walk_result_keys(json.loads(body), RESULT_KEYS),
+            inputs=responses_bodies,
+            repeats=arguments.repeats
+        ),
+        f'{backend_name} + compiled extractor': measure(
+            function=lambda body: result_extractor.extract(decode_json(body)),
+            inputs=responses_bodies,
+            repeats=arguments.repeats
+        )
+    }
+
+    print(f'Extraction cost per response ({arguments.responses} responses, {arguments.payload_bytes} bytes padding):')
+    for name, microseconds in results.items():
+        print(f'{name:>36}: {microseconds:.2f} us')
+
+    if orjson is None:
+        print('\norjson is not installed, so standard JSON backend is used.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+import asyncio
+import random
+import multiprocessing
+
+from aiohttp import web
+from collections import namedtuple
+from typing import List, Dict, AnyStr, Any, Optional
+
+
+ProviderProfile: namedtuple = namedtuple(
+    'ProviderProfile',
+    [
+        'name',
+        'latency_distribution',
+        'latency_mean_in_seconds',
+        'latency_jitter_in_seconds',
+        'error_rate',
+        'slow_body_in_seconds',
+        'payload_size_in_bytes'
+    ],
+    defaults=[
+        'constant',
+        0.05,
+        0.0,
+        0.0,
+        0.0,
+        0
+    ]
+)
+
+LATENCY_DISTRIBUTIONS: List[AnyStr] = ['constant', 'uniform', 'exponential', 'lognormal']
+
+
+class MockProvider:
+    """
+    Local weather provider (API), which emulates latency, errors, slow body and payload size according to its
+    :py:class:`ProviderProfile`. Response JSON has the same structure, as Open-Meteo response has, so
+    "result_keys" of provider are ['current', 'temperature_2m'].
+    """
+
+    body_chunks_number: int = 4
+
+    def __init__(self, provider_profile: ProviderProfile, seed: int) -> None:
+        if provider_profile.latency_distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f'Unknown latency distribution: {provider_profile.latency_distribution}')
+
+        self.__provider_profile: ProviderProfile = provider_profile
+        self.__random: random.Random = random.Random(seed)
+
+        response_json: Dict[AnyStr, Any] = {
+            'current': {'temperature_2m': 15.0},
+            'padding': 'x' * provider_profile.payload_size_in_bytes
+        }
+        self.__response_body: bytes = web.json_response(data=response_json).body
+
+    def __get_latency(self) -> float:
+        """
+        :return: Latency of next response in seconds according to latency distribution of provider.
+        """
+
+        mean: float = self.__provider_profile.latency_mean_in_seconds
+        jitter: float = self.__provider_profile.latency_jitter_in_seconds
+        match self.__provider_profile.latency_distribution:
+            case 'uniform':
+                return max(self.__random.uniform(mean - jitter, mean + jitter), 0.0)
+            case 'exponential':
+                return self.__random.expovariate(1 / mean) if mean > 0 else 0.0
+            case 'lognormal':
+                return self.__random.lognormvariate(0, jitter / mean) * mean if mean > 0 else 0.0
+            case _:
+                return mean
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        await asyncio.sleep(self.__get_latency())
+
+        if self.__random.random() < self.__provider_profile.error_rate:
+            return web.Response(status=500, text='Emulated provider error')
+
+        if not self.__provider_profile.slow_body_in_seconds:
+            return web.Response(body=self.__response_body, content_type='application/json')
+
+        # Slow body is sent in chunks with pauses between them:
+        response: web.StreamResponse = web.StreamResponse(headers={'Content-Type': 'application/json'})
+        await response.prepare(request)
+        chunk_size: int = len(self.__response_body) // self.body_chunks_number + 1
+        for chunk_start in range(0, len(self.__response_body), chunk_size):
+            await response.write(self.__response_body[chunk_start:chunk_start + chunk_size])
+            await asyncio.sleep(self.__provider_profile.slow_body_in_seconds / self.body_chunks_number)
+
+        await response.write_eof()
+        return response
+
+
+async def _serve_mock_providers(
+        provider_profiles: List[ProviderProfile],
+        seed: int,
+        ports_queue: multiprocessing.Queue
+) -> None:
+    """
+    Starts each mock provider on its own port, so connection pool limits per host apply to each provider
+    separately, as they apply to real providers.
+    """
+
+    runners: List[web.AppRunner] = []
+    ports: Dict[AnyStr, int] = {}
+    for provider_index, provider_profile in enumerate(provider_profiles):
+        mock_provider: MockProvider = MockProvider(provider_profile=provider_profile, seed=seed + provider_index)
+        application: web.Application = web.Application()
+        application.router.add_get('/{tail:.*}', mock_provider.handle)
+
+        runner: web.AppRunner = web.AppRunner(application, access_log=None)
+        await runner.setup()
+        site: web.TCPSite = web.TCPSite(runner, host='127.0.0.1', port=0)
+        await site.start()
+
+        runners.append(runner)
+        ports[provider_profile.name] = runner.addresses[0][1]
+
+    ports_queue.put(ports)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        for runner in runners:
+            await runner.cleanup()
+
+
+def _run_mock_providers(
+        provider_profiles: List[ProviderProfile],
+        seed: int,
+        ports_queue: multiprocessing.Queue
+) -> None:
+    asyncio.run(_serve_mock_providers(provider_profiles=provider_profiles, seed=seed, ports_queue=ports_queue))
+
+
+class MockProvidersServer:
+    """
+    Runs mock providers in a separate process, so their CPU time and memory are not counted in measurements
+    of weather checker.
+
+    Usage:
+        with MockProvidersServer(provider_profiles=[...]) as server:
+            urls = server.urls
+    """
+
+    start_timeout_in_seconds: float = 30.0
+
+    def __init__(self, provider_profiles: List[ProviderProfile], seed: int = 0) -> None:
+        self.__provider_profiles: List[ProviderProfile] = provider_profiles
+        self.__seed: int = seed
+        self.__process: Optional[multiprocessing.Process] = None
+        self.__ports: Dict[AnyStr, int] = {}
+
+    def __enter__(self) -> 'MockProvidersServer':
+        context = multiprocessing.get_context('spawn')
+        ports_queue: multiprocessing.Queue = context.Queue()
+        self.__process = context.Process(
+            target=_run_mock_providers,
+            kwargs={'provider_profiles': self.__provider_profiles, 'seed': self.__seed, 'ports_queue': ports_queue},
+            daemon=True
+        )
+        self.__process.start()
+        self.__ports = ports_queue.get(timeout=self.start_timeout_in_seconds)
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.__process.terminate()
+        self.__process.join()
+
+    @property
+    def urls(self) -> Dict[AnyStr, AnyStr]:
+        return {name: f'http://127.0.0.1:{port}/weather' for name, port in self.__ports.items()}
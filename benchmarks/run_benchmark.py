@@ -0,0 +1,287 @@
+"""
+Benchmark of Asynchronous Weather Checker against local mock providers. Runs fully offline.
+
+Usage (from project's root directory):
+    python -m benchmarks.run_benchmark --providers 10 --locations 50 --iterations 20
+    python -m benchmarks.run_benchmark --output benchmark.json
+    python -m benchmarks.run_benchmark --baseline benchmark.json --tolerance 0.2
+    python -m benchmarks.run_benchmark --metrics-overhead
+"""
+import io
+import sys
+import json
+import time
+import resource
+import argparse
+import tempfile
+import contextlib
+import multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
+
+from pathlib import Path
+from typing import List, Dict, AnyStr, Any
+
+from aiologger import Logger
+from aiologger.levels import LogLevel
+
+from . import mock_providers
+from async_weather_checker import AsyncWeatherChecker
+from configs import Config, CustomizedSettings, WeatherResource, Location
+from polling_metrics import PollingMetrics
+
+
+# Metrics, which are compared with baseline. True, if higher value is better:
+COMPARED_METRICS: Dict[AnyStr, bool] = {
+    'requests_per_second': True,
+    'iteration_latency_p50_in_seconds': False,
+    'iteration_latency_p95_in_seconds': False,
+    'iteration_latency_p99_in_seconds': False,
+    'peak_rss_in_megabytes': False,
+    'cpu_seconds_per_iteration': False
+}
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description='Benchmark of Asynchronous Weather Checker')
+    parser.add_argument('--providers', type=int, default=5, help='Number of mock providers.')
+    parser.add_argument('--locations', type=int, default=20, help='Number of polled locations.')
+    parser.add_argument('--iterations', type=int, default=10, help='Number of polling iterations.')
+    parser.add_argument('--check-interval', type=float, default=0.0, help='Polling interval in seconds.')
+    parser.add_argument(
+        '--latency-distribution',
+        choices=mock_providers.LATENCY_DISTRIBUTIONS,
+        default='lognormal',
+        help='Distribution of providers latency.'
+    )
+    parser.add_argument('--latency-mean-ms', type=float, default=50.0, help='Mean latency of providers.')
+    parser.add_argument('--latency-jitter-ms', type=float, default=20.0, help='Latency jitter of providers.')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Share of responses with 500 status.')
+    parser.add_argument('--slow-body-ms', type=float, default=0.0, help='Time of sending response body.')
+    parser.add_argument('--payload-bytes', type=int, default=1024, help='Size of padding in response JSON.')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of providers randomness.')
+    parser.add_argument('--output', type=Path, help='Path to .json file for saving benchmark report.')
+    parser.add_argument('--baseline', type=Path, help='Path to .json report, which current report is compared with.')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed relative regression against baseline.')
+    parser.add_argument('--verbose', action='store_true', help='Show output of weather checker.')
+    parser.add_argument('--metrics', action='store_true', help='Enable polling metrics.')
+    parser.add_argument(
+        '--metrics-overhead',
+        action='store_true',
+        help='Measure overhead of polling metrics by running benchmark without and with metrics.'
+    )
+    return parser.parse_args()
+
+
+def create_config(arguments: argparse.Namespace, urls: Dict[AnyStr, AnyStr], results_dir: Path) -> Config:
+    """
+    :param arguments: Parsed command line arguments.
+    :param urls: URLs of mock providers by their names.
+    :param results_dir: Directory for results files.
+    :return: :py:class:`Config` of weather checker, polling mock providers.
+    """
+
+    return Config(
+        customized_settings=CustomizedSettings(
+            times_to_check=arguments.iterations,
+            check_interval_in_seconds=arguments.check_interval
+        ),
+        weather_resources=[
+            WeatherResource(
+                name=name,
+                url=url,
+                params={'latitude': '{latitude}', 'longitude': '{longitude}'},
+                headers={},
+                result_keys=['current', 'temperature_2m']
+            ) for name, url in urls.items()
+        ],
+        locations=[
+            Location(name=f'Location{index}', latitude=str(index), longitude=str(index))
+            for index in range(arguments.locations)
+        ],
+        results_file_path=results_dir / 'weather_results.csv',
+        results_metadata_file_path=results_dir / 'weather_results_metadata.jsonl',
+        metrics_enabled=arguments.metrics,
+        # Metrics are served on port, chosen by OS, so benchmark doesn't conflict with running weather checker:
+        results_server_port=0
+    )
+
+
+def run_benchmark(arguments: argparse.Namespace) -> Dict[AnyStr, Any]:
+    """
+    Starts mock providers, runs weather checker against them and measures its performance.
+
+    :param arguments: Parsed command line arguments.
+    :return: Benchmark report.
+    """
+
+    provider_profiles: List[mock_providers.ProviderProfile] = [
+        mock_providers.ProviderProfile(
+            name=f'MockProvider{index}',
+            latency_distribution=arguments.latency_distribution,
+            latency_mean_in_seconds=arguments.latency_mean_ms / 1000,
+            latency_jitter_in_seconds=arguments.latency_jitter_ms / 1000,
+            error_rate=arguments.error_rate,
+            slow_body_in_seconds=arguments.slow_body_ms / 1000,
+            payload_size_in_bytes=arguments.payload_bytes
+        ) for index in range(arguments.providers)
+    ]
+
+    with (
+        mock_providers.MockProvidersServer(provider_profiles=provider_profiles, seed=arguments.seed) as server,
+        tempfile.TemporaryDirectory() as results_dir
+    ):
+        config: Config = create_config(arguments=arguments, urls=server.urls, results_dir=Path(results_dir))
+        logger: Logger = (
+            Logger.with_default_handlers(name='benchmark_logger') if arguments.verbose
+            else Logger(name='benchmark_logger', level=LogLevel.CRITICAL)
+        )
+        async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(logger=logger, config=config)
+
+        output: io.StringIO = io.StringIO()
+        with (
+            contextlib.redirect_stdout(sys.stdout if arguments.verbose else output),
+            contextlib.redirect_stderr(sys.stderr if arguments.verbose else output)
+        ):
+            start_time: float = time.perf_counter()
+            start_cpu_time: float = time.process_time()
+            async_weather_checker.run()
+            cpu_time: float = time.process_time() - start_cpu_time
+            wall_time: float = time.perf_counter() - start_time
+
+    iterations: int = async_weather_checker.iteration_statistics.iterations
+    requests: int = async_weather_checker.connection_statistics.requests
+    return {
+        'providers': arguments.providers,
+        'locations': arguments.locations,
+        'metrics_enabled': arguments.metrics,
+        'iterations': iterations,
+        'requests': requests,
+        'wall_seconds': round(wall_time, 3),
+        'requests_per_second': round(requests / wall_time, 1),
+        'iteration_latency_p50_in_seconds': round(async_weather_checker.iteration_statistics.get_percentile(50), 4),
+        'iteration_latency_p95_in_seconds': round(async_weather_checker.iteration_statistics.get_percentile(95), 4),
+        'iteration_latency_p99_in_seconds': round(async_weather_checker.iteration_statistics.get_percentile(99), 4),
+        # On Linux "ru_maxrss" is provided in kilobytes:
+        'peak_rss_in_megabytes': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        'cpu_seconds_per_iteration': round(cpu_time / iterations, 4) if iterations else 0.0
+    }
+
+
+def measure_register_request_cost(requests: int = 100000, providers: int = 10) -> float:
+    """
+    :return: Cost of registration of one request by :py:class:`PollingMetrics` in microseconds.
+    """
+
+    polling_metrics: PollingMetrics = PollingMetrics()
+    start_time: float = time.perf_counter()
+    for index in range(requests):
+        polling_metrics.register_request(
+            weather_resource_name=f'MockProvider{index % providers}',
+            latency_in_seconds=index % 1000 / 1000,
+            status=200,
+            received_bytes=1024
+        )
+
+    return (time.perf_counter() - start_time) / requests * 1_000_000
+
+
+def run_benchmark_in_subprocess(arguments: argparse.Namespace) -> Dict[AnyStr, Any]:
+    """
+    Runs benchmark in a separate spawned process, so its peak RSS and CPU time are not mixed with other runs.
+
+    :param arguments: Parsed command line arguments.
+    :return: Benchmark report.
+    """
+
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+        return executor.submit(run_benchmark, arguments).result()
+
+
+def measure_metrics_overhead(arguments: argparse.Namespace) -> Dict[AnyStr, Any]:
+    """
+    Runs benchmark without and with polling metrics against providers with the same seed. Each run is made
+    in its own process, since peak RSS ("ru_maxrss") is process-wide and never decreases.
+
+    :param arguments: Parsed command line arguments.
+    :return: Benchmark report with metrics and relative overhead of metrics (positive is worse).
+    """
+
+    report_without_metrics: Dict[AnyStr, Any] = run_benchmark_in_subprocess(
+        arguments=argparse.Namespace(**{**vars(arguments), 'metrics': False})
+    )
+    report: Dict[AnyStr, Any] = run_benchmark_in_subprocess(
+        arguments=argparse.Namespace(**{**vars(arguments), 'metrics': True})
+    )
+
+    cpu_seconds_per_iteration: float = report_without_metrics['cpu_seconds_per_iteration']
+    requests_per_second: float = report_without_metrics['requests_per_second']
+    peak_rss_in_megabytes: float = report_without_metrics['peak_rss_in_megabytes']
+    return {
+        **report,
+        'metrics_cpu_overhead': round(
+            report['cpu_seconds_per_iteration'] / cpu_seconds_per_iteration - 1, 3
+        ) if cpu_seconds_per_iteration else 0.0,
+        'metrics_throughput_overhead': round(
+            1 - report['requests_per_second'] / requests_per_second, 3
+        ) if requests_per_second else 0.0,
+        'metrics_rss_overhead': round(
+            report['peak_rss_in_megabytes'] / peak_rss_in_megabytes - 1, 3
+        ) if peak_rss_in_megabytes else 0.0,
+        'register_request_cost_in_microseconds': round(measure_register_request_cost(), 3)
+    }
+
+
+def find_regressions(report: Dict[AnyStr, Any], baseline: Dict[AnyStr, Any], tolerance: float) -> List[AnyStr]:
+    """
+    :param report: Current benchmark report.
+    :param baseline: Baseline benchmark report.
+    :param tolerance: Allowed relative regression, for example, 0.2 for 20%.
+    :return: Descriptions of metrics, which are worse than baseline more than tolerance allows.
+    """
+
+    regressions: List[AnyStr] = []
+    for metric, higher_is_better in COMPARED_METRICS.items():
+        value: float = report[metric]
+        baseline_value: float = baseline.get(metric, 0.0)
+        if not baseline_value:
+            continue
+
+        relative_change: float = (value - baseline_value) / baseline_value
+        if (-relative_change if higher_is_better else relative_change) > tolerance:
+            regressions.append(f'{metric}: {baseline_value} -> {value} ({relative_change:+.1%})')
+
+    return regressions
+
+
+def main() -> int:
+    arguments: argparse.Namespace = parse_arguments()
+    report: Dict[AnyStr, Any] = (
+        measure_metrics_overhead(arguments=arguments) if arguments.metrics_overhead
+        else run_benchmark(arguments=arguments)
+    )
+
+    for metric, value in report.items():
+        print(f'{metric:>36}: {value}')
+
+    if arguments.output is not None:
+        arguments.output.write_text(json.dumps(report, indent=2))
+
+    if arguments.baseline is not None:
+        regressions: List[AnyStr] = find_regressions(
+            report=report,
+            baseline=json.loads(arguments.baseline.read_text()),
+            tolerance=arguments.tolerance
+        )
+
+        if regressions:
+            print('\nRegressions against baseline:\n' + '\n'.join(regressions))
+            return 1
+
+        print('\nNo regressions against baseline.')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
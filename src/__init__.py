@@ -1,4 +1,29 @@
-from .configs import YamlHandler, CustomizedSettings, WeatherResource, YamlConfig, Config
+from .configs import YamlHandler, CustomizedSettings, WeatherResource, YamlConfig, Config, Location
 from .async_weather_checker import AsyncWeatherChecker
 from .async_logging_system import logger
 from .custom_types import Temperature, WeatherResult
+from .polling_statistics import ConnectionStatistics, TimeoutStatistics, IterationStatistics
+from .rolling_statistics import RollingStatistics, RollingWindow
+from .consensus_aggregator import ConsensusAggregator, ConsensusResult
+from .location_results import LocationResults
+from .polling_scheduler import PollingScheduler
+from .response_cache import ResponseCache, CachedResponse
+from .circuit_breaker import CircuitBreaker
+from .rate_limiter import RateLimiter, TokenBucket
+from .request_hedging import RequestHedger, P2QuantileEstimator
+from .single_flight import SingleFlight
+from .shard_balancer import ShardBalancer
+from .shard_results_writer import ShardResultsWriter
+from .lease_coordinator import LeaseBackend, SqliteLeaseBackend, LeaseCoordinator
+from .config_reloader import ConfigReloader, ConfigReloadError, ConfigDiff, diff_configs
+from .results_index import ResultsIndex, IndexedDocument
+from .results_server import ResultsServer
+from .metrics_registry import MetricsRegistry, MetricCounter, MetricGauge, MetricHistogram
+from .polling_metrics import PollingMetrics, EventLoopLagMonitor
+from .results_writer import ResultsWriter
+from .sqlite_results_writer import SqliteResultsWriter, ResultRow
+from .columnar_results_store import (
+    ColumnarResultsWriter, ColumnarResultsReader, ColumnarRow, convert_csv_to_columnar_store
+)
+from .polling_pipeline import PollingPipeline, PipelineStageStatistics
+from .result_extractor import ResultExtractor
@@ -1,13 +1,101 @@
 import asyncio
 import aiofiles
 import aiohttp
+import numpy
 import os
+import sys
+import json
+import time
+import random
+import threading
+import functools
+import multiprocessing
 
-from typing import List, Dict, AnyStr, Tuple, Any, Optional, Union
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
-from configs import WeatherResource, Config
-from async_logging_system import Logger
-from custom_types import Temperature, WeatherResult
+from aiohttp import hdrs
+from http import HTTPStatus
+from pathlib import Path
+from collections import namedtuple, Counter
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Connection
+from typing import (
+    List, Dict, AnyStr, Tuple, Any, Optional, Union, AsyncIterator, Iterator, Set, Literal, Awaitable, Callable
+)
+
+from configs import WeatherResource, Config, Location
+from async_logging_system import Logger, logger as default_logger
+from custom_types import Temperature
+from polling_statistics import ConnectionStatistics, TimeoutStatistics, IterationStatistics
+from rolling_statistics import RollingStatistics
+from consensus_aggregator import ConsensusAggregator, ConsensusResult
+from location_results import LocationResults
+from polling_scheduler import PollingScheduler
+from response_cache import ResponseCache, CachedResponse
+from circuit_breaker import CircuitBreaker, CircuitBreakerState
+from rate_limiter import RateLimiter
+from request_hedging import RequestHedger
+from single_flight import SingleFlight
+from results_writer import ResultsWriter
+from shard_results_writer import ShardResultsWriter
+from shard_balancer import ShardBalancer
+from lease_coordinator import LeaseBackend, SqliteLeaseBackend, LeaseCoordinator
+from config_reloader import ConfigReloader, ConfigReloadError, ConfigDiff, diff_configs
+from results_index import ResultsIndex
+from results_server import ResultsServer
+from polling_metrics import PollingMetrics, EventLoopLagMonitor
+from sqlite_results_writer import SqliteResultsWriter, ResultRow
+from columnar_results_store import ColumnarResultsWriter, ColumnarRow
+from polling_pipeline import PollingPipeline
+from result_extractor import ResultExtractor, decode_json
+
+
+class _LocationValues(dict):
+    """
+    Location values for rendering weather resource templates. Unknown placeholders are left as is.
+    """
+
+    def __missing__(self, key: AnyStr) -> AnyStr:
+        return '{' + key + '}'
+
+
+# Time, during which sharded polling worker should process queued commands after stop command:
+_SHARD_WORKER_STOP_TIMEOUT_IN_SECONDS: float = 30.0
+
+
+class ResponseBodyTooLargeError(Exception):
+    """
+    Raised, if weather resource response body exceeds "max_body_bytes" limit.
+    """
+
+
+# Data of a single polling iteration, which is passed between stages of polling pipeline:
+PollingIteration: namedtuple = namedtuple(
+    'PollingIteration',
+    [
+        'polled_weather_resources',
+        'columns_names',
+        'locations_results',
+        'results_metadata',
+        'started_at',
+        'timestamp',
+        'results_statuses',
+        'results_latencies',
+        'results_lines',
+        'results_rows',
+        'consensus_temperatures'
+    ],
+    defaults=[
+        None,
+        None,
+        None
+    ]
+)
+
+# Status of weather result, which is written to SQLite results sink:
+ResultStatus = Literal['ok', 'cached', 'not_modified', 'invalid', 'failed', 'circuit_open', 'deadline', 'not_due']
 
 
 class AsyncWeatherChecker:
@@ -16,16 +104,143 @@ class AsyncWeatherChecker:
     processing responses from them and saving information into a result file.
     """
 
-    def __init__(self, logger: Logger, config) -> None:
+    def __init__(self, logger: Logger, config, lease_backend: Optional[LeaseBackend] = None) -> None:
         self.__logger: Logger = logger
         self.__config: Config = config
 
+        # Backend of leases of locations shards, if polling is coordinated with other nodes:
+        self.__lease_backend: Optional[LeaseBackend] = lease_backend
+        self.__session: Optional[aiohttp.ClientSession] = None
+        self.__connection_statistics: ConnectionStatistics = ConnectionStatistics()
+        self.__timeout_statistics: TimeoutStatistics = TimeoutStatistics()
+        self.__iteration_statistics: IterationStatistics = IterationStatistics()
+        self.__oversized_responses: Counter = Counter()
+        self.__consensus_aggregator: ConsensusAggregator = self.__create_consensus_aggregator()
+        self.__rolling_statistics: RollingStatistics = RollingStatistics(
+            max_count=self.__config.rolling_window_max_count,
+            max_age_in_seconds=self.__config.rolling_window_max_age_in_seconds,
+            ewma_alpha=self.__config.rolling_ewma_alpha
+        )
+        self.__rendered_weather_resources: Dict[Tuple[AnyStr, Location], Tuple[WeatherResource, WeatherResource]] = {}
+        self.__latest_temperatures: Dict[Tuple[Location, AnyStr], Temperature] = {}
+
+        # Order of weather resources columns in results is calculated once, so temperatures are written straight
+        # to their slots in results rows without sorting:
+        self.__columns_names: List[AnyStr] = sorted(
+            weather_resource.name for weather_resource in self.__config.weather_resources
+        )
+        self.__columns_indices: Dict[AnyStr, int] = {name: index for index, name in enumerate(self.__columns_names)}
+
+        # Weather resources columns of the last written results file headers. Headers are written again, if columns
+        # were changed by config reload:
+        self.__written_columns_names: Optional[List[AnyStr]] = None
+        self.__results_statuses: Dict[Tuple[Location, AnyStr], ResultStatus] = {}
+        self.__results_latencies: Dict[Tuple[Location, AnyStr], float] = {}
+        self.__circuit_breakers: Dict[AnyStr, CircuitBreaker] = {}
+        self.__rate_limiters: Dict[AnyStr, RateLimiter] = {}
+        self.__request_hedgers: Dict[AnyStr, RequestHedger] = {}
+
+        # Identical requests of current iteration share a single request in flight:
+        self.__single_flight: SingleFlight = SingleFlight()
+        self.__results_writers: Dict[Path, ResultsWriter] = {}
+        self.__polling_pipeline: Optional[PollingPipeline] = None
+
+        # The latest results, which are served by results server:
+        self.__results_index: ResultsIndex = ResultsIndex()
+
+        # Metrics of polling, which are collected and served by results server, if metrics are enabled:
+        self.__polling_metrics: Optional[PollingMetrics] = (
+            PollingMetrics(
+                latency_buckets_in_seconds=self.__config.metrics_latency_buckets_in_seconds,
+                queue_depths_function=self.__get_queue_depths
+            ) if self.__config.metrics_enabled else None
+        )
+
+        # Result keys of all weather resources are compiled once, so malformed keys are reported on start:
+        self.__result_extractors: Dict[Union[Tuple, AnyStr], ResultExtractor] = self.__compile_result_extractors(
+            weather_resources=self.__config.weather_resources
+        )
+        self.__iteration_deadline_time: Optional[float] = None
+        self.__iterations_counter: int = self.__config.default_counter_value
+        self.__response_cache: ResponseCache = ResponseCache(
+            max_entries=self.__config.response_cache_max_entries,
+            file_path=self.__config.response_cache_file_path
+        )
+        self.__polling_scheduler: PollingScheduler = PollingScheduler(
+            weather_resources=self.__config.weather_resources,
+            default_interval_in_seconds=self.__config.customized_settings.check_interval_in_seconds,
+            missed_tick_policy=self.__config.customized_settings.missed_tick_policy,
+            tick_tolerance_in_seconds=self.__config.scheduler_tick_tolerance_in_seconds
+        )
+
+    @property
+    def connection_statistics(self) -> ConnectionStatistics:
+        return self.__connection_statistics
+
+    @property
+    def timeout_statistics(self) -> TimeoutStatistics:
+        return self.__timeout_statistics
+
+    @property
+    def iteration_statistics(self) -> IterationStatistics:
+        return self.__iteration_statistics
+
+    @property
+    def oversized_responses(self) -> Counter:
+        return self.__oversized_responses
+
+    @property
+    def rolling_statistics(self) -> RollingStatistics:
+        return self.__rolling_statistics
+
+    @property
+    def polling_scheduler(self) -> PollingScheduler:
+        return self.__polling_scheduler
+
+    @property
+    def response_cache(self) -> ResponseCache:
+        return self.__response_cache
+
+    @property
+    def circuit_breakers(self) -> Dict[AnyStr, CircuitBreaker]:
+        return self.__circuit_breakers
+
+    @property
+    def rate_limiters(self) -> Dict[AnyStr, RateLimiter]:
+        return self.__rate_limiters
+
+    @property
+    def request_hedgers(self) -> Dict[AnyStr, RequestHedger]:
+        return self.__request_hedgers
+
+    @property
+    def results_index(self) -> ResultsIndex:
+        return self.__results_index
+
+    @property
+    def polling_metrics(self) -> Optional[PollingMetrics]:
+        return self.__polling_metrics
+
     def run(self) -> None:
         """
-        Startpoint function, which runs weather checker in event loop of asyncio.
+        Startpoint function, which runs weather checker in event loop of asyncio. If more than one shard is
+        configured, locations are polled by worker processes (see :py:meth:`__check_weather_sharded`).
+        """
+
+        if self.__config.shards_number > 1:
+            asyncio.run(self.__check_weather_sharded())
+        else:
+            asyncio.run(self.__check_weather())
+
+    def run_shard(self, connection: Connection) -> None:
+        """
+        Startpoint function of sharded polling worker process, which polls locations by commands of supervisor
+        (see :py:meth:`__serve_shard`).
+
+        :param connection: Worker end of pipe to supervisor process.
         """
 
-        asyncio.run(self.__check_weather())
+        asyncio.run(self.__serve_shard(connection=connection))
 
     async def __check_weather(self) -> None:
         """
@@ -34,206 +249,2058 @@ class AsyncWeatherChecker:
         After cleaning last launch data and creating necessary data for current launch, function starts
         iteration cycle of getting weather a number of times, defined by user in according config file.
 
-        After getting and processing received weather, sleeps for a period, also defined by user in according
-        config file.
+        Iterations are driven by :py:class:`PollingScheduler`: each iteration polls weather resources, which are due
+        according to their own polling intervals (or default interval, defined by user in according config file),
+        and sleeps until next due time. Due times are calculated on monotonic clock from previous due times,
+        so polling time doesn't shift the schedule. Every scheduler tick is one iteration, which is counted
+        against "times_to_check" and writes one results row per location. Weather resources, which were not due
+        at the tick, are written with their latest received temperature.
+
+        All iterations share a single long-lived :py:class:`aiohttp.ClientSession`, which is owned by this function,
+        so connections to weather resources (API) are reused between requests and iterations. Results are written
+        by long-lived :py:class:`ResultsWriter` objects, which are flushed and closed on finish or cancellation.
+
+        Iterations are processed by :py:class:`PollingPipeline` (fetch -> extract -> aggregate -> sink), so results
+        of iteration N are processed and written, while weather resources are fetched for iteration N+1.
+        All queued iterations are processed, before weather checker finishes.
+
+        If coordination is enabled, each tick starts with renewal of leases of :py:class:`LeaseCoordinator`,
+        and only locations of leased shards are polled, so each location is polled by a single node of cluster.
+        Tick is skipped, if node holds no leases.
+
+        If config reload is enabled, config is reloaded by :py:class:`ConfigReloader` between iterations, when its
+        YAML files are modified or SIGHUP is received (see :py:meth:`__reload_config`).
+
+        If results server is enabled, the latest results are served by :py:class:`ResultsServer` on the same event
+        loop, while weather checker is running. If metrics are enabled, :py:class:`PollingMetrics` are served
+        by the same server, and event loop lag is measured by :py:class:`EventLoopLagMonitor`.
         """
 
         await self.__delete_last_launch_results()
-        await self.__write_headers_to_results_file()
+        if self.__config.results_sink == 'csv':
+            await self.__write_headers_to_results_file()
 
-        iterations_number: int = self.__config.iteration_start_point
-        while iterations_number < self.__config.customized_settings.times_to_check:
-            await self.__poll_weather_resources()
-            iterations_number += self.__config.increment_value
-            if iterations_number < self.__config.customized_settings.times_to_check:
-                print(f'Sleeping for {self.__config.customized_settings.check_interval_in_seconds} seconds...\n')
-                await asyncio.sleep(self.__config.customized_settings.check_interval_in_seconds)
+        if not self.__response_cache.load():
+            await self.__log_warning(
+                msg=f'Response cache file {self.__config.response_cache_file_path} is corrupt, '
+                    f'weather checker starts with cold cache'
+            )
 
-    async def __delete_last_launch_results(self) -> None:
+        async with (
+            self.__create_client_session() as session,
+            self.__create_results_sink() as results_writer,
+            self.__create_results_writer(file_path=self.__config.results_metadata_file_path) as metadata_writer,
+            self.__create_lease_coordinator() as lease_coordinator,
+            self.__create_config_reloader() as config_reloader,
+            self.__create_results_server(),
+            self.__create_event_loop_lag_monitor()
+        ):
+            self.__session = session
+            self.__results_writers = {
+                results_writer.file_path: results_writer,
+                metadata_writer.file_path: metadata_writer
+            }
+            try:
+                async with self.__create_polling_pipeline(
+                    fetch_stage=self.__fetch_shard_weather_results if lease_coordinator is not None else None
+                ) as polling_pipeline:
+                    self.__polling_pipeline = polling_pipeline
+                    self.__polling_scheduler.start()
+                    iterations_number: int = self.__config.iteration_start_point
+                    while iterations_number < self.__config.customized_settings.times_to_check:
+                        if config_reloader is not None and config_reloader.is_reload_due():
+                            await self.__reload_config(config_reloader=config_reloader)
+
+                        time_until_next_tick: float = self.__polling_scheduler.time_until_next_tick()
+                        if time_until_next_tick:
+                            print(f'Sleeping for {time_until_next_tick:.2f} seconds...\n')
+
+                        due_weather_resources: List[WeatherResource] = (
+                            await self.__polling_scheduler.wait_for_due_weather_resources()
+                        )
+
+                        if lease_coordinator is None:
+                            await polling_pipeline.put(due_weather_resources)
+                        else:
+                            await lease_coordinator.renew_leases()
+                            print(f'Lease statistics: {lease_coordinator}')
+                            leased_locations: List[Location] = lease_coordinator.filter_locations(
+                                locations=self.__config.locations or [self.__config.default_location]
+                            )
+                            if leased_locations:
+                                await polling_pipeline.put((due_weather_resources, leased_locations))
+
+                        iterations_number += self.__config.increment_value
+            finally:
+                self.__session = None
+                self.__results_writers = {}
+                self.__polling_pipeline = None
+                self.__response_cache.save()
+
+    @asynccontextmanager
+    async def __create_results_server(self) -> AsyncIterator[Optional[ResultsServer]]:
+        """
+        Provides running :py:class:`ResultsServer` of results index and (or) of metrics, if results server
+        or metrics are enabled.
+
+        :return: :py:class:`ResultsServer` or None, if both results server and metrics are disabled.
+        """
+
+        if not self.__config.results_server_enabled and self.__polling_metrics is None:
+            yield None
+            return
+
+        async with ResultsServer(
+            results_index=self.__results_index if self.__config.results_server_enabled else None,
+            host=self.__config.results_server_host,
+            port=self.__config.results_server_port,
+            metrics_registry=self.__polling_metrics.metrics_registry if self.__polling_metrics is not None else None
+        ) as results_server:
+            if self.__config.results_server_enabled:
+                print(f'Results are served on {results_server.url}/locations')
+
+            if self.__polling_metrics is not None:
+                print(f'Metrics are served on {results_server.url}/metrics')
+
+            yield results_server
+
+    @asynccontextmanager
+    async def __create_event_loop_lag_monitor(self) -> AsyncIterator[Optional[EventLoopLagMonitor]]:
+        """
+        :return: Running :py:class:`EventLoopLagMonitor` or None, if metrics are disabled.
+        """
+
+        if self.__polling_metrics is None:
+            yield None
+            return
+
+        async with EventLoopLagMonitor(
+            polling_metrics=self.__polling_metrics,
+            interval_in_seconds=self.__config.event_loop_lag_interval_in_seconds
+        ) as event_loop_lag_monitor:
+            yield event_loop_lag_monitor
+
+    def __get_queue_depths(self) -> Dict[Tuple[AnyStr], int]:
         """
-        Deletes last launch results file (.csv) if it exists.
+        :return: Current depths of queues of pipeline stages and results writers by their names.
         """
 
+        queue_depths: Dict[Tuple[AnyStr], int] = {
+            (file_path.name,): results_writer.queue_depth for file_path, results_writer in self.__results_writers.items()
+        }
+        if self.__polling_pipeline is not None:
+            for stage_name, stage_statistics in self.__polling_pipeline.snapshot().items():
+                queue_depths[(stage_name,)] = stage_statistics['queue_depth']
+
+        return queue_depths
+
+    def __create_flush_callback(self, file_path: Path) -> Optional[Callable[[float], None]]:
+        """
+        :param file_path: Path to results file.
+        :return: Callback of results writer, which registers latencies of its flushes, or None, if metrics
+        are disabled.
+        """
+
+        if self.__polling_metrics is None:
+            return None
+
+        return functools.partial(self.__polling_metrics.register_flush, file_path.name)
+
+    @asynccontextmanager
+    async def __create_config_reloader(self) -> AsyncIterator[Optional[ConfigReloader]]:
+        """
+        Provides :py:class:`ConfigReloader` of YAML files of config, if reload is enabled, and requests reload
+        on SIGHUP, while it is used.
+
+        :return: :py:class:`ConfigReloader` or None, if reload is disabled or config was not loaded from YAML files.
+        """
+
+        if not self.__config.config_reload_enabled or self.__config.yaml_config is None:
+            yield None
+            return
+
+        config_reloader: ConfigReloader = ConfigReloader(yaml_config=self.__config.yaml_config)
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        signal_handler_installed: bool = config_reloader.install_signal_handler(loop=loop)
         try:
-            os.remove(self.__config.results_file_path)
-        except (FileNotFoundError, OSError):
-            pass
+            yield config_reloader
+        finally:
+            if signal_handler_installed:
+                config_reloader.remove_signal_handler(loop=loop)
 
-    async def __write_headers_to_results_file(self) -> None:
+    async def __reload_config(self, config_reloader: ConfigReloader) -> None:
         """
-        Creates headers for results file (in .csv format) and writes it to a new results file.
-        Headers is a list of sorted weather resources (API) names.
+        Reloads config and applies its changes between iterations. Running config is kept, if reloaded config
+        is not valid.
 
-        Purpose of sorting headers is to write results in future in the same order as the according weather resource
-        name was written.
+        Iterations, which are already in polling pipeline, are processed with weather resources and columns,
+        which they were started with, and session, connections and results writers are not reopened.
+
+        :param config_reloader: :py:class:`ConfigReloader` of config YAML files.
         """
 
-        async with aiofiles.open(
-            file=self.__config.results_file_path,
-            mode=self.__config.results_file_writing_mode
-        ) as file:
+        try:
+            reloaded_config: Config = config_reloader.load_config(config=self.__config)
+            config_diff: ConfigDiff = diff_configs(running_config=self.__config, reloaded_config=reloaded_config)
+            self.__apply_config(config=reloaded_config, config_diff=config_diff)
+        except (ConfigReloadError, ValueError) as e:
+            await self.__log_error(msg=f'Running config is kept: {e}')
+            return
 
-            headers: List[str] = sorted(
-                [weather_resource.name for weather_resource in self.__config.weather_resources]
+        if not any(config_diff):
+            return
+
+        print(f'Config was reloaded: {config_diff}')
+        if config_diff.added_weather_resources and self.__config.results_sink == 'columnar':
+            await self.__log_warning(
+                msg=f'Results of added weather resources {config_diff.added_weather_resources} are stored '
+                    f'in columnar store after restart'
             )
-            headers += self.__config.base_headers
-            await file.write(self.__config.sep.join(headers) + self.__config.new_line_arg)
 
-    async def __poll_weather_resources(self) -> None:
+    def __apply_config(self, config: Config, config_diff: ConfigDiff) -> None:
         """
-        Poll each weather resource (API) for weather.
-        Received results will be sorted and written to the results file in .csv format.
+        Replaces running config by reloaded one. Added weather resources are polled from the next tick, removed
+        ones are not polled anymore, and changed ones are polled with new settings and with reset circuit breakers,
+        rate limiters and hedgers.
+
+        :param config: Reloaded :py:class:`Config`.
+        :param config_diff: :py:class:`ConfigDiff` between running and reloaded configs.
+        :raises: ValueError, if result keys of reloaded weather resources are malformed. Config is not changed.
         """
 
-        print('Polling weather resources...')
+        if not any(config_diff):
+            self.__config = config
+            return
 
-        tasks: List = []
-        for weather_resource in self.__config.weather_resources:
-            task: asyncio.Task = asyncio.create_task(
-                coro=self.__make_request_to_weather_resource(weather_resource=weather_resource)
-            )
-            tasks.append(task)
+        # Result keys are compiled before changing anything, so config with malformed keys is rejected as a whole:
+        result_extractors: Dict[Union[Tuple, AnyStr], ResultExtractor] = self.__compile_result_extractors(
+            weather_resources=config.weather_resources
+        )
 
-        weather_results: Tuple[WeatherResult] = await asyncio.gather(*tasks)
-        sorted_weather_results: List[WeatherResult] = await self.__sort_weather_results(weather_results=weather_results)
-        await self.__write_results_to_file(weather_results=sorted_weather_results)
+        self.__config = config
+        self.__result_extractors = result_extractors
+        self.__rendered_weather_resources = {}
+        for weather_resource_name in config_diff.changed_weather_resources + config_diff.removed_weather_resources:
+            self.__circuit_breakers.pop(weather_resource_name, None)
+            self.__rate_limiters.pop(weather_resource_name, None)
+            self.__request_hedgers.pop(weather_resource_name, None)
 
-        print('Successfully polled weather resources and saved result into file!')
+        if config_diff.removed_weather_resources:
+            self.__latest_temperatures = {
+                (location, weather_resource_name): temperature
+                for (location, weather_resource_name), temperature in self.__latest_temperatures.items()
+                if weather_resource_name not in config_diff.removed_weather_resources
+            }
+
+        # Columns and weights are replaced by new objects, so iterations in pipeline keep their own columns:
+        self.__columns_names = sorted(weather_resource.name for weather_resource in config.weather_resources)
+        self.__columns_indices = {name: index for index, name in enumerate(self.__columns_names)}
+        self.__consensus_aggregator = self.__create_consensus_aggregator()
+        self.__polling_scheduler.update_weather_resources(
+            weather_resources=config.weather_resources,
+            default_interval_in_seconds=config.customized_settings.check_interval_in_seconds,
+            missed_tick_policy=config.customized_settings.missed_tick_policy
+        )
 
-    async def __make_request_to_weather_resource(self, weather_resource: WeatherResource) -> WeatherResult:
+    def __create_consensus_aggregator(self) -> ConsensusAggregator:
+        """
+        :return: :py:class:`ConsensusAggregator` with aggregation strategy of config and weights of weather resources.
         """
-        Trys to receive weather from the resource (API) according params, provided by user in
-        corresponding config file.
 
-        After making request to weather resource, awaits until results of response from it will be processed and
-        temperature will be got for creating :py:class:`WeatherResult` object purpose.
+        return ConsensusAggregator(
+            strategy=self.__config.aggregation_strategy,
+            trim_proportion=self.__config.aggregation_trim_proportion,
+            mad_threshold=self.__config.aggregation_mad_threshold,
+            mad_floor=self.__config.aggregation_mad_floor,
+            weights={
+                weather_resource.name: weather_resource.weight
+                for weather_resource in self.__config.weather_resources if weather_resource.weight is not None
+            }
+        )
 
-        :param weather_resource: :py:class:`WeatherResource` object, which contents info about weather resource (API).
-        :return: :py:class:`WeatherResult`, which represents weather resource (API) name and temperature,
-        which was provided by the resource.
+    @asynccontextmanager
+    async def __create_lease_coordinator(self) -> AsyncIterator[Optional[LeaseCoordinator]]:
         """
+        Provides :py:class:`LeaseCoordinator` of this node, if coordination is enabled, which releases leases
+        on finish or cancellation. Leases are stored in SQLite database of config, if backend was not provided.
 
-        response_json: Optional[Dict] = None
+        :return: :py:class:`LeaseCoordinator` or None, if coordination is disabled.
+        """
 
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url=weather_resource.url,
-                    params=weather_resource.params,
-                    headers=weather_resource.headers
-                ) as response:
+        if not self.__config.coordination_enabled:
+            yield None
+            return
 
-                    response_json = await response.json(content_type=None)
+        lease_coordinator: LeaseCoordinator = LeaseCoordinator(
+            lease_backend=self.__lease_backend or SqliteLeaseBackend(database_path=self.__config.lease_database_path),
+            node_id=self.__config.coordination_node_id,
+            shards_number=self.__config.lease_shards_number,
+            lease_ttl_in_seconds=self.__config.lease_ttl_in_seconds
+        )
+        async with lease_coordinator:
+            yield lease_coordinator
 
-        except Exception as e:
-            await self.__logger.error(
-                msg=f'Failed to get weather from {weather_resource.name}.\n'
-                    f'Error: {e}\n',
-                exc_info=True
+    async def __check_weather_sharded(self) -> None:
+        """
+        Sharded mode of Weather Checker for polling of many locations by multiple cores.
+
+        Supervisor (this process) splits locations into contiguous shards, one per worker process. Each worker runs
+        its own weather checker loop with its own connection pool (see :py:meth:`__serve_shard`). Iterations are
+        driven by scheduler of supervisor: on each tick every worker gets a command with its locations and due
+        weather resources, and sends results rows and metadata of the iteration back over pipe.
+
+        Results of all shards are merged in order of shards (so in order of locations) and written by a single
+        writer of supervisor, so results file (or database, or columnar store) is the same, as in single process
+        mode. Metadata file has one line per iteration with metadata of each shard.
+
+        Shard sizes are rebalanced by :py:class:`ShardBalancer`, if latency of a shard, which falls behind, exceeds
+        latency of the fastest shard more than "shard_rebalance_threshold" times. New sizes are used from the next
+        sent command, so every iteration polls each location exactly once.
+        """
+
+        await self.__delete_last_launch_results()
+        if self.__config.results_sink == 'csv':
+            await self.__write_headers_to_results_file()
+
+        locations: List[Location] = self.__config.locations or [self.__config.default_location]
+        shards_number: int = min(self.__config.shards_number, len(locations))
+        shard_balancer: ShardBalancer = ShardBalancer(
+            items_number=len(locations),
+            shards_number=shards_number,
+            rebalance_threshold=self.__config.shard_rebalance_threshold
+        )
+
+        # Response cache file would be overwritten by each worker, so workers keep their caches in memory:
+        shard_config: Config = self.__config.model_copy(update={'shards_number': 1, 'response_cache_file_path': None})
+        context: multiprocessing.context.SpawnContext = multiprocessing.get_context('spawn')
+        connections: List[Connection] = []
+        processes: List[multiprocessing.Process] = []
+        for _ in range(shards_number):
+            supervisor_connection, worker_connection = context.Pipe()
+            process: multiprocessing.Process = context.Process(
+                target=_run_shard_worker,
+                kwargs={'config': shard_config, 'connection': worker_connection},
+                daemon=True
             )
+            process.start()
+            worker_connection.close()
+            connections.append(supervisor_connection)
+            processes.append(process)
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        # Each shard has its own receiving thread, and commands are sent by separate threads:
+        executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=2 * shards_number)
+        shards_queues: List[Dict[AnyStr, asyncio.Queue]] = [
+            {'results': asyncio.Queue(), 'metadata': asyncio.Queue()} for _ in range(shards_number)
+        ]
+        receivers: List[asyncio.Future] = [
+            loop.run_in_executor(executor, self.__receive_shard_messages, connection, shard_queues, loop)
+            for connection, shard_queues in zip(connections, shards_queues)
+        ]
+
+        sent_commands: asyncio.Queue = asyncio.Queue()
+        merger: Optional[asyncio.Task] = None
+        try:
+            async with (
+                self.__create_results_sink() as results_writer,
+                self.__create_results_writer(file_path=self.__config.results_metadata_file_path) as metadata_writer
+            ):
+                merger = asyncio.create_task(
+                    coro=self.__merge_shards_results(
+                        sent_commands=sent_commands,
+                        shards_queues=shards_queues,
+                        shard_balancer=shard_balancer,
+                        results_writer=results_writer,
+                        metadata_writer=metadata_writer
+                    )
+                )
+
+                self.__polling_scheduler.start()
+                iterations_number: int = self.__config.iteration_start_point
+                while iterations_number < self.__config.customized_settings.times_to_check and not merger.done():
+                    time_until_next_tick: float = self.__polling_scheduler.time_until_next_tick()
+                    if time_until_next_tick:
+                        print(f'Sleeping for {time_until_next_tick:.2f} seconds...\n')
+
+                    due_weather_resources_names: List[AnyStr] = [
+                        weather_resource.name
+                        for weather_resource in await self.__polling_scheduler.wait_for_due_weather_resources()
+                    ]
+
+                    sent_at: float = time.monotonic()
+                    for connection, shard_slice in zip(connections, shard_balancer.slices):
+                        await loop.run_in_executor(
+                            executor,
+                            connection.send,
+                            (locations[shard_slice], due_weather_resources_names)
+                        )
+
+                    sent_commands.put_nowait((sent_at, shard_balancer.sizes))
+                    iterations_number += self.__config.increment_value
 
+                sent_commands.put_nowait(None)
+                await merger
         finally:
-            temperature: Temperature = await self.__get_result_from_response(
-                response_json=response_json,
-                result_keys=weather_resource.result_keys
+            if merger is not None and not merger.done():
+                merger.cancel()
+                await asyncio.gather(merger, return_exceptions=True)
+
+            await loop.run_in_executor(executor, self.__stop_shards_workers, connections, processes)
+            await asyncio.gather(*receivers, return_exceptions=True)
+            for connection in connections:
+                connection.close()
+
+            executor.shutdown(wait=False)
+
+    async def __merge_shards_results(
+            self,
+            sent_commands: asyncio.Queue,
+            shards_queues: List[Dict[AnyStr, asyncio.Queue]],
+            shard_balancer: ShardBalancer,
+            results_writer: ResultsWriter,
+            metadata_writer: ResultsWriter
+    ) -> None:
+        """
+        Single writer of sharded mode. For each sent command takes results and metadata of the iteration from every
+        shard (workers process commands in order of sending), writes them together and rebalances shards by
+        latencies of shards in the iteration.
+
+        :param sent_commands: Queue of send times and shards sizes of sent commands. None means, that all commands
+        were sent.
+        :param shards_queues: Queues of received results and metadata messages of each shard.
+        :param shard_balancer: :py:class:`ShardBalancer` of locations.
+        :param results_writer: Writer of results sink.
+        :param metadata_writer: Writer of results metadata file.
+        """
+
+        while True:
+            sent_command: Optional[Tuple[float, List[int]]] = await sent_commands.get()
+            if sent_command is None:
+                return
+
+            sent_at, shards_sizes = sent_command
+            results_lines: List[Any] = []
+            shards_latencies: List[float] = []
+            shards_metadata: List[Dict[AnyStr, Any]] = []
+            for shard_index, shard_queues in enumerate(shards_queues):
+                received_at, shard_results_lines = await self.__get_shard_message(
+                    shard_queue=shard_queues['results'],
+                    shard_index=shard_index
+                )
+                _, shard_metadata_lines = await self.__get_shard_message(
+                    shard_queue=shard_queues['metadata'],
+                    shard_index=shard_index
+                )
+
+                results_lines.extend(shard_results_lines)
+                shards_latencies.append(received_at - sent_at)
+                shards_metadata.extend(json.loads(line) for line in shard_metadata_lines)
+
+            await results_writer.write(lines=results_lines)
+            await metadata_writer.write(
+                lines=[
+                    json.dumps(
+                        {
+                            'iteration': self.__iterations_counter,
+                            'shards_sizes': shards_sizes,
+                            'shards_latencies_in_seconds': [round(latency, 4) for latency in shards_latencies],
+                            'shards': shards_metadata
+                        }
+                    ) + self.__config.new_line_arg
+                ]
             )
 
-            return WeatherResult({weather_resource.name: temperature})
+            self.__iterations_counter += self.__config.increment_value
+            self.__iteration_statistics.register_iteration(latency_in_seconds=time.monotonic() - sent_at)
+            if shard_balancer.register_latencies(latencies_in_seconds=shards_latencies):
+                print(f'Shards were rebalanced by latencies {shards_latencies}: {shard_balancer}')
+
+            print('Successfully polled weather resources by shards and saved result into file!')
+            print(f'Iteration statistics: {self.__iteration_statistics}')
+            print(f'Shards statistics: {shard_balancer}')
 
     @staticmethod
-    async def __sort_weather_results(weather_results: Tuple[WeatherResult]) -> List[WeatherResult]:
+    async def __get_shard_message(shard_queue: asyncio.Queue, shard_index: int) -> Tuple[float, List[Any]]:
         """
-        Sorts weather results by name of weather resource (API), from which the result was received for purpose of
-        writing results in the same order, as headers with weather resources names were written to the result file.
+        :param shard_queue: Queue of received messages of shard.
+        :param shard_index: Index of shard.
+        :return: Receive time and lines of message.
+        :raises: RuntimeError, if worker of shard stopped before sending message.
+        """
+
+        shard_message: Optional[Tuple[float, List[Any]]] = await shard_queue.get()
+        if shard_message is None:
+            raise RuntimeError(f'Worker of shard {shard_index} stopped unexpectedly')
 
-        :param weather_results: Tuple of :py:class:`WeatherResult` objects, received from asyncio.gather() method.
-        :return: List of sorted :py:class:`WeatherResult` objects.
+        return shard_message
+
+    @staticmethod
+    def __receive_shard_messages(
+            connection: Connection,
+            shard_queues: Dict[AnyStr, asyncio.Queue],
+            loop: asyncio.AbstractEventLoop
+    ) -> None:
+        """
+        Receives messages of shard worker in thread, until worker closes its pipe, and puts them with receive time
+        to according queues of shard. None is put to all queues of shard after the last message.
         """
 
-        # Processes every WeatherResult from received tuple and unites in to single dictionary for sorting next:
-        united_weather_results = {}
-        for result in weather_results:
-            weather_resource_name, temperature = list(result.items())[0]
-            united_weather_results[weather_resource_name] = temperature
+        while True:
+            try:
+                message_kind, lines = connection.recv()
+            except (EOFError, OSError):
+                for shard_queue in shard_queues.values():
+                    loop.call_soon_threadsafe(shard_queue.put_nowait, None)
 
-        sorted_weather_results: List[WeatherResult] = [
-            WeatherResult(
-                {weather_result[0]: weather_result[1]}
-            ) for weather_result in sorted(united_weather_results.items())
-        ]
+                return
 
-        return sorted_weather_results
+            loop.call_soon_threadsafe(shard_queues[message_kind].put_nowait, (time.monotonic(), lines))
 
-    async def __get_result_from_response(
+    @staticmethod
+    def __stop_shards_workers(connections: List[Connection], processes: List[multiprocessing.Process]) -> None:
+        """
+        Sends stop command to shards workers and waits for them to process queued commands. Workers, which have not
+        finished in time, are terminated.
+        """
+
+        for connection in connections:
+            try:
+                connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+
+        for process in processes:
+            process.join(timeout=_SHARD_WORKER_STOP_TIMEOUT_IN_SECONDS)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+
+    async def __serve_shard(self, connection: Connection) -> None:
+        """
+        Polling loop of sharded worker process. Receives (locations, due weather resources names) commands from
+        supervisor and processes them by polling pipeline, until stop command (None) is received. Results rows
+        and metadata of each iteration are sent back to supervisor by :py:class:`ShardResultsWriter` objects
+        instead of being written by worker.
+
+        :param connection: Worker end of pipe to supervisor process.
+        """
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        send_lock: threading.Lock = threading.Lock()
+        weather_resources: Dict[AnyStr, WeatherResource] = {
+            weather_resource.name: weather_resource for weather_resource in self.__config.weather_resources
+        }
+        async with (
+            self.__create_client_session() as session,
+            ShardResultsWriter(
+                file_path=self.__get_results_sink_path(),
+                connection=connection,
+                message_kind='results',
+                send_lock=send_lock
+            ) as results_writer,
+            ShardResultsWriter(
+                file_path=self.__config.results_metadata_file_path,
+                connection=connection,
+                message_kind='metadata',
+                send_lock=send_lock
+            ) as metadata_writer
+        ):
+            self.__session = session
+            self.__results_writers = {
+                results_writer.file_path: results_writer,
+                metadata_writer.file_path: metadata_writer
+            }
+            try:
+                async with self.__create_polling_pipeline(
+                    fetch_stage=self.__fetch_shard_weather_results
+                ) as polling_pipeline:
+                    self.__polling_pipeline = polling_pipeline
+                    while True:
+                        try:
+                            shard_command: Optional[Tuple[List[Location], List[AnyStr]]] = (
+                                await loop.run_in_executor(None, connection.recv)
+                            )
+                        except EOFError:
+                            break
+
+                        if shard_command is None:
+                            break
+
+                        locations, due_weather_resources_names = shard_command
+                        await polling_pipeline.put(
+                            (
+                                [weather_resources[name] for name in due_weather_resources_names],
+                                locations
+                            )
+                        )
+            finally:
+                self.__session = None
+                self.__results_writers = {}
+                self.__polling_pipeline = None
+
+    async def __fetch_shard_weather_results(
             self,
-            response_json: Optional[Dict],
-            result_keys: List[AnyStr]
-    ) -> Temperature:
+            shard_task: Tuple[List[WeatherResource], List[Location]]
+    ) -> 'PollingIteration':
         """
-        if response in JSON format from weather API was  NOT received, returns :py:class:`Temperature`
-        with default value.
+        Fetch stage of polling pipeline of sharded worker or of node, which polling is coordinated by leases.
 
-        If response in JSON format from weather API was received, dynamically parses and getting data from it by keys,
-        which were provided by user in according configuration file.
+        :param shard_task: Due weather resources and locations of shard (or of leased shards).
+        :return: :py:class:`PollingIteration` with received weather results and iteration metadata.
+        """
 
-        :param response_json: A JSON object with weather data from according API.
-        :param result_keys: List of sorted keys for getting temperature from @response_json param.
-        :return: :py:class:`Temperature`
+        weather_resources, locations = shard_task
+        return await self.__fetch_weather_results(weather_resources=weather_resources, locations=locations)
+
+    def __create_polling_pipeline(
+            self,
+            fetch_stage: Optional[Callable[[Any], Awaitable['PollingIteration']]] = None
+    ) -> PollingPipeline:
+        """
+        :param fetch_stage: Fetch stage of pipeline. :py:meth:`__fetch_weather_results` of due weather resources
+        is used, if not provided.
+        :return: :py:class:`PollingPipeline` of polling iterations, which should be closed by caller.
+        """
+
+        return PollingPipeline(
+            stages=[
+                ('fetch', fetch_stage or self.__fetch_weather_results),
+                ('extract', self.__extract_weather_results),
+                ('aggregate', self.__aggregate_weather_results),
+                ('sink', self.__sink_weather_results)
+            ],
+            queue_max_size=self.__config.pipeline_queue_max_size
+        )
+
+    def __create_results_writer(self, file_path: Path) -> ResultsWriter:
+        """
+        :param file_path: Path to results file.
+        :return: :py:class:`ResultsWriter`, configured according to provided config, which should be closed by caller.
+        """
+
+        return ResultsWriter(
+            file_path=file_path,
+            mode=self.__config.results_file_writing_mode,
+            flush_max_lines=self.__config.results_flush_max_lines,
+            flush_interval_in_seconds=self.__config.results_flush_interval_in_seconds,
+            fsync_policy=self.__config.results_fsync_policy,
+            queue_max_size=self.__config.results_queue_max_size,
+            on_flush=self.__create_flush_callback(file_path=file_path)
+        )
+
+    def __create_results_sink(self) -> Union[ResultsWriter, SqliteResultsWriter, ColumnarResultsWriter]:
+        """
+        :return: Writer of results file, results database or columnar store, according to results sink from config,
+        which should be closed by caller.
+        """
+
+        if self.__config.results_sink == 'columnar':
+            return ColumnarResultsWriter(
+                store_path=self.__config.results_columnar_store_path,
+                providers=sorted(weather_resource.name for weather_resource in self.__config.weather_resources),
+                flush_max_lines=self.__config.results_flush_max_lines,
+                flush_interval_in_seconds=self.__config.results_flush_interval_in_seconds,
+                fsync_policy=self.__config.results_fsync_policy,
+                queue_max_size=self.__config.results_queue_max_size,
+                on_flush=self.__create_flush_callback(file_path=self.__config.results_columnar_store_path)
+            )
+
+        if self.__config.results_sink == 'sqlite':
+            return SqliteResultsWriter(
+                database_path=self.__config.results_database_path,
+                flush_max_lines=self.__config.results_flush_max_lines,
+                flush_interval_in_seconds=self.__config.results_flush_interval_in_seconds,
+                fsync_policy=self.__config.results_fsync_policy,
+                queue_max_size=self.__config.results_queue_max_size,
+                on_flush=self.__create_flush_callback(file_path=self.__config.results_database_path)
+            )
+
+        return self.__create_results_writer(file_path=self.__config.results_file_path)
+
+    def __get_results_sink_path(self) -> Path:
+        if self.__config.results_sink == 'columnar':
+            return self.__config.results_columnar_store_path
+
+        if self.__config.results_sink == 'sqlite':
+            return self.__config.results_database_path
+
+        return self.__config.results_file_path
+
+    @asynccontextmanager
+    async def __get_results_writer(self, file_path: Path) -> AsyncIterator[ResultsWriter]:
+        """
+        Provides long-lived results writer of file, if weather checker is running. Otherwise, (for example, if single
+        iteration is made outside polling cycle) provides temporary writer, which will be closed after usage.
+
+        :param file_path: Path to results file.
+        :return: :py:class:`ResultsWriter` of results file.
+        """
+
+        results_writer: Optional[ResultsWriter] = self.__results_writers.get(file_path)
+        if results_writer is not None:
+            yield results_writer
+            return
+
+        temporary_results_writer: Union[ResultsWriter, SqliteResultsWriter, ColumnarResultsWriter] = (
+            self.__create_results_sink() if file_path == self.__get_results_sink_path()
+            else self.__create_results_writer(file_path=file_path)
+        )
+
+        async with temporary_results_writer as results_writer:
+            yield results_writer
+
+    def __create_client_session(self) -> aiohttp.ClientSession:
         """
+        Creates :py:class:`aiohttp.ClientSession` with connection pool, configured according to provided config.
+        Connections statistics are collected via trace config of the session.
+
+        :return: :py:class:`aiohttp.ClientSession`, which should be closed by caller.
+        """
+
+        connector: aiohttp.TCPConnector = aiohttp.TCPConnector(
+            limit=self.__config.connection_limit,
+            limit_per_host=self.__config.connection_limit_per_host,
+            keepalive_timeout=self.__config.keepalive_timeout_in_seconds,
+            ttl_dns_cache=self.__config.dns_cache_ttl_in_seconds
+        )
+
+        return aiohttp.ClientSession(
+            connector=connector,
+            trace_configs=[self.__connection_statistics.trace_config]
+        )
 
-        temperature_value: Any = self.__config.default_temperature_value
+    @asynccontextmanager
+    async def __get_client_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """
+        Provides shared session, if weather checker is running. Otherwise, (for example, if single request is made
+        outside polling cycle) provides temporary session, which will be closed after usage.
 
-        if not response_json:
-            return Temperature(temperature_value)
+        :return: :py:class:`aiohttp.ClientSession` for making requests to weather resources (API).
+        """
 
-        for key in result_keys:
-            weather_info: Union[Dict | float | int] = temperature_value if temperature_value else response_json
-            temperature_value = weather_info.get(key, None)
+        if self.__session is not None:
+            yield self.__session
+            return
 
-        return Temperature(temperature_value)
+        async with self.__create_client_session() as session:
+            yield session
 
-    async def __write_results_to_file(self, weather_results: List[WeatherResult]) -> None:
+    async def __delete_last_launch_results(self) -> None:
+        """
+        Deletes last launch results file (.csv) and results metadata file (.jsonl) if they exist.
         """
-        Processes list of :py:class:`WeatherResult` to list of :py:class:`Temperature`,
-        awaits calculating average temperature and comprehenses it with the list of temperatures,
-        on the basis of which was calculated.
 
-        After processing temperatures, writes results to according file.
+        for file_path in (self.__config.results_file_path, self.__config.results_metadata_file_path):
+            try:
+                os.remove(file_path)
+            except (FileNotFoundError, OSError):
+                pass
 
-        :param weather_results: List of sorted :py:class:`WeatherResult` objects, each of which represents
-         weather resource (API) name and temperature, which was provided by the resource.
+    async def __write_headers_to_results_file(self) -> None:
         """
+        Creates headers for results file (in .csv format) and writes it to a new results file.
+        Headers is a location header and a list of sorted weather resources (API) names.
 
-        temperatures: List[Temperature] = [list(weather_result.values())[0] for weather_result in weather_results]
-        average_temperature: Temperature = await self.__calculate_average_temperature(temperatures=temperatures)
-        full_weather_results: List[AnyStr] = [str(temperature) for temperature in temperatures + [average_temperature]]
+        Order of weather resources names is calculated once on start, and results rows are assembled in the same
+        order by columns indices of weather resources.
+        """
 
         async with aiofiles.open(
             file=self.__config.results_file_path,
             mode=self.__config.results_file_writing_mode
         ) as file:
+            await file.write(self.__create_headers_line(columns_names=self.__columns_names))
+
+        self.__written_columns_names = self.__columns_names
 
-            await file.write(self.__config.sep.join(full_weather_results) + self.__config.new_line_arg)
+    def __create_headers_line(self, columns_names: List[AnyStr]) -> AnyStr:
+        """
+        :param columns_names: Sorted names of weather resources.
+        :return: Results file headers line with line separator.
+        """
+
+        headers: List[str] = [self.__config.location_header]
+        headers += columns_names
+        headers += self.__config.base_headers
+        if self.__consensus_aggregator.strategy != 'mean':
+            headers.append(self.__config.rejected_header)
+
+        return self.__config.sep.join(headers) + self.__config.new_line_arg
 
-    async def __calculate_average_temperature(self, temperatures: List[Temperature]) -> Temperature:
+    async def __poll_weather_resources(self, weather_resources: Optional[List[WeatherResource]] = None) -> None:
         """
-        Calculate the average temperature based on all weather results from different weather resources.
+        Poll each provided weather resource (API) for weather in each location.
+        Received results will be sorted and written to the results file in .csv format, one row per location.
+        Weather resources, which were not polled in this iteration, are written with their latest received
+        temperature for according location.
 
-        :param temperatures: List of :py:class:`Temperature` objects.
-        :return: :py:class:`Temperature`
+        Runs all stages of polling pipeline one after another for a single iteration.
+
+        :param weather_resources: List of :py:class:`WeatherResource` objects, which should be polled.
+        All weather resources from config will be polled, if not provided.
         """
 
-        temperature_sum: float = self.__config.default_average_temperature_value
-        results_counter: int = self.__config.default_counter_value
-        default_temperature: Temperature = Temperature(self.__config.default_temperature_value)
-        for temperature in temperatures:
-            if temperature != default_temperature:
-                temperature_sum += temperature
-                results_counter += self.__config.increment_value
+        polling_iteration: PollingIteration = await self.__fetch_weather_results(weather_resources=weather_resources)
+        polling_iteration = await self.__extract_weather_results(polling_iteration=polling_iteration)
+        polling_iteration = await self.__aggregate_weather_results(polling_iteration=polling_iteration)
+        await self.__sink_weather_results(polling_iteration=polling_iteration)
+
+    async def __fetch_weather_results(
+            self,
+            weather_resources: Optional[List[WeatherResource]] = None,
+            locations: Optional[List[Location]] = None
+    ) -> PollingIteration:
+        """
+        Fetch stage of polling pipeline. Polls each provided weather resource (API) for weather in each location.
+
+        (location, weather resource) pairs are processed by a bounded number of workers, which is limited by global
+        concurrency limit. Requests to each weather resource are also limited by per resource concurrency limit.
+
+        Workers, which have not finished until iteration deadline, are cancelled, and results, which were not
+        received, will be recorded with default temperature by extract stage, so the results rows are written on time.
+
+        :param weather_resources: List of :py:class:`WeatherResource` objects, which should be polled.
+        All weather resources from config will be polled, if not provided.
+        :param locations: List of :py:class:`Location` objects, which should be polled (locations of shard in sharded
+        mode). All locations from config will be polled, if not provided.
+        :return: :py:class:`PollingIteration` with received weather results and iteration metadata.
+        """
+
+        print('Polling weather resources...')
+
+        started_at: float = time.monotonic()
+        timestamp: AnyStr = datetime.now(timezone.utc).isoformat(timespec='milliseconds')
+        self.__results_statuses = {}
+        self.__results_latencies = {}
+        self.__single_flight = SingleFlight()
+        if weather_resources is None:
+            weather_resources = self.__config.weather_resources
+
+        locations = locations or self.__config.locations or [self.__config.default_location]
+
+        # Columns are taken once, so config reload during the iteration doesn't move its temperatures:
+        columns_names: List[AnyStr] = self.__columns_names
+        columns_indices: Dict[AnyStr, int] = self.__columns_indices
+        locations_results: List[LocationResults] = [
+            LocationResults(
+                location=location,
+                columns_number=len(columns_names),
+                default_temperature=self.__config.default_temperature_value
+            ) for location in locations
+        ]
+
+        # Location-major order interleaves weather resources, so workers are not blocked by single resource limit.
+        # Weather resources with batch mode are requested once per batch of consecutive locations:
+        polling_batches: Iterator[Tuple[List[LocationResults], WeatherResource]] = (
+            (locations_results[location_index:location_index + (weather_resource.batch_size or 1)], weather_resource)
+            for location_index in range(len(locations_results))
+            for weather_resource in weather_resources
+            if not location_index % (weather_resource.batch_size or 1)
+        )
+
+        resources_semaphores: Dict[AnyStr, asyncio.Semaphore] = {
+            weather_resource.name: asyncio.Semaphore(
+                weather_resource.max_concurrent_requests or self.__config.max_concurrent_requests_per_resource
+            ) for weather_resource in weather_resources
+        }
+
+        workers_number: int = min(
+            self.__config.max_concurrent_requests,
+            len(locations) * len(weather_resources)
+        )
+
+        workers: List[asyncio.Task] = [
+            asyncio.create_task(
+                coro=self.__poll_weather_resources_worker(
+                    polling_batches=polling_batches,
+                    resources_semaphores=resources_semaphores,
+                    columns_indices=columns_indices
+                )
+            ) for _ in range(workers_number)
+        ]
+
+        iteration_deadline: Optional[float] = self.__get_iteration_deadline()
+        self.__iteration_deadline_time = None if iteration_deadline is None else time.monotonic() + iteration_deadline
+        if workers:
+            _, pending_workers = await asyncio.wait(workers, timeout=iteration_deadline)
+            for worker in pending_workers:
+                worker.cancel()
+
+            await asyncio.gather(*pending_workers, return_exceptions=True)
+
+        polling_iteration: PollingIteration = PollingIteration(
+            polled_weather_resources=weather_resources,
+            columns_names=columns_names,
+            locations_results=locations_results,
+            results_metadata=self.__create_results_metadata(),
+            started_at=started_at,
+            timestamp=timestamp,
+            results_statuses=self.__results_statuses,
+            results_latencies=self.__results_latencies
+        )
+
+        self.__iterations_counter += self.__config.increment_value
+        return polling_iteration
+
+    async def __extract_weather_results(self, polling_iteration: PollingIteration) -> PollingIteration:
+        """
+        Extract stage of polling pipeline. Registers received temperatures in rolling statistics and adds snapshot
+        of windows, updated in the iteration, to iteration metadata and fills results, which were not received
+        in the iteration.
+
+        :param polling_iteration: :py:class:`PollingIteration` after fetch stage.
+        :return: :py:class:`PollingIteration` with complete weather results.
+        """
+
+        updated_window_keys: List[Tuple[AnyStr, AnyStr]] = []
+        for location_results in polling_iteration.locations_results:
+            for column_index, temperature in enumerate(location_results.temperatures):
+                if location_results.received[column_index] and temperature != self.__config.default_temperature_value:
+                    window_key: Tuple[AnyStr, AnyStr] = (
+                        location_results.location.name,
+                        polling_iteration.columns_names[column_index]
+                    )
+                    self.__rolling_statistics.register(
+                        location_name=window_key[0],
+                        weather_resource_name=window_key[1],
+                        temperature=temperature
+                    )
+                    updated_window_keys.append(window_key)
+
+        # Only updated windows are written, so size of metadata doesn't grow with number of all windows:
+        polling_iteration.results_metadata['rolling_statistics'] = self.__rolling_statistics.snapshot(
+            window_keys=updated_window_keys
+        )
+        await self.__fill_missing_weather_results(
+            locations_results=polling_iteration.locations_results,
+            columns_names=polling_iteration.columns_names,
+            polled_weather_resources=polling_iteration.polled_weather_resources
+        )
+
+        return polling_iteration
+
+    async def __aggregate_weather_results(self, polling_iteration: PollingIteration) -> PollingIteration:
+        """
+        Aggregate stage of polling pipeline. Calculates average temperature of each location and creates results
+        file rows or, if results are written to SQLite database or columnar store, creates their rows.
+        Temperatures, rejected by aggregation strategy, are added to iteration metadata.
+
+        :param polling_iteration: :py:class:`PollingIteration` after extract stage.
+        :return: :py:class:`PollingIteration` with results file rows, database rows or columnar store rows.
+        """
 
-        if results_counter == self.__config.default_counter_value:
-            return Temperature(self.__config.default_average_temperature_value)
+        consensus_temperatures: List[Tuple[Temperature, List[AnyStr]]] = self.__aggregate_temperatures(
+            locations_results=polling_iteration.locations_results,
+            columns_names=polling_iteration.columns_names
+        )
+        rejected_temperatures: Dict[AnyStr, List[AnyStr]] = {
+            location_results.location.name: rejected_weather_resources_names
+            for location_results, (_, rejected_weather_resources_names) in zip(
+                polling_iteration.locations_results,
+                consensus_temperatures
+            ) if rejected_weather_resources_names
+        }
+        if rejected_temperatures:
+            polling_iteration.results_metadata['rejected_temperatures'] = rejected_temperatures
+
+        polling_iteration = polling_iteration._replace(consensus_temperatures=consensus_temperatures)
+        if self.__config.results_sink == 'columnar':
+            return polling_iteration._replace(
+                results_rows=self.__create_columnar_rows(polling_iteration=polling_iteration)
+            )
+
+        if self.__config.results_sink == 'sqlite':
+            return polling_iteration._replace(
+                results_rows=self.__create_results_rows(polling_iteration=polling_iteration)
+            )
+
+        return polling_iteration._replace(
+            results_lines=self.__create_locations_results_lines(
+                locations_results=polling_iteration.locations_results,
+                consensus_temperatures=consensus_temperatures
+            )
+        )
+
+    async def __sink_weather_results(self, polling_iteration: PollingIteration) -> None:
+        """
+        Sink stage of polling pipeline. Writes results rows and metadata of the iteration and reports statistics.
+
+        :param polling_iteration: :py:class:`PollingIteration` after aggregate stage.
+        """
+
+        async with self.__get_results_writer(file_path=self.__get_results_sink_path()) as results_writer:
+            if self.__config.results_sink != 'csv':
+                await results_writer.write(lines=polling_iteration.results_rows)
+            elif self.__written_columns_names in (None, polling_iteration.columns_names):
+                await results_writer.write(lines=polling_iteration.results_lines)
+            else:
+                # Columns were changed by config reload, so rows of the iteration are preceded by new headers:
+                await results_writer.write(
+                    lines=[self.__create_headers_line(columns_names=polling_iteration.columns_names)]
+                    + polling_iteration.results_lines
+                )
+                self.__written_columns_names = polling_iteration.columns_names
+
+        await self.__write_results_metadata_to_file(results_metadata=polling_iteration.results_metadata)
+        if self.__config.results_server_enabled:
+            self.__index_results(polling_iteration=polling_iteration)
+
+        iteration_latency_in_seconds: float = time.monotonic() - polling_iteration.started_at
+        self.__iteration_statistics.register_iteration(latency_in_seconds=iteration_latency_in_seconds)
+        if self.__polling_metrics is not None:
+            self.__polling_metrics.register_iteration(latency_in_seconds=iteration_latency_in_seconds)
+
+        print('Successfully polled weather resources and saved result into file!')
+        print(f'Iteration statistics: {self.__iteration_statistics}')
+        print(f'Connection statistics: {self.__connection_statistics}')
+        print(f'Response cache statistics: {self.__response_cache}')
+        print(
+            'Request coalescing statistics: ' + ', '.join(
+                f'{name}={value}' for name, value in polling_iteration.results_metadata['request_coalescing'].items()
+            )
+        )
+        if self.__timeout_statistics.snapshot():
+            print(f'Timeout statistics: {self.__timeout_statistics}')
+
+        if self.__oversized_responses:
+            print(f'Oversized responses: {dict(self.__oversized_responses)}')
+
+        for weather_resource_name, rate_limiter in self.__rate_limiters.items():
+            if rate_limiter.waits or rate_limiter.retry_after_counter:
+                print(f'Rate limiter statistics of {weather_resource_name}: {rate_limiter}')
+
+        for weather_resource_name, request_hedger in self.__request_hedgers.items():
+            print(f'Hedging statistics of {weather_resource_name}: {request_hedger}')
+
+        if self.__polling_pipeline is not None:
+            print(f'Pipeline statistics: {self.__polling_pipeline}')
+
+    def __index_results(self, polling_iteration: PollingIteration) -> None:
+        """
+        Updates results index by results of the iteration, so they are served by results server.
+
+        :param polling_iteration: :py:class:`PollingIteration` after aggregate stage.
+        """
+
+        results_rows: List[ResultRow] = (
+            polling_iteration.results_rows if self.__config.results_sink == 'sqlite'
+            else self.__create_results_rows(polling_iteration=polling_iteration)
+        )
+        self.__results_index.update(
+            iteration=polling_iteration.results_metadata['iteration'],
+            timestamp=polling_iteration.timestamp,
+            results_rows=results_rows,
+            average_temperatures={
+                location_results.location.name: consensus_temperature
+                for location_results, consensus_temperature in zip(
+                    polling_iteration.locations_results,
+                    polling_iteration.consensus_temperatures
+                )
+            },
+            # Weather resources, which were not due, keep their statistics in documents of polled locations:
+            rolling_statistics=self.__rolling_statistics.snapshot(
+                window_keys=[(results_row.location, results_row.provider) for results_row in results_rows]
+            )
+        )
+
+    def __create_results_metadata(self) -> Dict[AnyStr, Any]:
+        """
+        :return: Metadata of current iteration (circuit breakers states of all weather resources and statistics of
+        coalescing of identical requests).
+        """
+
+        return {
+            'iteration': self.__iterations_counter,
+            'circuit_breakers': {
+                weather_resource.name: self.__get_circuit_breaker(weather_resource_name=weather_resource.name).snapshot()
+                for weather_resource in self.__config.weather_resources
+            },
+            'request_coalescing': self.__single_flight.snapshot()
+        }
+
+    async def __write_results_metadata_to_file(self, results_metadata: Dict[AnyStr, Any]) -> None:
+        """
+        Writes metadata of iteration to results metadata file as a single JSON line.
+
+        :param results_metadata: Metadata of iteration, created by :py:meth:`__create_results_metadata`.
+        """
+
+        async with self.__get_results_writer(file_path=self.__config.results_metadata_file_path) as metadata_writer:
+            await metadata_writer.write(lines=[json.dumps(results_metadata) + self.__config.new_line_arg])
+
+    def __get_iteration_deadline(self) -> Optional[float]:
+        """
+        :return: Iteration deadline from config or, if it was not provided, default polling interval, so one iteration
+        can't overrun next tick. None (no deadline), if polling interval is zero.
+        """
+
+        if self.__config.iteration_deadline_in_seconds is not None:
+            return self.__config.iteration_deadline_in_seconds
+
+        return self.__config.customized_settings.check_interval_in_seconds or None
+
+    async def __fill_missing_weather_results(
+            self,
+            locations_results: List[LocationResults],
+            columns_names: List[AnyStr],
+            polled_weather_resources: List[WeatherResource]
+    ) -> None:
+        """
+        Sets temperature of each weather resource (API), which result was not received for location
+        in current iteration:
+            - if such resource was polled in current iteration, its result was not received until iteration deadline,
+            so default temperature is used and deadline cancellation is registered for the resource;
+            - if such resource was not due in current iteration, its latest received temperature for the location
+            is used (or default temperature, if it was never received).
+
+        Received in current iteration temperatures are remembered as latest for next iterations.
+
+        :param locations_results: List of :py:class:`LocationResults` objects with received temperatures.
+        :param columns_names: Names of weather resources in order of results columns.
+        :param polled_weather_resources: List of :py:class:`WeatherResource` objects, polled in current iteration.
+        """
+
+        polled_weather_resources_names: Set[AnyStr] = {
+            weather_resource.name for weather_resource in polled_weather_resources
+        }
+
+        default_temperature: Temperature = Temperature(self.__config.default_temperature_value)
+        for location_results in locations_results:
+            location: Location = location_results.location
+            temperatures: List[Temperature] = location_results.temperatures
+            for column_index, weather_resource_name in enumerate(columns_names):
+                if location_results.received[column_index]:
+                    self.__latest_temperatures[(location, weather_resource_name)] = temperatures[column_index]
+                elif weather_resource_name in polled_weather_resources_names:
+                    self.__timeout_statistics.register_deadline_cancellation(weather_resource_name=weather_resource_name)
+                    temperatures[column_index] = default_temperature
+                else:
+                    temperatures[column_index] = self.__latest_temperatures.get(
+                        (location, weather_resource_name),
+                        default_temperature
+                    )
+
+    async def __poll_weather_resources_worker(
+            self,
+            polling_batches: Iterator[Tuple[List[LocationResults], WeatherResource]],
+            resources_semaphores: Dict[AnyStr, asyncio.Semaphore],
+            columns_indices: Dict[AnyStr, int]
+    ) -> None:
+        """
+        Takes (locations, weather resource) batches from shared iterator one by one, until it is exhausted,
+        makes request to weather resource for according locations and writes temperatures to the slot of weather
+        resource in locations results. Batch contains a single location, unless weather resource has batch mode.
+
+        :param polling_batches: Shared between all workers iterator of location results batches and weather resources.
+        :param resources_semaphores: Semaphores, limiting concurrent requests to each weather resource.
+        :param columns_indices: Indices of weather resources columns in locations results of the iteration.
+        """
+
+        for batch_locations_results, weather_resource in polling_batches:
+            locations: List[Location] = [location_results.location for location_results in batch_locations_results]
+            async with resources_semaphores[weather_resource.name]:
+                started_at: float = time.monotonic()
+                if len(locations) == 1:
+                    temperatures: List[Temperature] = [
+                        await self.__request_temperature(weather_resource=weather_resource, location=locations[0])
+                    ]
+                else:
+                    temperatures = await self.__request_batch_temperatures(
+                        weather_resource=weather_resource,
+                        locations=locations
+                    )
+
+                latency_in_seconds: float = time.monotonic() - started_at
+
+            column_index: int = columns_indices[weather_resource.name]
+            for location_results, temperature in zip(batch_locations_results, temperatures):
+                self.__results_latencies[(location_results.location, weather_resource.name)] = latency_in_seconds
+                location_results.set_temperature(column_index=column_index, temperature=temperature)
+
+    def __render_weather_resource(self, weather_resource: WeatherResource, location: Location) -> WeatherResource:
+        """
+        Substitutes location placeholders (for example, "{latitude}") in url, params and headers of weather resource
+        template. Rendered weather resources are cached, so every pair is rendered only once.
+
+        :param weather_resource: :py:class:`WeatherResource` template.
+        :param location: :py:class:`Location`, which data will be substituted to template.
+        :return: :py:class:`WeatherResource` for according location.
+        """
+
+        # Template is stored with rendered weather resource, so requests of iteration, which was started before
+        # config reload, don't reuse renderings of changed template (and vice versa):
+        cache_key: Tuple[AnyStr, Location] = (weather_resource.name, location)
+        cached_rendering: Optional[Tuple[WeatherResource, WeatherResource]] = (
+            self.__rendered_weather_resources.get(cache_key)
+        )
+        if cached_rendering is not None and cached_rendering[0] is weather_resource:
+            return cached_rendering[1]
+
+        # Missing location data is not substituted, so according placeholders are left as is:
+        location_values: _LocationValues = _LocationValues(
+            {field: value for field, value in location._asdict().items() if value is not None}
+        )
+        rendered_weather_resource = weather_resource._replace(
+            url=self.__render_template_value(value=weather_resource.url, location_values=location_values),
+            params={
+                key: self.__render_template_value(value=value, location_values=location_values)
+                for key, value in (weather_resource.params or {}).items()
+            },
+            headers={
+                key: self.__render_template_value(value=value, location_values=location_values)
+                for key, value in (weather_resource.headers or {}).items()
+            }
+        )
+
+        self.__rendered_weather_resources[cache_key] = (weather_resource, rendered_weather_resource)
+        return rendered_weather_resource
+
+    @staticmethod
+    def __render_template_value(value: Any, location_values: '_LocationValues') -> Any:
+        if isinstance(value, str) and '{' in value:
+            return value.format_map(location_values)
+
+        return value
+
+    async def __request_temperature(self, weather_resource: WeatherResource, location: Location) -> Temperature:
+        """
+        Receives temperature from weather resource (API) for provided location. Locations, for which weather resource
+        template is rendered to identical request (for example, duplicated cities or weather resource, which ignores
+        coordinates), share a single request in flight.
+
+        :param weather_resource: :py:class:`WeatherResource` object, which contents info about weather resource (API).
+        :param location: :py:class:`Location`, for which weather should be received.
+        :return: :py:class:`Temperature`, which was provided by the resource, or default temperature.
+        """
+
+        weather_resource = self.__render_weather_resource(weather_resource=weather_resource, location=location)
+        request_key: Tuple[AnyStr, AnyStr] = (
+            weather_resource.name,
+            self.__response_cache.make_key(
+                url=weather_resource.url,
+                params=weather_resource.params,
+                headers=weather_resource.headers
+            )
+        )
+
+        temperature, result_status = await self.__single_flight.run(
+            key=request_key,
+            make_call=lambda: self.__request_rendered_temperature(weather_resource=weather_resource, location=location)
+        )
+        self.__results_statuses[(location, weather_resource.name)] = result_status
+        return temperature
+
+    async def __request_rendered_temperature(
+            self,
+            weather_resource: WeatherResource,
+            location: Location
+    ) -> Tuple[Temperature, ResultStatus]:
+        """
+        Receives temperature from weather resource (API): from response cache, if cached response is fresh,
+        otherwise by request, which is made, if circuit breaker of weather resource allows it.
+
+        :param weather_resource: Rendered :py:class:`WeatherResource` object.
+        :param location: :py:class:`Location`, for which weather resource was rendered.
+        :return: :py:class:`Temperature`, which was provided by the resource, or default temperature,
+        and status of result.
+        """
+
+        cache_key: Optional[AnyStr] = None
+        cached_response: Optional[CachedResponse] = None
+        headers: Dict = weather_resource.headers
+        if weather_resource.cache_ttl_in_seconds is not None:
+            cache_key = self.__response_cache.make_key(
+                url=weather_resource.url,
+                params=weather_resource.params,
+                headers=weather_resource.headers
+            )
+
+            cached_response = self.__response_cache.get(key=cache_key)
+            if cached_response is not None:
+                return cached_response.temperature, 'cached'
+
+            cached_response = self.__response_cache.get_stale(key=cache_key)
+            headers = self.__create_conditional_headers(headers=headers, cached_response=cached_response)
+
+        response, failure_status = await self.__make_request_with_circuit_breaker(
+            weather_resource=weather_resource,
+            location=location,
+            headers=headers
+        )
+        if response is None:
+            return Temperature(self.__config.default_temperature_value), failure_status
+
+        response_status, response_json, response_headers = response
+        if response_status == HTTPStatus.NOT_MODIFIED and cached_response is not None:
+            self.__response_cache.revalidate(key=cache_key, ttl_in_seconds=weather_resource.cache_ttl_in_seconds)
+            return cached_response.temperature, 'not_modified'
+
+        temperature: Temperature = await self.__get_result_from_response(
+            response_json=response_json,
+            result_keys=weather_resource.result_keys
+        )
+
+        result_status: ResultStatus = 'invalid' if temperature == self.__config.default_temperature_value else 'ok'
+        if cache_key is not None and temperature != self.__config.default_temperature_value:
+            self.__response_cache.put(
+                key=cache_key,
+                temperature=temperature,
+                ttl_in_seconds=weather_resource.cache_ttl_in_seconds,
+                etag=response_headers.get(hdrs.ETAG),
+                last_modified=response_headers.get(hdrs.LAST_MODIFIED)
+            )
+
+        return temperature, result_status
+
+    async def __request_batch_temperatures(
+            self,
+            weather_resource: WeatherResource,
+            locations: List[Location]
+    ) -> List[Temperature]:
+        """
+        Receives temperatures from weather resource (API) with batch mode for multiple locations by a single request.
+        Identical batch requests share a single request in flight.
+
+        :param weather_resource: :py:class:`WeatherResource` object with batch mode.
+        :param locations: List of :py:class:`Location` objects, not longer than batch size of weather resource.
+        :return: List of :py:class:`Temperature` objects in order of locations.
+        """
+
+        batch_weather_resource: WeatherResource = self.__render_batch_weather_resource(
+            weather_resource=weather_resource,
+            locations=locations
+        )
+        request_key: Tuple[AnyStr, AnyStr] = (
+            batch_weather_resource.name,
+            self.__response_cache.make_key(
+                url=batch_weather_resource.url,
+                params=batch_weather_resource.params,
+                headers=batch_weather_resource.headers
+            )
+        )
+
+        temperatures, results_statuses = await self.__single_flight.run(
+            key=request_key,
+            make_call=lambda: self.__request_rendered_batch_temperatures(
+                weather_resource=batch_weather_resource,
+                locations=locations
+            )
+        )
+        for location, result_status in zip(locations, results_statuses):
+            self.__results_statuses[(location, weather_resource.name)] = result_status
+
+        return temperatures
+
+    def __render_batch_weather_resource(
+            self,
+            weather_resource: WeatherResource,
+            locations: List[Location]
+    ) -> WeatherResource:
+        """
+        Renders weather resource template for each location of batch and joins values of params, which contain
+        location placeholders, by batch separator of weather resource, for example, "59.94,51.51" latitudes.
+
+        :param weather_resource: :py:class:`WeatherResource` template with batch mode.
+        :param locations: List of :py:class:`Location` objects of batch.
+        :return: :py:class:`WeatherResource` for all locations of batch.
+        """
+
+        rendered_weather_resources: List[WeatherResource] = [
+            self.__render_weather_resource(weather_resource=weather_resource, location=location)
+            for location in locations
+        ]
+
+        batch_sep: AnyStr = weather_resource.batch_sep or self.__config.batch_sep
+        batch_params: Dict = {}
+        for key, value in (weather_resource.params or {}).items():
+            if isinstance(value, str) and '{' in value:
+                batch_params[key] = batch_sep.join(
+                    str(rendered_weather_resource.params[key])
+                    for rendered_weather_resource in rendered_weather_resources
+                )
+            else:
+                batch_params[key] = value
+
+        # URL and headers of batch weather resource have no location placeholders (checked by config):
+        return rendered_weather_resources[0]._replace(params=batch_params)
+
+    async def __request_rendered_batch_temperatures(
+            self,
+            weather_resource: WeatherResource,
+            locations: List[Location]
+    ) -> Tuple[List[Temperature], List[ResultStatus]]:
+        """
+        Makes batch request, if circuit breaker of weather resource allows it, and extracts temperature of each
+        location from array of results in response. Batch responses are not cached.
+
+        :param weather_resource: Rendered batch :py:class:`WeatherResource` object.
+        :param locations: List of :py:class:`Location` objects of batch.
+        :return: :py:class:`Temperature` and status of result of each location.
+        """
+
+        default_temperature: Temperature = Temperature(self.__config.default_temperature_value)
+        response, failure_status = await self.__make_request_with_circuit_breaker(
+            weather_resource=weather_resource,
+            location=Location(name=', '.join(location.name for location in locations)),
+            headers=weather_resource.headers
+        )
+        if response is None:
+            return [default_temperature] * len(locations), [failure_status] * len(locations)
+
+        _, response_json, _ = response
+        locations_responses_json: List[Any] = self.__split_batch_response(
+            response_json=response_json,
+            batch_results_keys=weather_resource.batch_results_keys
+        )
+
+        result_extractor: ResultExtractor = self.__get_result_extractor(result_keys=weather_resource.result_keys)
+        temperatures: List[Temperature] = [
+            Temperature(result_extractor.extract(location_response_json))
+            for location_response_json in locations_responses_json[:len(locations)]
+        ]
+        # Response with fewer results than locations is invalid for the rest of locations:
+        temperatures += [default_temperature] * (len(locations) - len(temperatures))
+
+        return temperatures, [
+            'invalid' if temperature == self.__config.default_temperature_value else 'ok'
+            for temperature in temperatures
+        ]
+
+    @staticmethod
+    def __split_batch_response(response_json: Any, batch_results_keys: Union[List, AnyStr, None]) -> List[Any]:
+        """
+        :param response_json: Decoded JSON of batch response.
+        :param batch_results_keys: Path to array of locations results in response. Response itself is the array,
+        if path is not provided.
+        :return: List of responses of locations in order of batch locations. Single object is a result of the only
+        location. Empty list, if array was not found.
+        """
+
+        locations_responses_json: Any = response_json
+        try:
+            for batch_results_key in ResultExtractor.compile_path(result_keys=batch_results_keys):
+                locations_responses_json = locations_responses_json[batch_results_key]
+        except (KeyError, IndexError, TypeError):
+            return []
+
+        if isinstance(locations_responses_json, dict):
+            return [locations_responses_json]
+
+        return locations_responses_json if isinstance(locations_responses_json, list) else []
+
+    async def __make_request_with_circuit_breaker(
+            self,
+            weather_resource: WeatherResource,
+            location: Location,
+            headers: Dict
+    ) -> Tuple[Optional[Tuple[int, Optional[Dict], Dict]], Optional[ResultStatus]]:
+        """
+        Makes request to weather resource (with retries), if circuit breaker of weather resource allows it,
+        and registers its success or failure in circuit breaker.
+
+        :param weather_resource: Rendered :py:class:`WeatherResource` object.
+        :param location: :py:class:`Location`, for which weather should be received.
+        :param headers: Request headers.
+        :return: Response (see :py:meth:`__make_request_with_retries`) or None and status of failure:
+        "circuit_open", if request was not allowed, or "failed", if request failed.
+        """
+
+        circuit_breaker: CircuitBreaker = self.__get_circuit_breaker(weather_resource_name=weather_resource.name)
+        previous_circuit_breaker_state: CircuitBreakerState = circuit_breaker.state
+        request_allowed: bool = circuit_breaker.allow_request()
+        await self.__log_circuit_breaker_transition(
+            weather_resource_name=weather_resource.name,
+            previous_state=previous_circuit_breaker_state,
+            state=circuit_breaker.state
+        )
+
+        if not request_allowed:
+            return None, 'circuit_open'
+
+        response: Optional[Tuple[int, Optional[Dict], Dict]] = await self.__make_request_with_retries(
+            weather_resource=weather_resource,
+            location=location,
+            headers=headers
+        )
+
+        previous_circuit_breaker_state = circuit_breaker.state
+        if response is None:
+            circuit_breaker.register_failure()
+        else:
+            circuit_breaker.register_success()
+
+        await self.__log_circuit_breaker_transition(
+            weather_resource_name=weather_resource.name,
+            previous_state=previous_circuit_breaker_state,
+            state=circuit_breaker.state
+        )
+
+        if response is None:
+            return None, 'failed'
+
+        return response, None
+
+    async def __make_request_with_retries(
+            self,
+            weather_resource: WeatherResource,
+            location: Location,
+            headers: Dict
+    ) -> Optional[Tuple[int, Optional[Dict], Dict]]:
+        """
+        Makes request to weather resource and retries it with jittered exponential backoff, if request failed due to
+        transient error (timeout, connection error, "429 Too Many Requests" or server error).
+        Retries are stopped, if next attempt would start after iteration deadline.
+
+        Each attempt waits for its turn in rate limiter of weather resource. "Retry-After" header of "429 Too Many
+        Requests" and "503 Service Unavailable" responses blocks rate limiter (so requests for other locations wait
+        too) and is used as a minimal backoff before retry.
+
+        If hedging is enabled for weather resource, attempt, which is not completed within observed latency quantile
+        of the resource, is hedged by identical request (see :py:class:`RequestHedger`).
+
+        :param weather_resource: Rendered :py:class:`WeatherResource` object.
+        :param location: :py:class:`Location`, for which weather should be received.
+        :param headers: Request headers.
+        :return: Tuple of response status, response JSON and response headers or None, if all attempts failed.
+        """
+
+        timeout: aiohttp.ClientTimeout = aiohttp.ClientTimeout(
+            total=weather_resource.timeout_in_seconds or self.__config.request_timeout_in_seconds
+        )
+
+        rate_limiter: RateLimiter = self.__get_rate_limiter(weather_resource=weather_resource)
+        request_hedger: Optional[RequestHedger] = self.__get_request_hedger(weather_resource=weather_resource)
+        attempt: int = self.__config.default_counter_value
+        while True:
+            retry_after_in_seconds: Optional[float] = None
+
+            # Cancellation (for example, due to iteration deadline) is not caught here and is propagated to caller:
+            try:
+                def make_request() -> Awaitable[Tuple[int, Optional[Dict], Dict]]:
+                    return self.__send_request(
+                        weather_resource=weather_resource,
+                        headers=headers,
+                        timeout=timeout,
+                        rate_limiter=rate_limiter,
+                        request_hedger=request_hedger
+                    )
+
+                if request_hedger is None:
+                    return await make_request()
+
+                return await request_hedger.run(make_request=make_request)
+
+            except asyncio.TimeoutError:
+                self.__timeout_statistics.register_timeout(weather_resource_name=weather_resource.name)
+                transient_error: bool = True
+                await self.__log_error(
+                    msg=f'Failed to get weather from {weather_resource.name} for {location.name}.\n'
+                        f'Error: request timeout {timeout.total} seconds exceeded\n'
+                )
+
+            except aiohttp.ClientResponseError as e:
+                transient_error = (
+                    e.status == HTTPStatus.TOO_MANY_REQUESTS or e.status >= HTTPStatus.INTERNAL_SERVER_ERROR
+                )
+                if e.status in (HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE):
+                    retry_after_in_seconds = self.__parse_retry_after(headers=e.headers)
+                    if retry_after_in_seconds is not None:
+                        rate_limiter.retry_after(delay_in_seconds=retry_after_in_seconds)
+
+                await self.__log_error(
+                    msg=f'Failed to get weather from {weather_resource.name} for {location.name}.\n'
+                        f'Error: {e.status} {e.message}\n'
+                )
+
+            except ResponseBodyTooLargeError as e:
+                self.__oversized_responses[weather_resource.name] += 1
+                transient_error = False
+                await self.__log_error(
+                    msg=f'Failed to get weather from {weather_resource.name} for {location.name}.\n'
+                        f'Error: {e}\n'
+                )
+
+            except aiohttp.ClientConnectionError as e:
+                transient_error = True
+                await self.__log_error(
+                    msg=f'Failed to get weather from {weather_resource.name} for {location.name}.\n'
+                        f'Error: {e}\n'
+                )
+
+            except Exception as e:
+                transient_error = False
+                await self.__log_error(
+                    msg=f'Failed to get weather from {weather_resource.name} for {location.name}.\n'
+                        f'Error: {e}\n',
+                    exc_info=True
+                )
+
+            if not transient_error or attempt >= self.__config.retry_attempts:
+                return None
+
+            if not await self.__wait_before_retry(attempt=attempt, min_backoff_in_seconds=retry_after_in_seconds or 0.0):
+                return None
+
+            attempt += self.__config.increment_value
+
+    async def __send_request(
+            self,
+            weather_resource: WeatherResource,
+            headers: Dict,
+            timeout: aiohttp.ClientTimeout,
+            rate_limiter: RateLimiter,
+            request_hedger: Optional[RequestHedger]
+    ) -> Tuple[int, Optional[Dict], Dict]:
+        """
+        Makes a single request to weather resource after its turn in rate limiter. Latency of succeeded request
+        is registered by request hedger of weather resource, if hedging is enabled. Latency, status or exception
+        and size of body of each completed request are registered by polling metrics, if metrics are enabled.
+
+        :param weather_resource: Rendered :py:class:`WeatherResource` object.
+        :param headers: Request headers.
+        :param timeout: Timeout of request.
+        :param rate_limiter: :py:class:`RateLimiter` of weather resource.
+        :param request_hedger: :py:class:`RequestHedger` of weather resource or None, if hedging is disabled.
+        :return: Tuple of response status, response JSON and response headers.
+        """
+
+        await rate_limiter.acquire()
+        started_at: float = time.monotonic()
+        response_body: bytes = b''
+        try:
+            async with self.__get_client_session() as session:
+                async with session.get(
+                    url=weather_resource.url,
+                    params=weather_resource.params,
+                    headers=headers,
+                    timeout=timeout
+                ) as response:
+
+                    if response.status == HTTPStatus.NOT_MODIFIED:
+                        response_json: Any = None
+                    else:
+                        response.raise_for_status()
+                        # Response is decoded from raw bytes by the fastest available JSON backend:
+                        response_body = await self.__read_response_body(
+                            response=response,
+                            max_body_bytes=weather_resource.max_body_bytes or self.__config.max_body_bytes
+                        )
+                        response_json = decode_json(response_body) if response_body.strip() else None
+
+        # Cancelled requests (for example, hedges, which lost the race) are not completed, so they are not registered:
+        except Exception as e:
+            if self.__polling_metrics is not None:
+                response_error: bool = isinstance(e, aiohttp.ClientResponseError)
+                self.__polling_metrics.register_request(
+                    weather_resource_name=weather_resource.name,
+                    latency_in_seconds=time.monotonic() - started_at,
+                    status=e.status if response_error else None,
+                    exception_name=None if response_error else type(e).__name__
+                )
+
+            raise
+
+        latency_in_seconds: float = time.monotonic() - started_at
+        if request_hedger is not None:
+            request_hedger.register_latency(latency_in_seconds=latency_in_seconds)
+
+        if self.__polling_metrics is not None:
+            self.__polling_metrics.register_request(
+                weather_resource_name=weather_resource.name,
+                latency_in_seconds=latency_in_seconds,
+                status=response.status,
+                received_bytes=len(response_body)
+            )
+
+        return response.status, response_json, response.headers
+
+    async def __read_response_body(self, response: aiohttp.ClientResponse, max_body_bytes: int) -> bytes:
+        """
+        Reads response body by chunks. Reading is stopped as soon as body exceeds the limit (or before reading,
+        if "Content-Length" header exceeds it), so the rest of body is not buffered, and connection is closed
+        instead of being reused.
+
+        :param response: :py:class:`aiohttp.ClientResponse` with unread body.
+        :param max_body_bytes: Max size of body in bytes.
+        :return: Response body.
+        """
+
+        if response.content_length is not None and response.content_length > max_body_bytes:
+            raise ResponseBodyTooLargeError(
+                f'response body of {response.content_length} bytes exceeds limit of {max_body_bytes} bytes'
+            )
+
+        response_body: bytearray = bytearray()
+        async for chunk in response.content.iter_chunked(self.__config.response_chunk_size_in_bytes):
+            response_body += chunk
+            if len(response_body) > max_body_bytes:
+                raise ResponseBodyTooLargeError(f'response body exceeds limit of {max_body_bytes} bytes')
+
+        return bytes(response_body)
+
+    async def __wait_before_retry(self, attempt: int, min_backoff_in_seconds: float = 0.0) -> bool:
+        """
+        Sleeps for jittered exponential backoff ("full jitter"), before next attempt of request.
+
+        :param attempt: Number of failed attempt, starting from zero.
+        :param min_backoff_in_seconds: Minimal backoff, for example, requested by "Retry-After" header.
+        :return: False, if next attempt would start after iteration deadline, so it should not be made.
+        """
+
+        backoff_in_seconds: float = max(
+            min_backoff_in_seconds,
+            random.uniform(
+                0,
+                min(
+                    self.__config.retry_backoff_max_in_seconds,
+                    self.__config.retry_backoff_base_in_seconds * 2 ** attempt
+                )
+            )
+        )
+
+        if self.__iteration_deadline_time is not None:
+            if time.monotonic() + backoff_in_seconds >= self.__iteration_deadline_time:
+                return False
+
+        await asyncio.sleep(backoff_in_seconds)
+        return True
+
+    @staticmethod
+    def __parse_retry_after(headers: Optional[Dict]) -> Optional[float]:
+        """
+        :param headers: Response headers.
+        :return: Delay in seconds from "Retry-After" header, provided as seconds or HTTP date. None, if header
+        is missing or malformed.
+        """
+
+        retry_after: Optional[AnyStr] = (headers or {}).get(hdrs.RETRY_AFTER)
+        if retry_after is None:
+            return None
+
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+
+        try:
+            retry_at: datetime = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+    def __get_rate_limiter(self, weather_resource: WeatherResource) -> RateLimiter:
+        """
+        :param weather_resource: :py:class:`WeatherResource` object.
+        :return: :py:class:`RateLimiter` of weather resource, shared by all locations and iterations.
+        """
+
+        rate_limiter: Optional[RateLimiter] = self.__rate_limiters.get(weather_resource.name)
+        if rate_limiter is None:
+            rate_limiter = RateLimiter(quotas=weather_resource.rate_limit)
+            self.__rate_limiters[weather_resource.name] = rate_limiter
+
+        return rate_limiter
+
+    def __get_request_hedger(self, weather_resource: WeatherResource) -> Optional[RequestHedger]:
+        """
+        :param weather_resource: :py:class:`WeatherResource` object.
+        :return: :py:class:`RequestHedger` of weather resource, shared by all locations and iterations,
+        or None, if hedging is disabled for weather resource.
+        """
+
+        hedging_enabled: bool = (
+            self.__config.hedging_enabled if weather_resource.hedging is None else weather_resource.hedging
+        )
+        if not hedging_enabled:
+            return None
+
+        request_hedger: Optional[RequestHedger] = self.__request_hedgers.get(weather_resource.name)
+        if request_hedger is None:
+            request_hedger = RequestHedger(
+                quantile=self.__config.hedge_latency_quantile,
+                budget_ratio=self.__config.hedge_budget_ratio,
+                min_samples=self.__config.hedge_min_samples
+            )
+            self.__request_hedgers[weather_resource.name] = request_hedger
+
+        return request_hedger
+
+    def __get_circuit_breaker(self, weather_resource_name: AnyStr) -> CircuitBreaker:
+        circuit_breaker: Optional[CircuitBreaker] = self.__circuit_breakers.get(weather_resource_name)
+        if circuit_breaker is None:
+            circuit_breaker = CircuitBreaker(
+                failure_threshold=self.__config.circuit_breaker_failure_threshold,
+                recovery_timeout_in_seconds=self.__config.circuit_breaker_recovery_timeout_in_seconds
+            )
+            self.__circuit_breakers[weather_resource_name] = circuit_breaker
+
+        return circuit_breaker
+
+    async def __log_circuit_breaker_transition(
+            self,
+            weather_resource_name: AnyStr,
+            previous_state: CircuitBreakerState,
+            state: CircuitBreakerState
+    ) -> None:
+        if previous_state != state:
+            await self.__log_warning(
+                msg=f'Circuit breaker of {weather_resource_name} changed state: {previous_state} -> {state}\n'
+            )
+
+    @staticmethod
+    def __create_conditional_headers(headers: Optional[Dict], cached_response: Optional[CachedResponse]) -> Dict:
+        """
+        Adds validators of cached response to request headers, so weather resource can answer "304 Not Modified",
+        if its data was not changed.
+
+        :param headers: Request headers of weather resource.
+        :param cached_response: Expired :py:class:`CachedResponse` or None, if response was not cached.
+        :return: Request headers with conditional headers.
+        """
+
+        conditional_headers: Dict = dict(headers or {})
+        if cached_response is None:
+            return conditional_headers
+
+        if cached_response.etag:
+            conditional_headers[hdrs.IF_NONE_MATCH] = cached_response.etag
+
+        if cached_response.last_modified:
+            conditional_headers[hdrs.IF_MODIFIED_SINCE] = cached_response.last_modified
+
+        return conditional_headers
+
+    async def __log_warning(self, msg: AnyStr) -> None:
+        """
+        Logs warning via async logger. Falls back to stderr the same way, as :py:meth:`__log_error` does.
+
+        :param msg: Warning message.
+        """
+
+        try:
+            await self.__logger.warning(msg=msg)
+        except ValueError:
+            print(msg, file=sys.stderr)
+
+    async def __log_error(self, msg: AnyStr, exc_info: bool = False) -> None:
+        """
+        Logs error via async logger.
+
+        Default handlers of aiologger write to stdout/stderr via pipe transports, which raise ValueError, if
+        the stream is redirected to a regular file (for example, "python main.py > log.txt" or PyTest output
+        capturing). In such case error is printed to stderr directly, so it is neither lost nor breaks polling.
+
+        :param msg: Error message.
+        :param exc_info: Whether to log traceback of currently handled exception.
+        """
+
+        try:
+            await self.__logger.error(msg=msg, exc_info=exc_info)
+        except ValueError:
+            print(msg, file=sys.stderr)
+
+    async def __get_result_from_response(
+            self,
+            response_json: Optional[Dict],
+            result_keys: List[AnyStr]
+    ) -> Temperature:
+        """
+        if response in JSON format from weather API was  NOT received, returns :py:class:`Temperature`
+        with default value.
+
+        If response in JSON format from weather API was received, gets temperature from it by compiled extractor of
+        keys, which were provided by user in according configuration file.
+
+        :param response_json: A JSON object with weather data from according API.
+        :param result_keys: List of sorted keys (or indices of lists) for getting temperature from @response_json param.
+        :return: :py:class:`Temperature`
+        """
+
+        return Temperature(self.__get_result_extractor(result_keys=result_keys).extract(response_json=response_json))
+
+    def __compile_result_extractors(
+            self,
+            weather_resources: List[WeatherResource]
+    ) -> Dict[Union[Tuple, AnyStr], ResultExtractor]:
+        """
+        :param weather_resources: List of :py:class:`WeatherResource` objects.
+        :return: :py:class:`ResultExtractor` objects, compiled from result keys of weather resources, by result keys.
+        :raises: ValueError, if result keys of some weather resource are malformed.
+        """
+
+        result_extractors: Dict[Union[Tuple, AnyStr], ResultExtractor] = {}
+        for weather_resource in weather_resources:
+            result_keys: Union[List, AnyStr] = weather_resource.result_keys
+            extractor_key: Union[Tuple, AnyStr] = (
+                result_keys if isinstance(result_keys, str) else tuple(result_keys or [])
+            )
+            if extractor_key not in result_extractors:
+                result_extractors[extractor_key] = ResultExtractor(
+                    result_keys=result_keys,
+                    default_value=self.__config.default_temperature_value
+                )
+
+        return result_extractors
+
+    def __get_result_extractor(self, result_keys: Union[List, AnyStr]) -> ResultExtractor:
+        """
+        :param result_keys: Result keys of weather resource.
+        :return: :py:class:`ResultExtractor`, compiled from result keys. Extractors are shared by weather resources
+        with equal result keys.
+        """
+
+        extractor_key: Union[Tuple, AnyStr] = result_keys if isinstance(result_keys, str) else tuple(result_keys or [])
+        result_extractor: Optional[ResultExtractor] = self.__result_extractors.get(extractor_key)
+        if result_extractor is None:
+            result_extractor = ResultExtractor(
+                result_keys=result_keys,
+                default_value=self.__config.default_temperature_value
+            )
+            self.__result_extractors[extractor_key] = result_extractor
+
+        return result_extractor
+
+    def __create_locations_results_lines(
+            self,
+            locations_results: List[LocationResults],
+            consensus_temperatures: List[Tuple[Temperature, List[AnyStr]]]
+    ) -> List[AnyStr]:
+        """
+        Creates results file rows: location name, temperatures from weather resources in order of headers,
+        average temperature and, if aggregation strategy rejects temperatures, names of weather resources,
+        which temperatures were rejected.
+
+        :param locations_results: List of :py:class:`LocationResults` objects with complete temperatures.
+        :param consensus_temperatures: Average temperatures and rejected weather resources names of locations,
+        calculated by :py:meth:`__aggregate_temperatures`.
+        :return: List of results file rows with line separators.
+        """
+
+        with_rejected: bool = self.__consensus_aggregator.strategy != 'mean'
+        results_lines: List[AnyStr] = []
+        for location_results, (average_temperature, rejected_weather_resources_names) in zip(
+                locations_results,
+                consensus_temperatures
+        ):
+            full_weather_results: List[AnyStr] = [location_results.location.name]
+            full_weather_results += map(str, location_results.temperatures)
+            full_weather_results.append(str(average_temperature))
+            if with_rejected:
+                full_weather_results.append(self.__config.rejected_sep.join(rejected_weather_resources_names))
+
+            results_lines.append(self.__config.sep.join(full_weather_results) + self.__config.new_line_arg)
+
+        return results_lines
+
+    def __aggregate_temperatures(
+            self,
+            locations_results: List[LocationResults],
+            columns_names: List[AnyStr]
+    ) -> List[Tuple[Temperature, List[AnyStr]]]:
+        """
+        Aggregates temperatures of all locations by one call of :py:class:`ConsensusAggregator` over
+        (locations x weather resources) matrix, where default temperatures are NaN.
+
+        :param locations_results: List of :py:class:`LocationResults` objects.
+        :param columns_names: Names of weather resources in order of slots of location results.
+        :return: Average temperature and names of weather resources, which temperatures were rejected,
+        for each location.
+        """
+
+        # Slots are already in order of columns, and default temperature (None) is converted to NaN by numpy:
+        temperatures: numpy.ndarray = numpy.array(
+            [location_results.temperatures for location_results in locations_results],
+            dtype=numpy.float64
+        ).reshape(len(locations_results), len(columns_names))
+
+        consensus_result: ConsensusResult = self.__consensus_aggregator.aggregate(
+            temperatures=temperatures,
+            weather_resources_names=columns_names
+        )
+
+        consensus_temperatures: List[Tuple[Temperature, List[AnyStr]]] = []
+        for average_temperature, rejected in zip(consensus_result.temperatures.tolist(), consensus_result.rejected):
+            if average_temperature != average_temperature:
+                # Location without received temperatures:
+                average_temperature = self.__config.default_average_temperature_value
+            else:
+                average_temperature = round(average_temperature, ndigits=self.__config.temperature_decimal_places)
+
+            consensus_temperatures.append(
+                (
+                    Temperature(average_temperature),
+                    [columns_names[column_index] for column_index in numpy.flatnonzero(rejected)]
+                )
+            )
+
+        return consensus_temperatures
+
+    def __create_results_rows(self, polling_iteration: PollingIteration) -> List[ResultRow]:
+        """
+        Creates results database rows: one row per location and weather resource with temperature, latency of
+        request and status of result. Results, which were not received until iteration deadline, have "deadline"
+        status, and weather resources, which were not due, have "not_due" status with their latest temperature.
+
+        :param polling_iteration: :py:class:`PollingIteration` after extract stage.
+        :return: List of :py:class:`ResultRow` objects.
+        """
+
+        polled_weather_resources_names: Set[AnyStr] = {
+            weather_resource.name for weather_resource in polling_iteration.polled_weather_resources
+        }
+
+        results_rows: List[ResultRow] = []
+        for location_results in polling_iteration.locations_results:
+            location: Location = location_results.location
+            for weather_resource_name, temperature in zip(
+                    polling_iteration.columns_names,
+                    location_results.temperatures
+            ):
+                result_key: Tuple[Location, AnyStr] = (location, weather_resource_name)
+                results_rows.append(
+                    ResultRow(
+                        timestamp=polling_iteration.timestamp,
+                        location=location.name,
+                        provider=weather_resource_name,
+                        temperature=temperature,
+                        latency_in_seconds=polling_iteration.results_latencies.get(result_key),
+                        status=polling_iteration.results_statuses.get(
+                            result_key,
+                            'deadline' if weather_resource_name in polled_weather_resources_names else 'not_due'
+                        )
+                    )
+                )
+
+        return results_rows
+
+    @staticmethod
+    def __create_columnar_rows(polling_iteration: PollingIteration) -> List[ColumnarRow]:
+        """
+        :param polling_iteration: :py:class:`PollingIteration` after extract stage.
+        :return: List of :py:class:`ColumnarRow` objects, one per location.
+        """
+
+        timestamp: float = datetime.fromisoformat(polling_iteration.timestamp).timestamp()
+        return [
+            ColumnarRow(
+                timestamp=timestamp,
+                location=location_results.location.name,
+                temperatures=dict(zip(polling_iteration.columns_names, location_results.temperatures))
+            ) for location_results in polling_iteration.locations_results
+        ]
+
+
+def _run_shard_worker(config: Config, connection: Connection) -> None:
+    """
+    Entry point of sharded polling worker process.
+
+    :param config: Config of worker.
+    :param connection: Worker end of pipe to supervisor process.
+    """
 
-        average_temperature: float = temperature_sum / results_counter
-        rounded_average_temperature: float = round(average_temperature, ndigits=self.__config.temperature_decimal_places)
-        return Temperature(rounded_average_temperature)
+    AsyncWeatherChecker(logger=default_logger, config=config).run_shard(connection=connection)
@@ -0,0 +1,95 @@
+import time
+
+from typing import AnyStr, Callable, Literal, Optional, Dict, Union
+
+
+CircuitBreakerState = Literal['closed', 'open', 'half_open']
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of single weather resource (API).
+
+    States:
+        - "closed" - requests are allowed. After a number of consecutive failed requests breaker is opened;
+        - "open" - requests are skipped instantly, because weather resource is considered dead. After recovery
+        timeout breaker becomes half-open;
+        - "half_open" - one probe request is allowed. If it succeeds, breaker is closed, otherwise it is opened again.
+        If probe didn't finish (for example, it was cancelled by iteration deadline), next probe is allowed after
+        recovery timeout.
+    """
+
+    def __init__(
+            self,
+            failure_threshold: int,
+            recovery_timeout_in_seconds: float,
+            clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.__failure_threshold: int = failure_threshold
+        self.__recovery_timeout_in_seconds: float = recovery_timeout_in_seconds
+        self.__clock: Callable[[], float] = clock
+
+        self.__state: CircuitBreakerState = 'closed'
+        self.__consecutive_failures_counter: int = 0
+        self.__opened_at: Optional[float] = None
+        self.__probe_started_at: Optional[float] = None
+        self.__skipped_requests_counter: int = 0
+
+    def allow_request(self) -> bool:
+        """
+        :return: True, if request to weather resource is allowed, otherwise False.
+        """
+
+        if self.__state == 'closed':
+            return True
+
+        now: float = self.__clock()
+        if self.__state == 'open' and now - self.__opened_at >= self.__recovery_timeout_in_seconds:
+            self.__state = 'half_open'
+            self.__probe_started_at = None
+
+        if self.__state == 'half_open':
+            if self.__probe_started_at is None or now - self.__probe_started_at >= self.__recovery_timeout_in_seconds:
+                self.__probe_started_at = now
+                return True
+
+        self.__skipped_requests_counter += 1
+        return False
+
+    def register_success(self) -> None:
+        self.__state = 'closed'
+        self.__consecutive_failures_counter = 0
+        self.__opened_at = None
+        self.__probe_started_at = None
+
+    def register_failure(self) -> None:
+        self.__consecutive_failures_counter += 1
+        if self.__state == 'half_open' or self.__consecutive_failures_counter >= self.__failure_threshold:
+            self.__state = 'open'
+            self.__opened_at = self.__clock()
+            self.__probe_started_at = None
+
+    def snapshot(self) -> Dict[AnyStr, Union[int, AnyStr]]:
+        """
+        Creates a snapshot of current circuit breaker state.
+
+        :return: Dictionary with state and counters of circuit breaker.
+        """
+
+        return {
+            'state': self.__state,
+            'consecutive_failures': self.__consecutive_failures_counter,
+            'skipped_requests': self.__skipped_requests_counter
+        }
+
+    @property
+    def state(self) -> CircuitBreakerState:
+        return self.__state
+
+    @property
+    def consecutive_failures(self) -> int:
+        return self.__consecutive_failures_counter
+
+    @property
+    def skipped_requests(self) -> int:
+        return self.__skipped_requests_counter
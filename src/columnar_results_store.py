@@ -0,0 +1,385 @@
+import os
+import csv
+import asyncio
+import json
+import argparse
+import numpy
+
+from pathlib import Path
+from collections import namedtuple, Counter
+from typing import List, Dict, AnyStr, Optional, IO, Callable
+
+from configs import Config, config as default_config
+from results_writer import ResultsWriter, FsyncPolicy
+
+
+# Results of a single location in a single iteration. Timestamp is UNIX time in seconds:
+ColumnarRow: namedtuple = namedtuple(
+    'ColumnarRow',
+    [
+        'timestamp',
+        'location',
+        'temperatures'
+    ]
+)
+
+TIMESTAMP_COLUMN: AnyStr = 'timestamp'
+LOCATION_COLUMN: AnyStr = 'location'
+
+_SCHEMA_FILE_NAME: AnyStr = 'schema.json'
+_COLUMN_FILE_SUFFIX: AnyStr = '.f64'
+
+# Fixed-width little-endian float64 values, so row N of every column starts at byte N * 8:
+_COLUMN_DTYPE: numpy.dtype = numpy.dtype('<f8')
+
+
+def _get_column_file_path(store_path: Path, column_index: int) -> Path:
+    # Columns are named by their index, so provider names are not restricted by file system:
+    return store_path / f'column_{column_index}{_COLUMN_FILE_SUFFIX}'
+
+
+def _load_schema(store_path: Path) -> Dict[AnyStr, List[AnyStr]]:
+    """
+    :param store_path: Directory of columnar store.
+    :return: Schema of store: names of columns (in order of their files) and names of locations (in order of their
+    codes in location column). Empty schema, if store doesn't exist yet.
+    """
+
+    schema_file_path: Path = store_path / _SCHEMA_FILE_NAME
+    if not schema_file_path.exists():
+        return {'columns': [TIMESTAMP_COLUMN, LOCATION_COLUMN], 'locations': []}
+
+    return json.loads(schema_file_path.read_text())
+
+
+def _count_rows(store_path: Path, columns_number: int) -> int:
+    """
+    Columns are appended one after another, so after crash they can have different lengths. Only complete rows,
+    which are present in all columns, are counted.
+    """
+
+    return min(
+        (
+            os.path.getsize(file_path) // _COLUMN_DTYPE.itemsize if file_path.exists() else 0
+            for file_path in (_get_column_file_path(store_path, index) for index in range(columns_number))
+        ),
+        default=0
+    )
+
+
+class ColumnarResultsWriter(ResultsWriter):
+    """
+    Long-lived writer of results to append-only columnar store: directory with a fixed-width float64 file per column
+    (timestamp, location code and temperature of each weather resource) and "schema.json" file with names of columns
+    and locations. Missing temperatures are written as NaN.
+
+    Rows are queued, buffered and written together (group commit) the same way, as :py:class:`ResultsWriter`
+    writes lines. Store is kept between launches: weather resources, which were added to config, get new columns,
+    filled by NaN for previous rows, and incomplete rows, left by crash, are truncated on start.
+
+    Usage:
+        async with ColumnarResultsWriter(store_path=..., providers=[...]) as results_writer:
+            await results_writer.write(lines=[ColumnarRow(...), ...])
+    """
+
+    def __init__(
+            self,
+            store_path: Path,
+            providers: List[AnyStr],
+            flush_max_lines: int = 1000,
+            flush_interval_in_seconds: float = 1.0,
+            fsync_policy: FsyncPolicy = 'on_close',
+            queue_max_size: int = 0,
+            on_flush: Optional[Callable[[float], None]] = None
+    ) -> None:
+        super().__init__(
+            file_path=store_path,
+            flush_max_lines=flush_max_lines,
+            flush_interval_in_seconds=flush_interval_in_seconds,
+            fsync_policy=fsync_policy,
+            queue_max_size=queue_max_size,
+            on_flush=on_flush
+        )
+
+        self.__providers: List[AnyStr] = providers
+        self.__columns: List[AnyStr] = []
+        self.__locations_codes: Dict[AnyStr, int] = {}
+        self.__files: List[IO] = []
+        self.__schema_changed: bool = False
+
+    def _open(self) -> None:
+        self.file_path.mkdir(parents=True, exist_ok=True)
+        schema: Dict[AnyStr, List[AnyStr]] = _load_schema(store_path=self.file_path)
+        self.__columns = schema['columns']
+        self.__locations_codes = {location: code for code, location in enumerate(schema['locations'])}
+
+        rows_number: int = _count_rows(store_path=self.file_path, columns_number=len(self.__columns))
+        for provider in self.__providers:
+            if provider not in self.__columns:
+                self.__columns.append(provider)
+                self.__schema_changed = True
+
+        rows_size: int = rows_number * _COLUMN_DTYPE.itemsize
+        for column_index in range(len(self.__columns)):
+            column_file_path: Path = _get_column_file_path(self.file_path, column_index)
+            column_size: int = os.path.getsize(column_file_path) if column_file_path.exists() else 0
+            column_file: IO = open(column_file_path, 'ab')
+            if column_size > rows_size:
+                column_file.truncate(rows_size)
+            elif column_size < rows_size:
+                # New column is filled for previous rows:
+                column_file.write(numpy.full(rows_number, numpy.nan, _COLUMN_DTYPE).tobytes())
+                column_file.flush()
+
+            self.__files.append(column_file)
+
+        self.__save_schema()
+
+    def _write(self, lines: List[ColumnarRow]) -> None:
+        columns_values: numpy.ndarray = numpy.full((len(self.__columns), len(lines)), numpy.nan, _COLUMN_DTYPE)
+        columns_indices: Dict[AnyStr, int] = {column: index for index, column in enumerate(self.__columns)}
+        for row_index, columnar_row in enumerate(lines):
+            columns_values[0, row_index] = columnar_row.timestamp
+            columns_values[1, row_index] = self.__get_location_code(location=columnar_row.location)
+            for provider, temperature in columnar_row.temperatures.items():
+                column_index: Optional[int] = columns_indices.get(provider)
+                if column_index is not None and temperature is not None:
+                    columns_values[column_index, row_index] = temperature
+
+        # Schema is saved before values, so reader never sees location code, which is missing in schema:
+        self.__save_schema()
+        for column_file, column_values in zip(self.__files, columns_values):
+            column_file.write(column_values.tobytes())
+            column_file.flush()
+
+    def _sync(self) -> None:
+        for column_file in self.__files:
+            os.fsync(column_file.fileno())
+
+    def _close(self) -> None:
+        for column_file in self.__files:
+            column_file.close()
+
+        self.__files = []
+
+    def __get_location_code(self, location: AnyStr) -> int:
+        location_code: Optional[int] = self.__locations_codes.get(location)
+        if location_code is None:
+            location_code = len(self.__locations_codes)
+            self.__locations_codes[location] = location_code
+            self.__schema_changed = True
+
+        return location_code
+
+    def __save_schema(self) -> None:
+        """
+        Atomically replaces schema file, if columns or locations were added.
+        """
+
+        if not self.__schema_changed:
+            return
+
+        temporary_schema_file_path: Path = self.file_path / f'{_SCHEMA_FILE_NAME}.tmp'
+        temporary_schema_file_path.write_text(
+            json.dumps({'columns': self.__columns, 'locations': list(self.__locations_codes)}, indent=2)
+        )
+        os.replace(temporary_schema_file_path, self.file_path / _SCHEMA_FILE_NAME)
+        self.__schema_changed = False
+
+
+class ColumnarResultsReader:
+    """
+    Reader of columnar store, written by :py:class:`ColumnarResultsWriter`. Columns are memory-mapped, so they are
+    sliced without copying or parsing, and only accessed pages are read from disk.
+
+    Reader sees rows, which were completely written, when it was created.
+
+    Usage:
+        results_reader = ColumnarResultsReader(store_path=...)
+        temperatures = results_reader.column('OpenMeteo')[-1000:]
+        london_results = results_reader.select(location='London', start_timestamp=...)
+    """
+
+    def __init__(self, store_path: Path) -> None:
+        schema: Dict[AnyStr, List[AnyStr]] = _load_schema(store_path=store_path)
+        self.__store_path: Path = store_path
+        self.__columns: List[AnyStr] = schema['columns']
+        self.__locations: List[AnyStr] = schema['locations']
+        self.__rows_number: int = _count_rows(store_path=store_path, columns_number=len(self.__columns))
+        self.__columns_values: Dict[AnyStr, numpy.ndarray] = {}
+
+    def __len__(self) -> int:
+        return self.__rows_number
+
+    def column(self, name: AnyStr) -> numpy.ndarray:
+        """
+        :param name: Name of column: "timestamp", "location" (location codes) or weather resource name.
+        :return: Read-only memory-mapped values of column.
+        """
+
+        if name not in self.__columns:
+            raise KeyError(f'Unknown column: {name}')
+
+        column_values: Optional[numpy.ndarray] = self.__columns_values.get(name)
+        if column_values is None:
+            if self.__rows_number:
+                column_values = numpy.memmap(
+                    _get_column_file_path(self.__store_path, self.__columns.index(name)),
+                    dtype=_COLUMN_DTYPE,
+                    mode='r',
+                    shape=(self.__rows_number,)
+                )
+            else:
+                # Empty file can't be memory-mapped:
+                column_values = numpy.empty(0, dtype=_COLUMN_DTYPE)
+
+            self.__columns_values[name] = column_values
+
+        return column_values
+
+    def select(
+            self,
+            location: Optional[AnyStr] = None,
+            start_timestamp: Optional[float] = None,
+            end_timestamp: Optional[float] = None,
+            columns: Optional[List[AnyStr]] = None
+    ) -> Dict[AnyStr, numpy.ndarray]:
+        """
+        Selects rows of location within time range [start_timestamp, end_timestamp).
+
+        :param location: Name of location. All locations are selected, if not provided.
+        :param start_timestamp: Start of time range in UNIX time. Unbounded, if not provided.
+        :param end_timestamp: End of time range in UNIX time. Unbounded, if not provided.
+        :param columns: Names of selected columns. All columns are selected, if not provided.
+        :return: Values of selected rows by columns names.
+        """
+
+        mask: numpy.ndarray = numpy.ones(self.__rows_number, dtype=bool)
+        if location is not None:
+            location_code: int = self.__locations.index(location) if location in self.__locations else -1
+            mask &= self.column(LOCATION_COLUMN) == location_code
+
+        timestamps: numpy.ndarray = self.column(TIMESTAMP_COLUMN)
+        if start_timestamp is not None:
+            mask &= timestamps >= start_timestamp
+
+        if end_timestamp is not None:
+            mask &= timestamps < end_timestamp
+
+        return {column: self.column(column)[mask] for column in columns or self.__columns}
+
+    @property
+    def columns(self) -> List[AnyStr]:
+        return self.__columns
+
+    @property
+    def providers(self) -> List[AnyStr]:
+        return self.__columns[2:]
+
+    @property
+    def locations(self) -> List[AnyStr]:
+        return self.__locations
+
+
+async def convert_csv_to_columnar_store(
+        csv_file_path: Path,
+        store_path: Path,
+        config: Config,
+        start_timestamp: Optional[float] = None,
+        interval_in_seconds: float = 0.0
+) -> int:
+    """
+    Converts results file (.csv) to columnar store. Results file has no timestamps, so timestamp of row is calculated
+    from number of iteration (number of previous rows of the same location), if start timestamp is provided,
+    otherwise NaN is written. Cells, which are not numbers (for example, "None"), are written as NaN, base headers
+    (average temperature) and rejected weather resources columns are skipped.
+
+    Headers, which are repeated in the middle of file (weather resources were changed by config reload), define
+    columns of the next rows.
+
+    :param csv_file_path: Path to results file, written by weather checker.
+    :param store_path: Directory of columnar store. Rows are appended, if store exists.
+    :param config: :py:class:`Config`, which results file was written with (separator and headers).
+    :param start_timestamp: UNIX time of first iteration.
+    :param interval_in_seconds: Polling interval, which was used for writing results file.
+    :return: Number of converted rows.
+    """
+
+    base_headers: List[AnyStr] = list(config.base_headers) + [config.rejected_header]
+    providers: List[AnyStr] = []
+    providers_indices: Dict[AnyStr, int] = {}
+    columnar_rows: List[ColumnarRow] = []
+    iterations_numbers: Counter = Counter()
+    with open(csv_file_path, newline='') as csv_file:
+        for values in csv.reader(csv_file, delimiter=config.sep):
+            if not values:
+                continue
+
+            if values[0] == config.location_header:
+                providers_indices = {
+                    header: index for index, header in enumerate(values) if index and header not in base_headers
+                }
+                providers += [provider for provider in providers_indices if provider not in providers]
+                continue
+
+            location: AnyStr = values[0]
+            timestamp: float = numpy.nan
+            if start_timestamp is not None:
+                timestamp = start_timestamp + iterations_numbers[location] * interval_in_seconds
+
+            iterations_numbers[location] += 1
+            columnar_rows.append(
+                ColumnarRow(
+                    timestamp=timestamp,
+                    location=location,
+                    temperatures={
+                        provider: _parse_temperature(value=values[index])
+                        for provider, index in providers_indices.items() if index < len(values)
+                    }
+                )
+            )
+
+    async with ColumnarResultsWriter(
+        store_path=store_path,
+        providers=providers,
+        flush_max_lines=max(len(columnar_rows), 1)
+    ) as results_writer:
+        await results_writer.write(lines=columnar_rows)
+
+    return len(columnar_rows)
+
+
+def _parse_temperature(value: AnyStr) -> Optional[float]:
+    """
+    :return: Temperature or None (written as NaN), if value is not a number.
+    """
+
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description='Converter of results file to columnar store')
+    parser.add_argument('csv_file_path', type=Path, help='Path to results file (.csv).')
+    parser.add_argument('store_path', type=Path, help='Directory of columnar store.')
+    parser.add_argument('--start-timestamp', type=float, help='UNIX time of first iteration.')
+    parser.add_argument('--interval', type=float, default=0.0, help='Polling interval in seconds.')
+    arguments: argparse.Namespace = parser.parse_args()
+
+    rows_number: int = asyncio.run(
+        convert_csv_to_columnar_store(
+            csv_file_path=arguments.csv_file_path,
+            store_path=arguments.store_path,
+            # Separator and headers of results file are taken from config, which weather checker is launched with:
+            config=default_config,
+            start_timestamp=arguments.start_timestamp,
+            interval_in_seconds=arguments.interval
+        )
+    )
+    print(f'Converted {rows_number} rows to {arguments.store_path}')
+
+
+if __name__ == '__main__':
+    main()
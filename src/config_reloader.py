@@ -0,0 +1,179 @@
+import os
+import yaml
+import signal
+import asyncio
+
+from pathlib import Path
+from collections import namedtuple
+from typing import List, Dict, AnyStr, Optional
+
+from configs import Config, YamlConfig, YamlHandler, WeatherResource
+
+
+# Difference between running and reloaded configs. Weather resources are compared by names:
+ConfigDiff: namedtuple = namedtuple(
+    'ConfigDiff',
+    [
+        'added_weather_resources',
+        'changed_weather_resources',
+        'removed_weather_resources',
+        'locations_changed',
+        'customized_settings_changed'
+    ]
+)
+
+
+class ConfigReloadError(Exception):
+    """
+    Raised, if reloaded YAML files can't be parsed or config, created from them, is not valid.
+    """
+
+
+class ConfigReloader:
+    """
+    Reloader of config from YAML files (customized settings, weather resources and locations, including .csv file
+    of locations), which were used to create running config.
+
+    Reload is due, when modification time of any YAML file (or of .csv file) was changed, or when reload was
+    requested by :py:meth:`request_reload` (for example, by SIGHUP handler). Reloaded config is validated as a whole,
+    and all its fields, which are not provided by YAML files, are taken from running config.
+
+    Usage:
+        config_reloader = ConfigReloader(yaml_config=config.yaml_config)
+        if config_reloader.is_reload_due():
+            reloaded_config = config_reloader.load_config(config=config)
+            config_diff = diff_configs(running_config=config, reloaded_config=reloaded_config)
+    """
+
+    def __init__(self, yaml_config: YamlConfig) -> None:
+        self.__yaml_handler: YamlHandler = YamlHandler(yaml_config=yaml_config)
+        self.__yaml_config: YamlConfig = yaml_config
+        self.__reload_requested: bool = False
+        self.__modification_times: Dict[Path, Optional[int]] = self.__get_modification_times()
+        self.__reloads_counter: int = 0
+        self.__failed_reloads_counter: int = 0
+
+    def request_reload(self) -> None:
+        self.__reload_requested = True
+
+    def install_signal_handler(self, loop: asyncio.AbstractEventLoop) -> bool:
+        """
+        Requests reload on SIGHUP.
+
+        :param loop: Running event loop.
+        :return: True, if handler was installed. Signal handlers are not supported on Windows and outside
+        of main thread, in which case reload is triggered by modification of files only.
+        """
+
+        if not hasattr(signal, 'SIGHUP'):
+            return False
+
+        try:
+            loop.add_signal_handler(signal.SIGHUP, self.request_reload)
+        except (NotImplementedError, RuntimeError, ValueError):
+            return False
+
+        return True
+
+    @staticmethod
+    def remove_signal_handler(loop: asyncio.AbstractEventLoop) -> None:
+        if hasattr(signal, 'SIGHUP'):
+            loop.remove_signal_handler(signal.SIGHUP)
+
+    def is_reload_due(self) -> bool:
+        return self.__reload_requested or self.__get_modification_times() != self.__modification_times
+
+    def load_config(self, config: Config) -> Config:
+        """
+        Parses YAML files and creates validated config from them. Reload is not due anymore after the call,
+        even if it failed, so broken files are not parsed again, until they are modified.
+
+        :param config: Running config, which provides fields, which are not stored in YAML files.
+        :return: Reloaded :py:class:`Config`.
+        :raises: ConfigReloadError, if YAML files can't be parsed or reloaded config is not valid.
+        """
+
+        self.__reload_requested = False
+        self.__modification_times = self.__get_modification_times()
+        # Class of running config is used, so nested models of running config are valid for reloaded one:
+        try:
+            reloaded_config: Config = type(config)(
+                **{
+                    **dict(config),
+                    'customized_settings': self.__yaml_handler.get_customized_settings(),
+                    'weather_resources': self.__yaml_handler.get_weather_resources(),
+                    'locations': self.__yaml_handler.get_locations()
+                }
+            )
+        except (OSError, yaml.YAMLError, TypeError, KeyError, ValueError) as e:
+            self.__failed_reloads_counter += 1
+            raise ConfigReloadError(f'Config can\'t be reloaded: {e}') from e
+
+        self.__reloads_counter += 1
+        return reloaded_config
+
+    def __get_modification_times(self) -> Dict[Path, Optional[int]]:
+        """
+        :return: Modification times of YAML files and .csv file of locations. None, if file doesn't exist.
+        """
+
+        file_paths: List[Path] = [
+            self.__yaml_config.customized_settings_yaml_path,
+            self.__yaml_config.weather_resources_yaml_path
+        ]
+        try:
+            locations_file_path: Optional[Path] = self.__yaml_handler.get_locations_file_path()
+        except (OSError, yaml.YAMLError, AttributeError):
+            locations_file_path = None
+
+        if locations_file_path is not None:
+            file_paths.append(locations_file_path)
+
+        modification_times: Dict[Path, Optional[int]] = {}
+        for file_path in file_paths:
+            try:
+                modification_times[file_path] = os.stat(file_path).st_mtime_ns
+            except OSError:
+                modification_times[file_path] = None
+
+        return modification_times
+
+    def snapshot(self) -> Dict[AnyStr, int]:
+        return {
+            'reloads': self.__reloads_counter,
+            'failed_reloads': self.__failed_reloads_counter
+        }
+
+    def __str__(self) -> AnyStr:
+        return ', '.join(f'{name}={value}' for name, value in self.snapshot().items())
+
+
+def diff_configs(running_config: Config, reloaded_config: Config) -> ConfigDiff:
+    """
+    :param running_config: Running :py:class:`Config`.
+    :param reloaded_config: Reloaded :py:class:`Config`.
+    :return: :py:class:`ConfigDiff` with names of added, changed and removed weather resources and flags of changed
+    locations and customized settings. All fields are empty (falsy), if configs are equal.
+    """
+
+    running_weather_resources: Dict[AnyStr, WeatherResource] = {
+        weather_resource.name: weather_resource for weather_resource in running_config.weather_resources
+    }
+    reloaded_weather_resources: Dict[AnyStr, WeatherResource] = {
+        weather_resource.name: weather_resource for weather_resource in reloaded_config.weather_resources
+    }
+
+    return ConfigDiff(
+        added_weather_resources=[
+            name for name in reloaded_weather_resources if name not in running_weather_resources
+        ],
+        changed_weather_resources=[
+            name for name, weather_resource in reloaded_weather_resources.items()
+            if name in running_weather_resources and running_weather_resources[name] != weather_resource
+        ],
+        removed_weather_resources=[
+            name for name in running_weather_resources if name not in reloaded_weather_resources
+        ],
+        locations_changed=running_config.locations != reloaded_config.locations,
+        customized_settings_changed=running_config.customized_settings != reloaded_config.customized_settings
+    )
@@ -1,23 +1,265 @@
-from typing import List, Literal, AnyStr
-from pydantic import BaseModel
+from typing import List, Literal, AnyStr, Optional
+from pydantic import BaseModel, model_validator
 from pathlib import Path
 
-from .yaml_configs import CustomizedSettings, WeatherResource
+from .yaml_configs import CustomizedSettings, WeatherResource, Location, YamlConfig
 
 
 class Config(BaseModel):
     customized_settings: CustomizedSettings
     weather_resources: List[WeatherResource]
+    locations: List[Location] = []
+
+    # Used as the only location, if no locations were provided by user. In such case weather resources params
+    # should contain coordinates themselves:
+    default_location: Location = Location(name='Default')
     iteration_start_point: int = 0
     sep: AnyStr = ','
     results_file_path: Path = Path('./weather_results.csv')
+    results_metadata_file_path: Path = Path('./weather_results_metadata.jsonl')
     results_file_writing_mode: Literal['a', 'w+', 'a+'] = 'a+'
     results_file_reading_mode: Literal['r', 'r+'] = 'r'
     default_temperature_value: None = None
     default_average_temperature_value: float = 0.0
     temperature_decimal_places: int = 2
     base_headers: List[AnyStr] = ['Average']
+
+    # Header of column with names of weather resources, which temperatures were rejected by aggregation strategy.
+    # Column is written only for strategies, which reject temperatures:
+    rejected_header: AnyStr = 'Rejected'
+    rejected_sep: AnyStr = ';'
+    location_header: AnyStr = 'Location'
     new_line_arg: AnyStr = '\n'
     increment_value: int = 1
     default_counter_value: int = 0
 
+    # Shared connection pool settings, used by all requests to weather resources (API) during all iterations:
+    connection_limit: int = 100
+    connection_limit_per_host: int = 10
+    keepalive_timeout_in_seconds: float = 30.0
+    dns_cache_ttl_in_seconds: int = 300
+
+    # Polling concurrency settings. Per resource limit can be overridden in weather resource config:
+    max_concurrent_requests: int = 100
+    max_concurrent_requests_per_resource: int = 10
+
+    # Timeout for a single request, if it is not provided in weather resource config:
+    request_timeout_in_seconds: float = 10.0
+
+    # Response bodies are read by chunks and reading is stopped, if body exceeds the limit, so memory per request
+    # stays bounded. Limit can be overridden in weather resource config:
+    max_body_bytes: int = 1048576
+    response_chunk_size_in_bytes: int = 16384
+
+    # Results, which were not received until deadline, will be written as default temperature.
+    # Defaults to polling interval from customized settings and must not exceed it:
+    iteration_deadline_in_seconds: Optional[float] = None
+
+    # Weather resources, which due times are within this tolerance, are polled in the same iteration:
+    scheduler_tick_tolerance_in_seconds: float = 0.05
+
+    # Responses cache settings. Responses are cached only for weather resources with "cache_ttl_in_seconds".
+    # If file path is provided, cache is loaded on start and saved on finish:
+    response_cache_max_entries: int = 10000
+    response_cache_file_path: Optional[Path] = None
+
+    # Failed by transient error requests are retried with jittered exponential backoff, bounded by iteration deadline:
+    retry_attempts: int = 2
+    retry_backoff_base_in_seconds: float = 0.5
+    retry_backoff_max_in_seconds: float = 5.0
+
+    # Separator of location params values of batch request, if it is not provided in weather resource config:
+    batch_sep: AnyStr = ','
+
+    # Request, which is not completed within observed latency quantile of weather resource, is hedged by identical
+    # request, and the first response is used. Hedges are limited by budget ratio of requests of weather resource
+    # and are not sent, until min samples of latencies were observed. Hedging can be overridden in weather resource
+    # config by "hedging" key:
+    hedging_enabled: bool = False
+    hedge_latency_quantile: float = 0.95
+    hedge_budget_ratio: float = 0.1
+    hedge_min_samples: int = 20
+
+    # Weather resource is skipped after a number of consecutive failed requests and probed after recovery timeout:
+    circuit_breaker_failure_threshold: int = 5
+    circuit_breaker_recovery_timeout_in_seconds: float = 60.0
+
+    # Results are written by long-lived writer, which flushes buffered lines by size or time (group commit).
+    # Fsync policy: "never", "on_flush" (after each group commit) or "on_close":
+    results_flush_max_lines: int = 1000
+    results_flush_interval_in_seconds: float = 1.0
+    results_fsync_policy: Literal['never', 'on_flush', 'on_close'] = 'on_close'
+    results_queue_max_size: int = 1000
+
+    # Results sink: "csv" results file, which is rewritten on each launch, "sqlite" database with one row per
+    # weather result or "columnar" store with float64 column per weather resource. Database and columnar store are
+    # appended on each launch, so results history stays queryable:
+    results_sink: Literal['csv', 'sqlite', 'columnar'] = 'csv'
+    results_database_path: Path = Path('./weather_results.sqlite3')
+    results_columnar_store_path: Path = Path('./weather_results_columns')
+
+    # Strategy of aggregation of temperatures from weather resources to average temperature of location: "mean",
+    # "median", "trimmed_mean" (the lowest and the highest trim proportion of temperatures are rejected) or "mad"
+    # (temperatures, which modified z-score exceeds threshold, are rejected). Weights of weather resources are set
+    # by "weight" key of weather resource config:
+    aggregation_strategy: Literal['mean', 'median', 'trimmed_mean', 'mad'] = 'mean'
+    aggregation_trim_proportion: float = 0.2
+    aggregation_mad_threshold: float = 3.5
+    aggregation_mad_floor: float = 0.5
+
+    # Rolling statistics of received temperatures per location and weather resource, which are written to results
+    # metadata file for each iteration. Window is limited by count and by age of values (unbounded, if not provided):
+    rolling_window_max_count: Optional[int] = 100
+    rolling_window_max_age_in_seconds: Optional[float] = 3600.0
+    rolling_ewma_alpha: float = 0.1
+
+    # Number of worker processes, which poll locations in sharded mode (1 - single process). Each worker polls its
+    # shard of locations with its own connection pool, and results are written by a single writer. Shards sizes are
+    # rebalanced, if the slowest shard latency exceeds the fastest one more than rebalance threshold times:
+    shards_number: int = 1
+    shard_rebalance_threshold: float = 1.5
+
+    # Coordination of nodes (hosts or processes), which poll the same locations: locations are split into shards
+    # by hash of location name, and each node polls only shards, which it leased in lease database. Leases are
+    # renewed on each tick and expire after TTL, so shards of a stopped node are claimed by other nodes. Node ID
+    # defaults to "<hostname>-<pid>":
+    coordination_enabled: bool = False
+    coordination_node_id: Optional[AnyStr] = None
+    lease_shards_number: int = 16
+    lease_ttl_in_seconds: float = 30.0
+    lease_database_path: Path = Path('./weather_checker_leases.sqlite3')
+
+    # Embedded HTTP server, which serves the latest results of locations and weather resources from memory as JSON:
+    results_server_enabled: bool = False
+    results_server_host: AnyStr = '127.0.0.1'
+    results_server_port: int = 8080
+
+    # Prometheus metrics of polling (latencies, statuses and exceptions of requests, received bytes, iterations
+    # latencies, results flushes latencies, queues depths and event loop lag), which are served on "/metrics"
+    # of results server host and port. Event loop lag is measured every lag interval:
+    metrics_enabled: bool = False
+    metrics_latency_buckets_in_seconds: List[float] = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+    event_loop_lag_interval_in_seconds: float = 0.5
+
+    # YAML files, which config was loaded from. If reload is enabled, config is reloaded from them between iterations,
+    # when they are modified or SIGHUP is received:
+    yaml_config: Optional[YamlConfig] = None
+    config_reload_enabled: bool = True
+
+    # Max number of iterations, waiting for each stage of polling pipeline (fetch -> extract -> aggregate -> sink).
+    # If a stage is slower than polling, next iterations wait for free place (backpressure):
+    pipeline_queue_max_size: int = 2
+
+    @model_validator(mode='after')
+    def check_iteration_deadline(self) -> 'Config':
+        """
+        Iteration, which lasts longer than polling interval, would overrun next ticks of scheduler.
+        """
+
+        check_interval_in_seconds: float = self.customized_settings.check_interval_in_seconds
+        if self.iteration_deadline_in_seconds is None:
+            return self
+
+        if self.iteration_deadline_in_seconds > check_interval_in_seconds:
+            raise ValueError(
+                f'Iteration deadline {self.iteration_deadline_in_seconds} seconds exceeds '
+                f'polling interval {check_interval_in_seconds} seconds'
+            )
+
+        return self
+
+    @model_validator(mode='after')
+    def check_location_placeholders(self) -> 'Config':
+        """
+        If no locations were provided, weather resources templates are rendered with default location, which has
+        no coordinates. Such templates must not contain placeholders of missing location data, otherwise requests
+        would be made with broken params.
+        """
+
+        if self.locations:
+            return self
+
+        missing_placeholders: List[AnyStr] = [
+            '{' + field + '}' for field, value in self.default_location._asdict().items() if value is None
+        ]
+
+        for weather_resource in self.weather_resources:
+            template_values: List = [weather_resource.url]
+            template_values += list((weather_resource.params or {}).values())
+            template_values += list((weather_resource.headers or {}).values())
+            for value in template_values:
+                for placeholder in missing_placeholders:
+                    if isinstance(value, str) and placeholder in value:
+                        raise ValueError(
+                            f'Weather resource {weather_resource.name} uses {placeholder} placeholder, '
+                            f'but no locations were provided'
+                        )
+
+        return self
+
+    @model_validator(mode='after')
+    def check_batch_placeholders(self) -> 'Config':
+        """
+        Batch request is made for multiple locations, so only its params can depend on location (their values are
+        joined). Location placeholders in url or headers of weather resource with batch mode can't be rendered.
+        """
+
+        for weather_resource in self.weather_resources:
+            if weather_resource.batch_size is None:
+                continue
+
+            if weather_resource.batch_size < 1:
+                raise ValueError(
+                    f'Batch size of weather resource {weather_resource.name} should be positive: '
+                    f'{weather_resource.batch_size}'
+                )
+
+            template_values: List = [weather_resource.url] + list((weather_resource.headers or {}).values())
+            for value in template_values:
+                if isinstance(value, str) and '{' in value:
+                    raise ValueError(
+                        f'Weather resource {weather_resource.name} with batch mode uses placeholder in url '
+                        f'or headers: {value}'
+                    )
+
+        return self
+
+    @model_validator(mode='after')
+    def check_coordination(self) -> 'Config':
+        """
+        Lease, which expires between renewals on ticks, would be claimed by other node, while it is still used.
+        Sharded mode splits locations by its own shards, which are not coordinated with other nodes.
+        """
+
+        if not self.coordination_enabled:
+            return self
+
+        check_interval_in_seconds: float = self.customized_settings.check_interval_in_seconds
+        if self.lease_ttl_in_seconds <= check_interval_in_seconds:
+            raise ValueError(
+                f'Lease TTL {self.lease_ttl_in_seconds} seconds should exceed '
+                f'polling interval {check_interval_in_seconds} seconds'
+            )
+
+        if self.shards_number > 1:
+            raise ValueError(f'Coordination is not supported in sharded mode: {self.shards_number} shards')
+
+        return self
+
+    @model_validator(mode='after')
+    def check_metrics(self) -> 'Config':
+        """
+        Each observed latency is counted in the first bucket, which upper bound is not less than latency, so bounds
+        should be sorted and unique.
+        """
+
+        buckets: List[float] = self.metrics_latency_buckets_in_seconds
+        if not buckets or buckets != sorted(set(buckets)):
+            raise ValueError(f'Metrics latency buckets should be sorted and unique: {buckets}')
+
+        if self.event_loop_lag_interval_in_seconds <= 0:
+            raise ValueError(
+                f'Event loop lag interval should be positive: {self.event_loop_lag_interval_in_seconds} seconds'
+            )
+
+        return self
@@ -1,4 +1,4 @@
-from .yaml_configs import CustomizedSettings, YamlConfig, WeatherResource
+from .yaml_configs import CustomizedSettings, YamlConfig, WeatherResource, Location
 
 
 yaml_config = YamlConfig()
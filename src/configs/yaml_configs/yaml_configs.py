@@ -10,6 +10,9 @@ class YamlConfig(BaseModel):
     customized_settings_yaml_path: Path = config_dir / Path('customized_settings.yaml')
     weather_resources_yaml_path: Path = config_dir / Path('weather_resources.yaml')
     weather_resources_key: AnyStr = 'weather_resources'
+    locations_key: AnyStr = 'locations'
+    locations_file_key: AnyStr = 'locations_file'
+    locations_file_encoding: AnyStr = 'utf-8'
     yaml_file_mode: Literal['r'] = 'r'
 
 
@@ -17,7 +20,11 @@ CustomizedSettings: namedtuple = namedtuple(
     'CustomizedSettings',
     [
         'times_to_check',
-        'check_interval_in_seconds'
+        'check_interval_in_seconds',
+        'missed_tick_policy'
+    ],
+    defaults=[
+        'skip'
     ]
 )
 
@@ -28,6 +35,43 @@ WeatherResource: namedtuple = namedtuple(
         'url',
         'params',
         'headers',
-        'result_keys'
+        'result_keys',
+        'max_concurrent_requests',
+        'timeout_in_seconds',
+        'check_interval_in_seconds',
+        'cache_ttl_in_seconds',
+        'rate_limit',
+        'max_body_bytes',
+        'weight',
+        'hedging',
+        'batch_size',
+        'batch_sep',
+        'batch_results_keys'
+    ],
+    defaults=[
+        None,
+        None,
+        None,
+        None,
+        None,
+        None,
+        None,
+        None,
+        None,
+        None,
+        None
+    ]
+)
+
+Location: namedtuple = namedtuple(
+    'Location',
+    [
+        'name',
+        'latitude',
+        'longitude'
+    ],
+    defaults=[
+        None,
+        None
     ]
 )
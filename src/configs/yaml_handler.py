@@ -1,8 +1,10 @@
+import csv
 import yaml
 
-from typing import List
+from typing import List, Dict, Any, AnyStr, Optional
+from pathlib import Path
 
-from .yaml_configs import CustomizedSettings, WeatherResource, YamlConfig
+from .yaml_configs import CustomizedSettings, WeatherResource, YamlConfig, Location
 
 
 class YamlHandler:
@@ -38,3 +40,62 @@ class YamlHandler:
         return [
             WeatherResource(**weather_resource) for weather_resource in yaml_data[self.__yaml_config.weather_resources_key]
         ]
+
+    def get_locations(self) -> List[Location]:
+        """
+        Reads locations from weather resources .yaml file. Locations can be provided directly in the file
+        and (or) in .csv file with "name,latitude,longitude" headers, which path is provided in the .yaml file.
+        Relative path to .csv file is resolved from directory of the .yaml file.
+
+        Each location will be crossed with every weather resource template during polling.
+
+        :return: List of :py:class:`Location` objects. Empty list, if no locations were provided.
+        """
+
+        with open(self.__yaml_config.weather_resources_yaml_path, self.__yaml_config.yaml_file_mode) as yaml_file:
+            yaml_data: Dict[AnyStr, Any] = yaml.safe_load(yaml_file)
+
+        locations: List[Location] = [
+            Location(**location) for location in yaml_data.get(self.__yaml_config.locations_key) or []
+        ]
+
+        locations_file_path: Optional[Path] = self.__get_locations_file_path(yaml_data=yaml_data)
+        if locations_file_path is not None:
+            locations += self.__read_locations_file(locations_file_path=locations_file_path)
+
+        return locations
+
+    def get_locations_file_path(self) -> Optional[Path]:
+        """
+        Reads path to .csv file with locations from weather resources .yaml file.
+
+        :return: Path to .csv file with locations. None, if it was not provided.
+        """
+
+        with open(self.__yaml_config.weather_resources_yaml_path, self.__yaml_config.yaml_file_mode) as yaml_file:
+            yaml_data: Dict[AnyStr, Any] = yaml.safe_load(yaml_file)
+
+        return self.__get_locations_file_path(yaml_data=yaml_data)
+
+    def __get_locations_file_path(self, yaml_data: Dict[AnyStr, Any]) -> Optional[Path]:
+        locations_file: AnyStr = yaml_data.get(self.__yaml_config.locations_file_key)
+        if not locations_file:
+            return None
+
+        return self.__yaml_config.weather_resources_yaml_path.parent / Path(locations_file)
+
+    def __read_locations_file(self, locations_file_path: Path) -> List[Location]:
+        """
+        Reads locations from .csv file, which first line contains headers, equal to :py:class:`Location` fields.
+
+        :param locations_file_path: Path to .csv file with locations.
+        :return: List of :py:class:`Location` objects.
+        """
+
+        with open(
+            locations_file_path,
+            self.__yaml_config.yaml_file_mode,
+            encoding=self.__yaml_config.locations_file_encoding,
+            newline=''
+        ) as locations_file:
+            return [Location(**location) for location in csv.DictReader(locations_file)]
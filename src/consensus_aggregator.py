@@ -0,0 +1,136 @@
+import numpy
+
+from collections import namedtuple
+from typing import List, Dict, AnyStr, Optional, Literal
+
+
+AggregationStrategy = Literal['mean', 'median', 'trimmed_mean', 'mad']
+
+# Result of aggregation of (locations x weather resources) temperatures matrix:
+#   - temperatures - aggregated temperature of each location (NaN, if location has no temperatures);
+#   - rejected - boolean matrix of temperatures, which were rejected as outliers and were not aggregated.
+ConsensusResult: namedtuple = namedtuple(
+    'ConsensusResult',
+    [
+        'temperatures',
+        'rejected'
+    ]
+)
+
+# Scale of MAD, which makes it consistent estimator of standard deviation for normal distribution:
+_MAD_SCALE: float = 0.6745
+
+
+class ConsensusAggregator:
+    """
+    Aggregator of temperatures, received from multiple weather resources (API), to a single temperature
+    of each location. Whole iteration is aggregated by one call over (locations x weather resources) matrix,
+    where missing temperatures are NaN.
+
+    Aggregation strategies:
+        - "mean" - weighted mean of all temperatures;
+        - "median" - median of all temperatures (weights are not applied);
+        - "trimmed_mean" - weighted mean after rejection of "trim_proportion" of the lowest and of the highest
+        temperatures of location;
+        - "mad" - weighted mean after rejection of temperatures, which modified z-score (based on median absolute
+        deviation from median) exceeds "mad_threshold". MAD is not less than "mad_floor", so close temperatures
+        are not rejected, when most of weather resources report the same temperature.
+
+    Weights reflect reliability of weather resources and are 1.0 for weather resources without weight.
+    """
+
+    def __init__(
+            self,
+            strategy: AggregationStrategy = 'mean',
+            trim_proportion: float = 0.2,
+            mad_threshold: float = 3.5,
+            mad_floor: float = 0.5,
+            weights: Optional[Dict[AnyStr, float]] = None
+    ) -> None:
+        if strategy not in ('mean', 'median', 'trimmed_mean', 'mad'):
+            raise ValueError(f'Unknown aggregation strategy: {strategy}')
+
+        if not 0 <= trim_proportion < 0.5:
+            raise ValueError(f'Trim proportion should be in [0, 0.5): {trim_proportion}')
+
+        self.__strategy: AggregationStrategy = strategy
+        self.__trim_proportion: float = trim_proportion
+        self.__mad_threshold: float = mad_threshold
+        self.__mad_floor: float = mad_floor
+        self.__weights: Dict[AnyStr, float] = weights or {}
+
+    def aggregate(self, temperatures: numpy.ndarray, weather_resources_names: List[AnyStr]) -> ConsensusResult:
+        """
+        :param temperatures: Matrix of temperatures (locations x weather resources), NaN for missing temperatures.
+        :param weather_resources_names: Names of weather resources in order of matrix columns.
+        :return: :py:class:`ConsensusResult` with aggregated temperature of each location and rejected temperatures.
+        """
+
+        temperatures = numpy.asarray(temperatures, dtype=numpy.float64)
+        received: numpy.ndarray = ~numpy.isnan(temperatures)
+        rejected: numpy.ndarray = numpy.zeros(temperatures.shape, dtype=bool)
+        if self.__strategy == 'median':
+            return ConsensusResult(temperatures=self.__get_median(temperatures=temperatures), rejected=rejected)
+
+        if self.__strategy == 'trimmed_mean':
+            rejected = self.__get_trimmed(temperatures=temperatures, received=received)
+        elif self.__strategy == 'mad':
+            rejected = self.__get_outliers(temperatures=temperatures, received=received)
+
+        weights: numpy.ndarray = numpy.array(
+            [self.__weights.get(name, 1.0) for name in weather_resources_names],
+            dtype=numpy.float64
+        )
+        accepted_weights: numpy.ndarray = numpy.where(received & ~rejected, weights, 0.0)
+        weights_sums: numpy.ndarray = accepted_weights.sum(axis=1)
+        weighted_sums: numpy.ndarray = numpy.where(accepted_weights > 0, temperatures, 0.0) @ weights
+        with numpy.errstate(invalid='ignore', divide='ignore'):
+            aggregated_temperatures: numpy.ndarray = numpy.where(
+                weights_sums > 0,
+                weighted_sums / weights_sums,
+                numpy.nan
+            )
+
+        return ConsensusResult(temperatures=aggregated_temperatures, rejected=rejected)
+
+    @staticmethod
+    def __get_median(temperatures: numpy.ndarray) -> numpy.ndarray:
+        median: numpy.ndarray = numpy.full(temperatures.shape[0], numpy.nan)
+        # Median of location without temperatures is NaN, but it is not reported as warning:
+        has_temperatures: numpy.ndarray = ~numpy.isnan(temperatures).all(axis=1)
+        if has_temperatures.any():
+            median[has_temperatures] = numpy.nanmedian(temperatures[has_temperatures], axis=1)
+
+        return median
+
+    def __get_trimmed(self, temperatures: numpy.ndarray, received: numpy.ndarray) -> numpy.ndarray:
+        """
+        :return: Matrix of temperatures, which are among the lowest or the highest "trim_proportion" of location.
+        """
+
+        # Missing temperatures are sorted after all received ones, so ranks of received temperatures are 0..n-1:
+        ranks: numpy.ndarray = numpy.argsort(
+            numpy.argsort(numpy.where(received, temperatures, numpy.inf), axis=1, kind='stable'),
+            axis=1,
+            kind='stable'
+        )
+        received_numbers: numpy.ndarray = received.sum(axis=1, keepdims=True)
+        trimmed_numbers: numpy.ndarray = numpy.floor(received_numbers * self.__trim_proportion).astype(int)
+        return received & ((ranks < trimmed_numbers) | (ranks >= received_numbers - trimmed_numbers))
+
+    def __get_outliers(self, temperatures: numpy.ndarray, received: numpy.ndarray) -> numpy.ndarray:
+        """
+        :return: Matrix of temperatures, which modified z-score exceeds MAD threshold.
+        """
+
+        median: numpy.ndarray = self.__get_median(temperatures=temperatures)[:, numpy.newaxis]
+        deviations: numpy.ndarray = numpy.abs(temperatures - median)
+        mad: numpy.ndarray = numpy.maximum(self.__get_median(temperatures=deviations), self.__mad_floor)
+        mad = mad[:, numpy.newaxis]
+        # MAD is zero only with zero floor, so deviating temperatures get infinite z-score:
+        with numpy.errstate(invalid='ignore', divide='ignore'):
+            return received & (_MAD_SCALE * deviations / mad > self.__mad_threshold)
+
+    @property
+    def strategy(self) -> AggregationStrategy:
+        return self.__strategy
@@ -0,0 +1,288 @@
+import os
+import math
+import time
+import zlib
+import socket
+import asyncio
+import sqlite3
+
+from pathlib import Path
+from typing import List, Dict, AnyStr, Optional, Union, Set
+
+
+_CREATE_LEASES_TABLE_QUERY: AnyStr = """
+CREATE TABLE IF NOT EXISTS leases (
+    shard INTEGER PRIMARY KEY,
+    node_id TEXT NOT NULL,
+    expires_at REAL NOT NULL
+)
+"""
+
+_CREATE_NODES_TABLE_QUERY: AnyStr = """
+CREATE TABLE IF NOT EXISTS nodes (
+    node_id TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL
+)
+"""
+
+# Lease is taken, if shard is free, its lease has expired or it is already held by the same node (renewal).
+# Conditional upsert is a single statement, so concurrent claims of the same shard can't both succeed:
+_CLAIM_LEASE_QUERY: AnyStr = """
+INSERT INTO leases (shard, node_id, expires_at) VALUES (?, ?, ?)
+ON CONFLICT (shard) DO UPDATE SET node_id = excluded.node_id, expires_at = excluded.expires_at
+WHERE leases.node_id = excluded.node_id OR leases.expires_at <= ?
+"""
+
+_RELEASE_LEASE_QUERY: AnyStr = 'DELETE FROM leases WHERE shard = ? AND node_id = ?'
+
+_SELECT_LEASES_QUERY: AnyStr = 'SELECT shard, node_id FROM leases WHERE expires_at > ?'
+
+_REGISTER_NODE_QUERY: AnyStr = """
+INSERT INTO nodes (node_id, expires_at) VALUES (?, ?)
+ON CONFLICT (node_id) DO UPDATE SET expires_at = excluded.expires_at
+"""
+
+_UNREGISTER_NODE_QUERY: AnyStr = 'DELETE FROM nodes WHERE node_id = ?'
+
+_SELECT_LIVE_NODES_QUERY: AnyStr = 'SELECT node_id FROM nodes WHERE expires_at > ? ORDER BY node_id'
+
+
+class LeaseBackend:
+    """
+    Storage of shards leases and heartbeats of nodes, which is shared by all nodes of cluster.
+
+    Methods are blocking and are called by :py:class:`LeaseCoordinator` from thread pool one at a time.
+    Implementation must make :py:meth:`claim_lease` atomic across nodes. Times are wall clock timestamps,
+    since they are compared by different processes.
+    """
+
+    def open(self) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        raise NotImplementedError
+
+    def claim_lease(self, shard: int, node_id: AnyStr, expires_at: float, now: float) -> bool:
+        """
+        :param shard: Index of shard.
+        :param node_id: ID of node, which claims the shard.
+        :param expires_at: Expiration time of lease.
+        :param now: Current time, after which expired leases of other nodes can be taken.
+        :return: True, if lease was taken or renewed by the node.
+        """
+
+        raise NotImplementedError
+
+    def release_lease(self, shard: int, node_id: AnyStr) -> None:
+        raise NotImplementedError
+
+    def get_leases(self, now: float) -> Dict[int, AnyStr]:
+        """
+        :return: Not expired leases: shards and IDs of nodes, which hold them.
+        """
+
+        raise NotImplementedError
+
+    def register_node(self, node_id: AnyStr, expires_at: float) -> None:
+        raise NotImplementedError
+
+    def unregister_node(self, node_id: AnyStr) -> None:
+        raise NotImplementedError
+
+    def get_live_nodes(self, now: float) -> List[AnyStr]:
+        """
+        :return: IDs of nodes, which heartbeats have not expired.
+        """
+
+        raise NotImplementedError
+
+
+class SqliteLeaseBackend(LeaseBackend):
+    """
+    Lease backend, stored in SQLite database. Database file is locked by SQLite on each write, so leases are
+    shared by processes of a single host (or hosts with shared file system, which supports file locks).
+    """
+
+    def __init__(self, database_path: Path, busy_timeout_in_seconds: float = 5.0) -> None:
+        self.__database_path: Path = database_path
+        self.__busy_timeout_in_seconds: float = busy_timeout_in_seconds
+        self.__connection: Optional[sqlite3.Connection] = None
+
+    def open(self) -> None:
+        # Connection is used by thread pool threads one at a time:
+        self.__connection = sqlite3.connect(
+            self.__database_path,
+            timeout=self.__busy_timeout_in_seconds,
+            check_same_thread=False
+        )
+        self.__connection.execute('PRAGMA journal_mode=WAL')
+        with self.__connection:
+            self.__connection.execute(_CREATE_LEASES_TABLE_QUERY)
+            self.__connection.execute(_CREATE_NODES_TABLE_QUERY)
+
+    def close(self) -> None:
+        if self.__connection is not None:
+            self.__connection.close()
+            self.__connection = None
+
+    def claim_lease(self, shard: int, node_id: AnyStr, expires_at: float, now: float) -> bool:
+        with self.__connection:
+            cursor: sqlite3.Cursor = self.__connection.execute(_CLAIM_LEASE_QUERY, (shard, node_id, expires_at, now))
+
+        return cursor.rowcount == 1
+
+    def release_lease(self, shard: int, node_id: AnyStr) -> None:
+        with self.__connection:
+            self.__connection.execute(_RELEASE_LEASE_QUERY, (shard, node_id))
+
+    def get_leases(self, now: float) -> Dict[int, AnyStr]:
+        return dict(self.__connection.execute(_SELECT_LEASES_QUERY, (now,)).fetchall())
+
+    def register_node(self, node_id: AnyStr, expires_at: float) -> None:
+        with self.__connection:
+            self.__connection.execute(_REGISTER_NODE_QUERY, (node_id, expires_at))
+
+    def unregister_node(self, node_id: AnyStr) -> None:
+        with self.__connection:
+            self.__connection.execute(_UNREGISTER_NODE_QUERY, (node_id,))
+
+    def get_live_nodes(self, now: float) -> List[AnyStr]:
+        return [node_id for node_id, in self.__connection.execute(_SELECT_LIVE_NODES_QUERY, (now,)).fetchall()]
+
+
+class LeaseCoordinator:
+    """
+    Coordinator of nodes, which poll the same locations: locations are split into a fixed number of shards by hash
+    of location name, and each node polls only locations of shards, which it holds time-limited leases of.
+
+    Leases are renewed by :py:meth:`renew_leases` on each tick together with heartbeat of node. Each node holds
+    at most its fair share of shards (number of shards divided by number of live nodes): free shards are claimed
+    up to fair share, and extra shards are released, so nodes, which joined later, claim them on their next tick.
+    Leases of a node, which stopped without releasing them, expire after TTL and are claimed by other nodes.
+    TTL should exceed polling interval, so lease of a running node doesn't expire between renewals.
+
+    Usage:
+        async with LeaseCoordinator(lease_backend=..., node_id=..., shards_number=..., ...) as lease_coordinator:
+            await lease_coordinator.renew_leases()
+            locations = lease_coordinator.filter_locations(locations=...)
+    """
+
+    def __init__(
+            self,
+            lease_backend: LeaseBackend,
+            node_id: Optional[AnyStr] = None,
+            shards_number: int = 16,
+            lease_ttl_in_seconds: float = 30.0
+    ) -> None:
+        if shards_number < 1:
+            raise ValueError(f'Shards number should be positive: {shards_number}')
+
+        if lease_ttl_in_seconds <= 0:
+            raise ValueError(f'Lease TTL should be positive: {lease_ttl_in_seconds}')
+
+        self.__lease_backend: LeaseBackend = lease_backend
+        self.__node_id: AnyStr = node_id or f'{socket.gethostname()}-{os.getpid()}'
+        self.__shards_number: int = shards_number
+        self.__lease_ttl_in_seconds: float = lease_ttl_in_seconds
+        self.__owned_shards: List[int] = []
+        self.__claims_counter: int = 0
+        self.__releases_counter: int = 0
+
+    async def __aenter__(self) -> 'LeaseCoordinator':
+        await asyncio.to_thread(self.__lease_backend.open)
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await asyncio.to_thread(self.__release_leases)
+
+    async def renew_leases(self) -> List[int]:
+        """
+        Renews heartbeat of node and its leases, claims free shards up to fair share and releases extra shards.
+
+        :return: Indices of shards, which are held by the node until next renewal.
+        """
+
+        return await asyncio.to_thread(self.__renew_leases)
+
+    def __renew_leases(self) -> List[int]:
+        now: float = time.time()
+        expires_at: float = now + self.__lease_ttl_in_seconds
+        self.__lease_backend.register_node(node_id=self.__node_id, expires_at=expires_at)
+        live_nodes_number: int = max(len(self.__lease_backend.get_live_nodes(now=now)), 1)
+        fair_share: int = math.ceil(self.__shards_number / live_nodes_number)
+
+        leases: Dict[int, AnyStr] = self.__lease_backend.get_leases(now=now)
+        held_shards: List[int] = sorted(shard for shard, node_id in leases.items() if node_id == self.__node_id)
+        for shard in held_shards[fair_share:]:
+            self.__lease_backend.release_lease(shard=shard, node_id=self.__node_id)
+            self.__releases_counter += 1
+
+        # Lease could be lost, if node was paused for longer than TTL, so renewal is checked too:
+        owned_shards: List[int] = [
+            shard for shard in held_shards[:fair_share]
+            if self.__lease_backend.claim_lease(shard=shard, node_id=self.__node_id, expires_at=expires_at, now=now)
+        ]
+        for shard in range(self.__shards_number):
+            if len(owned_shards) >= fair_share:
+                break
+
+            if shard in leases:
+                continue
+
+            if self.__lease_backend.claim_lease(shard=shard, node_id=self.__node_id, expires_at=expires_at, now=now):
+                owned_shards.append(shard)
+                self.__claims_counter += 1
+
+        self.__owned_shards = sorted(owned_shards)
+        return list(self.__owned_shards)
+
+    def __release_leases(self) -> None:
+        """
+        Releases all leases and heartbeat of node, so its shards are claimed by other nodes without waiting for TTL.
+        """
+
+        try:
+            for shard in self.__owned_shards:
+                self.__lease_backend.release_lease(shard=shard, node_id=self.__node_id)
+                self.__releases_counter += 1
+
+            self.__lease_backend.unregister_node(node_id=self.__node_id)
+        finally:
+            self.__owned_shards = []
+            self.__lease_backend.close()
+
+    def get_shard(self, location_name: AnyStr) -> int:
+        """
+        :param location_name: Name of location.
+        :return: Index of shard of location, which is the same on all nodes.
+        """
+
+        return zlib.crc32(location_name.encode()) % self.__shards_number
+
+    def filter_locations(self, locations: List) -> List:
+        """
+        :param locations: List of :py:class:`Location` objects.
+        :return: Locations of shards, which are held by the node, in original order.
+        """
+
+        owned_shards: Set[int] = set(self.__owned_shards)
+        return [location for location in locations if self.get_shard(location_name=location.name) in owned_shards]
+
+    def snapshot(self) -> Dict[AnyStr, Union[AnyStr, int, List[int]]]:
+        return {
+            'node_id': self.__node_id,
+            'owned_shards': list(self.__owned_shards),
+            'claims': self.__claims_counter,
+            'releases': self.__releases_counter
+        }
+
+    def __str__(self) -> AnyStr:
+        return ', '.join(f'{name}={value}' for name, value in self.snapshot().items())
+
+    @property
+    def node_id(self) -> AnyStr:
+        return self.__node_id
+
+    @property
+    def owned_shards(self) -> List[int]:
+        return list(self.__owned_shards)
@@ -0,0 +1,25 @@
+from typing import List
+
+from configs import Location
+from custom_types import Temperature
+
+
+class LocationResults:
+    """
+    Weather results of a single location in a single iteration. Each weather resource (API) has its own slot,
+    which index is the index of weather resource column in results file, so temperatures are written straight
+    to their slots, and results row is assembled without sorting and temporary dictionaries.
+
+    Slots, which temperatures were received in current iteration, are marked in "received" flags.
+    """
+
+    __slots__ = ('location', 'temperatures', 'received')
+
+    def __init__(self, location: Location, columns_number: int, default_temperature: Temperature = None) -> None:
+        self.location: Location = location
+        self.temperatures: List[Temperature] = [default_temperature] * columns_number
+        self.received: bytearray = bytearray(columns_number)
+
+    def set_temperature(self, column_index: int, temperature: Temperature) -> None:
+        self.temperatures[column_index] = temperature
+        self.received[column_index] = 1
@@ -0,0 +1,247 @@
+import math
+import bisect
+
+from typing import List, Dict, AnyStr, Tuple, Optional, Callable, Union
+
+
+LabelsValues = Tuple[AnyStr, ...]
+
+
+class Metric:
+    """
+    Base class of labelled metric. Values of metric are kept by tuples of labels values, which are passed
+    in order of labels names, so updating of metric is a single dictionary lookup.
+    """
+
+    metric_type: AnyStr = 'untyped'
+
+    def __init__(self, name: AnyStr, documentation: AnyStr, labels_names: Tuple[AnyStr, ...] = ()) -> None:
+        self.__name: AnyStr = name
+        self.__documentation: AnyStr = documentation
+        self.__labels_names: Tuple[AnyStr, ...] = labels_names
+
+    def render(self) -> List[AnyStr]:
+        """
+        :return: Lines of metric in Prometheus text format, including "HELP" and "TYPE" lines.
+        """
+
+        lines: List[AnyStr] = [
+            f'# HELP {self.__name} {self.__documentation}',
+            f'# TYPE {self.__name} {self.metric_type}'
+        ]
+        for labels_values, value in sorted(self.collect().items()):
+            lines.extend(self._render_sample(labels_values=labels_values, value=value))
+
+        return lines
+
+    def _render_sample(self, labels_values: LabelsValues, value: float) -> List[AnyStr]:
+        return [f'{self.__name}{self._format_labels(labels_values=labels_values)} {_format_value(value=value)}']
+
+    def _format_labels(
+            self,
+            labels_values: LabelsValues,
+            extra_labels: Tuple[Tuple[AnyStr, AnyStr], ...] = ()
+    ) -> AnyStr:
+        labels: List[Tuple[AnyStr, AnyStr]] = list(zip(self.__labels_names, labels_values)) + list(extra_labels)
+        if not labels:
+            return ''
+
+        return '{' + ','.join(f'{name}="{_escape_label_value(value=value)}"' for name, value in labels) + '}'
+
+    def collect(self) -> Dict[LabelsValues, float]:
+        raise NotImplementedError
+
+    @property
+    def name(self) -> AnyStr:
+        return self.__name
+
+    @property
+    def labels_names(self) -> Tuple[AnyStr, ...]:
+        return self.__labels_names
+
+
+class MetricCounter(Metric):
+    """
+    Monotonically increasing counter, for example, number of requests.
+    """
+
+    metric_type: AnyStr = 'counter'
+
+    def __init__(self, name: AnyStr, documentation: AnyStr, labels_names: Tuple[AnyStr, ...] = ()) -> None:
+        super().__init__(name=name, documentation=documentation, labels_names=labels_names)
+        self.__values: Dict[LabelsValues, float] = {}
+
+    def inc(self, labels_values: LabelsValues = (), value: float = 1.0) -> None:
+        if value < 0:
+            raise ValueError(f'Counter {self.name} can\'t be decreased: {value}')
+
+        self.__values[labels_values] = self.__values.get(labels_values, 0.0) + value
+
+    def collect(self) -> Dict[LabelsValues, float]:
+        return dict(self.__values)
+
+
+class MetricGauge(Metric):
+    """
+    Value, which can go up and down, for example, depth of queue. Values can be set directly or collected
+    by function on each scrape, so values, which are owned by other objects, are not copied on every change.
+    """
+
+    metric_type: AnyStr = 'gauge'
+
+    def __init__(
+            self,
+            name: AnyStr,
+            documentation: AnyStr,
+            labels_names: Tuple[AnyStr, ...] = (),
+            collect_function: Optional[Callable[[], Dict[LabelsValues, float]]] = None
+    ) -> None:
+        super().__init__(name=name, documentation=documentation, labels_names=labels_names)
+        self.__values: Dict[LabelsValues, float] = {}
+        self.__collect_function: Optional[Callable[[], Dict[LabelsValues, float]]] = collect_function
+
+    def set(self, value: float, labels_values: LabelsValues = ()) -> None:
+        self.__values[labels_values] = value
+
+    def collect(self) -> Dict[LabelsValues, float]:
+        if self.__collect_function is not None:
+            return {**self.__values, **self.__collect_function()}
+
+        return dict(self.__values)
+
+
+class MetricHistogram(Metric):
+    """
+    Histogram of observed values with fixed buckets upper bounds, for example, latencies of requests.
+    Observation is a binary search of bucket and increment of its counter; buckets are cumulated on scrape.
+    """
+
+    metric_type: AnyStr = 'histogram'
+
+    def __init__(
+            self,
+            name: AnyStr,
+            documentation: AnyStr,
+            buckets: List[float],
+            labels_names: Tuple[AnyStr, ...] = ()
+    ) -> None:
+        if not buckets or sorted(buckets) != list(buckets) or len(set(buckets)) != len(buckets):
+            raise ValueError(f'Buckets of histogram {name} should be sorted and unique: {buckets}')
+
+        super().__init__(name=name, documentation=documentation, labels_names=labels_names)
+        self.__buckets: List[float] = [bucket for bucket in buckets if not math.isinf(bucket)]
+
+        # Counters of each bucket (not cumulative) and of "+Inf" bucket, sum of values and count of values:
+        self.__counters: Dict[LabelsValues, List[float]] = {}
+
+    def observe(self, value: float, labels_values: LabelsValues = ()) -> None:
+        counters: Optional[List[float]] = self.__counters.get(labels_values)
+        if counters is None:
+            counters = [0] * (len(self.__buckets) + 3)
+            self.__counters[labels_values] = counters
+
+        counters[bisect.bisect_left(self.__buckets, value)] += 1
+        counters[-2] += value
+        counters[-1] += 1
+
+    def collect(self) -> Dict[LabelsValues, float]:
+        """
+        :return: Counts of observed values by labels values.
+        """
+
+        return {labels_values: counters[-1] for labels_values, counters in self.__counters.items()}
+
+    def get_buckets(self, labels_values: LabelsValues = ()) -> Dict[float, int]:
+        """
+        :return: Cumulative counts of observed values by buckets upper bounds, including infinity.
+        """
+
+        counters: List[float] = self.__counters.get(labels_values, [0] * (len(self.__buckets) + 3))
+        cumulative_counts: Dict[float, int] = {}
+        cumulative_count: int = 0
+        for bucket, count in zip(self.__buckets + [math.inf], counters):
+            cumulative_count += count
+            cumulative_counts[bucket] = cumulative_count
+
+        return cumulative_counts
+
+    def get_sum(self, labels_values: LabelsValues = ()) -> float:
+        return self.__counters[labels_values][-2] if labels_values in self.__counters else 0.0
+
+    def _render_sample(self, labels_values: LabelsValues, value: float) -> List[AnyStr]:
+        lines: List[AnyStr] = []
+        for bucket, count in self.get_buckets(labels_values=labels_values).items():
+            bucket_labels: AnyStr = self._format_labels(
+                labels_values=labels_values,
+                extra_labels=(('le', _format_value(value=bucket)),)
+            )
+            lines.append(f'{self.name}_bucket{bucket_labels} {count}')
+
+        labels: AnyStr = self._format_labels(labels_values=labels_values)
+        lines.append(f'{self.name}_sum{labels} {_format_value(value=self.get_sum(labels_values=labels_values))}')
+        lines.append(f'{self.name}_count{labels} {_format_value(value=value)}')
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Registry of metrics, which renders them in Prometheus text exposition format (version 0.0.4) and provides
+    their values for programmatic reading.
+
+    Metrics are updated by owner without locks, so they should be updated and rendered on the same event loop.
+
+    Usage:
+        metrics_registry = MetricsRegistry()
+        requests_counter = metrics_registry.register(metric=MetricCounter(name=..., documentation=..., labels_names=...))
+        requests_counter.inc(labels_values=(...,))
+        text = metrics_registry.render()
+    """
+
+    CONTENT_TYPE: AnyStr = 'text/plain; version=0.0.4; charset=utf-8'
+
+    def __init__(self) -> None:
+        self.__metrics: Dict[AnyStr, Metric] = {}
+
+    def register(self, metric: Metric) -> Union[Metric, MetricCounter, MetricGauge, MetricHistogram]:
+        if metric.name in self.__metrics:
+            raise ValueError(f'Metric {metric.name} is already registered')
+
+        self.__metrics[metric.name] = metric
+        return metric
+
+    def get(self, name: AnyStr) -> Optional[Metric]:
+        return self.__metrics.get(name)
+
+    def render(self) -> AnyStr:
+        """
+        :return: All metrics in Prometheus text format.
+        """
+
+        lines: List[AnyStr] = []
+        for metric in self.__metrics.values():
+            lines.extend(metric.render())
+
+        return '\n'.join(lines) + '\n'
+
+    def snapshot(self) -> Dict[AnyStr, Dict[LabelsValues, float]]:
+        """
+        Creates a snapshot of current metrics values. Histograms are represented by counts of observed values.
+
+        :return: Dictionary with metrics names and their values by labels values.
+        """
+
+        return {name: metric.collect() for name, metric in self.__metrics.items()}
+
+
+def _format_value(value: float) -> AnyStr:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+
+    if math.isnan(value):
+        return 'NaN'
+
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _escape_label_value(value: AnyStr) -> AnyStr:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
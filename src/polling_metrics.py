@@ -0,0 +1,211 @@
+import asyncio
+
+from typing import List, Dict, AnyStr, Optional, Callable
+
+from metrics_registry import MetricsRegistry, MetricCounter, MetricGauge, MetricHistogram, LabelsValues
+
+
+DEFAULT_LATENCY_BUCKETS_IN_SECONDS: List[float] = [
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+]
+
+
+class PollingMetrics:
+    """
+    Metrics of polling engine, which are exposed in Prometheus text format (see :py:meth:`render`) and are readable
+    programmatically (see :py:meth:`snapshot`):
+        - "weather_checker_request_latency_seconds" - histogram of latencies of requests by weather resource (API);
+        - "weather_checker_responses_total" - responses by weather resource and HTTP status code;
+        - "weather_checker_request_exceptions_total" - failed requests without response by weather resource
+        and exception (timeout, connection error, oversized body, ...);
+        - "weather_checker_received_bytes_total" - received bytes of responses bodies by weather resource;
+        - "weather_checker_iteration_duration_seconds" - histogram of latencies of polling iterations;
+        - "weather_checker_writer_flush_latency_seconds" - histogram of latencies of results writers flushes by file;
+        - "weather_checker_queue_depth" - current depth of pipeline stages and results writers queues;
+        - "weather_checker_event_loop_lag_seconds" - histogram of event loop lag (see :py:class:`EventLoopLagMonitor`).
+
+    Each registration is a dictionary lookup and a few additions, so metrics are updated on the hot path of requests.
+    """
+
+    def __init__(
+            self,
+            latency_buckets_in_seconds: Optional[List[float]] = None,
+            queue_depths_function: Optional[Callable[[], Dict[LabelsValues, float]]] = None
+    ) -> None:
+        buckets: List[float] = latency_buckets_in_seconds or DEFAULT_LATENCY_BUCKETS_IN_SECONDS
+        self.__metrics_registry: MetricsRegistry = MetricsRegistry()
+        self.__request_latency: MetricHistogram = self.__metrics_registry.register(
+            metric=MetricHistogram(
+                name='weather_checker_request_latency_seconds',
+                documentation='Latency of requests to weather resources.',
+                buckets=buckets,
+                labels_names=('provider',)
+            )
+        )
+        self.__responses: MetricCounter = self.__metrics_registry.register(
+            metric=MetricCounter(
+                name='weather_checker_responses_total',
+                documentation='Responses of weather resources by HTTP status code.',
+                labels_names=('provider', 'status')
+            )
+        )
+        self.__request_exceptions: MetricCounter = self.__metrics_registry.register(
+            metric=MetricCounter(
+                name='weather_checker_request_exceptions_total',
+                documentation='Requests to weather resources, which failed without response, by exception.',
+                labels_names=('provider', 'exception')
+            )
+        )
+        self.__received_bytes: MetricCounter = self.__metrics_registry.register(
+            metric=MetricCounter(
+                name='weather_checker_received_bytes_total',
+                documentation='Received bytes of responses bodies of weather resources.',
+                labels_names=('provider',)
+            )
+        )
+        self.__iteration_duration: MetricHistogram = self.__metrics_registry.register(
+            metric=MetricHistogram(
+                name='weather_checker_iteration_duration_seconds',
+                documentation='Latency of polling iterations from start of fetching to end of writing results.',
+                buckets=buckets
+            )
+        )
+        self.__flush_latency: MetricHistogram = self.__metrics_registry.register(
+            metric=MetricHistogram(
+                name='weather_checker_writer_flush_latency_seconds',
+                documentation='Latency of flushes of buffered results by results writers.',
+                buckets=buckets,
+                labels_names=('file',)
+            )
+        )
+        self.__metrics_registry.register(
+            metric=MetricGauge(
+                name='weather_checker_queue_depth',
+                documentation='Number of items, waiting in queues of pipeline stages and results writers.',
+                labels_names=('queue',),
+                collect_function=queue_depths_function
+            )
+        )
+        self.__event_loop_lag: MetricHistogram = self.__metrics_registry.register(
+            metric=MetricHistogram(
+                name='weather_checker_event_loop_lag_seconds',
+                documentation='Delay of scheduled wake-ups of event loop.',
+                buckets=buckets
+            )
+        )
+
+    def register_request(
+            self,
+            weather_resource_name: AnyStr,
+            latency_in_seconds: float,
+            status: Optional[int] = None,
+            received_bytes: int = 0,
+            exception_name: Optional[AnyStr] = None
+    ) -> None:
+        """
+        :param weather_resource_name: Name of weather resource.
+        :param latency_in_seconds: Latency of request, including reading of body.
+        :param status: HTTP status code or None, if response was not received.
+        :param received_bytes: Size of received response body.
+        :param exception_name: Name of exception, if request failed without response.
+        """
+
+        labels_values: LabelsValues = (weather_resource_name,)
+        self.__request_latency.observe(value=latency_in_seconds, labels_values=labels_values)
+        if status is not None:
+            self.__responses.inc(labels_values=(weather_resource_name, str(status)))
+
+        if exception_name is not None:
+            self.__request_exceptions.inc(labels_values=(weather_resource_name, exception_name))
+
+        if received_bytes:
+            self.__received_bytes.inc(labels_values=labels_values, value=received_bytes)
+
+    def register_iteration(self, latency_in_seconds: float) -> None:
+        self.__iteration_duration.observe(value=latency_in_seconds)
+
+    def register_flush(self, file_name: AnyStr, latency_in_seconds: float) -> None:
+        self.__flush_latency.observe(value=latency_in_seconds, labels_values=(file_name,))
+
+    def register_event_loop_lag(self, lag_in_seconds: float) -> None:
+        self.__event_loop_lag.observe(value=lag_in_seconds)
+
+    def render(self) -> AnyStr:
+        return self.__metrics_registry.render()
+
+    def snapshot(self) -> Dict[AnyStr, Dict[LabelsValues, float]]:
+        """
+        Creates a snapshot of current metrics values.
+
+        :return: Dictionary with metrics names and their values by labels values. Histograms are represented
+        by counts of observed values (buckets are available via :py:attr:`metrics_registry`).
+        """
+
+        return self.__metrics_registry.snapshot()
+
+    @property
+    def metrics_registry(self) -> MetricsRegistry:
+        return self.__metrics_registry
+
+
+class EventLoopLagMonitor:
+    """
+    Measures event loop lag: background task sleeps for a fixed interval and registers, how much later than
+    scheduled it was woken up. Lag grows, when event loop is blocked by synchronous code or is overloaded
+    by callbacks, so requests are sent and responses are read late.
+
+    Usage:
+        async with EventLoopLagMonitor(polling_metrics=..., interval_in_seconds=0.5) as event_loop_lag_monitor:
+            ...
+    """
+
+    def __init__(self, polling_metrics: PollingMetrics, interval_in_seconds: float = 0.5) -> None:
+        if interval_in_seconds <= 0:
+            raise ValueError(f'Event loop lag interval should be positive: {interval_in_seconds}')
+
+        self.__polling_metrics: PollingMetrics = polling_metrics
+        self.__interval_in_seconds: float = interval_in_seconds
+        self.__monitor_task: Optional[asyncio.Task] = None
+        self.__measurements_counter: int = 0
+        self.__max_lag_in_seconds: float = 0.0
+
+    async def __aenter__(self) -> 'EventLoopLagMonitor':
+        self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        self.__monitor_task = asyncio.create_task(coro=self.__run())
+
+    async def close(self) -> None:
+        if self.__monitor_task is None:
+            return
+
+        self.__monitor_task.cancel()
+        try:
+            await self.__monitor_task
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self.__monitor_task = None
+
+    async def __run(self) -> None:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        while True:
+            wake_up_time: float = loop.time() + self.__interval_in_seconds
+            await asyncio.sleep(self.__interval_in_seconds)
+            lag_in_seconds: float = max(loop.time() - wake_up_time, 0.0)
+            self.__polling_metrics.register_event_loop_lag(lag_in_seconds=lag_in_seconds)
+            self.__measurements_counter += 1
+            self.__max_lag_in_seconds = max(self.__max_lag_in_seconds, lag_in_seconds)
+
+    def snapshot(self) -> Dict[AnyStr, float]:
+        return {
+            'measurements': self.__measurements_counter,
+            'max_lag_in_seconds': round(self.__max_lag_in_seconds, 4)
+        }
+
+    def __str__(self) -> AnyStr:
+        return ', '.join(f'{name}={value}' for name, value in self.snapshot().items())
@@ -0,0 +1,211 @@
+import asyncio
+import time
+
+from typing import List, Tuple, Dict, AnyStr, Any, Callable, Awaitable, Optional, Union
+
+
+PipelineStage = Callable[[Any], Awaitable[Any]]
+
+
+class PipelineStageStatistics:
+    """
+    Collects statistics of a single pipeline stage: depth of its input queue, number of processed items,
+    time spent on processing and throughput.
+    """
+
+    def __init__(self, queue: asyncio.Queue, clock: Callable[[], float] = time.monotonic) -> None:
+        self.__queue: asyncio.Queue = queue
+        self.__clock: Callable[[], float] = clock
+
+        self.__processed_counter: int = 0
+        self.__max_queue_depth: int = 0
+        self.__busy_seconds: float = 0.0
+        self.__started_at: Optional[float] = None
+
+    def register_queued_item(self) -> None:
+        self.__max_queue_depth = max(self.__max_queue_depth, self.__queue.qsize())
+
+    def register_processed_item(self, started_at: float) -> None:
+        now: float = self.__clock()
+        if self.__started_at is None:
+            self.__started_at = started_at
+
+        self.__processed_counter += 1
+        self.__busy_seconds += now - started_at
+
+    def snapshot(self) -> Dict[AnyStr, Union[int, float]]:
+        """
+        Creates a snapshot of current stage statistics.
+
+        :return: Dictionary with counters names and their values. Throughput is a number of processed items
+        per second since first item processing was started.
+        """
+
+        elapsed_seconds: float = 0.0 if self.__started_at is None else self.__clock() - self.__started_at
+        return {
+            'queue_depth': self.__queue.qsize(),
+            'max_queue_depth': self.__max_queue_depth,
+            'processed': self.__processed_counter,
+            'busy_seconds': round(self.__busy_seconds, 3),
+            'throughput_per_second': round(self.__processed_counter / elapsed_seconds, 3) if elapsed_seconds else 0.0
+        }
+
+    @property
+    def processed(self) -> int:
+        return self.__processed_counter
+
+    @property
+    def max_queue_depth(self) -> int:
+        return self.__max_queue_depth
+
+
+class PollingPipeline:
+    """
+    Staged producer/consumer pipeline. Each stage is run by its own task, which takes items from its bounded input
+    queue and puts results to input queue of next stage, so different stages process different items concurrently
+    (for example, results of iteration N are written, while iteration N+1 is fetched). Items are processed
+    by every stage in order of putting.
+
+    Bounded queues make backpressure: if a stage is slower than producer, :py:meth:`put` waits for free place.
+
+    If a stage fails, it discards next items (so upstream stages are not blocked), and the error is raised
+    by next :py:meth:`put` or :py:meth:`close` call. On close all queued items are processed.
+
+    Usage:
+        async with PollingPipeline(stages=[('fetch', fetch), ('sink', sink)]) as polling_pipeline:
+            await polling_pipeline.put(item)
+    """
+
+    def __init__(
+            self,
+            stages: List[Tuple[AnyStr, PipelineStage]],
+            queue_max_size: int = 1,
+            clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if not stages:
+            raise ValueError('Pipeline should have at least one stage')
+
+        self.__stages: List[Tuple[AnyStr, PipelineStage]] = stages
+        self.__queue_max_size: int = queue_max_size
+        self.__clock: Callable[[], float] = clock
+
+        self.__queues: List[asyncio.Queue] = []
+        self.__stages_statistics: Dict[AnyStr, PipelineStageStatistics] = {}
+        self.__stages_tasks: List[asyncio.Task] = []
+        self.__error: Optional[BaseException] = None
+
+    async def __aenter__(self) -> 'PollingPipeline':
+        self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        """
+        Creates stages queues and starts stages tasks.
+        """
+
+        self.__queues = [asyncio.Queue(maxsize=self.__queue_max_size) for _ in self.__stages]
+        self.__stages_statistics = {
+            stage_name: PipelineStageStatistics(queue=queue, clock=self.__clock)
+            for (stage_name, _), queue in zip(self.__stages, self.__queues)
+        }
+
+        self.__stages_tasks = [
+            asyncio.create_task(coro=self.__run_stage(stage_index=stage_index))
+            for stage_index in range(len(self.__stages))
+        ]
+
+    async def put(self, item: Any) -> None:
+        """
+        Puts item to input queue of first stage. Waits, if queue is full.
+
+        :param item: Item, which will be processed by all stages.
+        """
+
+        self.__raise_for_error()
+        await self.__queues[0].put(item)
+        self.__stages_statistics[self.__stages[0][0]].register_queued_item()
+
+    async def close(self) -> None:
+        """
+        Waits until all queued items are processed and stops stages tasks. If closing is cancelled,
+        stages tasks are cancelled too.
+        """
+
+        if not self.__stages_tasks:
+            return
+
+        try:
+            await self.__queues[0].put(None)
+            await asyncio.gather(*self.__stages_tasks)
+        finally:
+            for stage_task in self.__stages_tasks:
+                stage_task.cancel()
+
+            self.__stages_tasks = []
+
+        self.__raise_for_error()
+
+    async def __run_stage(self, stage_index: int) -> None:
+        """
+        Stage task. Processes items from stage input queue until end of stream (None) is received.
+
+        :param stage_index: Index of stage in pipeline.
+        """
+
+        stage_name, stage = self.__stages[stage_index]
+        input_queue: asyncio.Queue = self.__queues[stage_index]
+        output_queue: Optional[asyncio.Queue] = None
+        if stage_index + 1 < len(self.__queues):
+            output_queue = self.__queues[stage_index + 1]
+
+        while True:
+            item: Any = await input_queue.get()
+            if item is None:
+                break
+
+            if self.__error is not None:
+                continue
+
+            started_at: float = self.__clock()
+            try:
+                result: Any = await stage(item)
+            except Exception as e:
+                self.__error = e
+                continue
+
+            self.__stages_statistics[stage_name].register_processed_item(started_at=started_at)
+            if output_queue is not None:
+                await output_queue.put(result)
+                self.__stages_statistics[self.__stages[stage_index + 1][0]].register_queued_item()
+
+        if output_queue is not None:
+            await output_queue.put(None)
+
+    def __raise_for_error(self) -> None:
+        if self.__error is not None:
+            raise self.__error
+
+    def snapshot(self) -> Dict[AnyStr, Dict[AnyStr, Union[int, float]]]:
+        """
+        Creates a snapshot of current statistics of all stages.
+
+        :return: Dictionary with stages names and their statistics.
+        """
+
+        return {
+            stage_name: stage_statistics.snapshot()
+            for stage_name, stage_statistics in self.__stages_statistics.items()
+        }
+
+    def __str__(self) -> AnyStr:
+        return ', '.join(
+            f'{stage_name}({", ".join(f"{name}={value}" for name, value in stage_statistics.items())})'
+            for stage_name, stage_statistics in self.snapshot().items()
+        )
+
+    @property
+    def stages_statistics(self) -> Dict[AnyStr, PipelineStageStatistics]:
+        return self.__stages_statistics
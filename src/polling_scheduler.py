@@ -0,0 +1,196 @@
+import asyncio
+import heapq
+import time
+
+from collections import Counter
+from typing import List, Tuple, Dict, AnyStr, Callable, Literal
+
+from configs import WeatherResource
+
+
+MissedTickPolicy = Literal['catch_up', 'skip']
+
+
+class PollingScheduler:
+    """
+    Fixed-rate scheduler of weather resources (API) polling, keyed on monotonic clock.
+
+    Each weather resource has its own polling interval and due time, which are stored in priority queue. Next due time
+    is calculated from previous due time (not from the moment of polling end), so polling period doesn't drift
+    because of polling time.
+
+    If a tick was missed (for example, because polling took longer than interval), scheduler behaves according to
+    missed tick policy:
+        - "catch_up" - all missed ticks will be executed one after another without sleeping;
+        - "skip" - missed ticks will be skipped and weather resource will be polled at next tick in future.
+    """
+
+    def __init__(
+            self,
+            weather_resources: List[WeatherResource],
+            default_interval_in_seconds: float,
+            missed_tick_policy: MissedTickPolicy = 'skip',
+            tick_tolerance_in_seconds: float = 0.0,
+            clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if missed_tick_policy not in ('catch_up', 'skip'):
+            raise ValueError(f'Unknown missed tick policy: {missed_tick_policy}')
+
+        self.__weather_resources: Dict[AnyStr, WeatherResource] = {
+            weather_resource.name: weather_resource for weather_resource in weather_resources
+        }
+
+        self.__default_interval_in_seconds: float = default_interval_in_seconds
+        self.__missed_tick_policy: MissedTickPolicy = missed_tick_policy
+        self.__tick_tolerance_in_seconds: float = tick_tolerance_in_seconds
+        self.__clock: Callable[[], float] = clock
+
+        # Heap of (due time, sequence number, weather resource name). Sequence number keeps order of resources
+        # with equal due times stable:
+        self.__due_times: List[Tuple[float, int, AnyStr]] = []
+        self.__sequence_number: int = 0
+        self.__skipped_ticks: Counter = Counter()
+        self.__started: bool = False
+
+    def start(self) -> None:
+        """
+        Makes all weather resources due immediately.
+        """
+
+        self.__due_times.clear()
+        self.__started = True
+        now: float = self.__clock()
+        for weather_resource_name in self.__weather_resources:
+            self.__push(due_time=now, weather_resource_name=weather_resource_name)
+
+    def update_weather_resources(
+            self,
+            weather_resources: List[WeatherResource],
+            default_interval_in_seconds: float,
+            missed_tick_policy: MissedTickPolicy = 'skip'
+    ) -> None:
+        """
+        Applies reloaded weather resources without resetting the schedule: added weather resources are due
+        immediately, removed ones are unscheduled, and changed ones keep their due times, after which they are
+        rescheduled with their new intervals.
+
+        :param weather_resources: List of :py:class:`WeatherResource` objects of reloaded config.
+        :param default_interval_in_seconds: Default polling interval of reloaded config.
+        :param missed_tick_policy: Missed tick policy of reloaded config.
+        """
+
+        if missed_tick_policy not in ('catch_up', 'skip'):
+            raise ValueError(f'Unknown missed tick policy: {missed_tick_policy}')
+
+        running_weather_resources_names: List[AnyStr] = list(self.__weather_resources)
+        self.__weather_resources = {
+            weather_resource.name: weather_resource for weather_resource in weather_resources
+        }
+        self.__default_interval_in_seconds = default_interval_in_seconds
+        self.__missed_tick_policy = missed_tick_policy
+
+        self.__due_times = [
+            due_tick for due_tick in self.__due_times if due_tick[2] in self.__weather_resources
+        ]
+        heapq.heapify(self.__due_times)
+
+        # Weather resources are scheduled by start:
+        if not self.__started:
+            return
+
+        now: float = self.__clock()
+        for weather_resource_name in self.__weather_resources:
+            if weather_resource_name not in running_weather_resources_names:
+                self.__push(due_time=now, weather_resource_name=weather_resource_name)
+
+    def __push(self, due_time: float, weather_resource_name: AnyStr) -> None:
+        heapq.heappush(self.__due_times, (due_time, self.__sequence_number, weather_resource_name))
+        self.__sequence_number += 1
+
+    def get_interval(self, weather_resource: WeatherResource) -> float:
+        """
+        :param weather_resource: :py:class:`WeatherResource` object.
+        :return: Polling interval of weather resource, or default interval, if it was not provided in config.
+        """
+
+        if weather_resource.check_interval_in_seconds is None:
+            return self.__default_interval_in_seconds
+
+        return weather_resource.check_interval_in_seconds
+
+    def time_until_next_tick(self) -> float:
+        """
+        :return: Seconds until nearest due time. Zero, if some weather resources are already due.
+        """
+
+        if not self.__due_times:
+            return 0.0
+
+        return max(self.__due_times[0][0] - self.__clock(), 0.0)
+
+    async def wait_for_due_weather_resources(self) -> List[WeatherResource]:
+        """
+        Sleeps until nearest due time and returns all weather resources, which are due at this moment
+        (including those, whose due times are within tick tolerance). Next due times of returned resources are
+        scheduled according to their intervals and missed tick policy.
+
+        :return: List of :py:class:`WeatherResource` objects, which should be polled now.
+        """
+
+        if not self.__due_times:
+            return []
+
+        await asyncio.sleep(self.time_until_next_tick())
+
+        now: float = self.__clock()
+        due_ticks: List[Tuple[float, AnyStr]] = []
+        while self.__due_times and self.__due_times[0][0] <= now + self.__tick_tolerance_in_seconds:
+            due_time, _, weather_resource_name = heapq.heappop(self.__due_times)
+            due_ticks.append((due_time, weather_resource_name))
+
+        # Rescheduling is made after popping all due ticks, so resources with small intervals are polled
+        # only once per tick:
+        due_weather_resources: List[WeatherResource] = []
+        for due_time, weather_resource_name in due_ticks:
+            weather_resource: WeatherResource = self.__weather_resources[weather_resource_name]
+            due_weather_resources.append(weather_resource)
+            self.__push(
+                due_time=self.__get_next_due_time(
+                    weather_resource_name=weather_resource_name,
+                    due_time=due_time,
+                    interval=self.get_interval(weather_resource=weather_resource),
+                    now=now
+                ),
+                weather_resource_name=weather_resource_name
+            )
+
+        return due_weather_resources
+
+    def __get_next_due_time(self, weather_resource_name: AnyStr, due_time: float, interval: float, now: float) -> float:
+        """
+        :param weather_resource_name: Name of weather resource, which is rescheduled.
+        :param due_time: Due time of current tick.
+        :param interval: Polling interval of weather resource.
+        :param now: Current clock time.
+        :return: Due time of next tick according to missed tick policy.
+        """
+
+        next_due_time: float = due_time + interval
+        if self.__missed_tick_policy == 'catch_up' or next_due_time > now or interval <= 0:
+            return next_due_time
+
+        missed_ticks: int = int((now - next_due_time) // interval) + 1
+        self.__skipped_ticks[weather_resource_name] += missed_ticks
+        return next_due_time + missed_ticks * interval
+
+    @property
+    def missed_tick_policy(self) -> MissedTickPolicy:
+        return self.__missed_tick_policy
+
+    @property
+    def skipped_ticks(self) -> Counter:
+        return self.__skipped_ticks
+
+    @property
+    def due_times(self) -> Dict[AnyStr, float]:
+        return {weather_resource_name: due_time for due_time, _, weather_resource_name in self.__due_times}
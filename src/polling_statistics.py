@@ -0,0 +1,179 @@
+import aiohttp
+
+from types import SimpleNamespace
+from typing import Dict, AnyStr, List
+from collections import Counter, deque
+
+
+class ConnectionStatistics:
+    """
+    Collects statistics of connections usage by shared :py:class:`aiohttp.ClientSession` for purpose of
+    confirming, that connections are reused between weather resources (API) requests and polling iterations.
+    """
+
+    def __init__(self) -> None:
+        self.__requests_counter: int = 0
+        self.__created_connections_counter: int = 0
+        self.__reused_connections_counter: int = 0
+        self.__dns_cache_hits_counter: int = 0
+        self.__dns_cache_misses_counter: int = 0
+
+        self.__trace_config: aiohttp.TraceConfig = aiohttp.TraceConfig()
+        self.__trace_config.on_request_start.append(self.__on_request_start)
+        self.__trace_config.on_connection_create_end.append(self.__on_connection_create_end)
+        self.__trace_config.on_connection_reuseconn.append(self.__on_connection_reuseconn)
+        self.__trace_config.on_dns_cache_hit.append(self.__on_dns_cache_hit)
+        self.__trace_config.on_dns_cache_miss.append(self.__on_dns_cache_miss)
+
+    async def __on_request_start(self, session: aiohttp.ClientSession, context: SimpleNamespace, params) -> None:
+        self.__requests_counter += 1
+
+    async def __on_connection_create_end(self, session: aiohttp.ClientSession, context: SimpleNamespace, params) -> None:
+        self.__created_connections_counter += 1
+
+    async def __on_connection_reuseconn(self, session: aiohttp.ClientSession, context: SimpleNamespace, params) -> None:
+        self.__reused_connections_counter += 1
+
+    async def __on_dns_cache_hit(self, session: aiohttp.ClientSession, context: SimpleNamespace, params) -> None:
+        self.__dns_cache_hits_counter += 1
+
+    async def __on_dns_cache_miss(self, session: aiohttp.ClientSession, context: SimpleNamespace, params) -> None:
+        self.__dns_cache_misses_counter += 1
+
+    def snapshot(self) -> Dict[AnyStr, int]:
+        """
+        Creates a snapshot of current connections statistics.
+
+        :return: Dictionary with counters names and their values.
+        """
+
+        return {
+            'requests': self.__requests_counter,
+            'created_connections': self.__created_connections_counter,
+            'reused_connections': self.__reused_connections_counter,
+            'dns_cache_hits': self.__dns_cache_hits_counter,
+            'dns_cache_misses': self.__dns_cache_misses_counter
+        }
+
+    def __str__(self) -> AnyStr:
+        return ', '.join(f'{name}={value}' for name, value in self.snapshot().items())
+
+    @property
+    def trace_config(self) -> aiohttp.TraceConfig:
+        return self.__trace_config
+
+    @property
+    def requests(self) -> int:
+        return self.__requests_counter
+
+    @property
+    def created_connections(self) -> int:
+        return self.__created_connections_counter
+
+    @property
+    def reused_connections(self) -> int:
+        return self.__reused_connections_counter
+
+    @property
+    def dns_cache_hits(self) -> int:
+        return self.__dns_cache_hits_counter
+
+    @property
+    def dns_cache_misses(self) -> int:
+        return self.__dns_cache_misses_counter
+
+
+class TimeoutStatistics:
+    """
+    Collects per weather resource (API) counters of requests, which exceeded their own timeout or were cancelled
+    due to iteration deadline, for purpose of finding weather resources, which are blowing the iteration budget.
+    """
+
+    def __init__(self) -> None:
+        self.__timeouts: Counter = Counter()
+        self.__deadline_cancellations: Counter = Counter()
+
+    def register_timeout(self, weather_resource_name: AnyStr) -> None:
+        self.__timeouts[weather_resource_name] += 1
+
+    def register_deadline_cancellation(self, weather_resource_name: AnyStr) -> None:
+        self.__deadline_cancellations[weather_resource_name] += 1
+
+    def snapshot(self) -> Dict[AnyStr, Dict[AnyStr, int]]:
+        """
+        Creates a snapshot of current timeouts statistics.
+
+        :return: Dictionary with weather resources names and their timeouts counters.
+        """
+
+        return {
+            weather_resource_name: {
+                'timeouts': self.__timeouts[weather_resource_name],
+                'deadline_cancellations': self.__deadline_cancellations[weather_resource_name]
+            } for weather_resource_name in sorted(self.__timeouts.keys() | self.__deadline_cancellations.keys())
+        }
+
+    def __str__(self) -> AnyStr:
+        return ', '.join(
+            f'{name}(timeouts={counters["timeouts"]}, deadline_cancellations={counters["deadline_cancellations"]})'
+            for name, counters in self.snapshot().items()
+        )
+
+    @property
+    def timeouts(self) -> Counter:
+        return self.__timeouts
+
+    @property
+    def deadline_cancellations(self) -> Counter:
+        return self.__deadline_cancellations
+
+
+class IterationStatistics:
+    """
+    Collects latencies of polling iterations (from start of fetching to end of writing results) for purpose of
+    detecting slow iterations and performance regressions. Only latest iterations are kept.
+    """
+
+    def __init__(self, max_iterations: int = 10000) -> None:
+        self.__latencies: deque = deque(maxlen=max_iterations)
+        self.__iterations_counter: int = 0
+
+    def register_iteration(self, latency_in_seconds: float) -> None:
+        self.__latencies.append(latency_in_seconds)
+        self.__iterations_counter += 1
+
+    def get_percentile(self, percentile: float) -> float:
+        """
+        :param percentile: Percentile from 0 to 100.
+        :return: Linearly interpolated percentile of kept iterations latencies. Zero, if there were no iterations.
+        """
+
+        if not self.__latencies:
+            return 0.0
+
+        latencies: List[float] = sorted(self.__latencies)
+        rank: float = (len(latencies) - 1) * percentile / 100
+        lower_index: int = int(rank)
+        upper_index: int = min(lower_index + 1, len(latencies) - 1)
+        return latencies[lower_index] + (latencies[upper_index] - latencies[lower_index]) * (rank - lower_index)
+
+    def snapshot(self) -> Dict[AnyStr, float]:
+        """
+        Creates a snapshot of current iterations statistics.
+
+        :return: Dictionary with number of iterations and latencies percentiles in seconds.
+        """
+
+        return {
+            'iterations': self.__iterations_counter,
+            'p50_in_seconds': round(self.get_percentile(percentile=50), 4),
+            'p95_in_seconds': round(self.get_percentile(percentile=95), 4),
+            'p99_in_seconds': round(self.get_percentile(percentile=99), 4)
+        }
+
+    def __str__(self) -> AnyStr:
+        return ', '.join(f'{name}={value}' for name, value in self.snapshot().items())
+
+    @property
+    def iterations(self) -> int:
+        return self.__iterations_counter
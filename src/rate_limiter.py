@@ -0,0 +1,155 @@
+import asyncio
+import time
+
+from typing import List, Dict, AnyStr, Callable, Optional, Union
+
+
+class TokenBucket:
+    """
+    Token bucket of a single quota (for example, 60 requests per 60 seconds).
+
+    Bucket is full at start and is refilled continuously with rate "requests / period", so requests can burst up to
+    the quota, but average rate never exceeds it.
+    """
+
+    def __init__(self, requests: int, period_in_seconds: float, clock: Callable[[], float] = time.monotonic) -> None:
+        if requests <= 0 or period_in_seconds <= 0:
+            raise ValueError(f'Rate limit should be positive: {requests} requests per {period_in_seconds} seconds')
+
+        self.__capacity: float = float(requests)
+        self.__refill_rate: float = requests / period_in_seconds
+        self.__clock: Callable[[], float] = clock
+
+        self.__tokens: float = self.__capacity
+        self.__updated_at: float = self.__clock()
+
+    def __refill(self) -> None:
+        now: float = self.__clock()
+        self.__tokens = min(self.__capacity, self.__tokens + (now - self.__updated_at) * self.__refill_rate)
+        self.__updated_at = now
+
+    def time_until_available(self) -> float:
+        """
+        :return: Seconds until one token is available. Zero, if token is available now.
+        """
+
+        self.__refill()
+        if self.__tokens >= 1:
+            return 0.0
+
+        return (1 - self.__tokens) / self.__refill_rate
+
+    def consume(self) -> None:
+        self.__refill()
+        self.__tokens -= 1
+
+    @property
+    def tokens(self) -> float:
+        self.__refill()
+        return self.__tokens
+
+
+class RateLimiter:
+    """
+    Async rate limiter of single weather resource (API), shared by all locations and iterations.
+
+    Request is allowed, when every quota bucket has a token and weather resource has not asked to wait via
+    "Retry-After" header. Otherwise, request waits (instead of failing) in FIFO queue, so requests are served
+    in order of arrival.
+    """
+
+    def __init__(
+            self,
+            quotas: Optional[Union[Dict[AnyStr, float], List[Dict[AnyStr, float]]]] = None,
+            clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        :param quotas: Quota or list of quotas with "requests" and "period_in_seconds" keys. Without quotas only
+        "Retry-After" headers are honored.
+        :param clock: Monotonic clock, used for refilling buckets.
+        """
+
+        if isinstance(quotas, dict):
+            quotas = [quotas]
+
+        self.__clock: Callable[[], float] = clock
+        self.__token_buckets: List[TokenBucket] = [
+            TokenBucket(requests=quota['requests'], period_in_seconds=quota['period_in_seconds'], clock=clock)
+            for quota in quotas or []
+        ]
+
+        # asyncio.Lock wakes up waiters in FIFO order, so holding it while waiting for tokens makes queue fair:
+        self.__lock: asyncio.Lock = asyncio.Lock()
+        self.__blocked_until: float = 0.0
+
+        self.__acquired_counter: int = 0
+        self.__waits_counter: int = 0
+        self.__waited_seconds: float = 0.0
+        self.__retry_after_counter: int = 0
+
+    def time_until_available(self) -> float:
+        """
+        :return: Seconds until request is allowed by all quotas and "Retry-After" block. Zero, if it is allowed now.
+        """
+
+        time_until_available: float = max(self.__blocked_until - self.__clock(), 0.0)
+        for token_bucket in self.__token_buckets:
+            time_until_available = max(time_until_available, token_bucket.time_until_available())
+
+        return time_until_available
+
+    async def acquire(self) -> None:
+        """
+        Waits in queue until request is allowed and consumes a token of each quota.
+        """
+
+        async with self.__lock:
+            waited: bool = False
+            started_at: float = self.__clock()
+            while (time_until_available := self.time_until_available()) > 0:
+                waited = True
+                await asyncio.sleep(time_until_available)
+
+            for token_bucket in self.__token_buckets:
+                token_bucket.consume()
+
+            self.__acquired_counter += 1
+            if waited:
+                self.__waits_counter += 1
+                self.__waited_seconds += self.__clock() - started_at
+
+    def retry_after(self, delay_in_seconds: float) -> None:
+        """
+        Blocks all requests to weather resource for provided time, for example, after "429 Too Many Requests" response
+        with "Retry-After" header.
+
+        :param delay_in_seconds: Time, during which requests are not allowed.
+        """
+
+        self.__retry_after_counter += 1
+        self.__blocked_until = max(self.__blocked_until, self.__clock() + delay_in_seconds)
+
+    def snapshot(self) -> Dict[AnyStr, Union[int, float]]:
+        """
+        Creates a snapshot of current rate limiter statistics.
+
+        :return: Dictionary with counters names and their values.
+        """
+
+        return {
+            'acquired': self.__acquired_counter,
+            'waits': self.__waits_counter,
+            'waited_seconds': round(self.__waited_seconds, 3),
+            'retry_after': self.__retry_after_counter
+        }
+
+    def __str__(self) -> AnyStr:
+        return ', '.join(f'{name}={value}' for name, value in self.snapshot().items())
+
+    @property
+    def waits(self) -> int:
+        return self.__waits_counter
+
+    @property
+    def retry_after_counter(self) -> int:
+        return self.__retry_after_counter
@@ -0,0 +1,229 @@
+import asyncio
+
+from typing import Dict, AnyStr, List, Optional, Callable, Awaitable, TypeVar, Set, Union
+
+
+T = TypeVar('T')
+
+
+class P2QuantileEstimator:
+    """
+    Online estimator of a single quantile by P² algorithm (Jain and Chlamtac), which keeps five markers instead of
+    all observations, so every update is O(1) in time and memory. Until five observations are received, quantile
+    is calculated exactly from them.
+    """
+
+    def __init__(self, quantile: float) -> None:
+        if not 0 < quantile < 1:
+            raise ValueError(f'Quantile should be in (0, 1): {quantile}')
+
+        self.__quantile: float = quantile
+        self.__heights: List[float] = []
+        self.__positions: List[int] = [1, 2, 3, 4, 5]
+        self.__desired_positions: List[float] = [1, 1 + 2 * quantile, 1 + 4 * quantile, 3 + 2 * quantile, 5]
+        self.__increments: List[float] = [0, quantile / 2, quantile, (1 + quantile) / 2, 1]
+        self.__count: int = 0
+
+    def add(self, value: float) -> None:
+        self.__count += 1
+        if self.__count <= 5:
+            self.__heights.append(value)
+            self.__heights.sort()
+            return
+
+        heights: List[float] = self.__heights
+        if value < heights[0]:
+            heights[0] = value
+            cell_index: int = 0
+        elif value >= heights[4]:
+            heights[4] = max(heights[4], value)
+            cell_index = 3
+        else:
+            cell_index = next(index for index in range(4) if heights[index] <= value < heights[index + 1])
+
+        for index in range(cell_index + 1, 5):
+            self.__positions[index] += 1
+
+        for index in range(5):
+            self.__desired_positions[index] += self.__increments[index]
+
+        for index in range(1, 4):
+            self.__adjust_marker(index=index)
+
+    def __adjust_marker(self, index: int) -> None:
+        heights: List[float] = self.__heights
+        positions: List[int] = self.__positions
+        difference: float = self.__desired_positions[index] - positions[index]
+        if not (
+                difference >= 1 and positions[index + 1] - positions[index] > 1
+                or difference <= -1 and positions[index - 1] - positions[index] < -1
+        ):
+            return
+
+        direction: int = 1 if difference > 0 else -1
+        # Piecewise-parabolic prediction of marker height is used, if it keeps markers heights ordered:
+        height: float = heights[index] + direction / (positions[index + 1] - positions[index - 1]) * (
+            (positions[index] - positions[index - 1] + direction)
+            * (heights[index + 1] - heights[index]) / (positions[index + 1] - positions[index])
+            + (positions[index + 1] - positions[index] - direction)
+            * (heights[index] - heights[index - 1]) / (positions[index] - positions[index - 1])
+        )
+        if not heights[index - 1] < height < heights[index + 1]:
+            height = heights[index] + direction * (heights[index + direction] - heights[index]) / (
+                positions[index + direction] - positions[index]
+            )
+
+        heights[index] = height
+        positions[index] += direction
+
+    def __len__(self) -> int:
+        return self.__count
+
+    @property
+    def value(self) -> Optional[float]:
+        """
+        :return: Estimated quantile or None, if there were no observations.
+        """
+
+        if not self.__count:
+            return None
+
+        if self.__count <= 5:
+            rank: float = (self.__count - 1) * self.__quantile
+            lower_index: int = int(rank)
+            upper_index: int = min(lower_index + 1, self.__count - 1)
+            return self.__heights[lower_index] + (
+                self.__heights[upper_index] - self.__heights[lower_index]
+            ) * (rank - lower_index)
+
+        return self.__heights[2]
+
+
+class RequestHedger:
+    """
+    Hedger of requests to a single weather resource (API). If request is not completed within observed latency
+    quantile of the resource, identical hedge request is sent, and whichever request succeeds first is used,
+    while the other one is cancelled.
+
+    Hedge requests are limited by budget: number of hedges doesn't exceed "budget_ratio" of requests, so a slow
+    resource can't be loaded more than by the ratio. Requests are not hedged, until "min_samples" latencies were
+    observed.
+
+    Usage:
+        response = await request_hedger.run(make_request=lambda: send_request(...))
+    """
+
+    def __init__(self, quantile: float = 0.95, budget_ratio: float = 0.1, min_samples: int = 20) -> None:
+        if budget_ratio < 0:
+            raise ValueError(f'Hedge budget ratio should not be negative: {budget_ratio}')
+
+        self.__latency_estimator: P2QuantileEstimator = P2QuantileEstimator(quantile=quantile)
+        self.__budget_ratio: float = budget_ratio
+        self.__min_samples: int = min_samples
+        self.__requests_counter: int = 0
+        self.__hedges_counter: int = 0
+        self.__hedge_wins_counter: int = 0
+
+    def register_latency(self, latency_in_seconds: float) -> None:
+        """
+        :param latency_in_seconds: Latency of completed request (primary or hedge) to the resource.
+        """
+
+        self.__latency_estimator.add(latency_in_seconds)
+
+    async def run(self, make_request: Callable[[], Awaitable[T]]) -> T:
+        """
+        :param make_request: Factory of request coroutine, which is called once for primary request and once more
+        for hedge request.
+        :return: Result of the first succeeded request.
+        :raises: Exception of the first failed request, if all requests failed.
+        """
+
+        self.__requests_counter += 1
+        hedge_delay_in_seconds: Optional[float] = self.hedge_delay_in_seconds
+        if hedge_delay_in_seconds is None:
+            return await make_request()
+
+        primary_request: asyncio.Task = asyncio.ensure_future(make_request())
+        hedge_request: Optional[asyncio.Task] = None
+        pending_requests: Set[asyncio.Task] = {primary_request}
+        error: Optional[BaseException] = None
+        try:
+            done_requests, pending_requests = await asyncio.wait(pending_requests, timeout=hedge_delay_in_seconds)
+            if not done_requests and self.__is_hedge_allowed():
+                self.__hedges_counter += 1
+                hedge_request = asyncio.ensure_future(make_request())
+                pending_requests.add(hedge_request)
+
+            while True:
+                for request in done_requests:
+                    if request.exception() is None:
+                        if request is hedge_request:
+                            self.__hedge_wins_counter += 1
+
+                        return request.result()
+
+                    error = error or request.exception()
+
+                if not pending_requests:
+                    raise error
+
+                done_requests, pending_requests = await asyncio.wait(
+                    pending_requests,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+
+        finally:
+            # Losing request is cancelled and awaited, so its connection is released before result is used:
+            for request in pending_requests:
+                request.cancel()
+
+            if pending_requests:
+                await asyncio.wait(pending_requests)
+
+    def __is_hedge_allowed(self) -> bool:
+        return self.__hedges_counter + 1 <= self.__budget_ratio * self.__requests_counter
+
+    def snapshot(self) -> Dict[AnyStr, Union[int, float, None]]:
+        """
+        Creates a snapshot of hedging statistics: hedge rate is a share of hedged requests, win rate is a share of
+        hedges, which succeeded before primary requests.
+
+        :return: Dictionary with statistics names and their values.
+        """
+
+        latency_quantile: Optional[float] = self.__latency_estimator.value
+        return {
+            'requests': self.__requests_counter,
+            'hedges': self.__hedges_counter,
+            'hedge_wins': self.__hedge_wins_counter,
+            'hedge_rate': round(self.__hedges_counter / self.__requests_counter, 4) if self.__requests_counter else 0.0,
+            'win_rate': round(self.__hedge_wins_counter / self.__hedges_counter, 4) if self.__hedges_counter else 0.0,
+            'latency_quantile_in_seconds': round(latency_quantile, 4) if latency_quantile is not None else None
+        }
+
+    def __str__(self) -> AnyStr:
+        return ', '.join(f'{name}={value}' for name, value in self.snapshot().items())
+
+    @property
+    def hedge_delay_in_seconds(self) -> Optional[float]:
+        """
+        :return: Observed latency quantile or None, if there are not enough observed latencies yet.
+        """
+
+        if len(self.__latency_estimator) < self.__min_samples:
+            return None
+
+        return self.__latency_estimator.value
+
+    @property
+    def latency_estimator(self) -> P2QuantileEstimator:
+        return self.__latency_estimator
+
+    @property
+    def hedges(self) -> int:
+        return self.__hedges_counter
+
+    @property
+    def hedge_wins(self) -> int:
+        return self.__hedge_wins_counter
@@ -0,0 +1,230 @@
+import hashlib
+import json
+import os
+import time
+
+from collections import OrderedDict, namedtuple
+from pathlib import Path
+from typing import Dict, AnyStr, Optional, Callable, Any
+
+from custom_types import Temperature
+
+
+CachedResponse: namedtuple = namedtuple(
+    'CachedResponse',
+    [
+        'temperature',
+        'etag',
+        'last_modified',
+        'expires_at'
+    ]
+)
+
+
+class ResponseCache:
+    """
+    LRU cache of temperatures, parsed from weather resources (API) responses, with per entry TTL.
+
+    Fresh entries are used instead of making requests. Expired entries are kept for revalidation: their ETag and
+    Last-Modified values are sent in conditional request, and if weather resource answers "304 Not Modified",
+    cached temperature is reused and entry is refreshed.
+
+    Cache can be persisted to .json file, so restarted weather checker starts with warm cache.
+    """
+
+    def __init__(
+            self,
+            max_entries: int,
+            file_path: Optional[Path] = None,
+            clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.__max_entries: int = max_entries
+        self.__file_path: Optional[Path] = file_path
+        self.__clock: Callable[[], float] = clock
+        self.__entries: OrderedDict[AnyStr, CachedResponse] = OrderedDict()
+
+        self.__hits_counter: int = 0
+        self.__misses_counter: int = 0
+        self.__revalidations_counter: int = 0
+
+    @staticmethod
+    def make_key(url: AnyStr, params: Optional[Dict], headers: Optional[Dict]) -> AnyStr:
+        """
+        Creates cache key of request. Key is hashed, because params and headers usually contain tokens,
+        which should not be stored on disk.
+
+        :param url: URL of weather resource.
+        :param params: Request params.
+        :param headers: Request headers.
+        :return: Cache key.
+        """
+
+        request: AnyStr = json.dumps([url, params or {}, headers or {}], sort_keys=True, default=str)
+        return hashlib.sha256(request.encode()).hexdigest()
+
+    def get(self, key: AnyStr) -> Optional[CachedResponse]:
+        """
+        :param key: Cache key, created by :py:meth:`make_key`.
+        :return: Fresh :py:class:`CachedResponse` (cache hit) or None (cache miss).
+        """
+
+        cached_response: Optional[CachedResponse] = self.__entries.get(key)
+        if cached_response is None or cached_response.expires_at <= self.__clock():
+            self.__misses_counter += 1
+            return None
+
+        self.__entries.move_to_end(key)
+        self.__hits_counter += 1
+        return cached_response
+
+    def get_stale(self, key: AnyStr) -> Optional[CachedResponse]:
+        """
+        :param key: Cache key, created by :py:meth:`make_key`.
+        :return: :py:class:`CachedResponse` regardless of its freshness, for purpose of conditional request.
+        """
+
+        return self.__entries.get(key)
+
+    def put(
+            self,
+            key: AnyStr,
+            temperature: Temperature,
+            ttl_in_seconds: float,
+            etag: Optional[AnyStr] = None,
+            last_modified: Optional[AnyStr] = None
+    ) -> None:
+        """
+        Saves parsed temperature to cache. Least recently used entry is evicted, if cache is full.
+
+        :param key: Cache key, created by :py:meth:`make_key`.
+        :param temperature: :py:class:`Temperature`, parsed from response.
+        :param ttl_in_seconds: Time, during which entry is fresh.
+        :param etag: ETag header of response.
+        :param last_modified: Last-Modified header of response.
+        """
+
+        self.__entries[key] = CachedResponse(
+            temperature=temperature,
+            etag=etag,
+            last_modified=last_modified,
+            expires_at=self.__clock() + ttl_in_seconds
+        )
+        self.__entries.move_to_end(key)
+
+        while len(self.__entries) > self.__max_entries:
+            self.__entries.popitem(last=False)
+
+    def revalidate(self, key: AnyStr, ttl_in_seconds: float) -> Optional[CachedResponse]:
+        """
+        Refreshes entry after "304 Not Modified" response.
+
+        :param key: Cache key, created by :py:meth:`make_key`.
+        :param ttl_in_seconds: Time, during which entry is fresh.
+        :return: Refreshed :py:class:`CachedResponse` or None, if entry was evicted meanwhile.
+        """
+
+        cached_response: Optional[CachedResponse] = self.__entries.get(key)
+        if cached_response is None:
+            return None
+
+        self.__revalidations_counter += 1
+        self.put(
+            key=key,
+            temperature=cached_response.temperature,
+            ttl_in_seconds=ttl_in_seconds,
+            etag=cached_response.etag,
+            last_modified=cached_response.last_modified
+        )
+
+        return self.__entries[key]
+
+    def load(self) -> bool:
+        """
+        Loads entries from cache file, if it exists. Expiration times are stored in file as wall clock time
+        and are converted to cache clock time.
+
+        :return: False, if cache file is corrupt (for example, truncated), so cache is left cold, otherwise True.
+        """
+
+        if self.__file_path is None or not self.__file_path.exists():
+            return True
+
+        clock_offset: float = self.__clock() - time.time()
+        loaded_entries: OrderedDict[AnyStr, CachedResponse] = OrderedDict()
+        try:
+            with open(self.__file_path, 'r') as cache_file:
+                entries: Dict[AnyStr, Dict[AnyStr, Any]] = json.load(cache_file)
+
+            for key, entry in entries.items():
+                loaded_entries[key] = CachedResponse(
+                    temperature=Temperature(entry['temperature']),
+                    etag=entry['etag'],
+                    last_modified=entry['last_modified'],
+                    expires_at=entry['expires_at'] + clock_offset
+                )
+        except (ValueError, KeyError, TypeError, AttributeError):
+            # Not decodable JSON (ValueError) or JSON of unexpected structure:
+            return False
+
+        self.__entries.update(loaded_entries)
+
+        while len(self.__entries) > self.__max_entries:
+            self.__entries.popitem(last=False)
+
+        return True
+
+    def save(self) -> None:
+        """
+        Saves entries to cache file, if it is provided. File is replaced atomically.
+        """
+
+        if self.__file_path is None:
+            return
+
+        clock_offset: float = time.time() - self.__clock()
+        entries: Dict[AnyStr, Dict[AnyStr, Any]] = {
+            key: {
+                'temperature': cached_response.temperature,
+                'etag': cached_response.etag,
+                'last_modified': cached_response.last_modified,
+                'expires_at': cached_response.expires_at + clock_offset
+            } for key, cached_response in self.__entries.items()
+        }
+
+        temporary_file_path: Path = self.__file_path.with_name(self.__file_path.name + '.tmp')
+        with open(temporary_file_path, 'w') as cache_file:
+            json.dump(entries, cache_file)
+
+        os.replace(temporary_file_path, self.__file_path)
+
+    def snapshot(self) -> Dict[AnyStr, int]:
+        """
+        Creates a snapshot of current cache statistics.
+
+        :return: Dictionary with counters names and their values.
+        """
+
+        return {
+            'entries': len(self.__entries),
+            'hits': self.__hits_counter,
+            'misses': self.__misses_counter,
+            'revalidations': self.__revalidations_counter
+        }
+
+    def __str__(self) -> AnyStr:
+        return ', '.join(f'{name}={value}' for name, value in self.snapshot().items())
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @property
+    def hits(self) -> int:
+        return self.__hits_counter
+
+    @property
+    def misses(self) -> int:
+        return self.__misses_counter
+
+    @property
+    def revalidations(self) -> int:
+        return self.__revalidations_counter
@@ -0,0 +1,111 @@
+import re
+import json
+
+from typing import List, Tuple, AnyStr, Any, Union, Callable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Faster JSON backend is used, if it is installed. Both backends decode raw bytes directly:
+decode_json: Callable[[Union[bytes, AnyStr]], Any] = orjson.loads if orjson is not None else json.loads
+
+ResultKey = Union[AnyStr, int]
+
+_PATH_PATTERN: re.Pattern = re.compile(r'(?:[^.\[\]]+|\[-?\d+])(?:\.[^.\[\]]+|\[-?\d+])*')
+_PATH_PART_PATTERN: re.Pattern = re.compile(r'([^.\[\]]+)|\[(-?\d+)]')
+_NUMBER_TYPES: Tuple[type, ...] = (int, float)
+
+
+class ResultExtractor:
+    """
+    Extractor of temperature from weather resource (API) response, compiled once from "result_keys" of
+    weather resource.
+
+    Result keys are a path in response JSON. String keys are used for objects and integer keys are used as indices
+    of lists. Path can also be provided as a single string, for example, "list[0].main.temp".
+
+    Temperature is extracted by "extract(response_json)" function. If any part of the path is missing or has
+    unexpected type, or found value is not a number, default value is returned.
+    """
+
+    def __init__(self, result_keys: Union[List[ResultKey], AnyStr], default_value: Any = None) -> None:
+        self.__path: Tuple[ResultKey, ...] = self.compile_path(result_keys=result_keys)
+        self.__default_value: Any = default_value
+
+        # Extracting function is compiled once and is called directly, without method call overhead:
+        self.extract: Callable[[Any], Any] = self.__compile_extract(path=self.__path, default_value=default_value)
+
+    @staticmethod
+    def compile_path(result_keys: Union[List[ResultKey], AnyStr]) -> Tuple[ResultKey, ...]:
+        """
+        :param result_keys: List of keys or path string.
+        :return: Tuple of keys, where list indices are integers.
+        """
+
+        if isinstance(result_keys, str):
+            if not _PATH_PATTERN.fullmatch(result_keys):
+                raise ValueError(f'Malformed result keys path: {result_keys}')
+
+            return tuple(key if key else int(index) for key, index in _PATH_PART_PATTERN.findall(result_keys))
+
+        for result_key in result_keys or []:
+            if not isinstance(result_key, (str, int)) or isinstance(result_key, bool):
+                raise ValueError(f'Result key should be a string or an integer: {result_key!r}')
+
+        return tuple(result_keys or [])
+
+    @staticmethod
+    def __compile_extract(path: Tuple[ResultKey, ...], default_value: Any) -> Callable[[Any], Any]:
+        """
+        Compiles path to a single function, which extracts temperature from response. Lookups of short paths
+        (the most common ones) are unrolled, so no loop and no nested call are made per response.
+
+        :param path: Compiled path.
+        :param default_value: Value, returned if temperature is not found.
+        :return: Function of decoded response JSON, which returns temperature or default value.
+        """
+
+        if not path:
+            return lambda response_json: default_value
+
+        # Missing response (None) and missing path parts raise TypeError or KeyError.
+        # Exact type check is cheaper than isinstance() and rejects booleans:
+        if len(path) == 1:
+            first_key, = path
+
+            def extract(response_json: Any) -> Any:
+                try:
+                    value: Any = response_json[first_key]
+                except (KeyError, IndexError, TypeError):
+                    return default_value
+
+                return value if type(value) in _NUMBER_TYPES else default_value
+        elif len(path) == 2:
+            first_key, second_key = path
+
+            def extract(response_json: Any) -> Any:
+                try:
+                    value: Any = response_json[first_key][second_key]
+                except (KeyError, IndexError, TypeError):
+                    return default_value
+
+                return value if type(value) in _NUMBER_TYPES else default_value
+        else:
+            def extract(response_json: Any) -> Any:
+                value: Any = response_json
+                try:
+                    for result_key in path:
+                        value = value[result_key]
+                except (KeyError, IndexError, TypeError):
+                    return default_value
+
+                return value if type(value) in _NUMBER_TYPES else default_value
+
+        return extract
+
+    @property
+    def path(self) -> Tuple[ResultKey, ...]:
+        return self.__path
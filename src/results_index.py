@@ -0,0 +1,137 @@
+import json
+import math
+import hashlib
+
+from collections import namedtuple
+from typing import List, Dict, AnyStr, Any, Optional, Tuple
+
+from custom_types import Temperature
+from sqlite_results_writer import ResultRow
+
+
+# JSON document of index, which is serialized once on update, and its ETag:
+IndexedDocument: namedtuple = namedtuple(
+    'IndexedDocument',
+    [
+        'body',
+        'etag'
+    ]
+)
+
+
+class ResultsIndex:
+    """
+    In-memory index of the latest results of each location and weather resource (API), which is updated by sink
+    stage of polling pipeline and is read by :py:class:`ResultsServer`.
+
+    Documents are serialized to JSON and their ETags are calculated on update, so reading of document is a single
+    dictionary lookup by path without serialization and without touching results files. Only documents of locations,
+    which were polled in the iteration, are updated, so locations, which were not polled (for example, leased
+    by other node), keep their previous documents without being serialized again.
+
+    Paths of documents:
+        ("locations",) - names of indexed locations in order of indexing;
+        ("locations", location name) - latest results of location: temperatures, statuses and latencies of weather
+        resources, average temperature and rolling statistics;
+        ("locations", location name, "providers", weather resource name) - latest result of weather resource.
+    """
+
+    def __init__(self) -> None:
+        self.__documents: Dict[Tuple[AnyStr, ...], IndexedDocument] = {}
+        self.__locations_names: List[AnyStr] = []
+        self.__updates_counter: int = 0
+
+    def update(
+            self,
+            iteration: int,
+            timestamp: AnyStr,
+            results_rows: List[ResultRow],
+            average_temperatures: Dict[AnyStr, Tuple[Temperature, List[AnyStr]]],
+            rolling_statistics: Dict[AnyStr, Dict[AnyStr, Dict[AnyStr, Any]]]
+    ) -> None:
+        """
+        :param iteration: Number of iteration.
+        :param timestamp: Timestamp of iteration in ISO format.
+        :param results_rows: :py:class:`ResultRow` objects of the iteration, one per location and weather resource.
+        :param average_temperatures: Average temperatures and rejected weather resources names by locations names.
+        :param rolling_statistics: Snapshot of :py:class:`RollingStatistics` by locations and weather resources names.
+        """
+
+        providers_results: Dict[AnyStr, Dict[AnyStr, Dict[AnyStr, Any]]] = {}
+        for results_row in results_rows:
+            providers_results.setdefault(results_row.location, {})[results_row.provider] = {
+                'temperature': self.__to_json_number(value=results_row.temperature),
+                'status': results_row.status,
+                'latency_in_seconds': self.__to_json_number(value=results_row.latency_in_seconds),
+                'rolling_statistics': rolling_statistics.get(results_row.location, {}).get(results_row.provider)
+            }
+
+        # Documents are updated in place only for locations, polled in the iteration. Server reads them on the same
+        # event loop, so reader never sees a partially updated index:
+        new_locations_names: List[AnyStr] = []
+        for location_name, location_providers_results in providers_results.items():
+            if ('locations', location_name) not in self.__documents:
+                new_locations_names.append(location_name)
+
+            average_temperature, rejected_weather_resources_names = average_temperatures.get(location_name, (None, []))
+            self.__documents[('locations', location_name)] = self.__create_document(
+                data={
+                    'location': location_name,
+                    'iteration': iteration,
+                    'timestamp': timestamp,
+                    'average_temperature': self.__to_json_number(value=average_temperature),
+                    'rejected_providers': rejected_weather_resources_names,
+                    'providers': location_providers_results
+                }
+            )
+            for weather_resource_name, provider_results in location_providers_results.items():
+                self.__documents[('locations', location_name, 'providers', weather_resource_name)] = (
+                    self.__create_document(
+                        data={
+                            'location': location_name,
+                            'provider': weather_resource_name,
+                            'iteration': iteration,
+                            'timestamp': timestamp,
+                            **provider_results
+                        }
+                    )
+                )
+
+        # List of locations is serialized again only, when new locations were indexed:
+        if new_locations_names or ('locations',) not in self.__documents:
+            self.__locations_names.extend(new_locations_names)
+            self.__documents[('locations',)] = self.__create_document(data={'locations': self.__locations_names})
+
+        self.__updates_counter += 1
+
+    def get(self, path: Tuple[AnyStr, ...]) -> Optional[IndexedDocument]:
+        """
+        :param path: Path of document, for example ("locations", "London").
+        :return: :py:class:`IndexedDocument` or None, if there is no document with such path.
+        """
+
+        return self.__documents.get(path)
+
+    @staticmethod
+    def __create_document(data: Dict[AnyStr, Any]) -> IndexedDocument:
+        body: bytes = json.dumps(data, allow_nan=False).encode()
+        return IndexedDocument(body=body, etag=f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"')
+
+    @staticmethod
+    def __to_json_number(value: Optional[float]) -> Optional[float]:
+        """
+        Converts NaN (missing temperature of columnar results) and numpy floats to JSON compatible values.
+        Values, which are not numbers, are converted to None.
+        """
+
+        if not isinstance(value, (int, float)) or math.isnan(value):
+            return None
+
+        return float(value)
+
+    def __len__(self) -> int:
+        return len(self.__locations_names)
+
+    @property
+    def updates(self) -> int:
+        return self.__updates_counter
@@ -0,0 +1,118 @@
+from aiohttp import web, hdrs
+from typing import AnyStr, Optional, Tuple
+
+from results_index import ResultsIndex, IndexedDocument
+from metrics_registry import MetricsRegistry
+
+
+class ResultsServer:
+    """
+    Embedded HTTP server, which serves the latest results from :py:class:`ResultsIndex` as JSON and metrics
+    from :py:class:`MetricsRegistry` in Prometheus text format. Server runs on event loop of weather checker,
+    and each results request is answered by a single lookup in index.
+
+    Responses have ETag of document, and request with "If-None-Match" header, which contains current ETag,
+    is answered with "304 Not Modified" without body.
+
+    Routes:
+        GET /locations - names of locations;
+        GET /locations/{location} - latest results and rolling statistics of location;
+        GET /locations/{location}/providers/{provider} - latest result and rolling statistics of weather resource;
+        GET /metrics - metrics in Prometheus text format.
+
+    Routes of results (or metrics) are not served, if results index (or metrics registry) is not provided.
+
+    Usage:
+        async with ResultsServer(results_index=..., host='127.0.0.1', port=8080) as results_server:
+            ...
+    """
+
+    def __init__(
+            self,
+            results_index: Optional[ResultsIndex] = None,
+            host: AnyStr = '127.0.0.1',
+            port: int = 8080,
+            metrics_registry: Optional[MetricsRegistry] = None
+    ) -> None:
+        self.__results_index: Optional[ResultsIndex] = results_index
+        self.__metrics_registry: Optional[MetricsRegistry] = metrics_registry
+        self.__host: AnyStr = host
+        self.__port: int = port
+        self.__runner: Optional[web.AppRunner] = None
+
+    async def __aenter__(self) -> 'ResultsServer':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        application: web.Application = web.Application()
+        if self.__results_index is not None:
+            application.router.add_get('/locations', self.__handle)
+            application.router.add_get('/locations/{location}', self.__handle)
+            application.router.add_get('/locations/{location}/providers/{provider}', self.__handle)
+
+        if self.__metrics_registry is not None:
+            application.router.add_get('/metrics', self.__handle_metrics)
+
+        # Access log is disabled, so serving of requests doesn't compete with polling for the event loop:
+        self.__runner = web.AppRunner(application, access_log=None)
+        await self.__runner.setup()
+        site: web.TCPSite = web.TCPSite(self.__runner, host=self.__host, port=self.__port)
+        await site.start()
+
+        # Port is known only after start, if it was chosen by OS (port 0):
+        self.__port = self.__runner.addresses[0][1]
+
+    async def close(self) -> None:
+        if self.__runner is not None:
+            await self.__runner.cleanup()
+            self.__runner = None
+
+    async def __handle(self, request: web.Request) -> web.Response:
+        path: Tuple[AnyStr, ...] = ('locations',)
+        if 'location' in request.match_info:
+            path += (request.match_info['location'],)
+
+        if 'provider' in request.match_info:
+            path += ('providers', request.match_info['provider'])
+
+        indexed_document: Optional[IndexedDocument] = self.__results_index.get(path=path)
+        if indexed_document is None:
+            return web.json_response(data={'error': f'Not found: {request.path}'}, status=404)
+
+        headers = {hdrs.ETAG: indexed_document.etag, hdrs.CACHE_CONTROL: 'no-cache'}
+        if self.__is_not_modified(if_none_match=request.headers.get(hdrs.IF_NONE_MATCH), etag=indexed_document.etag):
+            return web.Response(status=304, headers=headers)
+
+        return web.Response(body=indexed_document.body, content_type='application/json', headers=headers)
+
+    async def __handle_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(
+            body=self.__metrics_registry.render().encode(),
+            headers={hdrs.CONTENT_TYPE: MetricsRegistry.CONTENT_TYPE}
+        )
+
+    @staticmethod
+    def __is_not_modified(if_none_match: Optional[AnyStr], etag: AnyStr) -> bool:
+        """
+        :param if_none_match: Value of "If-None-Match" header: "*" or list of (possibly weak) ETags.
+        :param etag: ETag of current document.
+        :return: True, if client has current document.
+        """
+
+        if if_none_match is None:
+            return False
+
+        if if_none_match.strip() == '*':
+            return True
+
+        return any(
+            client_etag.strip().removeprefix('W/') == etag for client_etag in if_none_match.split(',')
+        )
+
+    @property
+    def url(self) -> AnyStr:
+        return f'http://{self.__host}:{self.__port}'
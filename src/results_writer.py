@@ -0,0 +1,264 @@
+import asyncio
+import os
+import threading
+
+from pathlib import Path
+from typing import List, AnyStr, Optional, Literal, Dict, IO, Any, Callable
+
+
+FsyncPolicy = Literal['never', 'on_flush', 'on_close']
+
+
+class ResultsWriter:
+    """
+    Long-lived writer of results file, which owns open file handle.
+
+    Lines are put to :py:class:`asyncio.Queue` and are written by a single writer task, so lines, put by one call
+    of :py:meth:`write`, are never interleaved with others and are written in order of calls. Lines are buffered
+    and written together (group commit), when buffer size reaches "flush_max_lines" or "flush_interval_in_seconds"
+    passes since first buffered line, so each flush is a single thread pool hop.
+
+    Fsync policy defines, when written data is forced to disk:
+        - "never" - data is only flushed to operating system;
+        - "on_flush" - after each group commit;
+        - "on_close" - once, when writer is closed.
+
+    Buffered lines are written on close in thread pool. If writer task was cancelled, they are written synchronously,
+    so results are never lost.
+
+    If "on_flush" callback is provided, it is called on event loop with latency of each group commit in seconds
+    (including thread pool hop), for example, to collect metrics.
+
+    Storage is accessed only by "_open", "_write", "_sync" and "_close" methods, which are called in thread pool
+    under lock, so other storages (for example, database) can reuse queueing and group commit by overriding them.
+
+    Usage:
+        async with ResultsWriter(file_path=...) as results_writer:
+            await results_writer.write(lines=[...])
+    """
+
+    def __init__(
+            self,
+            file_path: Path,
+            mode: AnyStr = 'a+',
+            flush_max_lines: int = 1000,
+            flush_interval_in_seconds: float = 1.0,
+            fsync_policy: FsyncPolicy = 'on_close',
+            queue_max_size: int = 0,
+            on_flush: Optional[Callable[[float], None]] = None
+    ) -> None:
+        if fsync_policy not in ('never', 'on_flush', 'on_close'):
+            raise ValueError(f'Unknown fsync policy: {fsync_policy}')
+
+        self.__file_path: Path = file_path
+        self.__mode: AnyStr = mode
+        self.__flush_max_lines: int = flush_max_lines
+        self.__flush_interval_in_seconds: float = flush_interval_in_seconds
+        self.__fsync_policy: FsyncPolicy = fsync_policy
+        self.__queue_max_size: int = queue_max_size
+        self.__on_flush: Optional[Callable[[float], None]] = on_flush
+
+        self.__file: Optional[IO] = None
+        self.__opened: bool = False
+        self.__queue: Optional[asyncio.Queue] = None
+        self.__writer_task: Optional[asyncio.Task] = None
+        self.__buffer: List[AnyStr] = []
+
+        # Guards storage, so lines, written at shutdown, don't interleave with lines, which are still written by thread.
+        # Lock is reentrant, because file is closed with the last lines under the same lock:
+        self.__file_lock: threading.RLock = threading.RLock()
+
+        self.__written_lines_counter: int = 0
+        self.__flushes_counter: int = 0
+        self.__fsyncs_counter: int = 0
+
+    async def __aenter__(self) -> 'ResultsWriter':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """
+        Opens results file and starts writer task.
+        """
+
+        await asyncio.to_thread(self._open)
+        self.__opened = True
+        self.__queue = asyncio.Queue(maxsize=self.__queue_max_size)
+        self.__writer_task = asyncio.create_task(coro=self.__run())
+
+    async def write(self, lines: List[AnyStr]) -> None:
+        """
+        Puts lines to writing queue. Waits, if queue is full.
+
+        :param lines: Lines (with line separators), which should be written together.
+        """
+
+        if self.__writer_task is None or self.__writer_task.done():
+            raise RuntimeError(f'Results writer of {self.__file_path} is not running')
+
+        await self.__queue.put(lines)
+
+    async def close(self) -> None:
+        """
+        Writes all queued lines, stops writer task and closes results file.
+        """
+
+        if self.__writer_task is None:
+            return
+
+        if not self.__writer_task.done():
+            await self.__queue.put(None)
+
+        try:
+            await self.__writer_task
+        except asyncio.CancelledError:
+            # Writer task was cancelled by caller, so its lines are written below:
+            if not self.__writer_task.cancelled():
+                raise
+        finally:
+            self.__writer_task = None
+
+            # Writer task could be cancelled even before it was started or while it was closing file in thread pool:
+            self.__close_file()
+
+    async def __run(self) -> None:
+        """
+        Writer task. Takes lines from queue, buffers them and writes the buffer by size or time.
+        """
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        closing: bool = False
+        try:
+            while not closing:
+                lines: Optional[List[AnyStr]] = await self.__queue.get()
+                if lines is None:
+                    break
+
+                self.__buffer.extend(lines)
+                flush_time: float = loop.time() + self.__flush_interval_in_seconds
+                while len(self.__buffer) < self.__flush_max_lines:
+                    timeout: float = flush_time - loop.time()
+                    if timeout <= 0:
+                        break
+
+                    try:
+                        lines = await asyncio.wait_for(self.__queue.get(), timeout=timeout)
+                    except asyncio.TimeoutError:
+                        break
+
+                    if lines is None:
+                        closing = True
+                        break
+
+                    self.__buffer.extend(lines)
+
+                buffered_lines: List[AnyStr] = self.__buffer
+                self.__buffer = []
+                flush_started_at: float = loop.time()
+                await asyncio.to_thread(
+                    self.__write_lines,
+                    lines=buffered_lines,
+                    fsync=self.__fsync_policy == 'on_flush'
+                )
+                if self.__on_flush is not None:
+                    self.__on_flush(loop.time() - flush_started_at)
+        except asyncio.CancelledError:
+            # Cancelled task can't wait for thread pool, so remaining lines are written on event loop:
+            self.__close_file()
+            raise
+
+        self.__drain_queue()
+        await asyncio.to_thread(self.__write_buffer_and_close)
+
+    def __close_file(self) -> None:
+        """
+        Synchronously writes lines, left in buffer and queue (for example, after cancellation), and closes file.
+        Does nothing, if file is already closed.
+        """
+
+        self.__drain_queue()
+        self.__write_buffer_and_close()
+
+    def __drain_queue(self) -> None:
+        if self.__queue is None:
+            return
+
+        while not self.__queue.empty():
+            lines: Optional[List[AnyStr]] = self.__queue.get_nowait()
+            if lines is not None:
+                self.__buffer.extend(lines)
+
+    def __write_buffer_and_close(self) -> None:
+        """
+        Writes buffered lines and closes file. Lines are taken from buffer under lock, so they are written once,
+        even if writer task was cancelled, while file was closed in thread pool.
+        """
+
+        with self.__file_lock:
+            if not self.__opened:
+                return
+
+            buffered_lines: List[AnyStr] = self.__buffer
+            self.__buffer = []
+            self.__write_lines(lines=buffered_lines, fsync=self.__fsync_policy != 'never')
+            self._close()
+            self.__opened = False
+
+    def __write_lines(self, lines: List[Any], fsync: bool) -> None:
+        with self.__file_lock:
+            if lines:
+                self._write(lines=lines)
+                self.__written_lines_counter += len(lines)
+                self.__flushes_counter += 1
+
+            if fsync:
+                self._sync()
+                self.__fsyncs_counter += 1
+
+    def _open(self) -> None:
+        self.__file = open(self.__file_path, self.__mode)
+
+    def _write(self, lines: List[AnyStr]) -> None:
+        self.__file.write(''.join(lines))
+        self.__file.flush()
+
+    def _sync(self) -> None:
+        os.fsync(self.__file.fileno())
+
+    def _close(self) -> None:
+        self.__file.close()
+
+    def snapshot(self) -> Dict[AnyStr, int]:
+        """
+        Creates a snapshot of current writer statistics.
+
+        :return: Dictionary with counters names and their values.
+        """
+
+        return {
+            'written_lines': self.__written_lines_counter,
+            'flushes': self.__flushes_counter,
+            'fsyncs': self.__fsyncs_counter
+        }
+
+    def __str__(self) -> AnyStr:
+        return ', '.join(f'{name}={value}' for name, value in self.snapshot().items())
+
+    @property
+    def file_path(self) -> Path:
+        return self.__file_path
+
+    @property
+    def queue_depth(self) -> int:
+        return self.__queue.qsize() if self.__queue is not None else 0
+
+    @property
+    def written_lines(self) -> int:
+        return self.__written_lines_counter
+
+    @property
+    def flushes(self) -> int:
+        return self.__flushes_counter
@@ -0,0 +1,216 @@
+import math
+import time
+
+from collections import deque
+from typing import Dict, AnyStr, Tuple, Optional, Callable, Deque, Union, Iterable
+
+
+class RollingWindow:
+    """
+    Rolling window of temperatures, which keeps mean, min/max and variance of values in window and exponentially
+    weighted moving average (EWMA) of all values. Every update is O(1) (amortized for eviction):
+        - mean and variance are updated by Welford algorithm on adding and reversed Welford algorithm on eviction;
+        - min and max are kept by monotonic deques, which first items are min and max of window.
+
+    Values are evicted, if window has more than "max_count" values or values are older than "max_age_in_seconds".
+    Window is unbounded by count or age, if according limit is not provided.
+    """
+
+    def __init__(
+            self,
+            max_count: Optional[int] = None,
+            max_age_in_seconds: Optional[float] = None,
+            ewma_alpha: float = 0.1
+    ) -> None:
+        if max_count is not None and max_count <= 0:
+            raise ValueError(f'Max count of rolling window should be positive: {max_count}')
+
+        if not 0 < ewma_alpha <= 1:
+            raise ValueError(f'EWMA alpha should be in (0, 1]: {ewma_alpha}')
+
+        self.__max_count: Optional[int] = max_count
+        self.__max_age_in_seconds: Optional[float] = max_age_in_seconds
+        self.__ewma_alpha: float = ewma_alpha
+
+        # Values are numbered, so monotonic deques know, which of their values were evicted from window:
+        self.__values: Deque[Tuple[int, float, float]] = deque()
+        self.__min_values: Deque[Tuple[int, float]] = deque()
+        self.__max_values: Deque[Tuple[int, float]] = deque()
+        self.__added_values_counter: int = 0
+
+        self.__mean: float = 0.0
+        self.__squared_deviations_sum: float = 0.0
+        self.__ewma: Optional[float] = None
+
+    def add(self, value: float, timestamp: float) -> None:
+        """
+        :param value: New value.
+        :param timestamp: Time of value (on the same clock, as time of eviction).
+        """
+
+        value_index: int = self.__added_values_counter
+        self.__added_values_counter += 1
+        self.__values.append((value_index, value, timestamp))
+
+        delta: float = value - self.__mean
+        self.__mean += delta / len(self.__values)
+        self.__squared_deviations_sum += delta * (value - self.__mean)
+
+        while self.__min_values and self.__min_values[-1][1] >= value:
+            self.__min_values.pop()
+
+        self.__min_values.append((value_index, value))
+
+        while self.__max_values and self.__max_values[-1][1] <= value:
+            self.__max_values.pop()
+
+        self.__max_values.append((value_index, value))
+
+        self.__ewma = value if self.__ewma is None else self.__ewma + self.__ewma_alpha * (value - self.__ewma)
+
+        if self.__max_count is not None:
+            while len(self.__values) > self.__max_count:
+                self.__evict_oldest_value()
+
+        self.evict(now=timestamp)
+
+    def evict(self, now: float) -> None:
+        """
+        Evicts values, which are older than max age of window.
+
+        :param now: Current time.
+        """
+
+        if self.__max_age_in_seconds is None:
+            return
+
+        while self.__values and now - self.__values[0][2] > self.__max_age_in_seconds:
+            self.__evict_oldest_value()
+
+    def __evict_oldest_value(self) -> None:
+        value_index, value, _ = self.__values.popleft()
+        if not self.__values:
+            self.__mean = 0.0
+            self.__squared_deviations_sum = 0.0
+        else:
+            delta: float = value - self.__mean
+            self.__mean -= delta / len(self.__values)
+            # Rounding errors must not make sum of squared deviations negative:
+            self.__squared_deviations_sum = max(self.__squared_deviations_sum - delta * (value - self.__mean), 0.0)
+
+        if self.__min_values[0][0] == value_index:
+            self.__min_values.popleft()
+
+        if self.__max_values[0][0] == value_index:
+            self.__max_values.popleft()
+
+    def snapshot(self) -> Dict[AnyStr, Union[int, float, None]]:
+        """
+        Creates a snapshot of window statistics. Statistics of empty window are None, except count.
+
+        :return: Dictionary with statistics names and their values.
+        """
+
+        count: int = len(self.__values)
+        variance: Optional[float] = self.variance
+        return {
+            'count': count,
+            'mean': self.__mean if count else None,
+            'min': self.__min_values[0][1] if count else None,
+            'max': self.__max_values[0][1] if count else None,
+            'variance': variance,
+            'std': math.sqrt(variance) if variance is not None else None,
+            'ewma': self.__ewma
+        }
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.__mean if self.__values else None
+
+    @property
+    def variance(self) -> Optional[float]:
+        """
+        :return: Sample variance of values in window or None, if there are less than two values.
+        """
+
+        if len(self.__values) < 2:
+            return None
+
+        return self.__squared_deviations_sum / (len(self.__values) - 1)
+
+    @property
+    def ewma(self) -> Optional[float]:
+        return self.__ewma
+
+
+class RollingStatistics:
+    """
+    Streaming aggregator of received temperatures, which keeps :py:class:`RollingWindow` per (location, weather
+    resource), so live statistics are available without reprocessing of results history.
+    """
+
+    def __init__(
+            self,
+            max_count: Optional[int] = None,
+            max_age_in_seconds: Optional[float] = None,
+            ewma_alpha: float = 0.1,
+            clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.__max_count: Optional[int] = max_count
+        self.__max_age_in_seconds: Optional[float] = max_age_in_seconds
+        self.__ewma_alpha: float = ewma_alpha
+        self.__clock: Callable[[], float] = clock
+        self.__windows: Dict[Tuple[AnyStr, AnyStr], RollingWindow] = {}
+
+        # Parameters are validated on creation, not on first received temperature:
+        RollingWindow(max_count=max_count, max_age_in_seconds=max_age_in_seconds, ewma_alpha=ewma_alpha)
+
+    def register(self, location_name: AnyStr, weather_resource_name: AnyStr, temperature: float) -> None:
+        """
+        :param location_name: Name of location.
+        :param weather_resource_name: Name of weather resource (API).
+        :param temperature: Received temperature.
+        """
+
+        window_key: Tuple[AnyStr, AnyStr] = (location_name, weather_resource_name)
+        rolling_window: Optional[RollingWindow] = self.__windows.get(window_key)
+        if rolling_window is None:
+            rolling_window = RollingWindow(
+                max_count=self.__max_count,
+                max_age_in_seconds=self.__max_age_in_seconds,
+                ewma_alpha=self.__ewma_alpha
+            )
+            self.__windows[window_key] = rolling_window
+
+        rolling_window.add(value=temperature, timestamp=self.__clock())
+
+    def get_window(self, location_name: AnyStr, weather_resource_name: AnyStr) -> Optional[RollingWindow]:
+        return self.__windows.get((location_name, weather_resource_name))
+
+    def snapshot(
+            self,
+            window_keys: Optional[Iterable[Tuple[AnyStr, AnyStr]]] = None
+    ) -> Dict[AnyStr, Dict[AnyStr, Dict[AnyStr, Union[int, float, None]]]]:
+        """
+        Creates a snapshot of statistics of windows. Expired values are evicted before.
+
+        :param window_keys: (location name, weather resource name) of windows, which should be included, for example,
+        windows, updated in the iteration, so snapshot costs O(number of keys). All windows, if not provided.
+        Keys without windows are skipped.
+        :return: Dictionary with statistics of windows by location names and weather resources names.
+        """
+
+        now: float = self.__clock()
+        statistics: Dict[AnyStr, Dict[AnyStr, Dict[AnyStr, Union[int, float, None]]]] = {}
+        for location_name, weather_resource_name in self.__windows if window_keys is None else window_keys:
+            rolling_window: Optional[RollingWindow] = self.__windows.get((location_name, weather_resource_name))
+            if rolling_window is None:
+                continue
+
+            rolling_window.evict(now=now)
+            statistics.setdefault(location_name, {})[weather_resource_name] = rolling_window.snapshot()
+
+        return statistics
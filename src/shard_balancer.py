@@ -0,0 +1,116 @@
+import math
+
+from typing import List, Dict, AnyStr, Union
+
+
+class ShardBalancer:
+    """
+    Splitter of ordered items (locations) into contiguous shards, which sizes are rebalanced by observed latencies
+    of shards, so a shard, which falls behind, gives a part of its items to faster shards.
+
+    Shards are rebalanced, if the slowest shard latency exceeds the fastest one more than "rebalance_threshold" times.
+    Target size of each shard is proportional to its throughput (items per second), and sizes are moved to targets
+    by "damping" share of difference, so a single noisy iteration doesn't move all items at once. Each shard keeps
+    at least one item.
+    """
+
+    def __init__(
+            self,
+            items_number: int,
+            shards_number: int,
+            rebalance_threshold: float = 1.5,
+            damping: float = 0.5
+    ) -> None:
+        if not 1 <= shards_number <= items_number:
+            raise ValueError(f'Shards number should be in [1, {items_number}]: {shards_number}')
+
+        if rebalance_threshold < 1:
+            raise ValueError(f'Rebalance threshold should not be less than 1: {rebalance_threshold}')
+
+        if not 0 < damping <= 1:
+            raise ValueError(f'Damping should be in (0, 1]: {damping}')
+
+        self.__items_number: int = items_number
+        self.__rebalance_threshold: float = rebalance_threshold
+        self.__damping: float = damping
+        self.__sizes: List[int] = self.__round_sizes(sizes=[items_number / shards_number] * shards_number)
+        self.__rebalances_counter: int = 0
+
+    def register_latencies(self, latencies_in_seconds: List[float]) -> bool:
+        """
+        :param latencies_in_seconds: Latencies of shards in the same iteration, in order of shards.
+        :return: True, if shards were rebalanced.
+        """
+
+        if min(latencies_in_seconds) <= 0:
+            return False
+
+        if max(latencies_in_seconds) <= self.__rebalance_threshold * min(latencies_in_seconds):
+            return False
+
+        throughputs: List[float] = [
+            size / latency_in_seconds for size, latency_in_seconds in zip(self.__sizes, latencies_in_seconds)
+        ]
+        throughputs_sum: float = sum(throughputs)
+        sizes: List[int] = self.__round_sizes(
+            sizes=[
+                size + self.__damping * (self.__items_number * throughput / throughputs_sum - size)
+                for size, throughput in zip(self.__sizes, throughputs)
+            ]
+        )
+        if sizes == self.__sizes:
+            return False
+
+        self.__sizes = sizes
+        self.__rebalances_counter += 1
+        return True
+
+    def __round_sizes(self, sizes: List[float]) -> List[int]:
+        """
+        Rounds sizes by largest remainder method, so their sum is equal to number of items, and every shard
+        has at least one item.
+        """
+
+        rounded_sizes: List[int] = [max(math.floor(size), 1) for size in sizes]
+        remainders: List[float] = [size - rounded_size for size, rounded_size in zip(sizes, rounded_sizes)]
+        shards_indices: List[int] = sorted(range(len(sizes)), key=lambda index: remainders[index], reverse=True)
+        missing_items_number: int = self.__items_number - sum(rounded_sizes)
+        for shard_index in shards_indices[:max(missing_items_number, 0)]:
+            rounded_sizes[shard_index] += 1
+
+        # Minimal sizes could exceed number of items, so extra items are taken from the largest shards:
+        while sum(rounded_sizes) > self.__items_number:
+            rounded_sizes[rounded_sizes.index(max(rounded_sizes))] -= 1
+
+        return rounded_sizes
+
+    def snapshot(self) -> Dict[AnyStr, Union[int, List[int]]]:
+        return {
+            'sizes': list(self.__sizes),
+            'rebalances': self.__rebalances_counter
+        }
+
+    def __str__(self) -> AnyStr:
+        return ', '.join(f'{name}={value}' for name, value in self.snapshot().items())
+
+    @property
+    def slices(self) -> List[slice]:
+        """
+        :return: Slices of items of each shard in order of shards.
+        """
+
+        slices: List[slice] = []
+        start: int = 0
+        for size in self.__sizes:
+            slices.append(slice(start, start + size))
+            start += size
+
+        return slices
+
+    @property
+    def sizes(self) -> List[int]:
+        return list(self.__sizes)
+
+    @property
+    def rebalances(self) -> int:
+        return self.__rebalances_counter
@@ -0,0 +1,89 @@
+import asyncio
+import threading
+
+from pathlib import Path
+from typing import List, Any, AnyStr, Dict, Optional
+from multiprocessing.connection import Connection
+
+from results_writer import ResultsWriter
+
+
+class ShardResultsWriter(ResultsWriter):
+    """
+    Writer of results of sharded polling worker, which sends lines (or rows) to supervisor process over pipe instead
+    of writing them to storage, so results of all shards are written by a single writer of supervisor.
+
+    Each call of :py:meth:`write` is sent as exactly one ("message_kind", lines) message, even if lines are empty,
+    so supervisor receives results of each iteration separately. Lines are not queued and buffered: message is sent
+    from thread pool, when :py:meth:`write` is awaited, and calls are sent in order. Writers of one worker share
+    the pipe and its send lock, since lines are sent from thread pool threads.
+
+    Usage:
+        async with ShardResultsWriter(file_path=..., connection=..., message_kind='results', send_lock=...) as writer:
+            await writer.write(lines=[...])
+    """
+
+    def __init__(
+            self,
+            file_path: Path,
+            connection: Connection,
+            message_kind: AnyStr,
+            send_lock: threading.Lock
+    ) -> None:
+        super().__init__(file_path=file_path, fsync_policy='never')
+
+        self.__connection: Connection = connection
+        self.__message_kind: AnyStr = message_kind
+        self.__send_lock: threading.Lock = send_lock
+
+        # Keeps order of messages, if writer is called by several tasks:
+        self.__order_lock: Optional[asyncio.Lock] = None
+
+        self.__sent_lines_counter: int = 0
+        self.__sent_messages_counter: int = 0
+
+    async def start(self) -> None:
+        self.__order_lock = asyncio.Lock()
+
+    async def write(self, lines: List[Any]) -> None:
+        """
+        Sends lines to supervisor as a single message.
+
+        :param lines: Lines (or rows), which should be sent together. Empty lines are sent too.
+        """
+
+        if self.__order_lock is None:
+            raise RuntimeError(f'Results writer of {self.file_path} is not running')
+
+        async with self.__order_lock:
+            await asyncio.to_thread(self.__send, lines)
+
+    async def close(self) -> None:
+        self.__order_lock = None
+
+    def __send(self, lines: List[Any]) -> None:
+        with self.__send_lock:
+            self.__connection.send((self.__message_kind, lines))
+            self.__sent_lines_counter += len(lines)
+            self.__sent_messages_counter += 1
+
+    def snapshot(self) -> Dict[AnyStr, int]:
+        """
+        Creates a snapshot of sent messages counters.
+
+        :return: Dictionary with counters names and their values.
+        """
+
+        return {
+            'written_lines': self.__sent_lines_counter,
+            'flushes': self.__sent_messages_counter,
+            'fsyncs': 0
+        }
+
+    @property
+    def written_lines(self) -> int:
+        return self.__sent_lines_counter
+
+    @property
+    def flushes(self) -> int:
+        return self.__sent_messages_counter
@@ -0,0 +1,87 @@
+import asyncio
+
+from typing import Dict, AnyStr, Hashable, Callable, Awaitable, TypeVar, Union
+
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    """
+    Coalescer of concurrent identical calls: while a call with some key is in flight, other calls with the same key
+    don't start their own calls and wait for result (or exception) of the call in flight.
+
+    Call in flight is cancelled only when all its callers were cancelled, so cancellation of one caller (for example,
+    due to iteration deadline) doesn't break the others.
+
+    Usage:
+        result = await single_flight.run(key=request_key, make_call=lambda: make_request(...))
+    """
+
+    def __init__(self) -> None:
+        self.__calls_in_flight: Dict[Hashable, asyncio.Task] = {}
+        self.__waiters_counters: Dict[Hashable, int] = {}
+        self.__calls_counter: int = 0
+        self.__coalesced_calls_counter: int = 0
+
+    async def run(self, key: Hashable, make_call: Callable[[], Awaitable[T]]) -> T:
+        """
+        :param key: Key of call, equal for identical calls.
+        :param make_call: Factory of call coroutine, which is called, if there is no call with the key in flight.
+        :return: Result of the call in flight.
+        """
+
+        self.__calls_counter += 1
+        call: asyncio.Task = self.__calls_in_flight.get(key)
+        if call is None:
+            call = asyncio.ensure_future(make_call())
+            self.__calls_in_flight[key] = call
+            self.__waiters_counters[key] = 0
+            call.add_done_callback(lambda _: self.__forget_call(key=key, call=call))
+        else:
+            self.__coalesced_calls_counter += 1
+
+        self.__waiters_counters[key] += 1
+        try:
+            return await asyncio.shield(call)
+
+        except asyncio.CancelledError:
+            if not call.done():
+                self.__waiters_counters[key] -= 1
+                if not self.__waiters_counters[key]:
+                    call.cancel()
+
+            raise
+
+    def __forget_call(self, key: Hashable, call: asyncio.Task) -> None:
+        # Finished call is removed, so next identical calls are made again instead of reusing its result:
+        if self.__calls_in_flight.get(key) is call:
+            del self.__calls_in_flight[key]
+            del self.__waiters_counters[key]
+
+    def snapshot(self) -> Dict[AnyStr, Union[int, float]]:
+        """
+        Creates a snapshot of coalescing statistics: deduplication ratio is a share of calls, which were coalesced
+        with a call in flight instead of making their own calls.
+
+        :return: Dictionary with statistics names and their values.
+        """
+
+        return {
+            'calls': self.__calls_counter,
+            'coalesced_calls': self.__coalesced_calls_counter,
+            'deduplication_ratio': (
+                round(self.__coalesced_calls_counter / self.__calls_counter, 4) if self.__calls_counter else 0.0
+            )
+        }
+
+    def __str__(self) -> AnyStr:
+        return ', '.join(f'{name}={value}' for name, value in self.snapshot().items())
+
+    @property
+    def calls_in_flight(self) -> int:
+        return len(self.__calls_in_flight)
+
+    @property
+    def coalesced_calls(self) -> int:
+        return self.__coalesced_calls_counter
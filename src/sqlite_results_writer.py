@@ -0,0 +1,108 @@
+import sqlite3
+
+from pathlib import Path
+from collections import namedtuple
+from typing import List, AnyStr, Optional, Dict, Callable
+
+from results_writer import ResultsWriter, FsyncPolicy
+
+
+# Single weather result in normalized form, one row per (iteration, location, weather resource):
+ResultRow: namedtuple = namedtuple(
+    'ResultRow',
+    [
+        'timestamp',
+        'location',
+        'provider',
+        'temperature',
+        'latency_in_seconds',
+        'status'
+    ]
+)
+
+_CREATE_TABLE_QUERY: AnyStr = """
+CREATE TABLE IF NOT EXISTS weather_results (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    location TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    temperature REAL,
+    latency_in_seconds REAL,
+    status TEXT NOT NULL
+)
+"""
+
+_CREATE_INDEX_QUERY: AnyStr = """
+CREATE INDEX IF NOT EXISTS weather_results_location_timestamp ON weather_results (location, timestamp)
+"""
+
+_INSERT_QUERY: AnyStr = """
+INSERT INTO weather_results (timestamp, location, provider, temperature, latency_in_seconds, status)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+# Durability of SQLite commits is defined by its synchronous mode, which is chosen according to fsync policy:
+_SYNCHRONOUS_MODES: Dict[AnyStr, AnyStr] = {
+    'never': 'OFF',
+    'on_flush': 'FULL',
+    'on_close': 'NORMAL'
+}
+
+
+class SqliteResultsWriter(ResultsWriter):
+    """
+    Long-lived writer of results to SQLite database in WAL mode, so results can be read by other processes
+    while they are written.
+
+    Rows are queued, buffered and written together (group commit) the same way, as :py:class:`ResultsWriter`
+    writes lines: each flush inserts all buffered rows in one transaction. Table "weather_results" is indexed
+    by (location, timestamp), so history of location is queried without full scan.
+
+    Fsync policy is applied via synchronous mode of SQLite: "never" - OFF, "on_flush" - FULL (each transaction
+    is synced), "on_close" - NORMAL (WAL is synced on checkpoints and on close).
+
+    Usage:
+        async with SqliteResultsWriter(database_path=...) as results_writer:
+            await results_writer.write(lines=[ResultRow(...), ...])
+    """
+
+    def __init__(
+            self,
+            database_path: Path,
+            flush_max_lines: int = 1000,
+            flush_interval_in_seconds: float = 1.0,
+            fsync_policy: FsyncPolicy = 'on_close',
+            queue_max_size: int = 0,
+            on_flush: Optional[Callable[[float], None]] = None
+    ) -> None:
+        super().__init__(
+            file_path=database_path,
+            flush_max_lines=flush_max_lines,
+            flush_interval_in_seconds=flush_interval_in_seconds,
+            fsync_policy=fsync_policy,
+            queue_max_size=queue_max_size,
+            on_flush=on_flush
+        )
+
+        self.__synchronous_mode: AnyStr = _SYNCHRONOUS_MODES[fsync_policy]
+        self.__connection: Optional[sqlite3.Connection] = None
+
+    def _open(self) -> None:
+        # Connection is used by thread pool threads one at a time under lock of writer:
+        self.__connection = sqlite3.connect(self.file_path, check_same_thread=False)
+        self.__connection.execute('PRAGMA journal_mode=WAL')
+        self.__connection.execute(f'PRAGMA synchronous={self.__synchronous_mode}')
+        with self.__connection:
+            self.__connection.execute(_CREATE_TABLE_QUERY)
+            self.__connection.execute(_CREATE_INDEX_QUERY)
+
+    def _write(self, lines: List[ResultRow]) -> None:
+        with self.__connection:
+            self.__connection.executemany(_INSERT_QUERY, lines)
+
+    def _sync(self) -> None:
+        # Transactions are already synced by SQLite according to synchronous mode:
+        pass
+
+    def _close(self) -> None:
+        self.__connection.close()
@@ -0,0 +1,90 @@
+import asyncio
+
+from aiohttp import web
+from typing import Dict, AnyStr, Any, Optional
+from collections import Counter
+
+
+class MockWeatherServer:
+    """
+    Local weather resource (API), which answers with JSON for purpose of testing weather checker without network.
+
+    Usage:
+        async with MockWeatherServer(response_json={...}) as server:
+            url = server.url
+    """
+
+    def __init__(
+            self,
+            response_json: Optional[Dict[AnyStr, Any]] = None,
+            delay_in_seconds: float = 0.0,
+            status: int = 200,
+            headers: Optional[Dict[AnyStr, AnyStr]] = None,
+            etag: Optional[AnyStr] = None,
+            chunked: bool = False
+    ) -> None:
+        self.response_json: Any = response_json if response_json is not None else {}
+        self.delay_in_seconds: float = delay_in_seconds
+        self.status: int = status
+        self.headers: Dict[AnyStr, AnyStr] = headers or {}
+        self.etag: Optional[AnyStr] = etag
+        self.chunked: bool = chunked
+        self.not_modified_responses_counter: int = 0
+        self.requests_counter: int = 0
+        self.requests_params: Counter = Counter()
+        self.requests_headers: list = []
+        self.concurrent_requests: int = 0
+        self.max_concurrent_requests: int = 0
+
+        self.__runner: Optional[web.AppRunner] = None
+        self.__port: Optional[int] = None
+
+    async def __handle(self, request: web.Request) -> web.StreamResponse:
+        self.requests_counter += 1
+        self.requests_params[tuple(sorted(request.query.items()))] += 1
+        self.requests_headers.append(dict(request.headers))
+        self.concurrent_requests += 1
+        self.max_concurrent_requests = max(self.max_concurrent_requests, self.concurrent_requests)
+        try:
+            if self.delay_in_seconds:
+                await asyncio.sleep(self.delay_in_seconds)
+        finally:
+            self.concurrent_requests -= 1
+
+        if self.etag is not None and request.headers.get('If-None-Match') == self.etag:
+            self.not_modified_responses_counter += 1
+            return web.Response(status=304, headers={'ETag': self.etag})
+
+        headers: Dict[AnyStr, AnyStr] = dict(self.headers)
+        if self.etag is not None:
+            headers['ETag'] = self.etag
+
+        json_response: web.Response = web.json_response(data=self.response_json, status=self.status, headers=headers)
+        if not self.chunked:
+            return json_response
+
+        # Chunked response has no "Content-Length" header, so its size is unknown until body is read:
+        response: web.StreamResponse = web.StreamResponse(status=self.status, headers=json_response.headers)
+        response.headers.popall('Content-Length', None)
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        await response.write(json_response.body)
+        await response.write_eof()
+        return response
+
+    async def __aenter__(self) -> 'MockWeatherServer':
+        application: web.Application = web.Application()
+        application.router.add_get('/{tail:.*}', self.__handle)
+        self.__runner = web.AppRunner(application)
+        await self.__runner.setup()
+        site: web.TCPSite = web.TCPSite(self.__runner, host='127.0.0.1', port=0)
+        await site.start()
+        self.__port = self.__runner.addresses[0][1]
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.__runner.cleanup()
+
+    @property
+    def url(self) -> AnyStr:
+        return f'http://127.0.0.1:{self.__port}/weather'
@@ -1,11 +1,22 @@
+import time
+import json
+import yaml
+import shutil
+import sqlite3
+import asyncio
 import aiofiles
 
 from pathlib import Path
-from typing import AnyStr, List
+from typing import AnyStr, List, Dict, Any, Tuple
 
-from src import AsyncWeatherChecker, logger, Temperature, WeatherResult
+from src import (
+    AsyncWeatherChecker, logger, Temperature, WeatherResult, Config, CustomizedSettings, ConnectionStatistics,
+    Location, WeatherResource, ResponseCache, ColumnarResultsReader, LeaseCoordinator, SqliteLeaseBackend,
+    YamlConfig, ConfigReloader, ResultsIndex, LocationResults
+)
 from .async_metaclass import AsyncMetaclass
-from .test_configs import test_config, MockData
+from .mock_weather_server import MockWeatherServer
+from .test_configs import test_config, test_yaml_config, MockData
 
 
 class TestAsyncWeatherChecker(metaclass=AsyncMetaclass):
@@ -52,12 +63,62 @@ class TestAsyncWeatherChecker(metaclass=AsyncMetaclass):
         async with aiofiles.open(test_config.results_file_path, test_config.results_file_writing_mode) as results_file:
             await results_file.write('')
 
+    @staticmethod
+    def __aggregate_temperatures(
+            async_weather_checker: AsyncWeatherChecker,
+            location: Location,
+            temperatures: List[Temperature]
+    ) -> Temperature:
+        """
+        Aggregates temperatures of a single location the same way, as aggregate stage of polling pipeline does.
+        """
+
+        location_results: LocationResults = LocationResults(location=location, columns_number=len(temperatures))
+        for column_index, temperature in enumerate(temperatures):
+            location_results.set_temperature(column_index=column_index, temperature=temperature)
+
+        average_temperature, _ = async_weather_checker._AsyncWeatherChecker__aggregate_temperatures(
+            locations_results=[location_results],
+            columns_names=[str(index) for index in range(len(temperatures))]
+        )[0]
+        return average_temperature
+
+    @staticmethod
+    def __create_location_results(
+            location: Location,
+            weather_results: List[WeatherResult]
+    ) -> Tuple[LocationResults, List[AnyStr]]:
+        """
+        Writes temperatures of weather results straight to slots of their columns, which are ordered by names
+        of weather resources, the same way, as fetch stage of polling pipeline does.
+        """
+
+        columns_names: List[AnyStr] = sorted(
+            weather_resource_name for weather_result in weather_results for weather_resource_name in weather_result
+        )
+        columns_indices: Dict[AnyStr, int] = {name: index for index, name in enumerate(columns_names)}
+        location_results: LocationResults = LocationResults(
+            location=location,
+            columns_number=len(columns_names),
+            default_temperature=test_config.default_temperature_value
+        )
+        for weather_result in weather_results:
+            for weather_resource_name, temperature in weather_result.items():
+                location_results.set_temperature(
+                    column_index=columns_indices[weather_resource_name],
+                    temperature=temperature
+                )
+
+        return location_results, columns_names
+
     async def test_calculate_average_temperature(self) -> None:
         """
         Checks if the average temperature is equal to mocked correct average temperature.
         """
 
-        average_temperature: Temperature = await self.async_weather_checker._AsyncWeatherChecker__calculate_average_temperature(
+        average_temperature: Temperature = self.__aggregate_temperatures(
+            async_weather_checker=self.async_weather_checker,
+            location=self.mock_data.location,
             temperatures=self.mock_data.list_of_temperatures
         )
         error_message: AnyStr = f'{average_temperature} != {self.mock_data.average_temperature}!'
@@ -69,7 +130,9 @@ class TestAsyncWeatherChecker(metaclass=AsyncMetaclass):
         equal to average temperature.
         """
 
-        average_temperature: Temperature = await self.async_weather_checker._AsyncWeatherChecker__calculate_average_temperature(
+        average_temperature: Temperature = self.__aggregate_temperatures(
+            async_weather_checker=self.async_weather_checker,
+            location=self.mock_data.location,
             temperatures=self.mock_data.list_of_temperatures + [self.mock_data.broken_temperature]
         )
         error_message: AnyStr = f'{average_temperature} != {self.mock_data.average_temperature}!'
@@ -81,7 +144,9 @@ class TestAsyncWeatherChecker(metaclass=AsyncMetaclass):
         equal to default average temperature.
         """
 
-        average_temperature: Temperature = await self.async_weather_checker._AsyncWeatherChecker__calculate_average_temperature(
+        average_temperature: Temperature = self.__aggregate_temperatures(
+            async_weather_checker=self.async_weather_checker,
+            location=self.mock_data.location,
             temperatures=[]
         )
         error_message: AnyStr = f'{average_temperature} != {self.mock_data.default_average_temperature}!'
@@ -165,72 +230,70 @@ class TestAsyncWeatherChecker(metaclass=AsyncMetaclass):
         error_message: AnyStr = f'{result} != {test_config.default_temperature_value}!'
         assert result == test_config.default_temperature_value, error_message
 
-    async def test_sort_weather_results(self) -> None:
+    async def test_location_results_in_order_of_columns(self) -> None:
         """
-        Checks that sorting weather results working correct.
+        Checks that temperatures of shuffled weather results are written to slots in order of columns.
         """
 
-        sorted_weather_results: List[WeatherResult] = await self.async_weather_checker._AsyncWeatherChecker__sort_weather_results(
+        location_results, _ = self.__create_location_results(
+            location=self.mock_data.location,
             weather_results=self.mock_data.shuffled_weather_results
         )
 
-        error_message: AnyStr = f'{sorted_weather_results} != {self.mock_data.weather_results}!'
-        assert sorted_weather_results == self.mock_data.weather_results, error_message
+        expected_temperatures: List[Temperature] = [
+            temperature for weather_result in self.mock_data.weather_results for temperature in weather_result.values()
+        ]
+        error_message: AnyStr = f'{location_results.temperatures} != {expected_temperatures}!'
+        assert location_results.temperatures == expected_temperatures, error_message
 
-    async def test_write_results_to_file(self) -> None:
+    async def test_create_locations_results_lines(self) -> None:
         """
-        Checks that writing weather results for results file working correct.
-
-        After checking deletes created during test results file.
+        Checks that results file row is assembled from location results and their average temperature.
         """
 
-        await self.async_weather_checker._AsyncWeatherChecker__write_results_to_file(
+        location_results, columns_names = self.__create_location_results(
+            location=self.mock_data.location,
             weather_results=self.mock_data.weather_results
         )
+        results_lines: List[AnyStr] = self.async_weather_checker._AsyncWeatherChecker__create_locations_results_lines(
+            locations_results=[location_results],
+            consensus_temperatures=self.async_weather_checker._AsyncWeatherChecker__aggregate_temperatures(
+                locations_results=[location_results],
+                columns_names=columns_names
+            )
+        )
 
-        results_file_data: AnyStr = await self.__read_test_results_file()
-        error_message: AnyStr = f'{results_file_data} != {self.mock_data.result_file_values_line}!'
-        assert results_file_data == self.mock_data.result_file_values_line, error_message
-
-        await self.async_weather_checker._AsyncWeatherChecker__delete_last_launch_results()
+        error_message: AnyStr = f'{results_lines} != [{self.mock_data.result_file_values_line}]!'
+        assert results_lines == [self.mock_data.result_file_values_line], error_message
 
     async def test_make_request_to_weather_resource(self) -> None:
         """
-        Makes request to the existing weather resource and checks that the weather result is not equal
+        Makes request to the existing weather resource and checks that the received temperature is not equal
         to default temperature.
 
-        Also checks that weather resource name is correct in weather result.
+        Weather resource is served locally by mocked weather resource with the same response format.
         """
 
-        weather_result: WeatherResult = await self.async_weather_checker._AsyncWeatherChecker__make_request_to_weather_resource(
-            weather_resource=self.mock_data.weather_resource
-        )
-
-        weather_resource_name: AnyStr = list(weather_result.keys())[0]
-        error_message: AnyStr = f'{weather_resource_name} != {self.mock_data.weather_resource.name}!'
-        assert weather_resource_name == self.mock_data.weather_resource.name, error_message
+        async with MockWeatherServer(response_json=self.mock_data.weather_resource_response_json) as server:
+            temperature: Temperature = await self.async_weather_checker._AsyncWeatherChecker__request_temperature(
+                weather_resource=self.mock_data.weather_resource._replace(url=server.url),
+                location=self.mock_data.location
+            )
 
-        temperature: Temperature = weather_result[weather_resource_name]
         error_message: AnyStr = f'{temperature} == {self.mock_data.broken_temperature}!'
         assert temperature != self.mock_data.broken_temperature, error_message
 
     async def test_make_request_to_broken_weather_resource(self) -> None:
         """
-        Makes request to non-existing weather resource and checks that the weather result is equal
+        Makes request to non-existing weather resource and checks that the received temperature is equal
         to default temperature.
-
-        Also checks that weather resource name is correct in weather result.
         """
 
-        weather_result: WeatherResult = await self.async_weather_checker._AsyncWeatherChecker__make_request_to_weather_resource(
-            weather_resource=self.mock_data.broken_weather_resource
+        temperature: Temperature = await self.async_weather_checker._AsyncWeatherChecker__request_temperature(
+            weather_resource=self.mock_data.broken_weather_resource,
+            location=self.mock_data.location
         )
 
-        weather_resource_name: AnyStr = list(weather_result.keys())[0]
-        error_message: AnyStr = f'{weather_resource_name} != {self.mock_data.broken_weather_resource.name}!'
-        assert weather_resource_name == self.mock_data.broken_weather_resource.name, error_message
-
-        temperature: Temperature = weather_result[weather_resource_name]
         error_message: AnyStr = f'{temperature} != {self.mock_data.broken_temperature}!'
         assert temperature == self.mock_data.broken_temperature, error_message
 
@@ -242,13 +305,33 @@ class TestAsyncWeatherChecker(metaclass=AsyncMetaclass):
         After checking deletes created during test results file.
         """
 
-        await self.async_weather_checker._AsyncWeatherChecker__poll_weather_resources()
+        async with MockWeatherServer(response_json=self.mock_data.weather_resource_response_json) as server:
+            async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(
+                logger=logger,
+                config=self.__create_mocked_weather_resource_config(url=server.url, mock_data=self.mock_data)
+            )
+            await async_weather_checker._AsyncWeatherChecker__poll_weather_resources()
 
         results_line: AnyStr = await self.__read_test_results_file()
         await self.__check_results_line(results_line=results_line, mock_data=self.mock_data)
 
         await self.async_weather_checker._AsyncWeatherChecker__delete_last_launch_results()
 
+    @staticmethod
+    def __create_mocked_weather_resource_config(url: AnyStr, mock_data: MockData) -> Config:
+        """
+        Creates copy of test config, which weather resource is served locally by mocked weather resource.
+
+        Method is static for purpose of correct work of Async Metaclass.
+
+        :param url: URL of mocked weather resource.
+        :param mock_data: mocked data with tested weather resource.
+        """
+
+        return test_config.model_copy(
+            update={'weather_resources': [mock_data.weather_resource._replace(url=url)]}
+        )
+
     @staticmethod
     async def __check_results_line(results_line: AnyStr, mock_data: MockData) -> None:
         """
@@ -261,7 +344,10 @@ class TestAsyncWeatherChecker(metaclass=AsyncMetaclass):
         :param mock_data: mocked data for comparing with received data from previous tested methods.
         """
 
-        weather_result_value, average_temperature_value = results_line.split(test_config.sep)
+        location_name, weather_result_value, average_temperature_value = results_line.split(test_config.sep)
+        error_message: AnyStr = f'{location_name} != {mock_data.location.name}!'
+        assert location_name == mock_data.location.name, error_message
+
         weather_result_temperature: Temperature = Temperature(weather_result_value)
         average_temperature_value.rstrip(test_config.new_line_arg)
         average_temperature: Temperature = Temperature(average_temperature_value)
@@ -282,7 +368,12 @@ class TestAsyncWeatherChecker(metaclass=AsyncMetaclass):
         After checking deletes created during test results file.
         """
 
-        await self.async_weather_checker._AsyncWeatherChecker__check_weather()
+        async with MockWeatherServer(response_json=self.mock_data.weather_resource_response_json) as server:
+            async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(
+                logger=logger,
+                config=self.__create_mocked_weather_resource_config(url=server.url, mock_data=self.mock_data)
+            )
+            await async_weather_checker._AsyncWeatherChecker__check_weather()
 
         async with aiofiles.open(test_config.results_file_path, test_config.results_file_reading_mode) as results_file:
             headers_line_index: int = 0
@@ -294,3 +385,984 @@ class TestAsyncWeatherChecker(metaclass=AsyncMetaclass):
                     await self.__check_results_line(results_line=line, mock_data=self.mock_data)
 
         await self.async_weather_checker._AsyncWeatherChecker__delete_last_launch_results()
+
+    async def test_check_weather_reuses_connections(self) -> None:
+        """
+        Checks, that all iterations share single connection pool, so only one connection is created to local
+        weather resource and all next requests reuse it.
+
+        After checking deletes created during test results file.
+        """
+
+        async with MockWeatherServer(response_json=self.mock_data.response_json) as server:
+            config: Config = test_config.model_copy(
+                update={
+                    'customized_settings': CustomizedSettings(times_to_check=3, check_interval_in_seconds=0),
+                    'weather_resources': [
+                        self.mock_data.broken_weather_resource._replace(url=server.url)
+                    ]
+                }
+            )
+            async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(logger=logger, config=config)
+            await async_weather_checker._AsyncWeatherChecker__check_weather()
+
+        connection_statistics: ConnectionStatistics = async_weather_checker.connection_statistics
+        error_message: AnyStr = f'{connection_statistics.requests} != {server.requests_counter}!'
+        assert connection_statistics.requests == server.requests_counter == 3, error_message
+
+        error_message: AnyStr = f'{connection_statistics.created_connections} != 1!'
+        assert connection_statistics.created_connections == 1, error_message
+
+        error_message: AnyStr = f'{connection_statistics.reused_connections} != 2!'
+        assert connection_statistics.reused_connections == 2, error_message
+
+        await async_weather_checker._AsyncWeatherChecker__delete_last_launch_results()
+
+    async def test_poll_weather_resources_for_multiple_locations(self) -> None:
+        """
+        Checks, that every location is crossed with every weather resource, one results row is written for
+        each location and concurrency limits are respected.
+
+        After checking deletes created during test results file.
+        """
+
+        locations: List[Location] = [
+            Location(name=f'City{index}', latitude=str(index), longitude=str(index)) for index in range(10)
+        ]
+
+        async with MockWeatherServer(response_json=self.mock_data.response_json, delay_in_seconds=0.01) as server:
+            weather_resources: List[WeatherResource] = [
+                self.mock_data.broken_weather_resource._replace(
+                    name=name,
+                    url=server.url,
+                    params={'latitude': '{latitude}', 'longitude': '{longitude}'},
+                    max_concurrent_requests=2
+                ) for name in ('FirstAPI', 'SecondAPI')
+            ]
+
+            config: Config = test_config.model_copy(
+                update={
+                    'weather_resources': weather_resources,
+                    'locations': locations,
+                    'max_concurrent_requests': 3
+                }
+            )
+            async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(logger=logger, config=config)
+            await async_weather_checker._AsyncWeatherChecker__poll_weather_resources()
+
+        error_message: AnyStr = f'{server.requests_counter} != {len(locations) * len(weather_resources)}!'
+        assert server.requests_counter == len(locations) * len(weather_resources), error_message
+
+        error_message: AnyStr = f'{len(server.requests_params)} != {len(locations)}!'
+        assert len(server.requests_params) == len(locations), error_message
+
+        error_message: AnyStr = f'{server.max_concurrent_requests} > {config.max_concurrent_requests}!'
+        assert server.max_concurrent_requests <= config.max_concurrent_requests, error_message
+
+        results_file_data: AnyStr = await self.__read_test_results_file()
+        expected_lines: List[AnyStr] = [
+            test_config.sep.join(
+                [location.name] + [str(self.mock_data.temperature_from_response)] * 3
+            ) + test_config.new_line_arg for location in locations
+        ]
+
+        error_message: AnyStr = f'{results_file_data} != {expected_lines}!'
+        assert results_file_data == ''.join(expected_lines), error_message
+
+        await async_weather_checker._AsyncWeatherChecker__delete_last_launch_results()
+
+    async def test_make_request_to_weather_resource_with_timeout(self) -> None:
+        """
+        Makes request to slow weather resource with small timeout and checks, that default temperature is received
+        and timeout is registered for the weather resource.
+        """
+
+        async with MockWeatherServer(response_json=self.mock_data.response_json, delay_in_seconds=1) as server:
+            async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(
+                logger=logger,
+                config=test_config.model_copy(update={'retry_attempts': 0})
+            )
+            weather_resource: WeatherResource = self.mock_data.broken_weather_resource._replace(
+                url=server.url,
+                timeout_in_seconds=0.1
+            )
+
+            temperature: Temperature = await async_weather_checker._AsyncWeatherChecker__request_temperature(
+                weather_resource=weather_resource,
+                location=self.mock_data.location
+            )
+
+        error_message: AnyStr = f'{temperature} != {self.mock_data.broken_temperature}!'
+        assert temperature == self.mock_data.broken_temperature, error_message
+
+        timeouts: int = async_weather_checker.timeout_statistics.timeouts[weather_resource.name]
+        error_message: AnyStr = f'{timeouts} != 1!'
+        assert timeouts == 1, error_message
+
+    async def test_poll_weather_resources_with_iteration_deadline(self) -> None:
+        """
+        Checks, that iteration is finished on deadline, even if weather resource hangs, and results of such
+        weather resource are written as default temperature and registered as deadline cancellations.
+
+        After checking deletes created during test results file.
+        """
+
+        async with MockWeatherServer(response_json=self.mock_data.response_json) as server:
+            async with MockWeatherServer(response_json=self.mock_data.response_json, delay_in_seconds=5) as slow_server:
+                weather_resources: List[WeatherResource] = [
+                    self.mock_data.broken_weather_resource._replace(name='FastAPI', url=server.url),
+                    self.mock_data.broken_weather_resource._replace(name='SlowAPI', url=slow_server.url)
+                ]
+
+                config: Config = test_config.model_copy(
+                    update={
+                        'weather_resources': weather_resources,
+                        'iteration_deadline_in_seconds': 0.5
+                    }
+                )
+                async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(logger=logger, config=config)
+
+                start_time: float = time.monotonic()
+                await async_weather_checker._AsyncWeatherChecker__poll_weather_resources()
+                polling_time: float = time.monotonic() - start_time
+
+        error_message: AnyStr = f'{polling_time} >= 2!'
+        assert polling_time < 2, error_message
+
+        results_file_data: AnyStr = await self.__read_test_results_file()
+        expected_line: AnyStr = test_config.sep.join(
+            [
+                self.mock_data.location.name,
+                str(self.mock_data.temperature_from_response),
+                str(self.mock_data.broken_temperature),
+                str(self.mock_data.temperature_from_response)
+            ]
+        ) + test_config.new_line_arg
+
+        error_message: AnyStr = f'{results_file_data} != {expected_line}!'
+        assert results_file_data == expected_line, error_message
+
+        deadline_cancellations: Dict[AnyStr, int] = dict(async_weather_checker.timeout_statistics.deadline_cancellations)
+        error_message: AnyStr = f'{deadline_cancellations} != {{"SlowAPI": 1}}!'
+        assert deadline_cancellations == {'SlowAPI': 1}, error_message
+
+        await async_weather_checker._AsyncWeatherChecker__delete_last_launch_results()
+
+    async def test_check_weather_with_per_resource_intervals(self) -> None:
+        """
+        Checks, that weather resources are polled according to their own intervals, and weather resource,
+        which was not due at iteration, is written with its latest received temperature.
+
+        After checking deletes created during test results file.
+        """
+
+        async with MockWeatherServer(response_json=self.mock_data.response_json) as server:
+            async with MockWeatherServer(response_json=self.mock_data.response_json) as slow_server:
+                weather_resources: List[WeatherResource] = [
+                    self.mock_data.broken_weather_resource._replace(
+                        name='FastAPI',
+                        url=server.url,
+                        check_interval_in_seconds=0.2
+                    ),
+                    self.mock_data.broken_weather_resource._replace(
+                        name='SlowAPI',
+                        url=slow_server.url,
+                        check_interval_in_seconds=1
+                    )
+                ]
+
+                config: Config = test_config.model_copy(
+                    update={
+                        'customized_settings': CustomizedSettings(times_to_check=4, check_interval_in_seconds=0.2),
+                        'weather_resources': weather_resources
+                    }
+                )
+                async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(logger=logger, config=config)
+                await async_weather_checker._AsyncWeatherChecker__check_weather()
+
+        error_message: AnyStr = f'{server.requests_counter} != 4 or {slow_server.requests_counter} != 1!'
+        assert server.requests_counter == 4 and slow_server.requests_counter == 1, error_message
+
+        async with aiofiles.open(test_config.results_file_path, test_config.results_file_reading_mode) as results_file:
+            results_lines: List[AnyStr] = (await results_file.readlines())[1:]
+
+        temperature: AnyStr = str(self.mock_data.temperature_from_response)
+        expected_line: AnyStr = test_config.sep.join(
+            [self.mock_data.location.name, temperature, temperature, temperature]
+        ) + test_config.new_line_arg
+
+        error_message: AnyStr = f'{results_lines} != {[expected_line] * 4}!'
+        assert results_lines == [expected_line] * 4, error_message
+
+        await async_weather_checker._AsyncWeatherChecker__delete_last_launch_results()
+
+    async def test_make_request_to_weather_resource_with_response_cache(self) -> None:
+        """
+        Checks, that fresh cached temperature is used without request, and expired one is revalidated
+        with conditional request, so "304 Not Modified" response reuses cached temperature.
+        """
+
+        async with MockWeatherServer(response_json=self.mock_data.response_json, etag='"v1"') as server:
+            async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(logger=logger, config=test_config)
+            weather_resource: WeatherResource = self.mock_data.broken_weather_resource._replace(
+                url=server.url,
+                cache_ttl_in_seconds=0.2
+            )
+
+            temperatures: List[Temperature] = []
+            for delay_in_seconds in (0, 0, 0.3):
+                await asyncio.sleep(delay_in_seconds)
+                temperature: Temperature = await async_weather_checker._AsyncWeatherChecker__request_temperature(
+                    weather_resource=weather_resource,
+                    location=self.mock_data.location
+                )
+                temperatures.append(temperature)
+
+        expected_temperatures: List[Temperature] = [self.mock_data.temperature_from_response] * 3
+        error_message: AnyStr = f'{temperatures} != {expected_temperatures}!'
+        assert temperatures == expected_temperatures, error_message
+
+        error_message: AnyStr = f'{server.requests_counter} != 2 or {server.not_modified_responses_counter} != 1!'
+        assert server.requests_counter == 2 and server.not_modified_responses_counter == 1, error_message
+
+        response_cache: ResponseCache = async_weather_checker.response_cache
+        error_message: AnyStr = f'{response_cache} has wrong counters!'
+        assert (response_cache.hits, response_cache.misses, response_cache.revalidations) == (1, 2, 1), error_message
+
+    async def test_make_request_to_weather_resource_with_retries(self) -> None:
+        """
+        Checks, that request, failed with server error, is retried configured number of times.
+        """
+
+        async with MockWeatherServer(response_json=self.mock_data.response_json, status=500) as server:
+            async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(
+                logger=logger,
+                config=test_config.model_copy(
+                    update={'retry_attempts': 2, 'retry_backoff_base_in_seconds': 0.01}
+                )
+            )
+            weather_resource: WeatherResource = self.mock_data.broken_weather_resource._replace(url=server.url)
+
+            temperature: Temperature = await async_weather_checker._AsyncWeatherChecker__request_temperature(
+                weather_resource=weather_resource,
+                location=self.mock_data.location
+            )
+
+        error_message: AnyStr = f'{temperature} != {self.mock_data.broken_temperature}!'
+        assert temperature == self.mock_data.broken_temperature, error_message
+
+        error_message: AnyStr = f'{server.requests_counter} != 3!'
+        assert server.requests_counter == 3, error_message
+
+    async def test_poll_weather_resources_with_open_circuit_breaker(self) -> None:
+        """
+        Checks, that after consecutive failures circuit breaker is opened, so next iteration skips weather resource
+        without request, and that circuit breaker state is written to results metadata file.
+
+        After checking deletes created during test results files.
+        """
+
+        async with MockWeatherServer(response_json=self.mock_data.response_json, status=500) as server:
+            config: Config = self.__create_mocked_weather_resource_config(url=server.url, mock_data=self.mock_data)
+            async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(
+                logger=logger,
+                config=config.model_copy(
+                    update={
+                        'retry_attempts': 0,
+                        'circuit_breaker_failure_threshold': 1,
+                        'circuit_breaker_recovery_timeout_in_seconds': 60.0
+                    }
+                )
+            )
+
+            await async_weather_checker._AsyncWeatherChecker__delete_last_launch_results()
+            for _ in range(2):
+                await async_weather_checker._AsyncWeatherChecker__poll_weather_resources()
+
+        error_message: AnyStr = f'{server.requests_counter} != 1!'
+        assert server.requests_counter == 1, error_message
+
+        async with aiofiles.open(
+            test_config.results_metadata_file_path,
+            test_config.results_file_reading_mode
+        ) as results_metadata_file:
+
+            results_metadata: List[Dict] = [json.loads(line) for line in await results_metadata_file.readlines()]
+
+        circuit_breakers_states: List[AnyStr] = [
+            iteration_metadata['circuit_breakers'][self.mock_data.weather_resource.name]['state']
+            for iteration_metadata in results_metadata
+        ]
+        error_message: AnyStr = f'{circuit_breakers_states} != ["open", "open"]!'
+        assert circuit_breakers_states == ['open', 'open'], error_message
+
+        skipped_requests: int = results_metadata[-1]['circuit_breakers'][self.mock_data.weather_resource.name][
+            'skipped_requests'
+        ]
+        error_message: AnyStr = f'{skipped_requests} != 1!'
+        assert skipped_requests == 1, error_message
+
+        await async_weather_checker._AsyncWeatherChecker__delete_last_launch_results()
+
+    async def test_poll_weather_resources_with_rate_limit(self) -> None:
+        """
+        Checks, that rate limit of weather resource is shared by all locations, so requests, exceeding it,
+        wait for their turn instead of failing.
+
+        After checking deletes created during test results file.
+        """
+
+        locations: List[Location] = [Location(name=f'City{index}') for index in range(3)]
+
+        async with MockWeatherServer(response_json=self.mock_data.response_json) as server:
+            weather_resource: WeatherResource = self.mock_data.broken_weather_resource._replace(
+                url=server.url,
+                params={'q': '{name}'},
+                rate_limit={'requests': 1, 'period_in_seconds': 0.2}
+            )
+            config: Config = test_config.model_copy(
+                update={'weather_resources': [weather_resource], 'locations': locations}
+            )
+            async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(logger=logger, config=config)
+
+            start_time: float = time.monotonic()
+            await async_weather_checker._AsyncWeatherChecker__poll_weather_resources()
+            elapsed_time: float = time.monotonic() - start_time
+
+        error_message: AnyStr = f'{elapsed_time} < 0.4!'
+        assert elapsed_time >= 0.39, error_message
+
+        results_file_data: AnyStr = await self.__read_test_results_file()
+        expected_lines: List[AnyStr] = [
+            test_config.sep.join(
+                [location.name] + [str(self.mock_data.temperature_from_response)] * 2
+            ) + test_config.new_line_arg for location in locations
+        ]
+
+        error_message: AnyStr = f'{results_file_data} != {expected_lines}!'
+        assert results_file_data == ''.join(expected_lines), error_message
+
+        await async_weather_checker._AsyncWeatherChecker__delete_last_launch_results()
+
+    async def test_make_request_to_weather_resource_with_retry_after(self) -> None:
+        """
+        Checks, that "Retry-After" header of "429 Too Many Requests" response is honored by rate limiter
+        and used as minimal backoff before retry.
+        """
+
+        async with MockWeatherServer(
+            response_json=self.mock_data.response_json,
+            status=429,
+            headers={'Retry-After': '0.3'}
+        ) as server:
+            async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(
+                logger=logger,
+                config=test_config.model_copy(
+                    update={'retry_attempts': 1, 'retry_backoff_base_in_seconds': 0.01}
+                )
+            )
+            weather_resource: WeatherResource = self.mock_data.broken_weather_resource._replace(url=server.url)
+
+            start_time: float = time.monotonic()
+            await async_weather_checker._AsyncWeatherChecker__request_temperature(
+                weather_resource=weather_resource,
+                location=self.mock_data.location
+            )
+            elapsed_time: float = time.monotonic() - start_time
+
+        error_message: AnyStr = f'{server.requests_counter} != 2 or {elapsed_time} < 0.3!'
+        assert server.requests_counter == 2 and elapsed_time >= 0.29, error_message
+
+        retry_after_counter: int = async_weather_checker.rate_limiters[weather_resource.name].retry_after_counter
+        error_message: AnyStr = f'{retry_after_counter} != 2!'
+        assert retry_after_counter == 2, error_message
+
+    async def test_make_request_to_weather_resource_with_oversized_response(self) -> None:
+        """
+        Checks, that response, which exceeds "max_body_bytes" limit of weather resource, is rejected without retries
+        both by "Content-Length" header and by streaming read of chunked body, so default temperature is returned.
+        """
+
+        response_json: Dict[AnyStr, Any] = dict(self.mock_data.weather_resource_response_json, padding='x' * 10000)
+        for chunked in (False, True):
+            async with MockWeatherServer(response_json=response_json, chunked=chunked) as server:
+                async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(logger=logger, config=test_config)
+                weather_resource: WeatherResource = self.mock_data.weather_resource._replace(
+                    url=server.url,
+                    max_body_bytes=1000
+                )
+
+                temperature: Temperature = await async_weather_checker._AsyncWeatherChecker__request_temperature(
+                    weather_resource=weather_resource,
+                    location=self.mock_data.location
+                )
+
+            error_message: AnyStr = f'{temperature} != {self.mock_data.broken_temperature} (chunked: {chunked})!'
+            assert temperature == self.mock_data.broken_temperature, error_message
+
+            error_message: AnyStr = f'{server.requests_counter} != 1 (chunked: {chunked})!'
+            assert server.requests_counter == 1, error_message
+
+            oversized_responses: int = async_weather_checker.oversized_responses[weather_resource.name]
+            error_message: AnyStr = f'{oversized_responses} != 1 (chunked: {chunked})!'
+            assert oversized_responses == 1, error_message
+
+    async def test_make_request_to_weather_resource_with_chunked_response(self) -> None:
+        """
+        Checks, that chunked response within "max_body_bytes" limit is read by chunks and its temperature is got.
+        """
+
+        async with MockWeatherServer(
+            response_json=self.mock_data.weather_resource_response_json,
+            chunked=True
+        ) as server:
+            async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(logger=logger, config=test_config)
+            temperature: Temperature = await async_weather_checker._AsyncWeatherChecker__request_temperature(
+                weather_resource=self.mock_data.weather_resource._replace(url=server.url),
+                location=self.mock_data.location
+            )
+
+        error_message: AnyStr = f'{temperature} == {self.mock_data.broken_temperature}!'
+        assert temperature != self.mock_data.broken_temperature, error_message
+
+    async def test_make_request_to_weather_resource_with_hedging(self) -> None:
+        """
+        Checks, that requests to weather resource with enabled hedging are made via its request hedger, which
+        observes their latencies, and only hedges are extra requests to weather resource (cancelled hedge
+        may not reach it).
+        """
+
+        weather_resource: WeatherResource = self.mock_data.weather_resource._replace(hedging=True)
+        async with MockWeatherServer(
+            response_json=self.mock_data.weather_resource_response_json,
+            delay_in_seconds=0.02
+        ) as server:
+            async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(
+                logger=logger,
+                config=test_config.model_copy(
+                    update={'hedge_latency_quantile': 0.5, 'hedge_budget_ratio': 1.0, 'hedge_min_samples': 3}
+                )
+            )
+            for _ in range(5):
+                temperature: Temperature = await async_weather_checker._AsyncWeatherChecker__request_temperature(
+                    weather_resource=weather_resource._replace(url=server.url),
+                    location=self.mock_data.location
+                )
+
+                error_message: AnyStr = f'{temperature} == {self.mock_data.broken_temperature}!'
+                assert temperature != self.mock_data.broken_temperature, error_message
+
+        snapshot: Dict[AnyStr, Any] = async_weather_checker.request_hedgers[weather_resource.name].snapshot()
+        error_message = f'{snapshot} is wrong for {server.requests_counter} requests!'
+        assert snapshot['requests'] == 5, error_message
+        assert 5 <= server.requests_counter <= snapshot['requests'] + snapshot['hedges'], error_message
+        assert snapshot['latency_quantile_in_seconds'] >= 0.02, error_message
+
+    async def test_poll_weather_resources_with_identical_requests(self) -> None:
+        """
+        Checks, that locations, for which weather resource is rendered to identical request, share a single request,
+        and deduplication ratio is written to results metadata file.
+
+        After checking deletes created during test results file.
+        """
+
+        locations: List[Location] = [Location(name=name) for name in ('First', 'Second', 'Third')]
+        async with MockWeatherServer(
+            response_json=self.mock_data.weather_resource_response_json,
+            delay_in_seconds=0.02
+        ) as server:
+            async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(
+                logger=logger,
+                config=self.__create_mocked_weather_resource_config(
+                    url=server.url,
+                    mock_data=self.mock_data
+                ).model_copy(update={'locations': locations})
+            )
+
+            await async_weather_checker._AsyncWeatherChecker__delete_last_launch_results()
+            await async_weather_checker._AsyncWeatherChecker__poll_weather_resources()
+
+        async with aiofiles.open(test_config.results_file_path, test_config.results_file_reading_mode) as results_file:
+            results_lines: List[AnyStr] = await results_file.readlines()
+
+        async with aiofiles.open(
+            test_config.results_metadata_file_path,
+            test_config.results_file_reading_mode
+        ) as results_metadata_file:
+
+            results_metadata: Dict[AnyStr, Any] = json.loads(await results_metadata_file.readline())
+
+        error_message: AnyStr = f'{server.requests_counter} requests were made instead of 1!'
+        assert server.requests_counter == 1, error_message
+
+        for results_line in results_lines:
+            temperature: AnyStr = results_line.split(test_config.sep)[1]
+            error_message = f'{results_line} has no temperature!'
+            assert temperature == str(self.mock_data.temperature_from_response), error_message
+
+        error_message = f'{results_metadata["request_coalescing"]} is wrong!'
+        assert results_metadata['request_coalescing']['coalesced_calls'] == 2, error_message
+        assert results_metadata['request_coalescing']['deduplication_ratio'] == round(2 / 3, 4), error_message
+
+        await async_weather_checker._AsyncWeatherChecker__delete_last_launch_results()
+
+    async def test_poll_weather_resources_with_batch_mode(self) -> None:
+        """
+        Checks, that weather resource with batch mode is requested once per batch of locations with joined location
+        params, and temperature of each location is extracted from array of results in order of locations.
+        """
+
+        locations: List[Location] = [
+            Location(name=f'City{index}', latitude=str(index), longitude=str(-index)) for index in range(6)
+        ]
+        response_json: List[Dict[AnyStr, Any]] = [
+            {'current': {'temperature_2m': temperature}} for temperature in (1.5, 2.5, 3.5)
+        ]
+
+        async with MockWeatherServer(response_json={'results': response_json}) as server:
+            weather_resource: WeatherResource = WeatherResource(
+                name='BatchAPI',
+                url=server.url,
+                params={'latitude': '{latitude}', 'longitude': '{longitude}', 'current': 'temperature_2m'},
+                headers={},
+                result_keys=['current', 'temperature_2m'],
+                batch_size=3,
+                batch_results_keys='results'
+            )
+            async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(
+                logger=logger,
+                config=test_config.model_copy(update={'weather_resources': [weather_resource], 'locations': locations})
+            )
+            polling_iteration = await async_weather_checker._AsyncWeatherChecker__fetch_weather_results()
+
+        error_message: AnyStr = f'{server.requests_counter} != 2!'
+        assert server.requests_counter == 2, error_message
+
+        expected_params: tuple = (('current', 'temperature_2m'), ('latitude', '3,4,5'), ('longitude', '-3,-4,-5'))
+        error_message = f'{expected_params} not in {server.requests_params}!'
+        assert server.requests_params[expected_params] == 1, error_message
+
+        temperatures: List[Temperature] = [
+            location_results.temperatures[0] for location_results in polling_iteration.locations_results
+        ]
+        error_message = f'{temperatures} are not in order of locations!'
+        assert temperatures == [1.5, 2.5, 3.5, 1.5, 2.5, 3.5], error_message
+
+        statuses: List = [polling_iteration.results_statuses[(location, 'BatchAPI')] for location in locations]
+        error_message = f'{statuses} are not ok!'
+        assert statuses == ['ok'] * len(locations), error_message
+
+    async def test_check_weather_with_sqlite_results_sink(self, tmp_path: Path) -> None:
+        """
+        Checks, that results are written to SQLite database, one row per iteration, location and weather resource,
+        if SQLite results sink is selected, and results of previous launches are kept.
+        """
+
+        database_path: Path = tmp_path / 'results.sqlite3'
+        async with MockWeatherServer(response_json=self.mock_data.weather_resource_response_json) as server:
+            config: Config = self.__create_mocked_weather_resource_config(
+                url=server.url,
+                mock_data=self.mock_data
+            ).model_copy(
+                update={
+                    'customized_settings': CustomizedSettings(times_to_check=2, check_interval_in_seconds=0.05),
+                    'results_sink': 'sqlite',
+                    'results_database_path': database_path
+                }
+            )
+
+            for _ in range(2):
+                async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(logger=logger, config=config)
+                await async_weather_checker._AsyncWeatherChecker__check_weather()
+
+        with sqlite3.connect(database_path) as connection:
+            database_rows: List[tuple] = connection.execute(
+                'SELECT location, provider, temperature, latency_in_seconds, status FROM weather_results'
+            ).fetchall()
+
+        rows_number: int = 2 * config.customized_settings.times_to_check * len(config.locations)
+        error_message: AnyStr = f'{len(database_rows)} != {rows_number}!'
+        assert len(database_rows) == rows_number, error_message
+
+        for location_name, provider, temperature, latency_in_seconds, status in database_rows:
+            error_message: AnyStr = f'Unexpected row: {location_name, provider, temperature, status}!'
+            assert provider == self.mock_data.weather_resource.name and status == 'ok', error_message
+            assert temperature != self.mock_data.broken_temperature and latency_in_seconds > 0, error_message
+
+    async def test_check_weather_with_columnar_results_sink(self, tmp_path: Path) -> None:
+        """
+        Checks, that results are written to columnar store, one row per iteration and location, if columnar results
+        sink is selected.
+        """
+
+        store_path: Path = tmp_path / 'store'
+        async with MockWeatherServer(response_json=self.mock_data.weather_resource_response_json) as server:
+            config: Config = self.__create_mocked_weather_resource_config(
+                url=server.url,
+                mock_data=self.mock_data
+            ).model_copy(
+                update={
+                    'customized_settings': CustomizedSettings(times_to_check=2, check_interval_in_seconds=0.05),
+                    'results_sink': 'columnar',
+                    'results_columnar_store_path': store_path
+                }
+            )
+
+            async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(logger=logger, config=config)
+            await async_weather_checker._AsyncWeatherChecker__check_weather()
+
+        results_reader: ColumnarResultsReader = ColumnarResultsReader(store_path=store_path)
+        rows_number: int = config.customized_settings.times_to_check * len(config.locations)
+        error_message: AnyStr = f'{len(results_reader)} != {rows_number}!'
+        assert len(results_reader) == rows_number, error_message
+
+        temperatures: List[float] = results_reader.column(self.mock_data.weather_resource.name).tolist()
+        error_message: AnyStr = f'Missing temperatures: {temperatures}!'
+        assert all(temperature == temperature for temperature in temperatures), error_message
+
+    async def test_poll_weather_resources_with_rolling_statistics(self) -> None:
+        """
+        Checks, that received temperatures are aggregated by rolling statistics, which snapshot is written to results
+        metadata file for each iteration.
+
+        After checking deletes created during test results file.
+        """
+
+        async with MockWeatherServer(response_json=self.mock_data.weather_resource_response_json) as server:
+            async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(
+                logger=logger,
+                config=self.__create_mocked_weather_resource_config(url=server.url, mock_data=self.mock_data)
+            )
+
+            await async_weather_checker._AsyncWeatherChecker__delete_last_launch_results()
+            for _ in range(3):
+                await async_weather_checker._AsyncWeatherChecker__poll_weather_resources()
+
+        async with aiofiles.open(
+            test_config.results_metadata_file_path,
+            test_config.results_file_reading_mode
+        ) as results_metadata_file:
+
+            results_metadata: List[Dict] = [json.loads(line) for line in await results_metadata_file.readlines()]
+
+        counts: List[int] = [
+            iteration_metadata['rolling_statistics'][self.mock_data.location.name][
+                self.mock_data.weather_resource.name
+            ]['count'] for iteration_metadata in results_metadata
+        ]
+        error_message: AnyStr = f'{counts} != [1, 2, 3]!'
+        assert counts == [1, 2, 3], error_message
+
+        await async_weather_checker._AsyncWeatherChecker__delete_last_launch_results()
+
+    async def test_create_results_lines_with_rejected_temperature(self) -> None:
+        """
+        Checks, that temperature in wrong units is rejected by MAD aggregation strategy, so it doesn't skew average
+        temperature, and name of its weather resource is written to results file row.
+        """
+
+        async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(
+            logger=logger,
+            config=test_config.model_copy(update={'aggregation_strategy': 'mad'})
+        )
+
+        location_results, columns_names = self.__create_location_results(
+            location=self.mock_data.location,
+            weather_results=[
+                WeatherResult({'First': 15.0}),
+                WeatherResult({'Second': 15.2}),
+                WeatherResult({'Third': 288.15})
+            ]
+        )
+        results_lines: List[AnyStr] = async_weather_checker._AsyncWeatherChecker__create_locations_results_lines(
+            locations_results=[location_results],
+            consensus_temperatures=async_weather_checker._AsyncWeatherChecker__aggregate_temperatures(
+                locations_results=[location_results],
+                columns_names=columns_names
+            )
+        )
+
+        expected_line: AnyStr = test_config.sep.join(
+            [self.mock_data.location.name, '15.0', '15.2', '288.15', '15.1', 'Third']
+        ) + test_config.new_line_arg
+        error_message: AnyStr = f'{results_lines} != [{expected_line}]!'
+        assert results_lines == [expected_line], error_message
+
+    async def test_poll_weather_resources_in_order_of_headers(self) -> None:
+        """
+        Checks, that temperatures of weather resources are written in order of results file headers, which is
+        calculated once on start, regardless of order of weather resources in config.
+
+        After checking deletes created during test results file.
+        """
+
+        async with MockWeatherServer(response_json=self.mock_data.weather_resource_response_json) as server:
+            async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(
+                logger=logger,
+                config=test_config.model_copy(
+                    update={
+                        'weather_resources': [
+                            self.mock_data.weather_resource._replace(name='Zeta', url=server.url),
+                            self.mock_data.weather_resource._replace(
+                                name='Alpha',
+                                url=server.url,
+                                result_keys=['missing_key']
+                            )
+                        ]
+                    }
+                )
+            )
+
+            await async_weather_checker._AsyncWeatherChecker__delete_last_launch_results()
+            await async_weather_checker._AsyncWeatherChecker__write_headers_to_results_file()
+            await async_weather_checker._AsyncWeatherChecker__poll_weather_resources()
+
+        async with aiofiles.open(test_config.results_file_path, test_config.results_file_reading_mode) as results_file:
+            headers, results_line = await results_file.readlines()
+
+        temperature: Temperature = Temperature(self.mock_data.temperature_from_response)
+        expected_headers: AnyStr = test_config.sep.join(
+            [test_config.location_header, 'Alpha', 'Zeta'] + test_config.base_headers
+        ) + test_config.new_line_arg
+        expected_line: AnyStr = test_config.sep.join(
+            [self.mock_data.location.name, str(test_config.default_temperature_value), str(temperature), str(temperature)]
+        ) + test_config.new_line_arg
+        error_message: AnyStr = f'{[headers, results_line]} != {[expected_headers, expected_line]}!'
+        assert [headers, results_line] == [expected_headers, expected_line], error_message
+
+        await async_weather_checker._AsyncWeatherChecker__delete_last_launch_results()
+
+    async def test_check_weather_with_shards(self) -> None:
+        """
+        Checks, that locations are polled by worker processes of shards, and results of all shards are written
+        by a single writer as one results file in order of locations, with one metadata line per iteration.
+
+        After checking deletes created during test results file.
+        """
+
+        locations: List[Location] = [
+            Location(name=f'City{index}', latitude=str(index), longitude=str(-index)) for index in range(4)
+        ]
+        async with MockWeatherServer(response_json=self.mock_data.weather_resource_response_json) as server:
+            config: Config = self.__create_mocked_weather_resource_config(
+                url=server.url,
+                mock_data=self.mock_data
+            ).model_copy(
+                update={
+                    'customized_settings': CustomizedSettings(times_to_check=2, check_interval_in_seconds=0.05),
+                    'locations': locations,
+                    'shards_number': 2
+                }
+            )
+            async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(logger=logger, config=config)
+            await async_weather_checker._AsyncWeatherChecker__check_weather_sharded()
+
+        async with aiofiles.open(config.results_file_path, config.results_file_reading_mode) as results_file:
+            _, *results_lines = await results_file.readlines()
+
+        locations_names: List[AnyStr] = [results_line.split(config.sep)[0] for results_line in results_lines]
+        expected_locations_names: List[AnyStr] = [location.name for location in locations] * 2
+        error_message: AnyStr = f'{locations_names} != {expected_locations_names}!'
+        assert locations_names == expected_locations_names, error_message
+
+        error_message = f'{server.requests_counter} != 8!'
+        assert server.requests_counter == 8, error_message
+
+        async with aiofiles.open(config.results_metadata_file_path) as metadata_file:
+            results_metadata: List[Dict[AnyStr, Any]] = [json.loads(line) for line in await metadata_file.readlines()]
+
+        error_message = f'{results_metadata} has wrong shards metadata!'
+        assert len(results_metadata) == 2, error_message
+        assert all(
+            sum(metadata['shards_sizes']) == 4 and len(metadata['shards']) == 2 for metadata in results_metadata
+        ), error_message
+
+        await async_weather_checker._AsyncWeatherChecker__delete_last_launch_results()
+
+    async def test_check_weather_with_coordination(self, tmp_path: Path) -> None:
+        """
+        Checks, that node with enabled coordination polls only locations of shards, which it leased, doesn't
+        poll locations of shards, which are leased by other node, and releases its leases on finish.
+
+        After checking deletes created during test results file.
+        """
+
+        database_path: Path = tmp_path / 'leases.sqlite3'
+        locations: List[Location] = [
+            Location(name=f'City{index}', latitude=str(index), longitude=str(-index)) for index in range(8)
+        ]
+        # Other node is alive and holds shard 0, so this node gets shard 1 as its fair share:
+        lease_backend: SqliteLeaseBackend = SqliteLeaseBackend(database_path=database_path)
+        lease_backend.open()
+        lease_backend.register_node(node_id='other', expires_at=time.time() + 60.0)
+        lease_backend.claim_lease(shard=0, node_id='other', expires_at=time.time() + 60.0, now=time.time())
+
+        async with MockWeatherServer(response_json=self.mock_data.weather_resource_response_json) as server:
+            config: Config = self.__create_mocked_weather_resource_config(
+                url=server.url,
+                mock_data=self.mock_data
+            ).model_copy(
+                update={
+                    'customized_settings': CustomizedSettings(times_to_check=2, check_interval_in_seconds=0.05),
+                    'locations': locations,
+                    'coordination_enabled': True,
+                    'coordination_node_id': 'node',
+                    'lease_shards_number': 2,
+                    'lease_database_path': database_path
+                }
+            )
+            async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(logger=logger, config=config)
+            await async_weather_checker._AsyncWeatherChecker__check_weather()
+
+        leases: Dict[int, AnyStr] = lease_backend.get_leases(now=time.time())
+        lease_backend.close()
+        error_message: AnyStr = f'{leases} != {{0: other}} after node finished!'
+        assert leases == {0: 'other'}, error_message
+
+        async with aiofiles.open(config.results_file_path, config.results_file_reading_mode) as results_file:
+            _, *results_lines = await results_file.readlines()
+
+        locations_names: List[AnyStr] = [results_line.split(config.sep)[0] for results_line in results_lines]
+        lease_coordinator: LeaseCoordinator = LeaseCoordinator(lease_backend=lease_backend, shards_number=2)
+        expected_locations_names: List[AnyStr] = [
+            location.name for location in locations if lease_coordinator.get_shard(location_name=location.name) == 1
+        ] * 2
+        error_message = f'{locations_names} != {expected_locations_names}!'
+        assert locations_names == expected_locations_names and expected_locations_names, error_message
+
+        await async_weather_checker._AsyncWeatherChecker__delete_last_launch_results()
+
+    async def test_poll_weather_resources_after_config_reload(self, tmp_path: Path) -> None:
+        """
+        Checks, that weather resource, added to YAML file, is polled after config reload without restart of weather
+        checker, and results file headers are written again before rows with new columns.
+
+        After checking deletes created during test results file.
+        """
+
+        yaml_config: YamlConfig = YamlConfig(
+            customized_settings_yaml_path=tmp_path / 'customized_settings.yaml',
+            weather_resources_yaml_path=tmp_path / 'weather_resources.yaml'
+        )
+        shutil.copy(test_yaml_config.customized_settings_yaml_path, yaml_config.customized_settings_yaml_path)
+
+        async with MockWeatherServer(response_json=self.mock_data.weather_resource_response_json) as server:
+            weather_resource: WeatherResource = self.mock_data.weather_resource._replace(url=server.url)
+            yaml_data: Dict[AnyStr, Any] = {
+                'locations': [self.mock_data.location._asdict()],
+                'weather_resources': [weather_resource._asdict()]
+            }
+            yaml_config.weather_resources_yaml_path.write_text(yaml.safe_dump(yaml_data))
+            config: Config = test_config.model_copy(
+                update={
+                    'weather_resources': [weather_resource],
+                    'locations': [self.mock_data.location],
+                    'yaml_config': yaml_config
+                }
+            )
+            async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(logger=logger, config=config)
+            config_reloader: ConfigReloader = ConfigReloader(yaml_config=yaml_config)
+
+            await async_weather_checker._AsyncWeatherChecker__delete_last_launch_results()
+            await async_weather_checker._AsyncWeatherChecker__write_headers_to_results_file()
+            await async_weather_checker._AsyncWeatherChecker__poll_weather_resources()
+
+            yaml_data['weather_resources'].append(weather_resource._replace(name='AMirror')._asdict())
+            yaml_config.weather_resources_yaml_path.write_text(yaml.safe_dump(yaml_data))
+            config_reloader.request_reload()
+            await async_weather_checker._AsyncWeatherChecker__reload_config(config_reloader=config_reloader)
+            await async_weather_checker._AsyncWeatherChecker__poll_weather_resources()
+
+        async with aiofiles.open(config.results_file_path, config.results_file_reading_mode) as results_file:
+            results_lines: List[AnyStr] = await results_file.readlines()
+
+        headers: List[List[AnyStr]] = [
+            results_lines[index].rstrip(config.new_line_arg).split(config.sep) for index in (0, 2)
+        ]
+        expected_headers: List[List[AnyStr]] = [
+            [config.location_header, weather_resource.name] + config.base_headers,
+            [config.location_header, 'AMirror', weather_resource.name] + config.base_headers
+        ]
+        error_message: AnyStr = f'{headers} != {expected_headers}!'
+        assert len(results_lines) == 4 and headers == expected_headers, error_message
+
+        temperatures: List[AnyStr] = results_lines[3].split(config.sep)[1:3]
+        error_message = f'{temperatures} are not received temperatures!'
+        assert temperatures[0] == temperatures[1] != str(config.default_temperature_value), error_message
+
+        await async_weather_checker._AsyncWeatherChecker__delete_last_launch_results()
+
+    async def test_check_weather_with_results_server(self) -> None:
+        """
+        Checks, that the latest results of location and weather resource are indexed after each iteration,
+        so they are served by results server from memory.
+
+        After checking deletes created during test results file.
+        """
+
+        async with MockWeatherServer(response_json=self.mock_data.weather_resource_response_json) as server:
+            config: Config = self.__create_mocked_weather_resource_config(
+                url=server.url,
+                mock_data=self.mock_data
+            ).model_copy(
+                update={
+                    'customized_settings': CustomizedSettings(times_to_check=2, check_interval_in_seconds=0.05),
+                    'results_server_enabled': True,
+                    'results_server_port': 0
+                }
+            )
+            async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(logger=logger, config=config)
+            await async_weather_checker._AsyncWeatherChecker__check_weather()
+
+        results_index: ResultsIndex = async_weather_checker.results_index
+        location_name: AnyStr = self.mock_data.location.name
+        weather_resource_name: AnyStr = self.mock_data.weather_resource.name
+        location_results: Dict[AnyStr, Any] = json.loads(results_index.get(path=('locations', location_name)).body)
+        error_message: AnyStr = f'{location_results} is not results of the last iteration!'
+        assert results_index.updates == 2 and location_results['iteration'] == 1, error_message
+
+        provider_results: Dict[AnyStr, Any] = location_results['providers'][weather_resource_name]
+        error_message = f'{provider_results} has no received temperature!'
+        assert provider_results['temperature'] == location_results['average_temperature'] is not None, error_message
+
+        await async_weather_checker._AsyncWeatherChecker__delete_last_launch_results()
+
+    async def test_check_weather_with_metrics(self) -> None:
+        """
+        Checks, that responses, received bytes, iterations and flushes of results writers are registered
+        by polling metrics.
+
+        After checking deletes created during test results file.
+        """
+
+        async with MockWeatherServer(response_json=self.mock_data.weather_resource_response_json) as server:
+            config: Config = self.__create_mocked_weather_resource_config(
+                url=server.url,
+                mock_data=self.mock_data
+            ).model_copy(
+                update={
+                    'customized_settings': CustomizedSettings(times_to_check=2, check_interval_in_seconds=0.05),
+                    'metrics_enabled': True,
+                    'results_server_port': 0
+                }
+            )
+            async_weather_checker: AsyncWeatherChecker = AsyncWeatherChecker(logger=logger, config=config)
+            await async_weather_checker._AsyncWeatherChecker__check_weather()
+
+        metrics: Dict[AnyStr, Dict] = async_weather_checker.polling_metrics.snapshot()
+        weather_resource_name: AnyStr = self.mock_data.weather_resource.name
+        responses: Dict = metrics['weather_checker_responses_total']
+        error_message: AnyStr = f'{responses} != {{({weather_resource_name}, 200): 2}}!'
+        assert responses == {(weather_resource_name, '200'): 2}, error_message
+
+        received_bytes: float = metrics['weather_checker_received_bytes_total'][(weather_resource_name,)]
+        assert received_bytes > 0, f'{received_bytes} received bytes were registered!'
+
+        iterations: Dict = metrics['weather_checker_iteration_duration_seconds']
+        assert iterations == {(): 2}, f'{iterations} != {{(): 2}}!'
+
+        flushes: Dict = metrics['weather_checker_writer_flush_latency_seconds']
+        error_message = f'{flushes} has no flushes of {config.results_file_path.name}!'
+        assert flushes.get((config.results_file_path.name,)), error_message
+
+        await async_weather_checker._AsyncWeatherChecker__delete_last_launch_results()
@@ -0,0 +1,75 @@
+from typing import AnyStr
+
+from src import CircuitBreaker
+from .test_polling_scheduler import MockClock
+
+
+class TestCircuitBreaker:
+    """
+    Class for testing CircuitBreaker methods.
+    """
+
+    def test_open_after_consecutive_failures(self) -> None:
+        """
+        Checks, that breaker is opened only after threshold of consecutive failures and skips requests after that.
+        """
+
+        circuit_breaker: CircuitBreaker = CircuitBreaker(failure_threshold=2, recovery_timeout_in_seconds=60)
+
+        circuit_breaker.register_failure()
+        circuit_breaker.register_success()
+        circuit_breaker.register_failure()
+        error_message: AnyStr = f'{circuit_breaker.state} != closed!'
+        assert circuit_breaker.state == 'closed' and circuit_breaker.allow_request(), error_message
+
+        circuit_breaker.register_failure()
+        error_message: AnyStr = f'{circuit_breaker.state} != open!'
+        assert circuit_breaker.state == 'open' and not circuit_breaker.allow_request(), error_message
+
+        error_message: AnyStr = f'{circuit_breaker.skipped_requests} != 1!'
+        assert circuit_breaker.skipped_requests == 1, error_message
+
+    def test_half_open_probe(self) -> None:
+        """
+        Checks, that after recovery timeout only one probe request is allowed, and breaker is closed, if it succeeds,
+        or opened again, if it fails.
+        """
+
+        clock: MockClock = MockClock()
+        circuit_breaker: CircuitBreaker = CircuitBreaker(failure_threshold=1, recovery_timeout_in_seconds=60, clock=clock)
+        circuit_breaker.register_failure()
+
+        clock.now = 60.0
+        error_message: AnyStr = 'Probe request was not allowed!'
+        assert circuit_breaker.allow_request() and circuit_breaker.state == 'half_open', error_message
+
+        error_message: AnyStr = 'Second request was allowed during probe!'
+        assert not circuit_breaker.allow_request(), error_message
+
+        circuit_breaker.register_failure()
+        error_message: AnyStr = f'{circuit_breaker.state} != open!'
+        assert circuit_breaker.state == 'open', error_message
+
+        clock.now = 120.0
+        circuit_breaker.allow_request()
+        circuit_breaker.register_success()
+        error_message: AnyStr = f'{circuit_breaker.snapshot()} is not closed!'
+        assert circuit_breaker.snapshot() == {'state': 'closed', 'consecutive_failures': 0, 'skipped_requests': 1}, \
+            error_message
+
+    def test_unfinished_probe_is_repeated(self) -> None:
+        """
+        Checks, that if probe request didn't finish (for example, was cancelled), next probe is allowed after
+        recovery timeout, so breaker doesn't get stuck in half-open state.
+        """
+
+        clock: MockClock = MockClock()
+        circuit_breaker: CircuitBreaker = CircuitBreaker(failure_threshold=1, recovery_timeout_in_seconds=60, clock=clock)
+        circuit_breaker.register_failure()
+
+        clock.now = 60.0
+        circuit_breaker.allow_request()
+
+        clock.now = 120.0
+        error_message: AnyStr = 'Next probe request was not allowed!'
+        assert circuit_breaker.allow_request(), error_message
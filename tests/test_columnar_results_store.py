@@ -0,0 +1,123 @@
+import numpy
+
+from pathlib import Path
+from typing import AnyStr, Dict
+
+from src import ColumnarResultsWriter, ColumnarResultsReader, ColumnarRow, Config, convert_csv_to_columnar_store
+from .async_metaclass import AsyncMetaclass
+from .test_configs import test_config
+
+
+class TestColumnarResultsStore(metaclass=AsyncMetaclass):
+    """
+    Class for testing ColumnarResultsWriter, ColumnarResultsReader and CSV converter.
+    """
+
+    async def test_write_and_read(self, tmp_path: Path) -> None:
+        """
+        Checks, that written rows are read by memory-mapped columns, missing temperatures are NaN and rows are
+        selected by location and time range.
+        """
+
+        store_path: Path = tmp_path / 'store'
+        async with ColumnarResultsWriter(store_path=store_path, providers=['First', 'Second']) as results_writer:
+            await results_writer.write(
+                lines=[
+                    ColumnarRow(timestamp=100.0, location='London', temperatures={'First': 1.0, 'Second': 2.0}),
+                    ColumnarRow(timestamp=100.0, location='Paris', temperatures={'First': 3.0, 'Second': None}),
+                    ColumnarRow(timestamp=200.0, location='London', temperatures={'First': 5.0})
+                ]
+            )
+
+        results_reader: ColumnarResultsReader = ColumnarResultsReader(store_path=store_path)
+        error_message: AnyStr = f'{len(results_reader)} != 3!'
+        assert len(results_reader) == 3, error_message
+
+        error_message: AnyStr = f'{results_reader.providers} != ["First", "Second"]!'
+        assert results_reader.providers == ['First', 'Second'], error_message
+
+        first_temperatures: numpy.ndarray = results_reader.column('First')
+        error_message: AnyStr = f'{type(first_temperatures)} is not memory-mapped!'
+        assert isinstance(first_temperatures, numpy.memmap), error_message
+
+        second_temperatures: numpy.ndarray = results_reader.column('Second')
+        error_message: AnyStr = f'{second_temperatures} != [2.0, nan, nan]!'
+        assert numpy.array_equal(second_temperatures, [2.0, numpy.nan, numpy.nan], equal_nan=True), error_message
+
+        london_results: Dict[AnyStr, numpy.ndarray] = results_reader.select(location='London', start_timestamp=150.0)
+        error_message: AnyStr = f'{london_results} has wrong rows!'
+        assert london_results['timestamp'].tolist() == [200.0], error_message
+        assert london_results['First'].tolist() == [5.0], error_message
+
+    async def test_new_provider_and_incomplete_row(self, tmp_path: Path) -> None:
+        """
+        Checks, that on next launch incomplete row, left by crash, is truncated and column of new provider is filled
+        by NaN for previous rows.
+        """
+
+        store_path: Path = tmp_path / 'store'
+        async with ColumnarResultsWriter(store_path=store_path, providers=['First']) as results_writer:
+            await results_writer.write(
+                lines=[ColumnarRow(timestamp=1.0, location='London', temperatures={'First': 1.0})]
+            )
+
+        # Emulates crash after writing of timestamp column only:
+        with open(store_path / 'column_0.f64', 'ab') as timestamp_file:
+            timestamp_file.write(numpy.array([2.0]).tobytes())
+
+        async with ColumnarResultsWriter(store_path=store_path, providers=['First', 'Second']) as results_writer:
+            await results_writer.write(
+                lines=[ColumnarRow(timestamp=3.0, location='London', temperatures={'First': 3.0, 'Second': 4.0})]
+            )
+
+        results_reader: ColumnarResultsReader = ColumnarResultsReader(store_path=store_path)
+        error_message: AnyStr = f'{results_reader.column("timestamp")} != [1.0, 3.0]!'
+        assert results_reader.column('timestamp').tolist() == [1.0, 3.0], error_message
+
+        error_message: AnyStr = f'{results_reader.column("Second")} != [nan, 4.0]!'
+        assert numpy.array_equal(results_reader.column('Second'), [numpy.nan, 4.0], equal_nan=True), error_message
+
+    async def test_convert_csv_to_columnar_store(self, tmp_path: Path) -> None:
+        """
+        Checks, that results file is converted with timestamps, calculated from iterations numbers, cells, which
+        are not numbers, are converted to NaN, configured base headers are skipped, and headers, repeated after
+        config reload, define columns of the next rows.
+        """
+
+        config: Config = test_config.model_copy(update={'base_headers': ['Mean']})
+        csv_file_path: Path = tmp_path / 'results.csv'
+        csv_file_path.write_text(
+            'Location,First,Second,Mean\n'
+            'London,1.0,None,1.0\n'
+            'Paris,2.0,broken,2.0\n'
+            'Location,First,Mean\n'
+            'London,4.0,4.0\n'
+        )
+
+        store_path: Path = tmp_path / 'store'
+        rows_number: int = await convert_csv_to_columnar_store(
+            csv_file_path=csv_file_path,
+            store_path=store_path,
+            config=config,
+            start_timestamp=1000.0,
+            interval_in_seconds=60.0
+        )
+
+        error_message: AnyStr = f'{rows_number} != 3!'
+        assert rows_number == 3, error_message
+
+        results_reader: ColumnarResultsReader = ColumnarResultsReader(store_path=store_path)
+        error_message: AnyStr = f'{results_reader.providers} != ["First", "Second"]!'
+        assert results_reader.providers == ['First', 'Second'], error_message
+
+        error_message: AnyStr = f'{results_reader.column("timestamp")} != [1000.0, 1000.0, 1060.0]!'
+        assert results_reader.column('timestamp').tolist() == [1000.0, 1000.0, 1060.0], error_message
+
+        error_message: AnyStr = f'{results_reader.column("Second")} != [nan, nan, nan]!'
+        assert numpy.isnan(results_reader.column('Second')).all(), error_message
+
+        error_message: AnyStr = f'{results_reader.column("First")} != [1.0, 2.0, 4.0]!'
+        assert results_reader.column('First').tolist() == [1.0, 2.0, 4.0], error_message
+
+        error_message: AnyStr = f'{results_reader.locations} != ["London", "Paris"]!'
+        assert results_reader.locations == ['London', 'Paris'], error_message
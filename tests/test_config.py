@@ -0,0 +1,122 @@
+from typing import AnyStr
+
+from pydantic import ValidationError
+
+from src import Config, Location
+from .test_configs import test_config, MockData
+
+
+class TestConfig:
+    """
+    Class for testing Config validation.
+    """
+
+    def test_location_placeholders_without_locations(self) -> None:
+        """
+        Checks, that config with location placeholders in weather resources, but without locations, is rejected.
+        """
+
+        try:
+            Config(
+                customized_settings=test_config.customized_settings,
+                weather_resources=MockData().weather_resources,
+                locations=[]
+            )
+        except ValidationError as e:
+            error_message: AnyStr = f'{e} does not mention placeholder!'
+            assert '{latitude}' in str(e), error_message
+            return
+
+        assert False, 'ValidationError was not raised!'
+
+    def test_location_placeholders_with_locations(self) -> None:
+        """
+        Checks, that config with location placeholders in weather resources and with locations is valid.
+        """
+
+        config: Config = Config(
+            customized_settings=test_config.customized_settings,
+            weather_resources=MockData().weather_resources,
+            locations=[Location(name='Moscow', latitude='55.75', longitude='37.62')]
+        )
+
+        error_message: AnyStr = f'{config.locations} is empty!'
+        assert config.locations, error_message
+
+    def test_iteration_deadline_exceeding_check_interval(self) -> None:
+        """
+        Checks, that config with iteration deadline longer than polling interval is rejected.
+        """
+
+        try:
+            Config(
+                customized_settings=test_config.customized_settings,
+                weather_resources=MockData().weather_resources,
+                locations=MockData().locations,
+                iteration_deadline_in_seconds=test_config.customized_settings.check_interval_in_seconds + 1
+            )
+        except ValidationError:
+            return
+
+        assert False, 'ValidationError was not raised!'
+
+    def test_batch_mode_with_placeholder_in_url(self) -> None:
+        """
+        Checks, that config with location placeholder in url of weather resource with batch mode is rejected,
+        since url can't be rendered for multiple locations.
+        """
+
+        weather_resource = MockData().weather_resource._replace(url='https://api.com/{name}', batch_size=10)
+        try:
+            Config(
+                customized_settings=test_config.customized_settings,
+                weather_resources=[weather_resource],
+                locations=MockData().locations
+            )
+        except ValidationError as e:
+            error_message: AnyStr = f'{e} does not mention batch mode!'
+            assert 'batch mode' in str(e), error_message
+            return
+
+        assert False, 'ValidationError was not raised!'
+
+    def test_coordination_with_lease_ttl_shorter_than_check_interval(self) -> None:
+        """
+        Checks, that config with coordination is rejected, if lease TTL doesn't exceed polling interval, since
+        lease would expire between renewals.
+        """
+
+        try:
+            Config(
+                customized_settings=test_config.customized_settings,
+                weather_resources=MockData().weather_resources,
+                locations=MockData().locations,
+                coordination_enabled=True,
+                lease_ttl_in_seconds=test_config.customized_settings.check_interval_in_seconds
+            )
+        except ValidationError as e:
+            error_message: AnyStr = f'{e} does not mention lease TTL!'
+            assert 'Lease TTL' in str(e), error_message
+            return
+
+        assert False, 'ValidationError was not raised!'
+
+    def test_metrics_with_unsorted_latency_buckets(self) -> None:
+        """
+        Checks, that config with unsorted metrics latency buckets is rejected.
+        """
+
+        try:
+            Config(
+                customized_settings=test_config.customized_settings,
+                weather_resources=MockData().weather_resources,
+                locations=MockData().locations,
+                metrics_enabled=True,
+                metrics_latency_buckets_in_seconds=[0.5, 0.1, 1.0]
+            )
+        except ValidationError as e:
+            error_message: AnyStr = f'{e} does not mention latency buckets!'
+            assert 'latency buckets' in str(e), error_message
+            return
+
+        assert False, 'ValidationError was not raised!'
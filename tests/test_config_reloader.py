@@ -0,0 +1,118 @@
+import os
+import yaml
+import shutil
+
+from pathlib import Path
+from typing import AnyStr, Dict, Any
+
+from src import Config, YamlConfig, ConfigReloader, ConfigReloadError, ConfigDiff, diff_configs
+from .test_configs import test_config, test_yaml_config
+
+
+class TestConfigReloader:
+    """
+    Class for testing ConfigReloader methods.
+    """
+
+    def test_reload_of_modified_weather_resources(self, tmp_path: Path) -> None:
+        """
+        Checks, that reload is due after modification of weather resources file, and reloaded config has added,
+        changed and removed weather resources, while fields, which are not stored in YAML files, are kept.
+        """
+
+        yaml_config: YamlConfig = self.__copy_yaml_config(tmp_path=tmp_path)
+        config: Config = test_config.model_copy(update={'yaml_config': yaml_config})
+        config_reloader: ConfigReloader = ConfigReloader(yaml_config=yaml_config)
+        error_message: AnyStr = 'Reload is due before modification!'
+        assert not config_reloader.is_reload_due(), error_message
+
+        yaml_data: Dict[AnyStr, Any] = yaml.safe_load(yaml_config.weather_resources_yaml_path.read_text())
+        open_meteo: Dict[AnyStr, Any] = yaml_data['weather_resources'][0]
+        yaml_data['weather_resources'] = [
+            {**open_meteo, 'headers': {'Authorization': 'token'}},
+            {**open_meteo, 'name': 'OpenMeteoMirror'}
+        ]
+        self.__write_yaml(file_path=yaml_config.weather_resources_yaml_path, yaml_data=yaml_data)
+
+        error_message = 'Reload is not due after modification!'
+        assert config_reloader.is_reload_due(), error_message
+
+        reloaded_config: Config = config_reloader.load_config(config=config)
+        config_diff: ConfigDiff = diff_configs(running_config=config, reloaded_config=reloaded_config)
+        expected_config_diff: ConfigDiff = ConfigDiff(
+            added_weather_resources=['OpenMeteoMirror'],
+            changed_weather_resources=['OpenMeteo'],
+            removed_weather_resources=[],
+            locations_changed=False,
+            customized_settings_changed=False
+        )
+        error_message = f'{config_diff} != {expected_config_diff}!'
+        assert config_diff == expected_config_diff, error_message
+
+        error_message = f'{reloaded_config.results_file_path} != {config.results_file_path}!'
+        assert reloaded_config.results_file_path == config.results_file_path, error_message
+
+        error_message = 'Reload is due after reload!'
+        assert not config_reloader.is_reload_due(), error_message
+
+    def test_reload_of_invalid_config(self, tmp_path: Path) -> None:
+        """
+        Checks, that config, which fails validation (polling interval becomes shorter than iteration deadline),
+        is not reloaded, and broken file is not parsed again, until it is modified or reload is requested.
+        """
+
+        yaml_config: YamlConfig = self.__copy_yaml_config(tmp_path=tmp_path)
+        config_reloader: ConfigReloader = ConfigReloader(yaml_config=yaml_config)
+        config: Config = test_config.model_copy(
+            update={'yaml_config': yaml_config, 'iteration_deadline_in_seconds': 5.0}
+        )
+        self.__write_yaml(
+            file_path=yaml_config.customized_settings_yaml_path,
+            yaml_data={'check_interval_in_seconds': 1, 'times_to_check': 2}
+        )
+
+        try:
+            config_reloader.load_config(config=config)
+        except ConfigReloadError as e:
+            error_message: AnyStr = f'{e} does not mention iteration deadline!'
+            assert 'Iteration deadline' in str(e), error_message
+        else:
+            raise AssertionError('ConfigReloadError was not raised!')
+
+        error_message = f'{config_reloader} is wrong or reload is due!'
+        assert config_reloader.snapshot()['failed_reloads'] == 1, error_message
+        assert not config_reloader.is_reload_due(), error_message
+
+        config_reloader.request_reload()
+        error_message = 'Reload is not due after request!'
+        assert config_reloader.is_reload_due(), error_message
+
+    @staticmethod
+    def __copy_yaml_config(tmp_path: Path) -> YamlConfig:
+        """
+        Copies test YAML files to temporary directory, so they can be modified by test.
+
+        Method is static for purpose of correct work of test class.
+
+        :param tmp_path: Temporary directory of test.
+        :return: :py:class:`YamlConfig` of copied files.
+        """
+
+        for file_path in (test_yaml_config.customized_settings_yaml_path, test_yaml_config.weather_resources_yaml_path):
+            shutil.copy(file_path, tmp_path / file_path.name)
+
+        return YamlConfig(
+            customized_settings_yaml_path=tmp_path / test_yaml_config.customized_settings_yaml_path.name,
+            weather_resources_yaml_path=tmp_path / test_yaml_config.weather_resources_yaml_path.name
+        )
+
+    @staticmethod
+    def __write_yaml(file_path: Path, yaml_data: Dict[AnyStr, Any]) -> None:
+        """
+        Writes YAML file and moves its modification time forward, so modification is detected even on file systems
+        with coarse timestamps.
+        """
+
+        modification_time: int = os.stat(file_path).st_mtime_ns
+        file_path.write_text(yaml.safe_dump(yaml_data))
+        os.utime(file_path, ns=(modification_time + 10 ** 9, modification_time + 10 ** 9))
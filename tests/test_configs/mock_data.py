@@ -3,7 +3,7 @@ import random
 from typing import List, AnyStr, Dict, Any
 from copy import deepcopy
 
-from src import WeatherResource, CustomizedSettings, Temperature, WeatherResult
+from src import WeatherResource, CustomizedSettings, Temperature, WeatherResult, Location
 from .test_config import mock_data_config, test_config
 
 
@@ -16,6 +16,8 @@ class MockData:
         self.__create_mocked_customized_settings()
         self.__create_broken_customized_settings()
 
+        self.__create_locations()
+        self.__location = self.__locations[0]
         self.__create_weather_resources()
         self.__weather_resource = self.__weather_resources[0]
         self.__create_broken_weather_resources()
@@ -28,6 +30,7 @@ class MockData:
         self.__temperature_from_response: Temperature = Temperature(mock_data_config.temperature_from_response)
 
         self.__create_response_json()
+        self.__create_weather_resource_response_json()
         self.__result_keys: List[AnyStr] = self.__broken_weather_resource.result_keys
 
         self.__create_sorted_weather_results()
@@ -48,6 +51,19 @@ class MockData:
             check_interval_in_seconds=mock_data_config.broken_check_weather_interval_in_seconds
         )
 
+    def __create_locations(self) -> None:
+        """
+        Params below should be equal to provided in "tests/test_configs/test_yaml_configs/weather_resources.yaml" file.
+        """
+
+        self.__locations = [
+            Location(
+                name='Saint-Petersburg',
+                latitude='59.9386300',
+                longitude='30.31413001'
+            )
+        ]
+
     def __create_weather_resources(self) -> None:
         """
         Params below should be equal to provided in "tests/test_configs/test_yaml_configs/weather_resources.yaml" file.
@@ -58,8 +74,8 @@ class MockData:
                 name='OpenMeteo',
                 url='https://api.open-meteo.com/v1/forecast',
                 params={
-                    'latitude': '59.9386300',
-                    'longitude': '30.31413001',
+                    'latitude': '{latitude}',
+                    'longitude': '{longitude}',
                     'current': 'temperature_2m'
                 },
                 headers={},
@@ -130,6 +146,21 @@ class MockData:
             }
         }
 
+    def __create_weather_resource_response_json(self) -> None:
+        """
+        Creates mocked response in JSON format of @self.__weather_resource, which is served by local mocked
+        weather resource instead of real API.
+        """
+
+        self.__weather_resource_response_json: Dict[AnyStr, Any] = {
+            'latitude': 59.94,
+            'longitude': 30.3125,
+            self.__weather_resource.result_keys[0]: {
+                'interval': 900,
+                self.__weather_resource.result_keys[1]: self.__temperature_from_response
+            }
+        }
+
     def __create_sorted_weather_results(self) -> None:
         """
         Creates mocked weather results for testing their sorting later.
@@ -163,7 +194,9 @@ class MockData:
         """
 
         weather_resources_names: List[AnyStr] = [weather_resource.name for weather_resource in self.__weather_resources]
-        headers: AnyStr = test_config.sep.join(weather_resources_names + test_config.base_headers)
+        headers: AnyStr = test_config.sep.join(
+            [test_config.location_header] + weather_resources_names + test_config.base_headers
+        )
         self.__result_file_headers: AnyStr = headers + test_config.new_line_arg
 
     def __create_result_file_values_line(self) -> None:
@@ -177,11 +210,19 @@ class MockData:
 
         weather_results_values.append(mock_data_config.average_temperature_value)
 
-        str_weather_results_values: List[AnyStr] = list(map(str, weather_results_values))
+        str_weather_results_values: List[AnyStr] = [self.__location.name] + list(map(str, weather_results_values))
         self.__result_file_values_line: AnyStr = (
                 test_config.sep.join(str_weather_results_values) + test_config.new_line_arg
         )
 
+    @property
+    def locations(self) -> List[Location]:
+        return self.__locations
+
+    @property
+    def location(self) -> Location:
+        return self.__location
+
     @property
     def weather_resources(self) -> List[WeatherResource]:
         return self.__weather_resources
@@ -230,6 +271,10 @@ class MockData:
     def response_json(self) -> Dict[AnyStr, Any]:
         return self.__response_json
 
+    @property
+    def weather_resource_response_json(self) -> Dict[AnyStr, Any]:
+        return self.__weather_resource_response_json
+
     @property
     def result_keys(self) -> List[AnyStr]:
         return self.__result_keys
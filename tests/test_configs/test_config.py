@@ -9,7 +9,9 @@ from .test_yaml_configs import test_yaml_config
 test_config: Config = Config(
     customized_settings=YamlHandler(yaml_config=test_yaml_config).get_customized_settings(),
     weather_resources=YamlHandler(yaml_config=test_yaml_config).get_weather_resources(),
-    results_file_path=Path('./test_weather_results.csv')
+    locations=YamlHandler(yaml_config=test_yaml_config).get_locations(),
+    results_file_path=Path('./test_weather_results.csv'),
+    results_metadata_file_path=Path('./test_weather_results_metadata.jsonl')
 )
 
 
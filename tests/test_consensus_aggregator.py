@@ -0,0 +1,104 @@
+import numpy
+
+from typing import AnyStr, List
+
+from src import ConsensusAggregator, ConsensusResult
+from .async_metaclass import AsyncMetaclass
+
+
+class TestConsensusAggregator(metaclass=AsyncMetaclass):
+    """
+    Class for testing ConsensusAggregator methods.
+    """
+
+    weather_resources_names: List[AnyStr] = ['First', 'Second', 'Third', 'Fourth', 'Fifth']
+
+    # The second location has temperature in Kelvin from the fifth weather resource, the third has no temperatures:
+    temperatures: numpy.ndarray = numpy.array([
+        [10.0, 11.0, 12.0, 13.0, 14.0],
+        [15.0, 15.2, 14.8, 15.1, 288.15],
+        [numpy.nan, numpy.nan, numpy.nan, numpy.nan, numpy.nan]
+    ])
+
+    async def test_mean(self) -> None:
+        """
+        Checks, that weighted mean is calculated over received temperatures and nothing is rejected.
+        """
+
+        consensus_result: ConsensusResult = ConsensusAggregator(strategy='mean', weights={'First': 3.0}).aggregate(
+            temperatures=numpy.array([[10.0, 20.0, numpy.nan, numpy.nan, numpy.nan]]),
+            weather_resources_names=self.weather_resources_names
+        )
+
+        error_message: AnyStr = f'{consensus_result.temperatures} != [12.5]!'
+        assert consensus_result.temperatures.tolist() == [12.5], error_message
+
+        error_message: AnyStr = f'{consensus_result.rejected} has rejected temperatures!'
+        assert not consensus_result.rejected.any(), error_message
+
+    async def test_median(self) -> None:
+        """
+        Checks, that median ignores missing temperatures and is NaN for location without temperatures.
+        """
+
+        consensus_result: ConsensusResult = ConsensusAggregator(strategy='median').aggregate(
+            temperatures=self.temperatures,
+            weather_resources_names=self.weather_resources_names
+        )
+
+        error_message: AnyStr = f'{consensus_result.temperatures} != [12.0, 15.1, nan]!'
+        assert numpy.array_equal(consensus_result.temperatures, [12.0, 15.1, numpy.nan], equal_nan=True), error_message
+
+    async def test_trimmed_mean(self) -> None:
+        """
+        Checks, that the lowest and the highest temperatures of each location are rejected.
+        """
+
+        consensus_result: ConsensusResult = ConsensusAggregator(strategy='trimmed_mean', trim_proportion=0.2).aggregate(
+            temperatures=self.temperatures,
+            weather_resources_names=self.weather_resources_names
+        )
+
+        error_message: AnyStr = f'{consensus_result.temperatures} != [12.0, 15.1, nan]!'
+        assert numpy.allclose(consensus_result.temperatures, [12.0, 15.1, numpy.nan], equal_nan=True), error_message
+
+        expected_rejected: List[List[bool]] = [
+            [True, False, False, False, True],
+            [False, False, True, False, True],
+            [False, False, False, False, False]
+        ]
+        error_message: AnyStr = f'{consensus_result.rejected} != {expected_rejected}!'
+        assert consensus_result.rejected.tolist() == expected_rejected, error_message
+
+    async def test_mad(self) -> None:
+        """
+        Checks, that only temperature in wrong units is rejected as outlier.
+        """
+
+        consensus_result: ConsensusResult = ConsensusAggregator(strategy='mad').aggregate(
+            temperatures=self.temperatures,
+            weather_resources_names=self.weather_resources_names
+        )
+
+        expected_rejected: List[List[bool]] = [
+            [False, False, False, False, False],
+            [False, False, False, False, True],
+            [False, False, False, False, False]
+        ]
+        error_message: AnyStr = f'{consensus_result.rejected} != {expected_rejected}!'
+        assert consensus_result.rejected.tolist() == expected_rejected, error_message
+
+        error_message: AnyStr = f'{consensus_result.temperatures} != [12.0, 15.025, nan]!'
+        assert numpy.allclose(consensus_result.temperatures, [12.0, 15.025, numpy.nan], equal_nan=True), error_message
+
+    async def test_unknown_strategy(self) -> None:
+        """
+        Checks, that unknown aggregation strategy is rejected.
+        """
+
+        try:
+            ConsensusAggregator(strategy='mode')
+        except ValueError:
+            return
+
+        assert False, 'ValueError was not raised!'
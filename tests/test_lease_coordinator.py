@@ -0,0 +1,92 @@
+import asyncio
+
+from pathlib import Path
+from typing import AnyStr, List
+
+from src import LeaseCoordinator, SqliteLeaseBackend, Location
+from .async_metaclass import AsyncMetaclass
+
+
+class TestLeaseCoordinator(metaclass=AsyncMetaclass):
+    """
+    Class for testing LeaseCoordinator and SqliteLeaseBackend methods.
+    """
+
+    async def test_handover_to_joined_node(self, tmp_path: Path) -> None:
+        """
+        Checks, that node, which joined later, gets fair share of shards, which are released by the first node,
+        and locations are split between nodes without overlaps.
+        """
+
+        database_path: Path = tmp_path / 'leases.sqlite3'
+        async with (
+            LeaseCoordinator(
+                lease_backend=SqliteLeaseBackend(database_path=database_path),
+                node_id='first',
+                shards_number=4
+            ) as first_coordinator,
+            LeaseCoordinator(
+                lease_backend=SqliteLeaseBackend(database_path=database_path),
+                node_id='second',
+                shards_number=4
+            ) as second_coordinator
+        ):
+            first_shards: List[int] = await first_coordinator.renew_leases()
+            second_shards: List[int] = await second_coordinator.renew_leases()
+            error_message: AnyStr = f'{first_shards, second_shards} != ([0, 1, 2, 3], [])!'
+            assert (first_shards, second_shards) == ([0, 1, 2, 3], []), error_message
+
+            first_shards = await first_coordinator.renew_leases()
+            second_shards = await second_coordinator.renew_leases()
+            error_message = f'{first_shards, second_shards} != ([0, 1], [2, 3])!'
+            assert (first_shards, second_shards) == ([0, 1], [2, 3]), error_message
+
+            locations: List[Location] = [Location(name=f'City{index}') for index in range(20)]
+            first_locations: List[Location] = first_coordinator.filter_locations(locations=locations)
+            second_locations: List[Location] = second_coordinator.filter_locations(locations=locations)
+            error_message = f'{first_locations} and {second_locations} are not a split of locations!'
+            assert sorted(first_locations + second_locations) == sorted(locations), error_message
+            assert not set(first_locations) & set(second_locations), error_message
+
+    async def test_shards_of_stopped_node_are_claimed_after_ttl(self, tmp_path: Path) -> None:
+        """
+        Checks, that shards of node, which stopped renewing its leases, are claimed by other node only after lease
+        TTL, and shards are released on exit, so they are claimed without waiting for TTL.
+        """
+
+        database_path: Path = tmp_path / 'leases.sqlite3'
+        second_coordinator: LeaseCoordinator = LeaseCoordinator(
+            lease_backend=SqliteLeaseBackend(database_path=database_path),
+            node_id='second',
+            shards_number=2,
+            lease_ttl_in_seconds=0.1
+        )
+        async with second_coordinator:
+            async with LeaseCoordinator(
+                lease_backend=SqliteLeaseBackend(database_path=database_path),
+                node_id='first',
+                shards_number=2,
+                lease_ttl_in_seconds=0.1
+            ) as first_coordinator:
+                await first_coordinator.renew_leases()
+                second_shards: List[int] = await second_coordinator.renew_leases()
+                error_message: AnyStr = f'{second_shards} are claimed before TTL!'
+                assert second_shards == [], error_message
+
+                await asyncio.sleep(0.15)
+                second_shards = await second_coordinator.renew_leases()
+                error_message = f'{second_shards} != [0, 1] after TTL!'
+                assert second_shards == [0, 1], error_message
+
+                first_shards: List[int] = await first_coordinator.renew_leases()
+                error_message = f'{first_shards} were not lost by stopped node!'
+                assert first_shards == [], error_message
+
+        async with LeaseCoordinator(
+            lease_backend=SqliteLeaseBackend(database_path=database_path),
+            node_id='third',
+            shards_number=2
+        ) as third_coordinator:
+            third_shards: List[int] = await third_coordinator.renew_leases()
+            error_message = f'{third_shards} != [0, 1] after release!'
+            assert third_shards == [0, 1], error_message
@@ -0,0 +1,82 @@
+import time
+import asyncio
+import aiohttp
+
+from typing import AnyStr, List, Dict
+
+from src import PollingMetrics, EventLoopLagMonitor, MetricHistogram, ResultsServer
+from .async_metaclass import AsyncMetaclass
+
+
+class TestPollingMetrics(metaclass=AsyncMetaclass):
+    """
+    Class for testing PollingMetrics, metrics registry and EventLoopLagMonitor methods.
+    """
+
+    async def test_render_metrics_in_prometheus_format(self) -> None:
+        """
+        Checks, that histogram buckets are cumulative, counters are labelled by status and exception, and queue
+        depths are collected on render.
+        """
+
+        polling_metrics: PollingMetrics = PollingMetrics(
+            latency_buckets_in_seconds=[0.1, 1.0],
+            queue_depths_function=lambda: {('fetch',): 3}
+        )
+        polling_metrics.register_request(
+            weather_resource_name='OpenMeteo',
+            latency_in_seconds=0.05,
+            status=200,
+            received_bytes=100
+        )
+        polling_metrics.register_request(weather_resource_name='OpenMeteo', latency_in_seconds=0.5, status=503)
+        polling_metrics.register_request(
+            weather_resource_name='OpenMeteo',
+            latency_in_seconds=2.0,
+            exception_name='TimeoutError'
+        )
+
+        lines: List[AnyStr] = polling_metrics.render().splitlines()
+        expected_lines: List[AnyStr] = [
+            'weather_checker_request_latency_seconds_bucket{provider="OpenMeteo",le="0.1"} 1',
+            'weather_checker_request_latency_seconds_bucket{provider="OpenMeteo",le="1"} 2',
+            'weather_checker_request_latency_seconds_bucket{provider="OpenMeteo",le="+Inf"} 3',
+            'weather_checker_request_latency_seconds_sum{provider="OpenMeteo"} 2.55',
+            'weather_checker_request_latency_seconds_count{provider="OpenMeteo"} 3',
+            'weather_checker_responses_total{provider="OpenMeteo",status="200"} 1',
+            'weather_checker_responses_total{provider="OpenMeteo",status="503"} 1',
+            'weather_checker_request_exceptions_total{provider="OpenMeteo",exception="TimeoutError"} 1',
+            'weather_checker_received_bytes_total{provider="OpenMeteo"} 100',
+            'weather_checker_queue_depth{queue="fetch"} 3'
+        ]
+        missing_lines: List[AnyStr] = [line for line in expected_lines if line not in lines]
+        assert not missing_lines, f'{missing_lines} are not rendered!'
+
+        snapshot: Dict = polling_metrics.snapshot()
+        error_message: AnyStr = f'{snapshot["weather_checker_responses_total"]} has no responses with 503 status!'
+        assert snapshot['weather_checker_responses_total'][('OpenMeteo', '503')] == 1, error_message
+
+    async def test_measure_event_loop_lag(self) -> None:
+        """
+        Checks, that event loop, blocked by synchronous code, is registered as lag, and metrics are served
+        on "/metrics".
+        """
+
+        polling_metrics: PollingMetrics = PollingMetrics(latency_buckets_in_seconds=[0.05, 1.0])
+        async with (
+            EventLoopLagMonitor(polling_metrics=polling_metrics, interval_in_seconds=0.01) as event_loop_lag_monitor,
+            ResultsServer(port=0, metrics_registry=polling_metrics.metrics_registry) as results_server,
+            aiohttp.ClientSession() as session
+        ):
+            await asyncio.sleep(0.02)
+            time.sleep(0.1)
+            await asyncio.sleep(0.02)
+
+            async with session.get(f'{results_server.url}/metrics') as response:
+                metrics_text: AnyStr = await response.text()
+
+        event_loop_lag: MetricHistogram = polling_metrics.metrics_registry.get('weather_checker_event_loop_lag_seconds')
+        buckets: Dict[float, int] = event_loop_lag.get_buckets()
+        error_message: AnyStr = f'{buckets} has no lag over 50 ms, {event_loop_lag_monitor}!'
+        assert buckets[float('inf')] > buckets[0.05], error_message
+        assert 'weather_checker_event_loop_lag_seconds_count' in metrics_text, f'{metrics_text} has no lag!'
@@ -0,0 +1,112 @@
+import time
+import asyncio
+
+from typing import AnyStr, List
+
+from src import PollingPipeline
+from .async_metaclass import AsyncMetaclass
+
+
+class TestPollingPipeline(metaclass=AsyncMetaclass):
+    """
+    Class for testing PollingPipeline methods.
+    """
+
+    async def test_items_order_and_statistics(self) -> None:
+        """
+        Checks, that every item is processed by all stages in order of putting, and statistics are collected
+        for each stage.
+        """
+
+        sink: List[int] = []
+
+        async def double(item: int) -> int:
+            return item * 2
+
+        async def save(item: int) -> None:
+            sink.append(item)
+
+        async with PollingPipeline(stages=[('double', double), ('save', save)]) as polling_pipeline:
+            for item in range(5):
+                await polling_pipeline.put(item)
+
+        error_message: AnyStr = f'{sink} != [0, 2, 4, 6, 8]!'
+        assert sink == [0, 2, 4, 6, 8], error_message
+
+        processed: List[int] = [
+            stage_statistics['processed'] for stage_statistics in polling_pipeline.snapshot().values()
+        ]
+        error_message: AnyStr = f'{processed} != [5, 5]!'
+        assert processed == [5, 5], error_message
+
+    async def test_stages_overlap(self) -> None:
+        """
+        Checks, that slow stages process different items concurrently, so total time is less than sequential one.
+        """
+
+        async def fetch(item: int) -> int:
+            await asyncio.sleep(0.1)
+            return item
+
+        async def sink(item: int) -> None:
+            await asyncio.sleep(0.1)
+
+        start_time: float = time.monotonic()
+        async with PollingPipeline(stages=[('fetch', fetch), ('sink', sink)]) as polling_pipeline:
+            for item in range(3):
+                await polling_pipeline.put(item)
+
+        elapsed_time: float = time.monotonic() - start_time
+
+        # Sequential processing would take 0.6 seconds, pipelined one takes 0.4 seconds:
+        error_message: AnyStr = f'{elapsed_time} >= 0.55!'
+        assert elapsed_time < 0.55, error_message
+
+    async def test_backpressure(self) -> None:
+        """
+        Checks, that producer waits, if slow stage queue is full.
+        """
+
+        stage_started: asyncio.Event = asyncio.Event()
+        stage_released: asyncio.Event = asyncio.Event()
+
+        async def slow_sink(item: int) -> None:
+            stage_started.set()
+            await stage_released.wait()
+
+        polling_pipeline: PollingPipeline = PollingPipeline(stages=[('sink', slow_sink)], queue_max_size=1)
+        polling_pipeline.start()
+        await polling_pipeline.put(0)
+        await stage_started.wait()
+        await polling_pipeline.put(1)
+
+        put_task: asyncio.Task = asyncio.create_task(polling_pipeline.put(2))
+        await asyncio.sleep(0.05)
+        error_message: AnyStr = 'Producer was not blocked by full queue!'
+        assert not put_task.done(), error_message
+
+        stage_released.set()
+        await put_task
+        await polling_pipeline.close()
+
+        error_message: AnyStr = f'{polling_pipeline.snapshot()} has wrong max queue depth!'
+        assert polling_pipeline.stages_statistics['sink'].max_queue_depth == 1, error_message
+
+    async def test_stage_error(self) -> None:
+        """
+        Checks, that error of a stage is raised on close and doesn't block the pipeline.
+        """
+
+        async def broken_stage(item: int) -> None:
+            raise RuntimeError('Broken stage')
+
+        polling_pipeline: PollingPipeline = PollingPipeline(stages=[('broken', broken_stage)])
+        polling_pipeline.start()
+        await polling_pipeline.put(0)
+
+        try:
+            await polling_pipeline.close()
+        except RuntimeError:
+            return
+
+        assert False, 'RuntimeError was not raised!'
@@ -0,0 +1,219 @@
+from typing import List, AnyStr
+
+from src import PollingScheduler, WeatherResource
+from .async_metaclass import AsyncMetaclass
+from .test_configs import MockData
+
+
+class MockClock:
+    """
+    Manually moved clock for testing scheduler without real sleeping.
+    """
+
+    def __init__(self) -> None:
+        self.now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestPollingScheduler(metaclass=AsyncMetaclass):
+    """
+    Class for testing PollingScheduler methods.
+    """
+
+    @classmethod
+    def setup_class(cls):
+        """
+        PyTest setup method similar to __init__ in base class.
+        """
+
+        weather_resource: WeatherResource = MockData().broken_weather_resource
+        cls.fast_weather_resource: WeatherResource = weather_resource._replace(name='FastAPI')
+        cls.slow_weather_resource: WeatherResource = weather_resource._replace(
+            name='SlowAPI',
+            check_interval_in_seconds=30
+        )
+
+    @staticmethod
+    def __get_names(weather_resources: List[WeatherResource]) -> List[AnyStr]:
+        return sorted(weather_resource.name for weather_resource in weather_resources)
+
+    async def test_fixed_rate_due_times(self) -> None:
+        """
+        Checks, that next due time is calculated from previous due time, so slow polling doesn't shift schedule.
+        """
+
+        clock: MockClock = MockClock()
+        polling_scheduler: PollingScheduler = PollingScheduler(
+            weather_resources=[self.fast_weather_resource],
+            default_interval_in_seconds=10,
+            clock=clock
+        )
+        polling_scheduler.start()
+
+        await polling_scheduler.wait_for_due_weather_resources()
+
+        # Polling took 3 seconds:
+        clock.now = 3.0
+        error_message: AnyStr = f'{polling_scheduler.time_until_next_tick()} != 7.0!'
+        assert polling_scheduler.time_until_next_tick() == 7.0, error_message
+
+        clock.now = 10.0
+        await polling_scheduler.wait_for_due_weather_resources()
+        error_message: AnyStr = f'{polling_scheduler.due_times} != {{"FastAPI": 20.0}}!'
+        assert polling_scheduler.due_times == {'FastAPI': 20.0}, error_message
+
+    async def test_per_resource_intervals(self) -> None:
+        """
+        Checks, that each weather resource is polled according to its own interval.
+        """
+
+        clock: MockClock = MockClock()
+        polling_scheduler: PollingScheduler = PollingScheduler(
+            weather_resources=[self.fast_weather_resource, self.slow_weather_resource],
+            default_interval_in_seconds=10,
+            clock=clock
+        )
+        polling_scheduler.start()
+
+        polled_weather_resources_names: List[List[AnyStr]] = []
+        for now in (0.0, 10.0, 20.0, 30.0):
+            clock.now = now
+            polled_weather_resources_names.append(
+                self.__get_names(weather_resources=await polling_scheduler.wait_for_due_weather_resources())
+            )
+
+        expected_names: List[List[AnyStr]] = [['FastAPI', 'SlowAPI'], ['FastAPI'], ['FastAPI'], ['FastAPI', 'SlowAPI']]
+        error_message: AnyStr = f'{polled_weather_resources_names} != {expected_names}!'
+        assert polled_weather_resources_names == expected_names, error_message
+
+    async def test_skip_missed_ticks(self) -> None:
+        """
+        Checks, that with "skip" policy missed ticks are skipped and counted.
+        """
+
+        clock: MockClock = MockClock()
+        polling_scheduler: PollingScheduler = PollingScheduler(
+            weather_resources=[self.fast_weather_resource],
+            default_interval_in_seconds=10,
+            missed_tick_policy='skip',
+            clock=clock
+        )
+        polling_scheduler.start()
+
+        # Ticks at 10, 20 and 30 seconds were missed:
+        clock.now = 35.0
+        await polling_scheduler.wait_for_due_weather_resources()
+
+        error_message: AnyStr = f'{polling_scheduler.due_times} != {{"FastAPI": 40.0}}!'
+        assert polling_scheduler.due_times == {'FastAPI': 40.0}, error_message
+
+        skipped_ticks: int = polling_scheduler.skipped_ticks['FastAPI']
+        error_message: AnyStr = f'{skipped_ticks} != 3!'
+        assert skipped_ticks == 3, error_message
+
+    async def test_catch_up_missed_ticks(self) -> None:
+        """
+        Checks, that with "catch_up" policy missed ticks are executed one after another without sleeping.
+        """
+
+        clock: MockClock = MockClock()
+        polling_scheduler: PollingScheduler = PollingScheduler(
+            weather_resources=[self.fast_weather_resource],
+            default_interval_in_seconds=10,
+            missed_tick_policy='catch_up',
+            clock=clock
+        )
+        polling_scheduler.start()
+
+        clock.now = 35.0
+        due_times: List[float] = []
+        for _ in range(4):
+            due_times.append(polling_scheduler.due_times['FastAPI'])
+            await polling_scheduler.wait_for_due_weather_resources()
+
+        error_message: AnyStr = f'{due_times} != [0.0, 10.0, 20.0, 30.0]!'
+        assert due_times == [0.0, 10.0, 20.0, 30.0], error_message
+
+        error_message: AnyStr = f'{polling_scheduler.time_until_next_tick()} != 5.0!'
+        assert polling_scheduler.time_until_next_tick() == 5.0, error_message
+
+        error_message: AnyStr = f'{polling_scheduler.skipped_ticks} is not empty!'
+        assert not polling_scheduler.skipped_ticks, error_message
+
+    async def test_tick_tolerance_grouping(self) -> None:
+        """
+        Checks, that weather resources, which due times are within tick tolerance, are polled at the same tick.
+        """
+
+        clock: MockClock = MockClock()
+        polling_scheduler: PollingScheduler = PollingScheduler(
+            weather_resources=[
+                self.fast_weather_resource,
+                self.slow_weather_resource._replace(check_interval_in_seconds=10.04)
+            ],
+            default_interval_in_seconds=10,
+            tick_tolerance_in_seconds=0.05,
+            clock=clock
+        )
+        polling_scheduler.start()
+        await polling_scheduler.wait_for_due_weather_resources()
+
+        clock.now = 10.0
+        polled_weather_resources_names: List[AnyStr] = self.__get_names(
+            weather_resources=await polling_scheduler.wait_for_due_weather_resources()
+        )
+
+        error_message: AnyStr = f'{polled_weather_resources_names} != ["FastAPI", "SlowAPI"]!'
+        assert polled_weather_resources_names == ['FastAPI', 'SlowAPI'], error_message
+
+    async def test_update_weather_resources(self) -> None:
+        """
+        Checks, that reloaded weather resources are applied without resetting schedule: added resource is due
+        immediately, removed resource is not polled anymore, and changed resource keeps its due time.
+        """
+
+        clock: MockClock = MockClock()
+        polling_scheduler: PollingScheduler = PollingScheduler(
+            weather_resources=[self.fast_weather_resource, self.slow_weather_resource],
+            default_interval_in_seconds=10,
+            clock=clock
+        )
+        polling_scheduler.start()
+        await polling_scheduler.wait_for_due_weather_resources()
+
+        clock.now = 5.0
+        added_weather_resource: WeatherResource = self.fast_weather_resource._replace(name='AddedAPI')
+        polling_scheduler.update_weather_resources(
+            weather_resources=[self.fast_weather_resource._replace(params={'changed': 'true'}), added_weather_resource],
+            default_interval_in_seconds=10
+        )
+        due_weather_resources: List[WeatherResource] = await polling_scheduler.wait_for_due_weather_resources()
+        error_message: AnyStr = f'{self.__get_names(due_weather_resources)} != [AddedAPI]!'
+        assert self.__get_names(due_weather_resources) == ['AddedAPI'], error_message
+
+        error_message = f'{polling_scheduler.due_times} != {{FastAPI: 10.0, AddedAPI: 15.0}}!'
+        assert polling_scheduler.due_times == {'FastAPI': 10.0, 'AddedAPI': 15.0}, error_message
+
+        clock.now = 10.0
+        due_weather_resources = await polling_scheduler.wait_for_due_weather_resources()
+        error_message = f'{due_weather_resources} is not changed FastAPI!'
+        assert [weather_resource.params for weather_resource in due_weather_resources] == [{'changed': 'true'}], \
+            error_message
+
+    async def test_unknown_missed_tick_policy(self) -> None:
+        """
+        Checks, that unknown missed tick policy is rejected.
+        """
+
+        try:
+            PollingScheduler(
+                weather_resources=[self.fast_weather_resource],
+                default_interval_in_seconds=10,
+                missed_tick_policy='unknown'
+            )
+        except ValueError:
+            return
+
+        assert False, 'ValueError was not raised!'
@@ -0,0 +1,34 @@
+from typing import AnyStr
+
+from src import IterationStatistics
+
+
+class TestIterationStatistics:
+    """
+    Class for testing IterationStatistics methods.
+    """
+
+    def test_percentiles(self) -> None:
+        """
+        Checks, that percentiles of iterations latencies are linearly interpolated.
+        """
+
+        iteration_statistics: IterationStatistics = IterationStatistics()
+        for latency_in_seconds in (0.4, 0.1, 0.3, 0.2, 1.0):
+            iteration_statistics.register_iteration(latency_in_seconds=latency_in_seconds)
+
+        error_message: AnyStr = f'{iteration_statistics.get_percentile(percentile=50)} != 0.3!'
+        assert iteration_statistics.get_percentile(percentile=50) == 0.3, error_message
+
+        error_message: AnyStr = f'{iteration_statistics.get_percentile(percentile=95)} != 0.88!'
+        assert round(iteration_statistics.get_percentile(percentile=95), 4) == 0.88, error_message
+
+    def test_percentiles_without_iterations(self) -> None:
+        """
+        Checks, that statistics without iterations has zero percentiles.
+        """
+
+        iteration_statistics: IterationStatistics = IterationStatistics()
+        expected_snapshot = {'iterations': 0, 'p50_in_seconds': 0.0, 'p95_in_seconds': 0.0, 'p99_in_seconds': 0.0}
+        error_message: AnyStr = f'{iteration_statistics.snapshot()} != {expected_snapshot}!'
+        assert iteration_statistics.snapshot() == expected_snapshot, error_message
@@ -0,0 +1,83 @@
+import time
+import asyncio
+
+from typing import AnyStr, List
+
+from src import RateLimiter, TokenBucket
+from .async_metaclass import AsyncMetaclass
+from .test_polling_scheduler import MockClock
+
+
+class TestRateLimiter(metaclass=AsyncMetaclass):
+    """
+    Class for testing TokenBucket and RateLimiter methods.
+    """
+
+    async def test_token_bucket_refill(self) -> None:
+        """
+        Checks, that bucket allows burst up to quota and is refilled with constant rate.
+        """
+
+        clock: MockClock = MockClock()
+        token_bucket: TokenBucket = TokenBucket(requests=2, period_in_seconds=10, clock=clock)
+        token_bucket.consume()
+        token_bucket.consume()
+
+        error_message: AnyStr = f'{token_bucket.time_until_available()} != 5.0!'
+        assert token_bucket.time_until_available() == 5.0, error_message
+
+        clock.now = 100.0
+        error_message: AnyStr = f'{token_bucket.tokens} != 2.0!'
+        assert token_bucket.tokens == 2.0, error_message
+
+    async def test_token_bucket_with_invalid_quota(self) -> None:
+        """
+        Checks, that non-positive quota is rejected.
+        """
+
+        try:
+            TokenBucket(requests=0, period_in_seconds=60)
+        except ValueError:
+            return
+
+        assert False, 'ValueError was not raised!'
+
+    async def test_acquire_in_fifo_order(self) -> None:
+        """
+        Checks, that requests, exceeding quota, wait instead of failing and are served in order of arrival.
+        """
+
+        rate_limiter: RateLimiter = RateLimiter(quotas={'requests': 1, 'period_in_seconds': 0.1})
+        served_requests: List[int] = []
+
+        async def make_request(request_number: int) -> None:
+            await rate_limiter.acquire()
+            served_requests.append(request_number)
+
+        start_time: float = time.monotonic()
+        await asyncio.gather(*(make_request(request_number=request_number) for request_number in range(4)))
+        elapsed_time: float = time.monotonic() - start_time
+
+        error_message: AnyStr = f'{served_requests} != [0, 1, 2, 3]!'
+        assert served_requests == [0, 1, 2, 3], error_message
+
+        error_message: AnyStr = f'{elapsed_time} < 0.3!'
+        assert elapsed_time >= 0.29, error_message
+
+        error_message: AnyStr = f'{rate_limiter.waits} != 3!'
+        assert rate_limiter.waits == 3, error_message
+
+    async def test_retry_after(self) -> None:
+        """
+        Checks, that "Retry-After" blocks requests even without quotas.
+        """
+
+        clock: MockClock = MockClock()
+        rate_limiter: RateLimiter = RateLimiter(clock=clock)
+        error_message: AnyStr = 'Request is not allowed without quotas!'
+        assert rate_limiter.time_until_available() == 0.0, error_message
+
+        rate_limiter.retry_after(delay_in_seconds=30)
+        clock.now = 10.0
+        error_message: AnyStr = f'{rate_limiter.time_until_available()} != 20.0!'
+        assert rate_limiter.time_until_available() == 20.0, error_message
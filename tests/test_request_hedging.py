@@ -0,0 +1,135 @@
+import random
+import asyncio
+
+from typing import AnyStr, List
+
+from src import RequestHedger, P2QuantileEstimator
+from .async_metaclass import AsyncMetaclass
+
+
+class TestRequestHedging(metaclass=AsyncMetaclass):
+    """
+    Class for testing P2QuantileEstimator and RequestHedger methods.
+    """
+
+    async def test_p2_quantile_estimator(self) -> None:
+        """
+        Checks, that estimated p95 of exponentially distributed latencies is close to exact p95.
+        """
+
+        randomizer: random.Random = random.Random(0)
+        latencies: List[float] = [randomizer.expovariate(10.0) for _ in range(10000)]
+        p2_quantile_estimator: P2QuantileEstimator = P2QuantileEstimator(quantile=0.95)
+        for latency in latencies:
+            p2_quantile_estimator.add(latency)
+
+        exact_quantile: float = sorted(latencies)[int(0.95 * len(latencies))]
+        error_message: AnyStr = f'{p2_quantile_estimator.value} is far from {exact_quantile}!'
+        assert abs(p2_quantile_estimator.value - exact_quantile) / exact_quantile < 0.05, error_message
+
+    async def test_p2_quantile_estimator_with_few_values(self) -> None:
+        """
+        Checks, that quantile of less than five values is calculated exactly.
+        """
+
+        p2_quantile_estimator: P2QuantileEstimator = P2QuantileEstimator(quantile=0.5)
+        error_message: AnyStr = f'{p2_quantile_estimator.value} is not None!'
+        assert p2_quantile_estimator.value is None, error_message
+
+        for value in (3.0, 1.0, 2.0):
+            p2_quantile_estimator.add(value)
+
+        error_message = f'{p2_quantile_estimator.value} != 2.0!'
+        assert p2_quantile_estimator.value == 2.0, error_message
+
+    async def test_hedge_wins_and_loser_is_cancelled(self) -> None:
+        """
+        Checks, that slow primary request is hedged after observed latency quantile, response of hedge is used,
+        and primary request is cancelled.
+        """
+
+        request_hedger: RequestHedger = RequestHedger(quantile=0.95, budget_ratio=1.0, min_samples=5)
+        for _ in range(5):
+            request_hedger.register_latency(latency_in_seconds=0.01)
+
+        delays: List[float] = [1.0, 0.0]
+        cancelled_requests: List[int] = []
+
+        async def make_request() -> int:
+            request_number: int = len(delays)
+            delay: float = delays.pop(0)
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled_requests.append(request_number)
+                raise
+
+            return request_number
+
+        result: int = await request_hedger.run(make_request=make_request)
+        error_message: AnyStr = f'{result} is not result of hedge request!'
+        assert result == 1, error_message
+
+        error_message = f'{cancelled_requests} != [2]!'
+        assert cancelled_requests == [2], error_message
+
+        snapshot = request_hedger.snapshot()
+        error_message = f'{snapshot} is wrong!'
+        assert snapshot['hedges'] == 1 and snapshot['hedge_wins'] == 1 and snapshot['win_rate'] == 1.0, error_message
+
+    async def test_hedge_after_failed_primary(self) -> None:
+        """
+        Checks, that error of the first completed request is not returned, while the other request can succeed,
+        and error is raised, if all requests failed.
+        """
+
+        request_hedger: RequestHedger = RequestHedger(quantile=0.5, budget_ratio=1.0, min_samples=1)
+        request_hedger.register_latency(latency_in_seconds=0.01)
+        delays: List[float] = [0.05, 0.1]
+
+        async def make_request() -> float:
+            delay: float = delays.pop(0)
+            await asyncio.sleep(delay)
+            if delay < 0.1:
+                raise ConnectionError('Primary failed')
+
+            return delay
+
+        result: float = await request_hedger.run(make_request=make_request)
+        error_message: AnyStr = f'{result} != 0.1!'
+        assert result == 0.1, error_message
+
+        async def make_failed_request() -> None:
+            await asyncio.sleep(0.02)
+            raise ConnectionError('Failed')
+
+        try:
+            await request_hedger.run(make_request=make_failed_request)
+        except ConnectionError:
+            pass
+        else:
+            raise AssertionError('ConnectionError was not raised!')
+
+    async def test_hedge_budget(self) -> None:
+        """
+        Checks, that number of hedges doesn't exceed budget ratio of requests, and requests are not hedged,
+        until min samples of latencies were observed.
+        """
+
+        request_hedger: RequestHedger = RequestHedger(quantile=0.5, budget_ratio=0.25, min_samples=3)
+
+        async def make_request() -> None:
+            await asyncio.sleep(0.02)
+
+        for _ in range(3):
+            await request_hedger.run(make_request=make_request)
+            request_hedger.register_latency(latency_in_seconds=0.001)
+
+        error_message: AnyStr = f'{request_hedger.hedges} hedges before min samples!'
+        assert request_hedger.hedges == 0, error_message
+
+        for _ in range(9):
+            await request_hedger.run(make_request=make_request)
+
+        error_message = f'{request_hedger.hedges} != 3 with 12 requests!'
+        assert request_hedger.hedges == 3, error_message
@@ -0,0 +1,109 @@
+from pathlib import Path
+from typing import AnyStr, Optional
+
+from src import ResponseCache, CachedResponse, Temperature
+from .test_polling_scheduler import MockClock
+
+
+class TestResponseCache:
+    """
+    Class for testing ResponseCache methods.
+    """
+
+    def test_get_fresh_and_expired_entry(self) -> None:
+        """
+        Checks, that entry is returned only until its TTL expires, but is still available for revalidation.
+        """
+
+        clock: MockClock = MockClock()
+        response_cache: ResponseCache = ResponseCache(max_entries=10, clock=clock)
+        key: AnyStr = ResponseCache.make_key(url='https://weather.com', params={'q': 'Moscow'}, headers={})
+        response_cache.put(key=key, temperature=Temperature(15.0), ttl_in_seconds=60, etag='"v1"')
+
+        cached_response: Optional[CachedResponse] = response_cache.get(key=key)
+        error_message: AnyStr = f'{cached_response} is not fresh!'
+        assert cached_response is not None and cached_response.temperature == 15.0, error_message
+
+        clock.now = 60.0
+        error_message: AnyStr = 'Entry is not expired!'
+        assert response_cache.get(key=key) is None, error_message
+
+        error_message: AnyStr = f'{response_cache.get_stale(key=key)} has wrong ETag!'
+        assert response_cache.get_stale(key=key).etag == '"v1"', error_message
+
+        response_cache.revalidate(key=key, ttl_in_seconds=60)
+        error_message: AnyStr = 'Entry was not refreshed!'
+        assert response_cache.get(key=key) is not None, error_message
+
+        expected_snapshot = {'entries': 1, 'hits': 2, 'misses': 1, 'revalidations': 1}
+        error_message: AnyStr = f'{response_cache.snapshot()} != {expected_snapshot}!'
+        assert response_cache.snapshot() == expected_snapshot, error_message
+
+    def test_make_key(self) -> None:
+        """
+        Checks, that key doesn't depend on params order, but depends on params and headers values.
+        """
+
+        key: AnyStr = ResponseCache.make_key(url='https://weather.com', params={'a': '1', 'b': '2'}, headers={})
+        same_key: AnyStr = ResponseCache.make_key(url='https://weather.com', params={'b': '2', 'a': '1'}, headers={})
+        other_key: AnyStr = ResponseCache.make_key(
+            url='https://weather.com',
+            params={'a': '1', 'b': '2'},
+            headers={'token': 'other'}
+        )
+
+        assert key == same_key, f'{key} != {same_key}!'
+        assert key != other_key, f'{key} == {other_key}!'
+
+    def test_least_recently_used_eviction(self) -> None:
+        """
+        Checks, that least recently used entry is evicted, when cache is full.
+        """
+
+        response_cache: ResponseCache = ResponseCache(max_entries=2)
+        for key in ('first', 'second'):
+            response_cache.put(key=key, temperature=Temperature(1.0), ttl_in_seconds=60)
+
+        response_cache.get(key='first')
+        response_cache.put(key='third', temperature=Temperature(1.0), ttl_in_seconds=60)
+
+        error_message: AnyStr = 'Wrong entry was evicted!'
+        assert response_cache.get_stale(key='second') is None, error_message
+        assert response_cache.get_stale(key='first') is not None, error_message
+        assert response_cache.get_stale(key='third') is not None, error_message
+
+    def test_persistence(self, tmp_path: Path) -> None:
+        """
+        Checks, that saved cache is loaded by new cache with the same entries and remaining TTL.
+        """
+
+        file_path: Path = tmp_path / 'response_cache.json'
+        response_cache: ResponseCache = ResponseCache(max_entries=10, file_path=file_path)
+        response_cache.put(key='key', temperature=Temperature(-3.5), ttl_in_seconds=600, last_modified='yesterday')
+        response_cache.save()
+
+        loaded_response_cache: ResponseCache = ResponseCache(max_entries=10, file_path=file_path)
+        loaded_response_cache.load()
+
+        cached_response: Optional[CachedResponse] = loaded_response_cache.get(key='key')
+        error_message: AnyStr = f'{cached_response} was not loaded!'
+        assert cached_response is not None, error_message
+        assert cached_response.temperature == -3.5, error_message
+        assert cached_response.last_modified == 'yesterday', error_message
+
+    def test_load_of_corrupt_file(self, tmp_path: Path) -> None:
+        """
+        Checks, that truncated cache file or file with unexpected entries is not loaded and cache starts cold.
+        """
+
+        file_path: Path = tmp_path / 'response_cache.json'
+        response_cache: ResponseCache = ResponseCache(max_entries=10, file_path=file_path)
+        response_cache.put(key='key', temperature=Temperature(-3.5), ttl_in_seconds=600)
+        response_cache.save()
+
+        for corrupt_content in (file_path.read_text()[:-5], '{"key": {"temperature": -3.5}}', '[]'):
+            file_path.write_text(corrupt_content)
+            loaded_response_cache: ResponseCache = ResponseCache(max_entries=10, file_path=file_path)
+
+            error_message: AnyStr = f'Corrupt cache file {corrupt_content} was loaded!'
+            assert not loaded_response_cache.load() and len(loaded_response_cache) == 0, error_message
@@ -0,0 +1,59 @@
+from typing import AnyStr
+
+from src import ResultExtractor
+from src.result_extractor import decode_json
+
+
+class TestResultExtractor:
+    """
+    Class for testing ResultExtractor methods.
+    """
+
+    def test_extract_with_list_indices(self) -> None:
+        """
+        Checks, that integer keys are used as list indices, and path can be provided as a single string.
+        """
+
+        response_json = decode_json(b'{"list": [{"main": {"temp": 1.5}}, {"main": {"temp": -2}}]}')
+        for result_keys in (['list', 1, 'main', 'temp'], 'list[1].main.temp', 'list[-1].main.temp'):
+            temperature = ResultExtractor(result_keys=result_keys).extract(response_json=response_json)
+            error_message: AnyStr = f'{temperature} != -2 for {result_keys}!'
+            assert temperature == -2, error_message
+
+    def test_extract_with_falsy_intermediate_value(self) -> None:
+        """
+        Checks, that falsy intermediate value doesn't restart lookup from the root of response.
+        """
+
+        result_extractor: ResultExtractor = ResultExtractor(result_keys=['current', 'temperature'])
+        temperature = result_extractor.extract(response_json={'current': {}, 'temperature': 5.0})
+        error_message: AnyStr = f'{temperature} is not None!'
+        assert temperature is None, error_message
+
+        temperature = result_extractor.extract(response_json={'current': {'temperature': 0}})
+        error_message: AnyStr = f'{temperature} != 0!'
+        assert temperature == 0, error_message
+
+    def test_extract_with_unexpected_types(self) -> None:
+        """
+        Checks, that default value is returned for missing path parts, unexpected types and not numeric results.
+        """
+
+        result_extractor: ResultExtractor = ResultExtractor(result_keys=['current', 0], default_value=-273)
+        for response_json in ({'current': 15.0}, {'current': {'0': 1}}, {'current': ['hot']}, {'current': [True]}):
+            temperature = result_extractor.extract(response_json=response_json)
+            error_message: AnyStr = f'{temperature} != -273 for {response_json}!'
+            assert temperature == -273, error_message
+
+    def test_malformed_result_keys(self) -> None:
+        """
+        Checks, that malformed result keys are rejected on compilation.
+        """
+
+        for result_keys in ('list[x].temp', 'main..temp', ['main', 1.5]):
+            try:
+                ResultExtractor(result_keys=result_keys)
+            except ValueError:
+                continue
+
+            assert False, f'ValueError was not raised for {result_keys}!'
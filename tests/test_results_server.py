@@ -0,0 +1,84 @@
+import json
+import aiohttp
+
+from typing import AnyStr, Dict, Any
+
+from src import ResultsIndex, ResultsServer, IndexedDocument, ResultRow
+from .async_metaclass import AsyncMetaclass
+
+
+class TestResultsServer(metaclass=AsyncMetaclass):
+    """
+    Class for testing ResultsIndex and ResultsServer methods.
+    """
+
+    @staticmethod
+    def create_results_index() -> ResultsIndex:
+        results_index: ResultsIndex = ResultsIndex()
+        results_index.update(
+            iteration=1,
+            timestamp='2024-01-01T00:00:00',
+            results_rows=[
+                ResultRow('2024-01-01T00:00:00', 'London', 'Open-Meteo', 10.0, 0.1, 'ok'),
+                ResultRow('2024-01-01T00:00:00', 'London', 'Mirror', float('nan'), 0.2, 'error')
+            ],
+            average_temperatures={'London': (10.0, [])},
+            rolling_statistics={}
+        )
+        return results_index
+
+    async def test_update_keeps_not_polled_locations(self) -> None:
+        """
+        Checks, that documents of location, which was not polled in the next iteration, are kept, and missing
+        temperature is served as null.
+        """
+
+        results_index: ResultsIndex = self.create_results_index()
+        london_document: IndexedDocument = results_index.get(path=('locations', 'London'))
+        results_index.update(
+            iteration=2,
+            timestamp='2024-01-01T00:01:00',
+            results_rows=[ResultRow('2024-01-01T00:01:00', 'Paris', 'Open-Meteo', 12.0, 0.1, 'ok')],
+            average_temperatures={'Paris': (12.0, [])},
+            rolling_statistics={}
+        )
+
+        locations: Dict[AnyStr, Any] = json.loads(results_index.get(path=('locations',)).body)
+        error_message: AnyStr = f'{locations["locations"]} != ["London", "Paris"]!'
+        assert locations['locations'] == ['London', 'Paris'] and len(results_index) == 2, error_message
+
+        provider_document: IndexedDocument = results_index.get(path=('locations', 'London', 'providers', 'Mirror'))
+        provider_results: Dict[AnyStr, Any] = json.loads(provider_document.body)
+        error_message = f'{provider_results} is not result of the first iteration with null temperature!'
+        assert provider_results['iteration'] == 1 and provider_results['temperature'] is None, error_message
+
+        error_message = 'Document of not polled location was serialized again!'
+        assert results_index.get(path=('locations', 'London')) is london_document, error_message
+
+    async def test_serve_documents_with_etag(self) -> None:
+        """
+        Checks, that document is served with ETag, request with the same ETag is answered with 304 and missing
+        location is answered with 404.
+        """
+
+        results_index: ResultsIndex = self.create_results_index()
+        async with (
+            ResultsServer(results_index=results_index, port=0) as results_server,
+            aiohttp.ClientSession() as session
+        ):
+            async with session.get(f'{results_server.url}/locations/London') as response:
+                location_results: Dict[AnyStr, Any] = await response.json()
+                etag: AnyStr = response.headers['ETag']
+
+            error_message: AnyStr = f'{location_results} is not results of London!'
+            assert location_results['average_temperature'] == 10.0, error_message
+            assert etag == results_index.get(path=('locations', 'London')).etag, f'{etag} is not ETag of document!'
+
+            async with session.get(
+                f'{results_server.url}/locations/London',
+                headers={'If-None-Match': f'W/{etag}'}
+            ) as response:
+                assert response.status == 304, f'{response.status} != 304!'
+
+            async with session.get(f'{results_server.url}/locations/Berlin/providers/Mirror') as response:
+                assert response.status == 404, f'{response.status} != 404!'
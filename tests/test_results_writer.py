@@ -0,0 +1,105 @@
+import asyncio
+import threading
+
+from pathlib import Path
+from typing import AnyStr, List
+
+from src import ResultsWriter
+from .async_metaclass import AsyncMetaclass
+
+
+class TestResultsWriter(metaclass=AsyncMetaclass):
+    """
+    Class for testing ResultsWriter methods.
+    """
+
+    async def test_group_commit_by_size(self, tmp_path: Path) -> None:
+        """
+        Checks, that buffered lines are written together, when buffer size is reached, and all lines are written
+        in order of calls on close.
+        """
+
+        file_path: Path = tmp_path / 'results.csv'
+        lines: List[AnyStr] = [f'line{index}\n' for index in range(5)]
+        async with ResultsWriter(file_path=file_path, flush_max_lines=2, flush_interval_in_seconds=60) as results_writer:
+            for line in lines:
+                await results_writer.write(lines=[line])
+
+            await asyncio.sleep(0.05)
+            error_message: AnyStr = f'{results_writer.written_lines} != 4!'
+            assert results_writer.written_lines == 4, error_message
+
+        error_message: AnyStr = f'{file_path.read_text()} != {lines}!'
+        assert file_path.read_text() == ''.join(lines), error_message
+
+        error_message: AnyStr = f'{results_writer.snapshot()} has wrong counters!'
+        assert results_writer.snapshot() == {'written_lines': 5, 'flushes': 3, 'fsyncs': 1}, error_message
+
+    async def test_group_commit_by_time(self, tmp_path: Path) -> None:
+        """
+        Checks, that buffered lines are written after flush interval, even if buffer is not full.
+        """
+
+        file_path: Path = tmp_path / 'results.csv'
+        async with ResultsWriter(
+            file_path=file_path,
+            flush_max_lines=100,
+            flush_interval_in_seconds=0.05,
+            fsync_policy='on_flush'
+        ) as results_writer:
+            await results_writer.write(lines=['first\n', 'second\n'])
+            await asyncio.sleep(0.2)
+
+            error_message: AnyStr = f'{file_path.read_text()} is not flushed!'
+            assert file_path.read_text() == 'first\nsecond\n', error_message
+
+    async def test_close_in_thread_pool(self, tmp_path: Path) -> None:
+        """
+        Checks, that the last lines are written and file is closed in thread pool, not on event loop.
+        """
+
+        closing_threads: List[threading.Thread] = []
+
+        class ClosingThreadResultsWriter(ResultsWriter):
+            def _close(self) -> None:
+                closing_threads.append(threading.current_thread())
+                super()._close()
+
+        file_path: Path = tmp_path / 'results.csv'
+        async with ClosingThreadResultsWriter(file_path=file_path, flush_interval_in_seconds=60) as results_writer:
+            await results_writer.write(lines=['first\n'])
+
+        error_message: AnyStr = f'{file_path.read_text()} != "first\\n"!'
+        assert file_path.read_text() == 'first\n', error_message
+
+        error_message = f'File was closed in {closing_threads}, not in thread pool!'
+        assert closing_threads and closing_threads[0] is not threading.main_thread(), error_message
+
+    async def test_close_after_cancellation(self, tmp_path: Path) -> None:
+        """
+        Checks, that queued lines are written, even if writer task was cancelled.
+        """
+
+        file_path: Path = tmp_path / 'results.csv'
+        results_writer: ResultsWriter = ResultsWriter(file_path=file_path, flush_interval_in_seconds=60)
+        await results_writer.start()
+        await results_writer.write(lines=['first\n'])
+        await results_writer.write(lines=['second\n'])
+
+        results_writer._ResultsWriter__writer_task.cancel()
+        await results_writer.close()
+
+        error_message: AnyStr = f'{file_path.read_text()} != "first\\nsecond\\n"!'
+        assert file_path.read_text() == 'first\nsecond\n', error_message
+
+    async def test_unknown_fsync_policy(self) -> None:
+        """
+        Checks, that unknown fsync policy is rejected.
+        """
+
+        try:
+            ResultsWriter(file_path=Path('results.csv'), fsync_policy='always')
+        except ValueError:
+            return
+
+        assert False, 'ValueError was not raised!'
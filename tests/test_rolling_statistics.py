@@ -0,0 +1,117 @@
+import random
+import statistics
+
+from typing import AnyStr, List, Dict, Any
+
+from src import RollingWindow, RollingStatistics
+from .async_metaclass import AsyncMetaclass
+
+
+class TestRollingStatistics(metaclass=AsyncMetaclass):
+    """
+    Class for testing RollingWindow and RollingStatistics methods.
+    """
+
+    async def test_count_window(self) -> None:
+        """
+        Checks, that statistics of window, limited by count, are equal to statistics, calculated from scratch
+        on last values.
+        """
+
+        randomizer: random.Random = random.Random(0)
+        values: List[float] = [randomizer.uniform(-30, 40) for _ in range(500)]
+        rolling_window: RollingWindow = RollingWindow(max_count=20)
+        for index, value in enumerate(values):
+            rolling_window.add(value=value, timestamp=float(index))
+            window_values: List[float] = values[max(index - 19, 0):index + 1]
+            snapshot: Dict[AnyStr, Any] = rolling_window.snapshot()
+
+            error_message: AnyStr = f'{snapshot} is wrong for {window_values}!'
+            assert snapshot['count'] == len(window_values), error_message
+            assert abs(snapshot['mean'] - statistics.fmean(window_values)) < 1e-9, error_message
+            assert snapshot['min'] == min(window_values) and snapshot['max'] == max(window_values), error_message
+            if len(window_values) > 1:
+                assert abs(snapshot['variance'] - statistics.variance(window_values)) < 1e-6, error_message
+
+    async def test_time_window(self) -> None:
+        """
+        Checks, that values older than max age are evicted on adding and on explicit eviction.
+        """
+
+        rolling_window: RollingWindow = RollingWindow(max_age_in_seconds=10.0)
+        rolling_window.add(value=5.0, timestamp=0.0)
+        rolling_window.add(value=1.0, timestamp=5.0)
+        rolling_window.add(value=3.0, timestamp=12.0)
+
+        snapshot: Dict[AnyStr, Any] = rolling_window.snapshot()
+        error_message: AnyStr = f'{snapshot} is wrong!'
+        assert snapshot['count'] == 2 and snapshot['mean'] == 2.0, error_message
+        assert snapshot['min'] == 1.0 and snapshot['max'] == 3.0, error_message
+
+        rolling_window.evict(now=30.0)
+        snapshot = rolling_window.snapshot()
+        error_message: AnyStr = f'{snapshot} is not empty!'
+        assert snapshot['count'] == 0 and snapshot['mean'] is None and snapshot['min'] is None, error_message
+
+    async def test_ewma(self) -> None:
+        """
+        Checks, that EWMA starts from first value and is updated with configured alpha.
+        """
+
+        rolling_window: RollingWindow = RollingWindow(ewma_alpha=0.5)
+        for index, value in enumerate([10.0, 20.0, 0.0]):
+            rolling_window.add(value=value, timestamp=float(index))
+
+        error_message: AnyStr = f'{rolling_window.ewma} != 7.5!'
+        assert rolling_window.ewma == 7.5, error_message
+
+    async def test_rolling_statistics_snapshot(self) -> None:
+        """
+        Checks, that statistics are kept separately for each location and weather resource, and expired values
+        are evicted on snapshot.
+        """
+
+        now: List[float] = [0.0]
+        rolling_statistics: RollingStatistics = RollingStatistics(max_age_in_seconds=60.0, clock=lambda: now[0])
+        rolling_statistics.register(location_name='London', weather_resource_name='First', temperature=10.0)
+        rolling_statistics.register(location_name='London', weather_resource_name='Second', temperature=20.0)
+        now[0] = 30.0
+        rolling_statistics.register(location_name='London', weather_resource_name='First', temperature=20.0)
+
+        snapshot: Dict[AnyStr, Any] = rolling_statistics.snapshot()
+        error_message: AnyStr = f'{snapshot} is wrong!'
+        assert snapshot['London']['First']['mean'] == 15.0, error_message
+        assert snapshot['London']['Second']['count'] == 1, error_message
+
+        now[0] = 70.0
+        snapshot = rolling_statistics.snapshot()
+        error_message: AnyStr = f'{snapshot} has expired values!'
+        assert snapshot['London']['First']['count'] == 1 and snapshot['London']['Second']['count'] == 0, error_message
+
+    async def test_rolling_statistics_snapshot_of_updated_windows(self) -> None:
+        """
+        Checks, that snapshot by window keys contains only requested windows, and keys without windows are skipped.
+        """
+
+        rolling_statistics: RollingStatistics = RollingStatistics()
+        rolling_statistics.register(location_name='London', weather_resource_name='First', temperature=10.0)
+        rolling_statistics.register(location_name='Paris', weather_resource_name='First', temperature=20.0)
+
+        snapshot: Dict[AnyStr, Any] = rolling_statistics.snapshot(
+            window_keys=[('Paris', 'First'), ('Paris', 'Second')]
+        )
+        error_message: AnyStr = f'{snapshot} has not only Paris window of First!'
+        assert list(snapshot) == ['Paris'] and list(snapshot['Paris']) == ['First'], error_message
+
+    async def test_invalid_parameters(self) -> None:
+        """
+        Checks, that non-positive max count and EWMA alpha out of (0, 1] are rejected.
+        """
+
+        for parameters in ({'max_count': 0}, {'ewma_alpha': 0.0}, {'ewma_alpha': 1.5}):
+            try:
+                RollingStatistics(**parameters)
+            except ValueError:
+                continue
+
+            assert False, f'ValueError was not raised for {parameters}!'
@@ -0,0 +1,58 @@
+from typing import AnyStr, List
+
+from src import ShardBalancer
+from .async_metaclass import AsyncMetaclass
+
+
+class TestShardBalancer(metaclass=AsyncMetaclass):
+    """
+    Class for testing ShardBalancer methods.
+    """
+
+    async def test_initial_slices(self) -> None:
+        """
+        Checks, that items are split into contiguous shards of nearly equal sizes, which cover all items.
+        """
+
+        shard_balancer: ShardBalancer = ShardBalancer(items_number=10, shards_number=3)
+        error_message: AnyStr = f'{shard_balancer.sizes} != [4, 3, 3]!'
+        assert shard_balancer.sizes == [4, 3, 3], error_message
+
+        items: List[int] = list(range(10))
+        sharded_items: List[int] = [item for shard_slice in shard_balancer.slices for item in items[shard_slice]]
+        error_message = f'{sharded_items} != {items}!'
+        assert sharded_items == items, error_message
+
+    async def test_rebalance_of_slow_shard(self) -> None:
+        """
+        Checks, that shard, which falls behind, gives items to faster shards, every shard keeps at least one item,
+        and shards are not rebalanced, while latencies are within threshold.
+        """
+
+        shard_balancer: ShardBalancer = ShardBalancer(items_number=12, shards_number=2, rebalance_threshold=1.5)
+        error_message: AnyStr = 'Shards were rebalanced within threshold!'
+        assert not shard_balancer.register_latencies(latencies_in_seconds=[1.0, 1.4]), error_message
+
+        error_message = 'Shards were not rebalanced!'
+        assert shard_balancer.register_latencies(latencies_in_seconds=[1.0, 3.0]), error_message
+
+        error_message = f'{shard_balancer.sizes} != [8, 4]!'
+        assert shard_balancer.sizes == [8, 4] and shard_balancer.rebalances == 1, error_message
+
+        for _ in range(20):
+            shard_balancer.register_latencies(latencies_in_seconds=[0.1, 100.0])
+
+        error_message = f'{shard_balancer.sizes} != [11, 1]!'
+        assert shard_balancer.sizes == [11, 1], error_message
+
+    async def test_wrong_shards_number(self) -> None:
+        """
+        Checks, that shards number can't exceed number of items.
+        """
+
+        try:
+            ShardBalancer(items_number=2, shards_number=3)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError('ValueError was not raised!')
@@ -0,0 +1,54 @@
+import threading
+
+from pathlib import Path
+from typing import AnyStr, List, Tuple, Any
+from multiprocessing import Pipe
+from multiprocessing.connection import Connection
+
+from src import ShardResultsWriter
+from .async_metaclass import AsyncMetaclass
+
+
+class TestShardResultsWriter(metaclass=AsyncMetaclass):
+    """
+    Class for testing ShardResultsWriter methods.
+    """
+
+    async def test_message_per_write(self, tmp_path: Path) -> None:
+        """
+        Checks, that each write is sent to supervisor as exactly one message in order of calls, even if lines
+        are empty, and nothing is written to results file.
+        """
+
+        supervisor_connection, worker_connection = Pipe()
+        file_path: Path = tmp_path / 'results.csv'
+        async with ShardResultsWriter(
+            file_path=file_path,
+            connection=worker_connection,
+            message_kind='results',
+            send_lock=threading.Lock()
+        ) as shard_results_writer:
+            await shard_results_writer.write(lines=['first\n', 'second\n'])
+            await shard_results_writer.write(lines=[])
+            await shard_results_writer.write(lines=['third\n'])
+
+        messages: List[Tuple[AnyStr, List[Any]]] = self.__receive_messages(connection=supervisor_connection)
+        expected_messages: List[Tuple[AnyStr, List[Any]]] = [
+            ('results', ['first\n', 'second\n']),
+            ('results', []),
+            ('results', ['third\n'])
+        ]
+        error_message: AnyStr = f'{messages} != {expected_messages}!'
+        assert messages == expected_messages, error_message
+
+        error_message = f'{shard_results_writer} is not counter of 3 messages with 3 lines!'
+        assert shard_results_writer.flushes == 3 and shard_results_writer.written_lines == 3, error_message
+        assert not file_path.exists(), f'{file_path} was created by shard results writer!'
+
+    @staticmethod
+    def __receive_messages(connection: Connection) -> List[Tuple[AnyStr, List[Any]]]:
+        messages: List[Tuple[AnyStr, List[Any]]] = []
+        while connection.poll():
+            messages.append(connection.recv())
+
+        return messages
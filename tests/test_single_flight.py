@@ -0,0 +1,102 @@
+import asyncio
+
+from typing import AnyStr, List
+
+from src import SingleFlight
+from .async_metaclass import AsyncMetaclass
+
+
+class TestSingleFlight(metaclass=AsyncMetaclass):
+    """
+    Class for testing SingleFlight methods.
+    """
+
+    async def test_concurrent_identical_calls(self) -> None:
+        """
+        Checks, that concurrent calls with the same key share a single call, calls with other keys are made
+        separately, and finished call is not reused.
+        """
+
+        single_flight: SingleFlight = SingleFlight()
+        made_calls: List[AnyStr] = []
+
+        async def make_call(key: AnyStr) -> AnyStr:
+            made_calls.append(key)
+            await asyncio.sleep(0.02)
+            return key.upper()
+
+        results: List[AnyStr] = await asyncio.gather(
+            *(single_flight.run(key=key, make_call=lambda key=key: make_call(key=key)) for key in 'aaab')
+        )
+        error_message: AnyStr = f'{results} != [A, A, A, B]!'
+        assert results == ['A', 'A', 'A', 'B'], error_message
+
+        error_message = f'{made_calls} != [a, b]!'
+        assert made_calls == ['a', 'b'], error_message
+
+        snapshot = single_flight.snapshot()
+        error_message = f'{snapshot} is wrong!'
+        assert snapshot == {'calls': 4, 'coalesced_calls': 2, 'deduplication_ratio': 0.5}, error_message
+
+        await single_flight.run(key='a', make_call=lambda: make_call(key='a'))
+        error_message = f'{made_calls} != [a, b, a]!'
+        assert made_calls == ['a', 'b', 'a'] and single_flight.calls_in_flight == 0, error_message
+
+    async def test_shared_exception(self) -> None:
+        """
+        Checks, that exception of call is raised to all its callers.
+        """
+
+        single_flight: SingleFlight = SingleFlight()
+
+        async def make_call() -> None:
+            await asyncio.sleep(0.01)
+            raise ConnectionError('Failed')
+
+        results: List = await asyncio.gather(
+            *(single_flight.run(key='key', make_call=make_call) for _ in range(3)),
+            return_exceptions=True
+        )
+        error_message: AnyStr = f'{results} are not ConnectionError!'
+        assert all(isinstance(result, ConnectionError) for result in results), error_message
+
+    async def test_cancellation_of_callers(self) -> None:
+        """
+        Checks, that cancellation of one caller doesn't cancel the call, which is awaited by other caller,
+        and the call is cancelled, when all its callers were cancelled.
+        """
+
+        single_flight: SingleFlight = SingleFlight()
+        started_call: asyncio.Event = asyncio.Event()
+        cancelled_calls: List[bool] = []
+
+        async def make_call() -> AnyStr:
+            started_call.set()
+            try:
+                await asyncio.sleep(0.05)
+            except asyncio.CancelledError:
+                cancelled_calls.append(True)
+                raise
+
+            return 'result'
+
+        first_caller: asyncio.Task = asyncio.create_task(single_flight.run(key='key', make_call=make_call))
+        second_caller: asyncio.Task = asyncio.create_task(single_flight.run(key='key', make_call=make_call))
+        await started_call.wait()
+        first_caller.cancel()
+
+        error_message: AnyStr = f'{cancelled_calls} is not empty!'
+        assert await second_caller == 'result' and not cancelled_calls, error_message
+
+        started_call.clear()
+        callers: List[asyncio.Task] = [
+            asyncio.create_task(single_flight.run(key='key', make_call=make_call)) for _ in range(2)
+        ]
+        await started_call.wait()
+        for caller in callers:
+            caller.cancel()
+
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0)
+        error_message = f'{cancelled_calls} != [True]!'
+        assert cancelled_calls == [True] and single_flight.calls_in_flight == 0, error_message
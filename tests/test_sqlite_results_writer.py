@@ -0,0 +1,86 @@
+import asyncio
+import sqlite3
+
+from pathlib import Path
+from typing import AnyStr, List
+
+from src import SqliteResultsWriter, ResultRow
+from .async_metaclass import AsyncMetaclass
+
+
+class TestSqliteResultsWriter(metaclass=AsyncMetaclass):
+    """
+    Class for testing SqliteResultsWriter methods.
+    """
+
+    @staticmethod
+    def __create_results_rows(rows_number: int) -> List[ResultRow]:
+        """
+        Method is static for purpose of correct work of Async Metaclass.
+        """
+
+        return [
+            ResultRow(
+                timestamp=f'2024-01-01T00:00:{index:02d}.000+00:00',
+                location='Location',
+                provider='Provider',
+                temperature=float(index),
+                latency_in_seconds=0.1,
+                status='ok'
+            ) for index in range(rows_number)
+        ]
+
+    async def test_group_commit(self, tmp_path: Path) -> None:
+        """
+        Checks, that buffered rows are inserted in one transaction per flush and all rows are inserted on close.
+        """
+
+        database_path: Path = tmp_path / 'results.sqlite3'
+        results_rows: List[ResultRow] = self.__create_results_rows(rows_number=5)
+        async with SqliteResultsWriter(
+            database_path=database_path,
+            flush_max_lines=2,
+            flush_interval_in_seconds=60
+        ) as results_writer:
+            for results_row in results_rows:
+                await results_writer.write(lines=[results_row])
+
+            await asyncio.sleep(0.05)
+            error_message: AnyStr = f'{results_writer.written_lines} != 4!'
+            assert results_writer.written_lines == 4, error_message
+
+        with sqlite3.connect(database_path) as connection:
+            database_rows: List[tuple] = connection.execute(
+                'SELECT timestamp, location, provider, temperature, latency_in_seconds, status '
+                'FROM weather_results ORDER BY id'
+            ).fetchall()
+
+        error_message: AnyStr = f'{database_rows} != {results_rows}!'
+        assert database_rows == [tuple(results_row) for results_row in results_rows], error_message
+
+        error_message: AnyStr = f'{results_writer.flushes} != 3!'
+        assert results_writer.flushes == 3, error_message
+
+    async def test_schema(self, tmp_path: Path) -> None:
+        """
+        Checks, that database is in WAL mode and results are indexed by location and timestamp.
+        """
+
+        database_path: Path = tmp_path / 'results.sqlite3'
+        async with SqliteResultsWriter(database_path=database_path) as results_writer:
+            await results_writer.write(lines=self.__create_results_rows(rows_number=1))
+
+        with sqlite3.connect(database_path) as connection:
+            journal_mode: AnyStr = connection.execute('PRAGMA journal_mode').fetchone()[0]
+            query_plan: AnyStr = ' '.join(
+                str(row) for row in connection.execute(
+                    'EXPLAIN QUERY PLAN SELECT * FROM weather_results WHERE location = ? AND timestamp > ?',
+                    ('Location', '2024')
+                )
+            )
+
+        error_message: AnyStr = f'{journal_mode} != wal!'
+        assert journal_mode == 'wal', error_message
+
+        error_message: AnyStr = f'Index is not used: {query_plan}!'
+        assert 'weather_results_location_timestamp' in query_plan, error_message
@@ -1,6 +1,7 @@
 from typing import List, AnyStr
+from pathlib import Path
 
-from src import YamlHandler, CustomizedSettings, WeatherResource
+from src import YamlHandler, CustomizedSettings, WeatherResource, Location
 from .test_configs import MockData, test_yaml_config
 
 
@@ -48,3 +49,39 @@ class TestYamlHandler:
         broken_weather_resources: List[WeatherResource] = MockData().broken_weather_resources
         error_message: AnyStr = f'{weather_resources} == {broken_weather_resources}'
         assert weather_resources != broken_weather_resources, error_message
+
+    def test_get_locations(self) -> None:
+        """
+        Creates exemplars of Locations and compares it to mocked Locations.
+        """
+
+        locations: List[Location] = YamlHandler(yaml_config=test_yaml_config).get_locations()
+        mocked_locations: List[Location] = MockData().locations
+        error_message: AnyStr = f'{locations} != {mocked_locations}'
+        assert locations == mocked_locations, error_message
+
+    def test_get_locations_from_locations_file(self, tmp_path: Path) -> None:
+        """
+        Creates weather resources .yaml file, which refers to .csv file with locations, and checks, that
+        locations from both files are read.
+        """
+
+        (tmp_path / 'locations.csv').write_text('name,latitude,longitude\nMoscow,55.75,37.62\nKazan,55.79,49.12\n')
+        weather_resources_yaml_path: Path = tmp_path / 'weather_resources.yaml'
+        weather_resources_yaml_path.write_text(
+            "locations: [{name: 'Sochi', latitude: '43.58', longitude: '39.72'}]\n"
+            "locations_file: 'locations.csv'\n"
+            "weather_resources: []\n"
+        )
+
+        locations: List[Location] = YamlHandler(
+            yaml_config=test_yaml_config.model_copy(update={'weather_resources_yaml_path': weather_resources_yaml_path})
+        ).get_locations()
+
+        expected_locations: List[Location] = [
+            Location(name='Sochi', latitude='43.58', longitude='39.72'),
+            Location(name='Moscow', latitude='55.75', longitude='37.62'),
+            Location(name='Kazan', latitude='55.79', longitude='49.12')
+        ]
+        error_message: AnyStr = f'{locations} != {expected_locations}'
+        assert locations == expected_locations, error_message